@@ -59,6 +59,7 @@
     CredentialProvider,
     StaticProvider,
 )
+from .refresh_scheduler import TokenRefreshScheduler
 from .storage import (
     CompositeStorage,
     CredentialStorage,
@@ -88,6 +89,7 @@
 __all__ = [
     # Main store
     "CredentialStore",
+    "TokenRefreshScheduler",
     # Models
     "CredentialObject",
     "CredentialKey",
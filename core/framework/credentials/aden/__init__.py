@@ -10,7 +10,8 @@
 Components:
 - AdenCredentialClient: HTTP client for Aden API
 - AdenSyncProvider: CredentialProvider that syncs with Aden
-- AdenCachedStorage: Storage with local cache + Aden fallback
+- AdenCachedStorage: Storage with local cache + Aden fallback, optionally
+  kept current by a background delta sync
 
 Quick Start:
     from core.framework.credentials import CredentialStore
@@ -53,6 +54,7 @@
     AdenNotFoundError,
     AdenRateLimitError,
     AdenRefreshError,
+    AdenSyncResponse,
 )
 from .provider import AdenSyncProvider
 from .storage import AdenCachedStorage
@@ -63,6 +65,7 @@
     "AdenClientConfig",
     "AdenCredentialResponse",
     "AdenIntegrationInfo",
+    "AdenSyncResponse",
     # Client errors
     "AdenClientError",
     "AdenAuthenticationError",
@@ -24,6 +24,9 @@
 
     # Request a refresh
     refreshed = client.request_refresh("hubspot")
+
+    # Fetch everything that changed since the last sync in one call
+    batch = client.sync_credentials(since=previous.watermark)
 """
 
 from __future__ import annotations
@@ -198,6 +201,36 @@ def from_dict(cls, data: dict[str, Any]) -> AdenIntegrationInfo:
         )
 
 
+@dataclass
+class AdenSyncResponse:
+    """Response from the bulk sync endpoint."""
+
+    credentials: list[AdenCredentialResponse]
+    """Credentials created or changed since the requested watermark."""
+
+    removed: list[str] = field(default_factory=list)
+    """Integration IDs deleted or deactivated since the requested watermark."""
+
+    watermark: str | None = None
+    """Opaque cursor to pass as ``since`` on the next sync."""
+
+    full: bool = False
+    """True when the response is a full snapshot rather than a delta (no or
+    expired watermark); integrations missing from it no longer exist."""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AdenSyncResponse:
+        """Create from API response dictionary."""
+        return cls(
+            credentials=[
+                AdenCredentialResponse.from_dict(item) for item in data.get("credentials", [])
+            ],
+            removed=list(data.get("removed", [])),
+            watermark=data.get("watermark"),
+            full=bool(data.get("full", False)),
+        )
+
+
 class AdenCredentialClient:
     """
     HTTP client for Aden credential server.
@@ -391,6 +424,28 @@ def list_integrations(self) -> list[AdenIntegrationInfo]:
         data = response.json()
         return [AdenIntegrationInfo.from_dict(item) for item in data.get("integrations", [])]
 
+    def sync_credentials(self, since: str | None = None) -> AdenSyncResponse:
+        """
+        Fetch every credential changed since a watermark in one request.
+
+        Without ``since`` (or when the server no longer knows the watermark)
+        the response is a full snapshot of all active integrations.
+
+        Args:
+            since: Watermark from the previous AdenSyncResponse.
+
+        Returns:
+            Changed credentials, removed integration IDs and the new watermark.
+
+        Raises:
+            AdenNotFoundError: If the server has no bulk sync endpoint.
+            AdenAuthenticationError: If API key is invalid.
+            AdenClientError: For connection failures.
+        """
+        params = {"since": since} if since else None
+        response = self._request_with_retry("GET", "/v1/credentials/sync", params=params)
+        return AdenSyncResponse.from_dict(response.json())
+
     def validate_token(self, integration_id: str) -> dict[str, Any]:
         """
         Check if a token is still valid without fetching it.
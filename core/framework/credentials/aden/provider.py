@@ -50,7 +50,9 @@
     AdenClientError,
     AdenCredentialClient,
     AdenCredentialResponse,
+    AdenNotFoundError,
     AdenRefreshError,
+    AdenSyncResponse,
 )
 
 if TYPE_CHECKING:
@@ -278,12 +280,34 @@ def fetch_from_aden(self, integration_id: str) -> CredentialObject | None:
 
         return self._aden_response_to_credential(aden_response)
 
+    def fetch_changed_from_aden(
+        self, since: str | None = None
+    ) -> tuple[list[CredentialObject], AdenSyncResponse]:
+        """
+        Fetch every credential changed since a watermark in one request.
+
+        Args:
+            since: Watermark from the previous sync, or None for a full snapshot.
+
+        Returns:
+            (changed credentials, raw sync response with removals and watermark)
+
+        Raises:
+            AdenNotFoundError: If the server has no bulk sync endpoint.
+            AdenClientError: For connection failures.
+        """
+        response = self._client.sync_credentials(since=since)
+        credentials = [self._aden_response_to_credential(item) for item in response.credentials]
+        return credentials, response
+
     def sync_all(self, store: CredentialStore) -> int:
         """
         Sync all credentials from Aden server to local store.
 
-        Fetches the list of available integrations from Aden and
-        populates the local credential store with current tokens.
+        Fetches a snapshot of all active integrations from the bulk sync
+        endpoint and populates the local credential store with current
+        tokens.  Servers without that endpoint are synced one integration
+        at a time.
 
         Args:
             store: The credential store to populate.
@@ -291,6 +315,21 @@ def sync_all(self, store: CredentialStore) -> int:
         Returns:
             Number of credentials synced.
         """
+        try:
+            credentials, _ = self.fetch_changed_from_aden()
+        except AdenNotFoundError:
+            return self._sync_each(store)
+        except AdenClientError as e:
+            logger.error(f"Failed to sync credentials from Aden: {e}")
+            return 0
+
+        for cred in credentials:
+            store.save_credential(cred)
+        logger.info(f"Synced {len(credentials)} credentials from Aden")
+        return len(credentials)
+
+    def _sync_each(self, store: CredentialStore) -> int:
+        """Sync integrations one request at a time (servers without bulk sync)."""
         synced = 0
 
         try:
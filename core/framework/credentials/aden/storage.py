@@ -39,15 +39,22 @@
     # Credentials automatically fetched from Aden on first access
     # Cached locally for 5 minutes
     # Falls back to cache if Aden is unreachable
+
+    # Or keep the local cache current in the background, so load()
+    # never waits on the network
+    storage.start_background_sync(interval_seconds=60)
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from ..storage import CredentialStorage
+from .client import AdenNotFoundError
 
 if TYPE_CHECKING:
     from ..models import CredentialObject
@@ -66,6 +73,9 @@ class AdenCachedStorage(CredentialStorage):
     - **Offline resilience**: Uses cached credentials when Aden is unreachable
     - **Provider-based lookup**: Match credentials by provider name (e.g., "hubspot")
       when direct ID lookup fails, since Aden uses hash-based IDs internally.
+    - **Delta sync**: sync_changes_from_aden() fetches everything changed since the
+      last sync in one request; start_background_sync() runs it on an interval and
+      makes load() serve from the local cache only.
 
     The cache TTL determines how long to trust local credentials before
     checking with the Aden server for updates. This balances:
@@ -117,6 +127,14 @@ def __init__(
         # Index: provider name (e.g., "hubspot") -> credential hash ID
         self._provider_index: dict[str, str] = {}
 
+        # Delta sync state
+        self._sync_lock = threading.Lock()
+        self._watermark: str | None = None
+        self._synced_ids: set[str] = set()
+        self._last_sync: datetime | None = None
+        self._sync_thread: threading.Thread | None = None
+        self._sync_stop = threading.Event()
+
     def save(self, credential: CredentialObject) -> None:
         """
         Save credential to local cache and update provider index.
@@ -184,6 +202,10 @@ def _load_by_id(self, credential_id: str) -> CredentialObject | None:
         """
         local_cred = self._local.load(credential_id)
 
+        # The background sync keeps the local cache current
+        if self.background_sync_running:
+            return local_cred
+
         # If we prefer local and have a fresh cache, use it
         if self._prefer_local and local_cred and self._is_cache_fresh(credential_id):
             logger.debug(f"Using cached credential '{credential_id}'")
@@ -328,12 +350,24 @@ def sync_all_from_aden(self) -> int:
         """
         Sync all credentials from Aden server to local cache.
 
-        Fetches the list of available integrations from Aden and
-        updates the local cache with current tokens.
+        Fetches a full snapshot from the bulk sync endpoint, falling back
+        to one request per integration on servers without it.
 
         Returns:
             Number of credentials synced.
         """
+        with self._sync_lock:
+            self._watermark = None
+        try:
+            return self.sync_changes_from_aden(raise_errors=True)
+        except AdenNotFoundError:
+            return self._sync_each_from_aden()
+        except Exception as e:
+            logger.error(f"Failed to sync credentials from Aden: {e}")
+            return 0
+
+    def _sync_each_from_aden(self) -> int:
+        """Sync integrations one request at a time (servers without bulk sync)."""
         synced = 0
 
         try:
@@ -360,6 +394,126 @@ def sync_all_from_aden(self) -> int:
 
         return synced
 
+    def sync_changes_from_aden(
+        self,
+        raise_errors: bool = False,
+        on_change: Callable[[list[str]], None] | None = None,
+    ) -> int:
+        """
+        Apply every change since the last sync, fetched in one request.
+
+        The first call (or any call after the server forgot the watermark)
+        receives a full snapshot; credentials synced earlier that are
+        missing from it are removed locally.  After a successful sync every
+        synced credential counts as fresh, so load() does not re-fetch them
+        until the cache TTL passes again.
+
+        Args:
+            raise_errors: Raise client errors instead of logging them.
+            on_change: Called with the IDs and provider names of credentials
+                that were updated or removed (e.g. to drop them from a
+                CredentialStore's in-memory cache).
+
+        Returns:
+            Number of credentials updated.
+        """
+        with self._sync_lock:
+            try:
+                credentials, response = self._aden_provider.fetch_changed_from_aden(self._watermark)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.warning(f"Delta sync from Aden failed: {e}")
+                return 0
+
+            received = {cred.id for cred in credentials}
+            removed = set(response.removed)
+            if response.full:
+                removed |= self._synced_ids - received
+
+            changed: list[str] = []
+            for cred_id in removed - received:
+                for name, indexed_id in list(self._provider_index.items()):
+                    if indexed_id == cred_id:
+                        del self._provider_index[name]
+                        changed.append(name)
+                self.delete(cred_id)
+                self._synced_ids.discard(cred_id)
+                changed.append(cred_id)
+            for cred in credentials:
+                self.save(cred)
+                changed.append(cred.id)
+                type_key = cred.keys.get("_integration_type")
+                if type_key is not None:
+                    changed.append(type_key.value.get_secret_value())
+
+            now = datetime.now(UTC)
+            self._synced_ids |= received
+            for cred_id in self._synced_ids:
+                self._cache_timestamps[cred_id] = now
+            self._watermark = response.watermark
+            self._last_sync = now
+
+        if credentials or removed:
+            logger.info(f"Delta sync from Aden: {len(credentials)} updated, {len(removed)} removed")
+        if on_change is not None and changed:
+            on_change(list(dict.fromkeys(changed)))
+        return len(credentials)
+
+    def start_background_sync(
+        self,
+        interval_seconds: float = 60.0,
+        initial_sync: bool = True,
+        on_change: Callable[[list[str]], None] | None = None,
+    ) -> None:
+        """
+        Keep the local cache current with a background delta sync.
+
+        While the sync runs, load() answers from the local cache only and
+        never blocks on the Aden server.
+
+        Args:
+            interval_seconds: Delay between delta syncs.
+            initial_sync: Run a full sync before returning, so the cache is
+                populated before the first load().
+            on_change: Passed to sync_changes_from_aden().
+        """
+        if self.background_sync_running:
+            return
+        if initial_sync:
+            self.sync_all_from_aden()
+
+        self._sync_stop.clear()
+
+        def run() -> None:
+            while not self._sync_stop.wait(interval_seconds):
+                try:
+                    self.sync_changes_from_aden(raise_errors=True, on_change=on_change)
+                except AdenNotFoundError:
+                    self._sync_each_from_aden()
+                except Exception as e:
+                    logger.warning(f"Background Aden sync failed: {e}")
+
+        self._sync_thread = threading.Thread(target=run, name="aden-credential-sync", daemon=True)
+        self._sync_thread.start()
+
+    def stop_background_sync(self, timeout: float | None = 5.0) -> None:
+        """Stop the background sync; load() falls back to on-demand fetches."""
+        self._sync_stop.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join(timeout)
+            self._sync_thread = None
+
+    @property
+    def background_sync_running(self) -> bool:
+        """Whether the background delta sync is active."""
+        return self._sync_thread is not None and self._sync_thread.is_alive()
+
+    @property
+    def last_sync(self) -> datetime | None:
+        """When the last successful delta sync finished."""
+        return self._last_sync
+
     def get_cache_info(self) -> dict[str, dict]:
         """
         Get cache status information for all credentials.
@@ -7,8 +7,13 @@
 - AdenCachedStorage: Storage with local cache + Aden fallback
 """
 
+import json
+import threading
+import time
 from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from pydantic import SecretStr
@@ -27,8 +32,10 @@
     AdenCredentialClient,
     AdenCredentialResponse,
     AdenIntegrationInfo,
+    AdenNotFoundError,
     AdenRefreshError,
     AdenSyncProvider,
+    AdenSyncResponse,
 )
 
 # =============================================================================
@@ -54,6 +61,8 @@ def mock_client(aden_config):
     """Create a mock Aden client."""
     client = Mock(spec=AdenCredentialClient)
     client.config = aden_config
+    # Behave like a server without the bulk sync endpoint unless a test opts in
+    client.sync_credentials.side_effect = AdenNotFoundError("Integration not found: /sync")
     return client
 
 
@@ -811,3 +820,237 @@ def test_cached_storage_with_store(self, mock_client, aden_response):
         cred2 = cached_storage.load("hubspot")
         assert cred2 is not None
         mock_client.get_credential.assert_not_called()
+
+
+# =============================================================================
+# Bulk / Delta Sync Tests
+# =============================================================================
+
+
+class _FakeAdenServer:
+    """Local stand-in for the Aden credential API, versioned for delta sync."""
+
+    def __init__(self):
+        self.version = 0
+        self.credentials: dict[str, tuple[int, dict]] = {}
+        self.removed: dict[str, int] = {}
+        self.forget_watermarks = False
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                with fake._lock:
+                    fake.requests.append(url.path)
+                    if url.path == "/v1/credentials/sync":
+                        since = parse_qs(url.query).get("since", [None])[0]
+                        body = fake._sync(since)
+                    elif url.path.startswith("/v1/credentials/"):
+                        entry = fake.credentials.get(url.path.rsplit("/", 1)[1])
+                        body = entry[1] if entry else None
+                    else:
+                        body = None
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def put(self, integration_id: str, token: str) -> None:
+        with self._lock:
+            self.version += 1
+            self.removed.pop(integration_id, None)
+            self.credentials[integration_id] = (
+                self.version,
+                {
+                    "integration_id": integration_id,
+                    "integration_type": integration_id,
+                    "access_token": token,
+                    "expires_at": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+                },
+            )
+
+    def remove(self, integration_id: str) -> None:
+        with self._lock:
+            self.version += 1
+            self.credentials.pop(integration_id, None)
+            self.removed[integration_id] = self.version
+
+    def _sync(self, since: str | None) -> dict:
+        full = since is None or self.forget_watermarks
+        floor = 0 if full else int(since)
+        return {
+            "credentials": [data for ver, data in self.credentials.values() if ver > floor],
+            "removed": [] if full else [i for i, ver in self.removed.items() if ver > floor],
+            "watermark": str(self.version),
+            "full": full,
+        }
+
+    def count(self, path: str) -> int:
+        with self._lock:
+            return self.requests.count(path)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def aden_server():
+    server = _FakeAdenServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def live_storage(aden_server):
+    client = AdenCredentialClient(
+        AdenClientConfig(base_url=aden_server.base_url, api_key="test-key", retry_attempts=1)
+    )
+    storage = AdenCachedStorage(
+        local_storage=InMemoryStorage(),
+        aden_provider=AdenSyncProvider(client=client),
+        cache_ttl_seconds=300,
+    )
+    yield storage
+    storage.stop_background_sync()
+    client.close()
+
+
+def _token(storage: AdenCachedStorage, credential_id: str) -> str | None:
+    cred = storage.load(credential_id)
+    return cred.keys["access_token"].value.get_secret_value() if cred else None
+
+
+class TestAdenDeltaSync:
+    """Tests for the bulk sync endpoint and AdenCachedStorage delta sync."""
+
+    def test_sync_credentials_full_then_delta(self, aden_server):
+        aden_server.put("hubspot", "hub-1")
+        aden_server.put("github", "gh-1")
+        client = AdenCredentialClient(
+            AdenClientConfig(base_url=aden_server.base_url, api_key="test-key")
+        )
+
+        first = client.sync_credentials()
+        aden_server.put("github", "gh-2")
+        aden_server.remove("hubspot")
+        second = client.sync_credentials(since=first.watermark)
+        client.close()
+
+        assert first.full is True
+        assert sorted(c.integration_id for c in first.credentials) == ["github", "hubspot"]
+        assert second.full is False
+        assert [c.access_token for c in second.credentials] == ["gh-2"]
+        assert second.removed == ["hubspot"]
+
+    def test_sync_response_from_dict(self):
+        response = AdenSyncResponse.from_dict(
+            {
+                "credentials": [{"integration_id": "slack", "access_token": "t"}],
+                "removed": ["old"],
+                "watermark": "42",
+            }
+        )
+
+        assert response.credentials[0].integration_id == "slack"
+        assert response.removed == ["old"]
+        assert response.watermark == "42"
+        assert response.full is False
+
+    def test_sync_all_from_aden_uses_one_request(self, aden_server, live_storage):
+        for i in range(15):
+            aden_server.put(f"integration_{i}", f"token-{i}")
+
+        synced = live_storage.sync_all_from_aden()
+
+        assert synced == 15
+        assert aden_server.requests == ["/v1/credentials/sync"]
+        assert _token(live_storage, "integration_7") == "token-7"
+        # Freshly synced credentials are served without another request
+        assert len(aden_server.requests) == 1
+
+    def test_delta_sync_applies_changes_and_removals(self, aden_server, live_storage):
+        aden_server.put("hubspot", "hub-1")
+        aden_server.put("github", "gh-1")
+        live_storage.sync_all_from_aden()
+
+        aden_server.put("hubspot", "hub-2")
+        aden_server.remove("github")
+        changed: list[str] = []
+        updated = live_storage.sync_changes_from_aden(on_change=changed.extend)
+
+        assert updated == 1
+        assert _token(live_storage, "hubspot") == "hub-2"
+        assert live_storage._local.load("github") is None
+        assert set(changed) == {"hubspot", "github"}
+
+    def test_full_snapshot_drops_missing_credentials(self, aden_server, live_storage):
+        aden_server.put("hubspot", "hub-1")
+        aden_server.put("github", "gh-1")
+        live_storage.sync_all_from_aden()
+
+        aden_server.remove("github")
+        aden_server.forget_watermarks = True
+        live_storage.sync_changes_from_aden()
+
+        assert live_storage._local.load("github") is None
+        assert live_storage._local.load("hubspot") is not None
+
+    def test_sync_error_keeps_local_cache(self, aden_server, live_storage):
+        aden_server.put("hubspot", "hub-1")
+        live_storage.sync_all_from_aden()
+        aden_server.close()
+
+        assert live_storage.sync_changes_from_aden() == 0
+        assert live_storage._local.load("hubspot") is not None
+
+    def test_background_sync_keeps_load_off_the_network(self, aden_server, live_storage):
+        aden_server.put("hubspot", "hub-1")
+        live_storage.start_background_sync(interval_seconds=0.05)
+        assert live_storage.background_sync_running
+        assert _token(live_storage, "hubspot") == "hub-1"
+
+        aden_server.put("hubspot", "hub-2")
+        deadline = time.monotonic() + 5
+        while _token(live_storage, "hubspot") != "hub-2" and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert _token(live_storage, "hubspot") == "hub-2"
+        # Unknown credentials are not looked up on the request path either
+        assert live_storage.load("missing") is None
+        assert aden_server.count("/v1/credentials/hubspot") == 0
+        assert aden_server.count("/v1/credentials/missing") == 0
+
+        live_storage.stop_background_sync()
+        assert not live_storage.background_sync_running
+
+    def test_provider_sync_all_uses_bulk_endpoint(self, provider, mock_client, aden_response):
+        mock_client.sync_credentials.side_effect = None
+        mock_client.sync_credentials.return_value = AdenSyncResponse(
+            credentials=[aden_response], watermark="1", full=True
+        )
+
+        store = CredentialStore(storage=InMemoryStorage())
+        synced = provider.sync_all(store)
+
+        assert synced == 1
+        assert store.get_credential("hubspot") is not None
+        mock_client.list_integrations.assert_not_called()
+        mock_client.get_credential.assert_not_called()
@@ -0,0 +1,339 @@
+"""
+Background refresh of expiring credentials.
+
+Without a scheduler, tokens are refreshed lazily: the first lookup after a
+token enters its provider's refresh window pays for the OAuth round-trip.
+TokenRefreshScheduler watches every credential the store caches that has
+an expiring ``access_token`` and a provider able to refresh it (OAuth2 and
+Aden-synced credentials), and refreshes it ahead of expiry on a small
+thread pool, so request-path lookups find a fresh token in the cache.
+
+- Refreshes are scheduled ``lead_time`` before expiry (at most half the
+  remaining lifetime for short-lived tokens), minus a random jitter so
+  tokens issued together are not refreshed in one burst.
+- At most ``max_concurrency`` refreshes run at once.  They go through
+  ``CredentialStore.refresh_credential``, so they share the store's
+  single-flight refresh with request-path callers.
+- A refresh counts as failed when it raises or does not extend the
+  token's expiry; failures are retried with capped exponential backoff.
+- Every attempt is logged, counted in :meth:`TokenRefreshScheduler.stats`
+  and passed to the optional ``on_event`` callback.
+
+Usage:
+    store = CredentialStore.with_aden_sync()
+    scheduler = store.start_refresh_scheduler()
+    ...
+    store.stop_refresh_scheduler()
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .models import CredentialObject
+
+if TYPE_CHECKING:
+    from .store import CredentialStore
+
+logger = logging.getLogger(__name__)
+
+
+def _access_token_expiry(credential: CredentialObject | None) -> datetime | None:
+    if credential is None:
+        return None
+    key = credential.keys.get("access_token")
+    return key.expires_at if key is not None else None
+
+
+class TokenRefreshScheduler:
+    """
+    Refreshes cached credentials ahead of their access token's expiry.
+
+    Usually created through CredentialStore.start_refresh_scheduler(), which
+    also makes the store report every cached credential to track().
+    """
+
+    def __init__(
+        self,
+        store: CredentialStore,
+        lead_time: timedelta = timedelta(minutes=10),
+        jitter: timedelta = timedelta(minutes=2),
+        max_concurrency: int = 4,
+        min_interval: timedelta = timedelta(seconds=30),
+        backoff_base: timedelta = timedelta(seconds=30),
+        backoff_max: timedelta = timedelta(minutes=15),
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            store: Credential store whose credentials are refreshed
+            lead_time: How long before expiry to refresh. Keep this larger than
+                the providers' refresh buffer (5 minutes by default) so lookups
+                never see a token that needs refreshing.
+            jitter: Maximum random amount subtracted from each refresh time
+            max_concurrency: Maximum number of refreshes running at once
+            min_interval: Minimum delay between two refreshes of one credential
+            backoff_base: Delay before retrying a failed refresh, doubled per failure
+            backoff_max: Cap on the retry delay
+            on_event: Called with a dict for every refresh attempt
+        """
+        self._store = store
+        self._lead_time = lead_time
+        self._jitter = jitter
+        self._min_interval = min_interval
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._on_event = on_event
+        self._max_concurrency = max_concurrency
+
+        self._cond = threading.Condition()
+        # (due timestamp, sequence, credential_id); stale entries are skipped
+        self._heap: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}
+        self._expiry: dict[str, datetime] = {}
+        self._failures: dict[str, int] = {}
+        self._last_error: dict[str, str] = {}
+        self._inflight: set[str] = set()
+        self._seq = 0
+
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._refresh_seconds = 0.0
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    # --- Tracking ---
+
+    def track(self, credential: CredentialObject) -> None:
+        """
+        Schedule a refresh for *credential* if it has an expiring access token
+        and a provider that can refresh it. Re-tracking reschedules.
+        """
+        expires_at = _access_token_expiry(credential)
+        if expires_at is None or not credential.auto_refresh:
+            self.untrack(credential.id)
+            return
+        if self._store.get_provider_for_credential(credential) is None:
+            return
+
+        now = datetime.now(UTC)
+        remaining = expires_at - now
+        lead = min(self._lead_time, max(remaining / 2, timedelta(0)))
+        jitter = self._jitter.total_seconds() * random.random()
+        due = expires_at - lead - timedelta(seconds=jitter)
+        due = max(due, now + self._min_interval if remaining > self._min_interval else now)
+
+        with self._cond:
+            if self._expiry.get(credential.id) == expires_at and credential.id in self._due:
+                return  # Already scheduled for this token
+            self._expiry[credential.id] = expires_at
+            self._failures.pop(credential.id, None)
+            self._schedule(credential.id, due.timestamp())
+
+    def untrack(self, credential_id: str) -> None:
+        """Stop refreshing a credential."""
+        with self._cond:
+            self._due.pop(credential_id, None)
+            self._expiry.pop(credential_id, None)
+            self._failures.pop(credential_id, None)
+
+    def tracked(self) -> dict[str, datetime]:
+        """Credential IDs mapped to their next scheduled refresh time."""
+        with self._cond:
+            return {cred_id: datetime.fromtimestamp(due, UTC) for cred_id, due in self._due.items()}
+
+    def _schedule(self, credential_id: str, due: float) -> None:
+        """Caller holds self._cond."""
+        self._seq += 1
+        self._due[credential_id] = due
+        heapq.heappush(self._heap, (due, self._seq, credential_id))
+        self._cond.notify()
+
+    def _take_due(self, now: float) -> list[str]:
+        """Pop credentials whose refresh is due. Caller holds self._cond."""
+        ready = []
+        busy = []
+        while self._heap and self._heap[0][0] <= now:
+            due, _, cred_id = heapq.heappop(self._heap)
+            if self._due.get(cred_id) != due:
+                continue  # Rescheduled or untracked
+            if cred_id in self._inflight:
+                busy.append(cred_id)
+                continue
+            del self._due[cred_id]
+            self._inflight.add(cred_id)
+            ready.append(cred_id)
+        for cred_id in busy:
+            self._schedule(cred_id, now + 1.0)  # Retry once the running refresh ends
+        return ready
+
+    # --- Refreshing ---
+
+    def _refresh(self, credential_id: str) -> None:
+        with self._cond:
+            old_expiry = self._expiry.get(credential_id)
+            attempt = self._failures.get(credential_id, 0) + 1
+
+        started = time.monotonic()
+        error = None
+        refreshed = None
+        new_expiry = None
+        try:
+            refreshed = self._store.refresh_credential(credential_id)
+            if refreshed is None:
+                self.untrack(credential_id)
+                return
+            new_expiry = _access_token_expiry(refreshed)
+            if new_expiry is None or (old_expiry is not None and new_expiry <= old_expiry):
+                error = "refresh did not extend the token expiry"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        finally:
+            with self._cond:
+                self._inflight.discard(credential_id)
+        duration = time.monotonic() - started
+
+        with self._cond:
+            self._refresh_seconds += duration
+            if error is None:
+                self._refreshes += 1
+                self._last_error.pop(credential_id, None)
+            else:
+                self._refresh_failures += 1
+                self._failures[credential_id] = attempt
+                self._last_error[credential_id] = error
+                if credential_id in self._expiry:
+                    delay = min(
+                        self._backoff_base.total_seconds() * 2 ** (attempt - 1),
+                        self._backoff_max.total_seconds(),
+                    )
+                    delay *= 0.5 + random.random() / 2
+                    self._schedule(credential_id, time.time() + delay)
+
+        if error is None:
+            logger.info(f"Proactively refreshed credential '{credential_id}' in {duration:.2f}s")
+            # Usually already tracked via the store's cache hook
+            if refreshed is not None:
+                self.track(refreshed)
+        else:
+            logger.warning(
+                f"Background refresh of '{credential_id}' failed (attempt {attempt}): {error}"
+            )
+        self._emit(
+            {
+                "type": "refresh_succeeded" if error is None else "refresh_failed",
+                "credential_id": credential_id,
+                "attempt": attempt,
+                "duration_seconds": duration,
+                "expires_at": new_expiry,
+                "error": error,
+            }
+        )
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self._on_event is None:
+            return
+        try:
+            self._on_event(event)
+        except Exception as e:
+            logger.warning(f"Refresh event callback failed: {e}")
+
+    def run_due(self) -> int:
+        """
+        Run every refresh that is due now and wait for them to finish.
+
+        Returns:
+            Number of refreshes attempted
+        """
+        with self._cond:
+            ready = self._take_due(time.time())
+        if not ready:
+            return 0
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as pool:
+            list(pool.map(self._refresh, ready))
+        return len(ready)
+
+    # --- Background thread ---
+
+    def start(self) -> None:
+        """Start the background thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="credential-refresh"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="credential-refresh-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the background thread and wait for running refreshes."""
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            with self._cond:
+                ready = self._take_due(time.time())
+                if not ready:
+                    timeout = self._heap[0][0] - time.time() if self._heap else None
+                    self._cond.wait(timeout if timeout is None else max(timeout, 0.01))
+                    continue
+            executor = self._executor
+            if executor is None:
+                return
+            for cred_id in ready:
+                future: Future = executor.submit(self._refresh, cred_id)
+                future.add_done_callback(self._log_crash)
+
+    @staticmethod
+    def _log_crash(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Credential refresh task crashed: {future.exception()}")
+
+    # --- Metrics ---
+
+    def stats(self) -> dict[str, Any]:
+        """Refresh counters and per-credential state."""
+        with self._cond:
+            next_due = min(self._due.values(), default=None)
+            return {
+                "tracked": len(self._due) + len(self._inflight),
+                "in_flight": len(self._inflight),
+                "refreshes": self._refreshes,
+                "failures": self._refresh_failures,
+                "refresh_seconds_total": self._refresh_seconds,
+                "next_refresh_at": (
+                    datetime.fromtimestamp(next_due, UTC) if next_due is not None else None
+                ),
+                "failing": {
+                    cred_id: {"attempts": self._failures[cred_id], "error": error}
+                    for cred_id, error in self._last_error.items()
+                    if cred_id in self._failures
+                },
+            }
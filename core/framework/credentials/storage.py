@@ -13,6 +13,8 @@
 import json
 import logging
 import os
+import threading
+import uuid
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from pathlib import Path
@@ -20,6 +22,7 @@
 
 from pydantic import SecretStr
 
+from ..utils.io import file_lock
 from .models import CredentialDecryptionError, CredentialKey, CredentialObject, CredentialType
 
 logger = logging.getLogger(__name__)
@@ -56,6 +59,26 @@ def load(self, credential_id: str) -> CredentialObject | None:
         """
         pass
 
+    def load_many(self, credential_ids: list[str]) -> dict[str, CredentialObject]:
+        """
+        Load several credentials at once.
+
+        The default implementation calls load() for each ID; backends override
+        it when a batch can be served more cheaply.
+
+        Args:
+            credential_ids: The IDs of the credentials to load
+
+        Returns:
+            Dict of credential_id -> CredentialObject for the IDs that were found
+        """
+        result = {}
+        for credential_id in credential_ids:
+            credential = self.load(credential_id)
+            if credential is not None:
+                result[credential_id] = credential
+        return result
+
     @abstractmethod
     def delete(self, credential_id: str) -> bool:
         """
@@ -105,7 +128,13 @@ class EncryptedFileStorage(CredentialStorage):
             credentials/
                 {credential_id}.enc   # Encrypted credential JSON
             metadata/
-                index.json            # Index of all credentials (unencrypted)
+                index.jsonl           # Append-only index journal (unencrypted)
+                index.lock            # Serialises journal writes across processes
+                index.json            # Legacy index, read once and migrated
+
+    Decrypted credentials are cached in memory and reused until the file's
+    mtime or size changes, so repeated loads skip disk reads and decryption.
+    Loads return copies, so callers may modify them freely.
 
     The encryption key is read from the HIVE_CREDENTIAL_KEY environment variable.
     If not set, a new key is generated (and must be persisted for data recovery).
@@ -117,6 +146,8 @@ class EncryptedFileStorage(CredentialStorage):
     """
 
     DEFAULT_PATH = "~/.hive/credentials"
+    # Rewrite the index journal once it has this many more lines than entries
+    INDEX_COMPACT_SLACK = 256
 
     def __init__(
         self,
@@ -161,6 +192,17 @@ def __init__(
 
         self._fernet = Fernet(self._key)
 
+        # credential_id -> (mtime_ns, size, decrypted credential)
+        self._cache: dict[str, tuple[int, int, CredentialObject]] = {}
+        self._index_lock = threading.Lock()
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._index_lines = 0  # journal lines replayed into self._index
+        self._journal_pos = 0
+        # First line of the journal replayed into self._index. Compaction
+        # starts the new journal with a unique header, so a changed first
+        # line means the journal was replaced (inode numbers can repeat).
+        self._journal_generation: bytes | None = None
+
     def _ensure_dirs(self) -> None:
         """Create directory structure."""
         (self.base_path / "credentials").mkdir(parents=True, exist_ok=True)
@@ -185,17 +227,30 @@ def save(self, credential: CredentialObject) -> None:
         cred_path = self._cred_path(credential.id)
         with open(cred_path, "wb") as f:
             f.write(encrypted)
+        st = cred_path.stat()
+        self._cache[credential.id] = (
+            st.st_mtime_ns,
+            st.st_size,
+            credential.model_copy(deep=True),
+        )
 
         # Update index
         self._update_index(credential.id, "save", credential.credential_type.value)
         logger.debug(f"Saved encrypted credential '{credential.id}'")
 
     def load(self, credential_id: str) -> CredentialObject | None:
-        """Load and decrypt credential."""
+        """Load and decrypt credential, reusing the cached copy if the file is unchanged."""
         cred_path = self._cred_path(credential_id)
-        if not cred_path.exists():
+        try:
+            st = cred_path.stat()
+        except FileNotFoundError:
+            self._cache.pop(credential_id, None)
             return None
 
+        cached = self._cache.get(credential_id)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2].model_copy(deep=True)
+
         # Read encrypted data
         with open(cred_path, "rb") as f:
             encrypted = f.read()
@@ -210,10 +265,22 @@ def load(self, credential_id: str) -> CredentialObject | None:
             ) from e
 
         # Deserialize
-        return self._deserialize_credential(data)
+        credential = self._deserialize_credential(data)
+        self._cache[credential_id] = (st.st_mtime_ns, st.st_size, credential)
+        return credential.model_copy(deep=True)
+
+    def load_many(self, credential_ids: list[str]) -> dict[str, CredentialObject]:
+        """Load several credentials, decrypting only those not cached or changed on disk."""
+        result = {}
+        for credential_id in dict.fromkeys(credential_ids):
+            credential = self.load(credential_id)
+            if credential is not None:
+                result[credential_id] = credential
+        return result
 
     def delete(self, credential_id: str) -> bool:
         """Delete a credential file."""
+        self._cache.pop(credential_id, None)
         cred_path = self._cred_path(credential_id)
         if cred_path.exists():
             cred_path.unlink()
@@ -224,17 +291,17 @@ def delete(self, credential_id: str) -> bool:
 
     def list_all(self) -> list[str]:
         """List all credential IDs."""
-        index_path = self.base_path / "metadata" / "index.json"
-        if not index_path.exists():
-            return []
-        with open(index_path) as f:
-            index = json.load(f)
-        return list(index.get("credentials", {}).keys())
+        with self._index_lock:
+            return list(self._load_index())
 
     def exists(self, credential_id: str) -> bool:
         """Check if credential exists."""
         return self._cred_path(credential_id).exists()
 
+    def clear_cache(self) -> None:
+        """Drop all decrypted credentials held in memory."""
+        self._cache.clear()
+
     def _serialize_credential(self, credential: CredentialObject) -> dict[str, Any]:
         """Convert credential to JSON-serializable dict, extracting secret values."""
         data = credential.model_dump(mode="json")
@@ -258,33 +325,122 @@ def _deserialize_credential(self, data: dict[str, Any]) -> CredentialObject:
 
         return CredentialObject.model_validate(data)
 
+    # --- Index ---
+
+    def _journal_path(self) -> Path:
+        return self.base_path / "metadata" / "index.jsonl"
+
+    def _legacy_index_path(self) -> Path:
+        return self.base_path / "metadata" / "index.json"
+
+    def _index_lock_path(self) -> Path:
+        return self.base_path / "metadata" / "index.lock"
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """
+        Bring the in-memory index up to date with the journal and return it.
+
+        Only lines appended since the last call are read. A legacy index.json
+        is used as the starting point when the journal is (re)read from the
+        start. Caller holds self._index_lock.
+        """
+        try:
+            f = open(self._journal_path(), "rb")
+        except FileNotFoundError:
+            f = None
+        try:
+            # Size and header come from the handle read below: a compaction in
+            # another process may replace the file at any moment.
+            size = os.fstat(f.fileno()).st_size if f else 0
+            first = f.readline() if f else b""
+            generation = first if first.endswith(b"\n") else b""
+
+            if (
+                self._index is None
+                or generation != self._journal_generation
+                or size < self._journal_pos
+            ):
+                # First read, or the journal was compacted/replaced
+                self._index = self._read_legacy_index()
+                self._index_lines = 0
+                self._journal_pos = 0
+                self._journal_generation = generation
+
+            if f and size > self._journal_pos:
+                f.seek(self._journal_pos)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Partially written line, read it next time
+                    self._journal_pos += len(raw)
+                    try:
+                        entry = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if entry.get("op") == "compact":
+                        continue  # Header written by _compact_index
+                    self._index_lines += 1
+                    if entry.get("op") == "delete":
+                        self._index.pop(entry["id"], None)
+                    else:
+                        self._index[entry["id"]] = {
+                            "updated_at": entry.get("updated_at"),
+                            "type": entry.get("type"),
+                        }
+        finally:
+            if f:
+                f.close()
+        return self._index
+
+    def _read_legacy_index(self) -> dict[str, dict[str, Any]]:
+        legacy = self._legacy_index_path()
+        if not legacy.exists():
+            return {}
+        try:
+            with open(legacy) as f:
+                return dict(json.load(f).get("credentials", {}))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable credential index {legacy}: {e}")
+            return {}
+
     def _update_index(
         self,
         credential_id: str,
         operation: str,
         credential_type: str | None = None,
     ) -> None:
-        """Update the metadata index."""
-        index_path = self.base_path / "metadata" / "index.json"
-
-        if index_path.exists():
-            with open(index_path) as f:
-                index = json.load(f)
-        else:
-            index = {"credentials": {}, "version": "1.0"}
-
+        """Record a save or delete by appending one line to the index journal."""
+        entry: dict[str, Any] = {"op": operation, "id": credential_id}
         if operation == "save":
-            index["credentials"][credential_id] = {
-                "updated_at": datetime.now(UTC).isoformat(),
-                "type": credential_type,
-            }
-        elif operation == "delete":
-            index["credentials"].pop(credential_id, None)
-
-        index["last_modified"] = datetime.now(UTC).isoformat()
-
-        with open(index_path, "w") as f:
-            json.dump(index, f, indent=2)
+            entry.update(updated_at=datetime.now(UTC).isoformat(), type=credential_type)
+
+        # The file lock keeps other processes from appending to a journal
+        # that a compaction is about to replace.
+        with self._index_lock, file_lock(self._index_lock_path()):
+            if self._legacy_index_path().exists():
+                # Migrate the legacy index into the journal on the first write
+                self._compact_index(self._load_index())
+            # Single append; the next _load_index() replays it with any lines
+            # other processes appended in the meantime.
+            with open(self._journal_path(), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            index = self._load_index()
+            if self._index_lines > len(index) + self.INDEX_COMPACT_SLACK:
+                self._compact_index(index)
+
+    def _compact_index(self, index: dict[str, dict[str, Any]]) -> None:
+        """Rewrite the journal with one line per live credential. Caller holds both locks."""
+        journal = self._journal_path()
+        tmp = journal.with_suffix(".tmp")
+        header = json.dumps({"op": "compact", "generation": uuid.uuid4().hex}) + "\n"
+        with open(tmp, "w") as f:
+            f.write(header)
+            for credential_id, info in index.items():
+                f.write(json.dumps({"op": "save", "id": credential_id, **info}) + "\n")
+        tmp.replace(journal)
+        self._legacy_index_path().unlink(missing_ok=True)
+        self._journal_generation = header.encode()
+        self._journal_pos = journal.stat().st_size
+        self._index_lines = len(index)
 
 
 class EnvVarStorage(CredentialStorage):
@@ -501,6 +657,16 @@ def load(self, credential_id: str) -> CredentialObject | None:
 
         return None
 
+    def load_many(self, credential_ids: list[str]) -> dict[str, CredentialObject]:
+        """Batch-load from primary, then fallbacks for the IDs still missing."""
+        result = self._primary.load_many(credential_ids)
+        for fallback in self._fallbacks:
+            missing = [cred_id for cred_id in credential_ids if cred_id not in result]
+            if not missing:
+                break
+            result.update(fallback.load_many(missing))
+        return result
+
     def delete(self, credential_id: str) -> bool:
         """Delete from primary storage only."""
         return self._primary.delete(credential_id)
@@ -7,14 +7,23 @@
 - Template resolution for {{cred.key}} patterns
 - Caching with TTL for performance
 - Thread-safe operations
+
+Locking: the store-wide lock only guards the in-memory cache and is never
+held across storage I/O or a provider refresh.  Loads are serialized per
+credential through a fixed set of striped locks, and refreshes are
+single-flight: the first caller refreshes while concurrent callers get the
+cached credential if none of its keys has expired yet, or wait for the
+refresh result otherwise.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import SecretStr
 
@@ -28,8 +37,21 @@
 from .storage import CredentialStorage, EnvVarStorage, InMemoryStorage
 from .template import TemplateResolver
 
+if TYPE_CHECKING:
+    from .refresh_scheduler import TokenRefreshScheduler
+
 logger = logging.getLogger(__name__)
 
+LOCK_STRIPES = 64
+
+
+@dataclass
+class _RefreshFlight:
+    """An in-progress refresh that concurrent callers can wait on."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: CredentialObject | None = None
+
 
 class CredentialStore:
     """
@@ -40,7 +62,7 @@ class CredentialStore:
     - Provider-based lifecycle management (refresh, validate)
     - Template resolution for {{cred.key}} patterns
     - Caching with TTL for performance
-    - Thread-safe operations
+    - Thread-safe operations with per-credential, single-flight refresh
 
     Usage:
         # Basic usage
@@ -89,8 +111,12 @@ def __init__(
         self._cache: dict[str, tuple[CredentialObject, datetime]] = {}
         self._cache_ttl = cache_ttl_seconds
         self._lock = threading.RLock()
+        # Per-credential load locks (striped) and in-flight refreshes
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._refreshing: dict[str, _RefreshFlight] = {}
 
         self._auto_refresh = auto_refresh
+        self._refresh_scheduler: TokenRefreshScheduler | None = None
 
         # Register providers
         for provider in providers or [StaticProvider()]:
@@ -189,26 +215,79 @@ def get_credential(
             CredentialObject or None if not found
         """
         with self._lock:
-            # Check cache
             cached = self._get_from_cache(credential_id)
-            if cached is not None:
-                if refresh_if_needed and self._should_refresh(cached):
-                    return self._refresh_credential(cached)
-                return cached
+        if cached is None:
+            with self._stripe(credential_id):
+                # Another caller may have loaded it while we waited
+                with self._lock:
+                    cached = self._get_from_cache(credential_id)
+                if cached is None:
+                    cached = self._storage.load(credential_id)
+                    if cached is None:
+                        return None
+                    self._add_to_cache(cached)
+
+        if refresh_if_needed and self._should_refresh(cached):
+            return self._refresh_once(cached, serve_stale=True)
+        return cached
+
+    def get_credentials(
+        self,
+        credential_ids: list[str],
+        refresh_if_needed: bool = True,
+    ) -> dict[str, CredentialObject]:
+        """
+        Get several credentials, loading cache misses in one storage batch.
 
-            # Load from storage
-            credential = self._storage.load(credential_id)
-            if credential is None:
-                return None
+        Args:
+            credential_ids: The credential identifiers
+            refresh_if_needed: If True, refresh expired credentials
 
-            # Refresh if needed
-            if refresh_if_needed and self._should_refresh(credential):
-                credential = self._refresh_credential(credential)
+        Returns:
+            Dict of credential_id -> CredentialObject for the IDs that were found
+        """
+        found: dict[str, CredentialObject] = {}
+        with self._lock:
+            for credential_id in credential_ids:
+                cached = self._get_from_cache(credential_id)
+                if cached is not None:
+                    found[credential_id] = cached
+
+        missing = [cred_id for cred_id in dict.fromkeys(credential_ids) if cred_id not in found]
+        if missing:
+            for credential_id, credential in self._storage.load_many(missing).items():
+                self._add_to_cache(credential)
+                found[credential_id] = credential
+
+        if refresh_if_needed:
+            for credential_id, credential in found.items():
+                if self._should_refresh(credential):
+                    found[credential_id] = self._refresh_once(credential, serve_stale=True)
+        return found
+
+    async def get_credential_async(
+        self,
+        credential_id: str,
+        refresh_if_needed: bool = True,
+    ) -> CredentialObject | None:
+        """
+        Async variant of get_credential().
 
-            # Cache
-            self._add_to_cache(credential)
+        Fresh cached credentials are returned without leaving the event loop;
+        storage loads and refreshes run in a worker thread.
 
-            return credential
+        Args:
+            credential_id: The credential identifier
+            refresh_if_needed: If True, refresh expired credentials
+
+        Returns:
+            CredentialObject or None if not found
+        """
+        with self._lock:
+            cached = self._get_from_cache(credential_id)
+        if cached is not None and not (refresh_if_needed and self._should_refresh(cached)):
+            return cached
+        return await asyncio.to_thread(self.get_credential, credential_id, refresh_if_needed)
 
     def get_key(self, credential_id: str, key_name: str) -> str | None:
         """
@@ -226,6 +305,22 @@ def get_key(self, credential_id: str, key_name: str) -> str | None:
             return None
         return credential.get_key(key_name)
 
+    async def get_key_async(self, credential_id: str, key_name: str) -> str | None:
+        """
+        Async variant of get_key().
+
+        Args:
+            credential_id: The credential identifier
+            key_name: The key within the credential
+
+        Returns:
+            The key value or None if not found
+        """
+        credential = await self.get_credential_async(credential_id)
+        if credential is None:
+            return None
+        return credential.get_key(key_name)
+
     def get(self, credential_id: str) -> str | None:
         """
         Legacy compatibility: get the primary key value.
@@ -346,6 +441,8 @@ def delete_credential(self, credential_id: str) -> bool:
         Returns:
             True if the credential existed and was deleted
         """
+        if self._refresh_scheduler is not None:
+            self._refresh_scheduler.untrack(credential_id)
         with self._lock:
             self._remove_from_cache(credential_id)
             result = self._storage.delete(credential_id)
@@ -492,7 +589,99 @@ def refresh_credential(self, credential_id: str) -> CredentialObject | None:
         if credential is None:
             return None
 
-        return self._refresh_credential(credential)
+        return self._refresh_once(credential, serve_stale=False)
+
+    def _stripe(self, credential_id: str) -> threading.Lock:
+        """Lock serializing storage loads of one credential."""
+        return self._stripes[hash(credential_id) % LOCK_STRIPES]
+
+    def _refresh_once(self, credential: CredentialObject, serve_stale: bool) -> CredentialObject:
+        """
+        Refresh a credential, coalescing concurrent refreshes of the same ID.
+
+        The first caller performs the refresh. Later callers wait for its
+        result, or with serve_stale return *credential* straight away when
+        none of its keys has expired yet. A caller that read *credential*
+        before an earlier refresh finished gets that refresh's result instead
+        of refreshing again: with rotating refresh tokens, refreshing the old
+        object would fail or overwrite the newer token.
+        """
+        with self._lock:
+            flight = self._refreshing.get(credential.id)
+            leader = flight is None
+            if leader:
+                flight = self._refreshing[credential.id] = _RefreshFlight()
+
+        if not leader:
+            if serve_stale and not credential.needs_refresh:
+                return credential
+            flight.done.wait()
+            return flight.result or credential
+
+        result = credential
+        try:
+            latest = self._latest(credential)
+            if serve_stale:
+                stale = self._should_refresh(latest)
+            else:
+                stale = latest == credential
+            result = self._refresh_credential(latest) if stale else latest
+            return result
+        finally:
+            flight.result = result
+            with self._lock:
+                self._refreshing.pop(credential.id, None)
+            flight.done.set()
+
+    def _latest(self, credential: CredentialObject) -> CredentialObject:
+        """The cached (or else stored) version of *credential*."""
+        with self._lock:
+            cached = self._get_from_cache(credential.id)
+        if cached is not None:
+            return cached
+        stored = self._storage.load(credential.id)
+        if stored is None or stored == credential:
+            return credential
+        self._add_to_cache(stored)
+        return stored
+
+    def start_refresh_scheduler(self, **kwargs: Any) -> TokenRefreshScheduler:
+        """
+        Start refreshing expiring credentials in the background.
+
+        Every credential the store caches from now on (and every one already
+        cached) is tracked and refreshed ahead of expiry, so lookups are
+        served from the cache instead of refreshing on the request path.
+
+        Args:
+            **kwargs: Options passed to TokenRefreshScheduler
+
+        Returns:
+            The running scheduler (the existing one if already started)
+        """
+        from .refresh_scheduler import TokenRefreshScheduler
+
+        with self._lock:
+            if self._refresh_scheduler is None:
+                self._refresh_scheduler = TokenRefreshScheduler(self, **kwargs)
+            scheduler = self._refresh_scheduler
+            cached = [credential for credential, _ in self._cache.values()]
+        for credential in cached:
+            scheduler.track(credential)
+        scheduler.start()
+        return scheduler
+
+    def stop_refresh_scheduler(self) -> None:
+        """Stop background refresh started by start_refresh_scheduler()."""
+        with self._lock:
+            scheduler, self._refresh_scheduler = self._refresh_scheduler, None
+        if scheduler is not None:
+            scheduler.stop()
+
+    @property
+    def refresh_scheduler(self) -> TokenRefreshScheduler | None:
+        """The background refresh scheduler, if started."""
+        return self._refresh_scheduler
 
     # --- Caching ---
 
@@ -512,11 +701,16 @@ def _get_from_cache(self, credential_id: str) -> CredentialObject | None:
 
     def _add_to_cache(self, credential: CredentialObject) -> None:
         """Add credential to cache."""
-        self._cache[credential.id] = (credential, datetime.now(UTC))
+        with self._lock:
+            self._cache[credential.id] = (credential, datetime.now(UTC))
+        scheduler = self._refresh_scheduler
+        if scheduler is not None:
+            scheduler.track(credential)
 
     def _remove_from_cache(self, credential_id: str) -> None:
         """Remove credential from cache."""
-        self._cache.pop(credential_id, None)
+        with self._lock:
+            self._cache.pop(credential_id, None)
 
     def clear_cache(self) -> None:
         """Clear the credential cache."""
@@ -620,6 +814,7 @@ def with_aden_sync(
         cache_ttl_seconds: int = 300,
         local_path: str | None = None,
         auto_sync: bool = True,
+        background_sync_interval: float | None = None,
         **kwargs: Any,
     ) -> CredentialStore:
         """
@@ -634,6 +829,9 @@ def with_aden_sync(
             cache_ttl_seconds: How long to cache credentials locally (default: 5 min)
             local_path: Path for local credential storage (default: ~/.hive/credentials)
             auto_sync: Whether to sync all credentials on startup (default: True)
+            background_sync_interval: If set, fetch changed credentials from Aden
+                every this many seconds in the background; lookups then never wait
+                on the Aden server
             **kwargs: Additional arguments passed to CredentialStore
 
         Returns:
@@ -692,8 +890,19 @@ def with_aden_sync(
                 **kwargs,
             )
 
-            # Initial sync
-            if auto_sync:
+            if background_sync_interval is not None:
+
+                def drop_changed(credential_ids: list[str]) -> None:
+                    for credential_id in credential_ids:
+                        store._remove_from_cache(credential_id)
+
+                cached_storage.start_background_sync(
+                    interval_seconds=background_sync_interval,
+                    initial_sync=auto_sync,
+                    on_change=drop_changed,
+                )
+            elif auto_sync:
+                # Initial sync
                 synced = provider.sync_all(store)
                 logger.info(f"Synced {synced} credentials from Aden server")
 
@@ -12,6 +12,9 @@
 
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
@@ -23,6 +26,7 @@
     CredentialKeyNotFoundError,
     CredentialNotFoundError,
     CredentialObject,
+    CredentialRefreshError,
     CredentialStore,
     CredentialType,
     CredentialUsageSpec,
@@ -31,6 +35,7 @@
     InMemoryStorage,
     StaticProvider,
     TemplateResolver,
+    TokenRefreshScheduler,
 )
 from pydantic import SecretStr
 
@@ -323,6 +328,99 @@ def test_delete(self, storage):
         assert storage.delete("test")
         assert storage.load("test") is None
 
+    def test_load_uses_decrypted_cache(self, storage, temp_dir):
+        """Unchanged files are not decrypted again; changed files are."""
+        from cryptography.fernet import Fernet
+
+        storage.save(
+            CredentialObject(id="test", keys={"k": CredentialKey(name="k", value=SecretStr("v1"))})
+        )
+
+        with patch.object(Fernet, "decrypt", side_effect=AssertionError("decrypted")):
+            loaded = storage.load("test")
+        assert loaded.get_key("k") == "v1"
+
+        # Callers get copies, so mutating one does not leak into the cache
+        loaded.set_key("k", "mutated")
+        assert storage.load("test").get_key("k") == "v1"
+
+        # Another writer changes the file on disk
+        other = EncryptedFileStorage(temp_dir, encryption_key=storage._key)
+        other.save(
+            CredentialObject(
+                id="test", keys={"k": CredentialKey(name="k", value=SecretStr("v2-longer"))}
+            )
+        )
+        assert storage.load("test").get_key("k") == "v2-longer"
+
+    def test_load_many(self, storage):
+        """load_many returns the credentials that exist."""
+        for cred_id in ("a", "b"):
+            storage.save(
+                CredentialObject(
+                    id=cred_id, keys={"k": CredentialKey(name="k", value=SecretStr(cred_id))}
+                )
+            )
+
+        loaded = storage.load_many(["a", "missing", "b"])
+
+        assert sorted(loaded) == ["a", "b"]
+        assert loaded["b"].get_key("k") == "b"
+
+    def test_index_journal(self, storage, temp_dir):
+        """Saves append to the index journal; a legacy index.json is migrated."""
+        import json
+
+        metadata = temp_dir / "metadata"
+        (metadata / "index.json").write_text(
+            json.dumps({"credentials": {"legacy": {"type": "api_key"}}, "version": "1.0"})
+        )
+        fresh = EncryptedFileStorage(temp_dir, encryption_key=storage._key)
+        assert fresh.list_all() == ["legacy"]
+
+        fresh.save(CredentialObject(id="cred1", keys={}))
+        fresh.save(CredentialObject(id="cred2", keys={}))
+        fresh.delete("cred1")
+
+        assert not (metadata / "index.json").exists()
+        lines = (metadata / "index.jsonl").read_text().splitlines()
+        ops = [json.loads(line)["op"] for line in lines]
+        assert ops == ["compact", "save", "save", "save", "delete"]
+        assert sorted(fresh.list_all()) == ["cred2", "legacy"]
+
+        # Other instances see appended entries
+        storage.save(CredentialObject(id="cred3", keys={}))
+        assert sorted(fresh.list_all()) == ["cred2", "cred3", "legacy"]
+
+    def test_index_journal_compaction(self, storage, temp_dir):
+        """The journal is rewritten once it is mostly superseded entries."""
+        storage.INDEX_COMPACT_SLACK = 4
+        for _ in range(10):
+            storage.save(CredentialObject(id="same", keys={}))
+
+        lines = (temp_dir / "metadata" / "index.jsonl").read_text().splitlines()
+        assert len(lines) <= 6  # compaction header + at most 5 entries
+        assert storage.list_all() == ["same"]
+        assert EncryptedFileStorage(temp_dir, encryption_key=storage._key).list_all() == ["same"]
+
+    def test_index_journal_compaction_keeps_concurrent_appends(self, storage, temp_dir):
+        """Entries appended by other instances while one compacts are not lost."""
+        others = [EncryptedFileStorage(temp_dir, encryption_key=storage._key) for _ in range(3)]
+        for other in [storage, *others]:
+            other.INDEX_COMPACT_SLACK = 1
+
+        def churn(n):
+            target = others[n % len(others)]
+            target.save(CredentialObject(id=f"cred{n}", keys={}))
+            storage.save(CredentialObject(id="same", keys={}))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(40)))
+
+        expected = sorted(["same", *(f"cred{n}" for n in range(40))])
+        fresh = EncryptedFileStorage(temp_dir, encryption_key=storage._key)
+        assert sorted(fresh.list_all()) == expected
+
 
 class TestCompositeStorage:
     """Tests for CompositeStorage."""
@@ -620,6 +718,25 @@ def test_caching(self):
         cred2 = store.get_credential("test")
         assert cred2 is not None
 
+    def test_get_credentials_batches_misses(self):
+        """get_credentials serves cache hits and loads the rest in one batch."""
+        storage = InMemoryStorage()
+        for cred_id in ("a", "b", "c"):
+            storage.save(
+                CredentialObject(
+                    id=cred_id, keys={"k": CredentialKey(name="k", value=SecretStr(cred_id))}
+                )
+            )
+        store = CredentialStore(storage=storage)
+        store.get_credential("a")
+
+        with patch.object(storage, "load_many", wraps=storage.load_many) as load_many:
+            found = store.get_credentials(["a", "b", "c", "missing"])
+
+        load_many.assert_called_once_with(["b", "c", "missing"])
+        assert sorted(found) == ["a", "b", "c"]
+        assert store.get_credentials(["b"])["b"].get_key("k") == "b"
+
     def test_clear_cache(self):
         """Test clearing the cache."""
         storage = InMemoryStorage()
@@ -635,6 +752,233 @@ def test_clear_cache(self):
         assert store.get_credential("test") is None
 
 
+class _SlowRefreshProvider(StaticProvider):
+    """Provider whose refresh blocks until released, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    @property
+    def provider_id(self) -> str:
+        return "slow_refresh"
+
+    def should_refresh(self, credential):
+        return credential.get_key("access_token") == "old"
+
+    def refresh(self, credential):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        refreshed = credential.model_copy(deep=True)
+        refreshed.set_key("access_token", "new")
+        return refreshed
+
+
+class TestCredentialStoreConcurrency:
+    """Tests for per-credential locking and single-flight refresh."""
+
+    def _store(self, expires_at):
+        provider = _SlowRefreshProvider()
+        storage = InMemoryStorage()
+        storage.save(
+            CredentialObject(
+                id="oauth",
+                provider_id="slow_refresh",
+                auto_refresh=True,
+                keys={
+                    "access_token": CredentialKey(
+                        name="access_token", value=SecretStr("old"), expires_at=expires_at
+                    )
+                },
+            )
+        )
+        storage.save(
+            CredentialObject(id="other", keys={"k": CredentialKey(name="k", value=SecretStr("v"))})
+        )
+        return CredentialStore(storage=storage, providers=[provider]), provider
+
+    def test_concurrent_refresh_is_single_flight(self):
+        """Callers needing an expired token share one refresh."""
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(store.get_key, "oauth", "access_token") for _ in range(8)]
+            assert provider.started.wait(timeout=5)
+            provider.release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert results == ["new"] * 8
+        assert provider.calls == 1
+        assert store.get_key("oauth", "access_token") == "new"
+
+    def test_refresh_does_not_block_other_lookups(self):
+        """Other credentials and still-valid tokens are served during a refresh."""
+        store, provider = self._store(datetime.now(UTC) + timedelta(minutes=2))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(store.get_key, "oauth", "access_token")
+            assert provider.started.wait(timeout=5)
+
+            # Not expired yet: served stale instead of waiting for the refresh
+            assert store.get_key("oauth", "access_token") == "old"
+            assert store.get_key("other", "k") == "v"
+
+            provider.release.set()
+            assert leader.result(timeout=5) == "new"
+
+        assert provider.calls == 1
+
+    def test_late_caller_does_not_refresh_again(self):
+        """A caller holding the pre-refresh object gets the finished refresh's result."""
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1))
+        provider.release.set()
+        stale = store.get_credential("oauth", refresh_if_needed=False)
+
+        assert store.get_key("oauth", "access_token") == "new"
+        # Read the expired object just before the refresh above finished
+        late = store._refresh_once(stale, serve_stale=True)
+
+        assert late.get_key("access_token") == "new"
+        assert provider.calls == 1
+
+        manual = store._refresh_once(stale, serve_stale=False)
+
+        assert manual.get_key("access_token") == "new"
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_get_credential_async(self):
+        """The async lookup refreshes off the event loop."""
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1))
+        provider.release.set()
+
+        assert await store.get_key_async("oauth", "access_token") == "new"
+        assert await store.get_key_async("other", "k") == "v"
+        assert await store.get_credential_async("missing") is None
+        assert provider.calls == 1
+
+
+class _ExtendingProvider(StaticProvider):
+    """Provider whose refresh issues a new token valid for an hour."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    @property
+    def provider_id(self) -> str:
+        return "extending"
+
+    def refresh(self, credential):
+        self.calls += 1
+        if self.fail:
+            raise CredentialRefreshError("token endpoint unavailable")
+        refreshed = credential.model_copy(deep=True)
+        refreshed.set_key(
+            "access_token",
+            f"token-{self.calls}",
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        return refreshed
+
+
+class TestTokenRefreshScheduler:
+    """Tests for proactive background refresh."""
+
+    def _store(self, expires_at, fail=False):
+        provider = _ExtendingProvider(fail=fail)
+        storage = InMemoryStorage()
+        storage.save(
+            CredentialObject(
+                id="oauth",
+                provider_id="extending",
+                auto_refresh=True,
+                keys={
+                    "access_token": CredentialKey(
+                        name="access_token", value=SecretStr("token-0"), expires_at=expires_at
+                    )
+                },
+            )
+        )
+        storage.save(
+            CredentialObject(id="static", keys={"k": CredentialKey(name="k", value=SecretStr("v"))})
+        )
+        return CredentialStore(storage=storage, providers=[provider]), provider
+
+    def test_schedules_ahead_of_expiry(self):
+        """Cached credentials are scheduled lead_time before expiry."""
+        expires_at = datetime.now(UTC) + timedelta(hours=2)
+        store, _ = self._store(expires_at)
+        scheduler = TokenRefreshScheduler(store, jitter=timedelta(0))
+        store._refresh_scheduler = scheduler
+
+        store.get_credential("oauth")
+        store.get_credential("static")
+
+        tracked = scheduler.tracked()
+        assert list(tracked) == ["oauth"]
+        assert abs((tracked["oauth"] - (expires_at - timedelta(minutes=10))).total_seconds()) < 1
+
+    def test_refreshes_due_credentials(self):
+        """Due refreshes update the cache so lookups skip the provider."""
+        events = []
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1))
+        scheduler = TokenRefreshScheduler(store, jitter=timedelta(0), on_event=events.append)
+        store._refresh_scheduler = scheduler
+        store.get_credential("oauth", refresh_if_needed=False)
+
+        assert scheduler.run_due() == 1
+        assert provider.calls == 1
+        assert store.get_key("oauth", "access_token") == "token-1"
+        assert provider.calls == 1  # served from cache
+        assert events[0]["type"] == "refresh_succeeded"
+        assert scheduler.stats()["refreshes"] == 1
+        # Rescheduled for the new token
+        next_due = scheduler.tracked()["oauth"]
+        assert next_due > datetime.now(UTC) + timedelta(minutes=45)
+
+    def test_failed_refresh_backs_off(self):
+        """Failures are reported and retried after a backoff delay."""
+        events = []
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1), fail=True)
+        scheduler = TokenRefreshScheduler(
+            store, backoff_base=timedelta(seconds=60), on_event=events.append
+        )
+        store._refresh_scheduler = scheduler
+        store.get_credential("oauth", refresh_if_needed=False)
+
+        assert scheduler.run_due() == 1
+        assert scheduler.run_due() == 0  # not retried immediately
+
+        stats = scheduler.stats()
+        assert stats["failures"] == 1
+        assert stats["failing"]["oauth"]["attempts"] == 1
+        assert events[0]["type"] == "refresh_failed"
+        retry_in = (scheduler.tracked()["oauth"] - datetime.now(UTC)).total_seconds()
+        assert 25 < retry_in <= 60
+
+    def test_background_thread_refreshes(self):
+        """start_refresh_scheduler() refreshes already-cached credentials."""
+        store, provider = self._store(datetime.now(UTC) - timedelta(minutes=1))
+        store.get_credential("oauth", refresh_if_needed=False)
+
+        scheduler = store.start_refresh_scheduler()
+        try:
+            for _ in range(100):
+                if provider.calls:
+                    break
+                time.sleep(0.05)
+            assert scheduler.running
+        finally:
+            store.stop_refresh_scheduler()
+
+        assert provider.calls == 1
+        assert store.refresh_scheduler is None
+        assert store.get_key("oauth", "access_token") == "token-1"
+
+
 class TestOAuth2Module:
     """Tests for OAuth2 module."""
 
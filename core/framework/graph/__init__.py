@@ -41,6 +41,7 @@
     StepStatus,
     load_export,
 )
+from framework.graph.sandbox_pool import ProcessPoolSandbox
 from framework.graph.worker_node import StepExecutionResult, WorkerNode
 
 __all__ = [
@@ -86,6 +87,7 @@
     "ExecutorConfig",
     # Code Sandbox
     "CodeSandbox",
+    "ProcessPoolSandbox",
     "safe_exec",
     "safe_eval",
     # Conversation
@@ -0,0 +1,76 @@
+"""
+Compiled-Code Cache.
+
+Plan steps, function nodes and edge conditions evaluate the same few
+snippets over and over.  Parsing, validating and compiling a snippet
+costs far more than running it, so CodeSandbox (execute,
+execute_expression, safe_exec) and graph.safe_eval keep their parsed or
+compiled forms in one shared, bounded LRU keyed by a hash of the source.
+
+Entries are immutable (code objects, validation issue lists, ASTs that
+are only read) and safe to share between threads.  Failures such as
+syntax errors are not cached.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class CompiledCodeCache:
+    """Bounded LRU of parsed/validated/compiled code, keyed by source hash."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, bytes], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, kind: Hashable, source: str, build: Callable[[], T]) -> T:
+        """
+        Return the cached value for *source*, building it on a miss.
+
+        Args:
+            kind: What was built (mode, validator settings...); part of the key
+            source: Source code the value was built from
+            build: Called on a miss; exceptions propagate and nothing is cached
+
+        Returns:
+            The cached or newly built value
+        """
+        key = (kind, hashlib.sha256(source.encode("utf-8", "surrogatepass")).digest())
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by CodeSandbox and graph.safe_eval
+code_cache = CompiledCodeCache()
@@ -17,8 +17,11 @@
 import sys
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from types import CodeType
 from typing import Any
 
+from framework.graph.code_cache import code_cache
+
 # Safe builtins whitelist
 SAFE_BUILTINS = {
     # Basic types
@@ -231,6 +234,16 @@ def handler(signum, frame):
             # Windows: no timeout support, just execute
             yield
 
+    def _validate_and_compile(self, code: str) -> tuple[list[str], CodeType | None]:
+        """Validation issues and compiled code for *code*, cached by source hash."""
+
+        def build() -> tuple[list[str], CodeType | None]:
+            issues = self.validator.validate(code)
+            return issues, None if issues else compile(code, "<sandbox>", "exec")
+
+        kind = ("exec", frozenset(self.validator.blocked_nodes))
+        return code_cache.get_or_build(kind, code, build)
+
     def _create_namespace(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Create isolated namespace for code execution."""
         namespace = {
@@ -265,8 +278,12 @@ def execute(
         inputs = inputs or {}
         extract_vars = extract_vars or []
 
-        # Validate code first
-        issues = self.validator.validate(code)
+        # Validate and compile code first (cached across calls)
+        try:
+            issues, compiled = self._validate_and_compile(code)
+        except (SyntaxError, ValueError) as e:
+            # Errors only compile() detects, e.g. 'return' outside function
+            return SandboxResult(success=False, error=f"{type(e).__name__}: {e}")
         if issues:
             return SandboxResult(
                 success=False,
@@ -286,8 +303,6 @@ def execute(
 
         try:
             with self._timeout_context(self.timeout_seconds):
-                # Compile and execute
-                compiled = compile(code, "<sandbox>", "exec")
                 exec(compiled, namespace)
 
             execution_time_ms = int((time.time() - start_time) * 1000)
@@ -336,6 +351,21 @@ def execute(
         finally:
             sys.stdout = old_stdout
 
+    async def execute_async(
+        self,
+        code: str,
+        inputs: dict[str, Any] | None = None,
+        extract_vars: list[str] | None = None,
+    ) -> SandboxResult:
+        """
+        Execute code from async code.
+
+        The SIGALRM timeout only works on the main thread, so in-process
+        execution runs inline and blocks the event loop. ProcessPoolSandbox
+        runs code in worker processes instead.
+        """
+        return self.execute(code, inputs, extract_vars)
+
     def execute_expression(
         self,
         expression: str,
@@ -348,9 +378,11 @@ def execute_expression(
         """
         inputs = inputs or {}
 
-        # Validate
+        # Validate (cached across calls)
         try:
-            ast.parse(expression, mode="eval")
+            compiled = code_cache.get_or_build(
+                "eval", expression, lambda: compile(expression, "<sandbox>", "eval")
+            )
         except SyntaxError as e:
             return SandboxResult(success=False, error=f"Syntax error: {e}")
 
@@ -358,7 +390,7 @@ def execute_expression(
 
         try:
             with self._timeout_context(self.timeout_seconds):
-                result = eval(expression, namespace)
+                result = eval(compiled, namespace)
 
             return SandboxResult(success=True, result=result)
 
@@ -198,6 +198,17 @@ def __init__(
         self._meta_persisted: bool = False
         self._last_api_input_tokens: int | None = None
         self._current_phase: str | None = None
+        # Serialized LLM dicts, kept parallel to ``_messages`` so each
+        # message is converted once instead of on every inner iteration.
+        self._llm_dicts: list[dict[str, Any]] = []
+        # Repaired output for ``_messages[:_repaired_upto]``.  Only the tail
+        # after this boundary is re-scanned by ``to_llm_messages``.
+        self._repaired_prefix: list[dict[str, Any]] = []
+        self._repaired_upto: int = 0
+        # Bumped whenever existing messages are rewritten (prune, compact,
+        # clear).  Appends leave it unchanged, so a caller can tell whether
+        # a snapshot of the history prefix is still current.
+        self._rewrite_generation: int = 0
 
     # --- Properties --------------------------------------------------------
 
@@ -251,6 +262,11 @@ def message_count(self) -> int:
     def next_seq(self) -> int:
         return self._next_seq
 
+    @property
+    def rewrite_generation(self) -> int:
+        """Counter of in-place history rewrites (prune, compact, clear)."""
+        return self._rewrite_generation
+
     # --- Add messages ------------------------------------------------------
 
     async def add_user_message(
@@ -266,7 +282,7 @@ async def add_user_message(
             phase_id=self._current_phase,
             is_transition_marker=is_transition_marker,
         )
-        self._messages.append(msg)
+        self._append(msg)
         self._next_seq += 1
         await self._persist(msg)
         return msg
@@ -283,7 +299,7 @@ async def add_assistant_message(
             tool_calls=tool_calls,
             phase_id=self._current_phase,
         )
-        self._messages.append(msg)
+        self._append(msg)
         self._next_seq += 1
         await self._persist(msg)
         return msg
@@ -302,7 +318,7 @@ async def add_tool_result(
             is_error=is_error,
             phase_id=self._current_phase,
         )
-        self._messages.append(msg)
+        self._append(msg)
         self._next_seq += 1
         await self._persist(msg)
         return msg
@@ -315,34 +331,47 @@ def to_llm_messages(self) -> list[dict[str, Any]]:
         Automatically repairs orphaned tool_use blocks (assistant messages
         with tool_calls that lack corresponding tool-result messages).  This
         can happen when a loop is cancelled mid-tool-execution.
+
+        Per-message dicts are cached and the repair pass only inspects the
+        messages added since the last call, so the cost per inner iteration
+        is proportional to the new tail rather than the whole history.
+        The returned list is fresh; the dicts inside it are shared with the
+        cache and must not be mutated.
         """
-        msgs = [m.to_llm_dict() for m in self._messages]
-        return self._repair_orphaned_tool_calls(msgs)
+        start = self._repaired_upto
+        # Everything before the last non-tool message is final: that message
+        # closes any open tool-call block, so later appends cannot change it.
+        boundary = start
+        for i in range(len(self._messages) - 1, start, -1):
+            if self._messages[i].role != "tool":
+                boundary = i
+                break
+        if boundary > start:
+            self._repaired_prefix.extend(
+                self._repair_orphaned_tool_calls(self._llm_dicts[start:boundary])
+            )
+            self._repaired_upto = boundary
+
+        return self._repaired_prefix + self._repair_orphaned_tool_calls(self._llm_dicts[boundary:])
 
     @staticmethod
     def _repair_orphaned_tool_calls(
         msgs: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        """Ensure every tool_call has a matching tool-result message."""
+        """Ensure every tool_call has a matching tool-result message.
+
+        Single pass: the tool-call IDs of the most recent assistant message
+        stay pending until answered by a following tool message; the first
+        non-tool message (or the end of the list) flushes any that remain
+        as synthetic error results.
+        """
         repaired: list[dict[str, Any]] = []
-        for i, m in enumerate(msgs):
-            repaired.append(m)
-            tool_calls = m.get("tool_calls")
-            if m.get("role") != "assistant" or not tool_calls:
-                continue
-            # Collect IDs of tool results that follow this assistant message
-            answered: set[str] = set()
-            for j in range(i + 1, len(msgs)):
-                if msgs[j].get("role") == "tool":
-                    tid = msgs[j].get("tool_call_id")
-                    if tid:
-                        answered.add(tid)
-                else:
-                    break  # stop at first non-tool message
-            # Patch any missing results
-            for tc in tool_calls:
-                tc_id = tc.get("id")
-                if tc_id and tc_id not in answered:
+        pending: list[str] = []
+        answered: set[str] = set()
+
+        def flush() -> None:
+            for tc_id in pending:
+                if tc_id not in answered:
                     repaired.append(
                         {
                             "role": "tool",
@@ -350,6 +379,21 @@ def _repair_orphaned_tool_calls(
                             "content": "ERROR: Tool execution was interrupted.",
                         }
                     )
+            pending.clear()
+            answered.clear()
+
+        for m in msgs:
+            if m.get("role") == "tool":
+                repaired.append(m)
+                tid = m.get("tool_call_id")
+                if tid:
+                    answered.add(tid)
+                continue
+            flush()
+            repaired.append(m)
+            if m.get("role") == "assistant" and m.get("tool_calls"):
+                pending.extend(tc["id"] for tc in m["tool_calls"] if tc.get("id"))
+        flush()
         return repaired
 
     def estimate_tokens(self) -> int:
@@ -503,11 +547,18 @@ async def prune_old_tool_results(
                 phase_id=msg.phase_id,
                 is_transition_marker=msg.is_transition_marker,
             )
+            self._llm_dicts[i] = self._messages[i].to_llm_dict()
             count += 1
 
             if self._store:
                 await self._store.write_part(msg.seq, self._messages[i].to_storage_dict())
 
+        # Pruned dicts were swapped in place; drop the repaired view so it
+        # is rebuilt from the cache on the next to_llm_messages() call.
+        if count:
+            self._invalidate_repair()
+            self._rewrite_generation += 1
+
         # Reset token estimate — content lengths changed
         self._last_api_input_tokens = None
         return count
@@ -531,7 +582,23 @@ async def compact(
         if not self._messages:
             return
 
+        split = self.compaction_split(keep_recent, phase_graduated)
+
+        # Nothing to compact
+        if split == 0:
+            return
+
+        await self._compact_at(split, summary)
+
+    def compaction_split(self, keep_recent: int = 2, phase_graduated: bool = False) -> int:
+        """Return the index of the first message :meth:`compact` would keep.
+
+        Messages before the returned index are the ones replaced by the
+        summary.  See :meth:`compact` for the meaning of the arguments.
+        """
         total = len(self._messages)
+        if total == 0:
+            return 0
 
         # Phase-graduated: find the split point based on phase boundaries.
         # Keeps current phase + previous phase intact, compacts older phases.
@@ -552,10 +619,25 @@ async def compact(
         while split < total and self._messages[split].role == "tool":
             split += 1
 
-        # Nothing to compact
-        if split == 0:
-            return
+        return split
+
+    async def compact_before(self, seq: int, summary: str) -> bool:
+        """Replace every message with a sequence number below *seq* with *summary*.
 
+        Used to apply a summary that was generated for a known prefix of
+        the history while newer messages kept arriving.  Returns ``False``
+        (and changes nothing) when *seq* is no longer present.
+        """
+        for i, msg in enumerate(self._messages):
+            if msg.seq == seq:
+                if i == 0:
+                    return False
+                await self._compact_at(i, summary)
+                return True
+        return False
+
+    async def _compact_at(self, split: int, summary: str) -> None:
+        """Replace ``_messages[:split]`` with a single summary message."""
         old_messages = list(self._messages[:split])
         recent_messages = list(self._messages[split:])
 
@@ -588,6 +670,9 @@ async def compact(
             await self._store.write_cursor({"next_seq": self._next_seq})
 
         self._messages = [summary_msg] + recent_messages
+        self._llm_dicts = [summary_msg.to_llm_dict()] + self._llm_dicts[split:]
+        self._invalidate_repair()
+        self._rewrite_generation += 1
         self._last_api_input_tokens = None  # reset; next LLM call will recalibrate
 
     def _find_phase_graduated_split(self) -> int | None:
@@ -623,6 +708,9 @@ async def clear(self) -> None:
             await self._store.delete_parts_before(self._next_seq)
             await self._store.write_cursor({"next_seq": self._next_seq})
         self._messages.clear()
+        self._llm_dicts.clear()
+        self._invalidate_repair()
+        self._rewrite_generation += 1
         self._last_api_input_tokens = None
 
     def export_summary(self) -> str:
@@ -654,6 +742,18 @@ def export_summary(self) -> str:
 
         return "\n".join(lines)
 
+    # --- LLM-dict cache internals -------------------------------------------
+
+    def _append(self, message: Message) -> None:
+        """Append *message* and its serialized LLM dict."""
+        self._messages.append(message)
+        self._llm_dicts.append(message.to_llm_dict())
+
+    def _invalidate_repair(self) -> None:
+        """Discard the repaired prefix after an in-place history rewrite."""
+        self._repaired_prefix = []
+        self._repaired_upto = 0
+
     # --- Persistence internals ---------------------------------------------
 
     async def _persist(self, message: Message) -> None:
@@ -703,6 +803,7 @@ async def restore(cls, store: ConversationStore) -> NodeConversation | None:
 
         parts = await store.read_parts()
         conv._messages = [Message.from_storage_dict(p) for p in parts]
+        conv._llm_dicts = [m.to_llm_dict() for m in conv._messages]
 
         cursor = await store.read_cursor()
         if cursor:
@@ -338,6 +338,13 @@ class AsyncEntryPointSpec(BaseModel):
     max_concurrent: int = Field(
         default=10, description="Maximum concurrent executions for this entry point"
     )
+    weight: float = Field(
+        default=1.0,
+        description="Share of the runtime-wide execution budget relative to other entry points",
+    )
+    max_queued: int | None = Field(
+        default=None, description="Maximum queued triggers before new ones are rejected"
+    )
 
     model_config = {"extra": "allow"}
 
@@ -17,10 +17,9 @@
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Literal, Protocol, runtime_checkable
 
-from framework.graph.conversation import ConversationStore, NodeConversation
+from framework.graph.conversation import ConversationStore, Message, NodeConversation
 from framework.graph.node import NodeContext, NodeProtocol, NodeResult
 from framework.llm.provider import Tool, ToolResult, ToolUse
 from framework.llm.stream_events import (
@@ -30,6 +29,7 @@
     ToolCallEvent,
 )
 from framework.runtime.event_bus import EventBus
+from framework.storage.spillover_store import SpilloverStore
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +87,18 @@ class LoopConfig:
     # ``None`` the result is simply truncated with an explanatory note.
     max_tool_result_chars: int = 3_000
     spillover_dir: str | None = None  # Path string; created on first use
+    # Disk quota for spilled results in *spillover_dir* (LRU-evicted) and
+    # whether to gzip them.  Identical results are only stored once.
+    spillover_max_bytes: int = 256 * 1024 * 1024
+    spillover_compress: bool = False
+
+    # --- Speculative compaction ---
+    # Once usage passes this fraction of *max_history_tokens*, the older
+    # part of the conversation is summarized in the background while the
+    # loop keeps running.  The summary is swapped in at the next turn
+    # boundary if that prefix was not rewritten in the meantime.  Must be
+    # below the compaction threshold to help; ``None`` disables it.
+    speculative_compaction_threshold: float | None = 0.6
 
 
 # ---------------------------------------------------------------------------
@@ -137,6 +149,31 @@ async def restore(cls, store: ConversationStore) -> OutputAccumulator:
         return cls(values=values, store=store)
 
 
+# ---------------------------------------------------------------------------
+# Speculative compaction state
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _SpeculativeCompaction:
+    """A background summary of a conversation prefix.
+
+    The summary covers every message with ``seq < split_seq`` as it was
+    at *generation*; it is only applied if the conversation has not been
+    rewritten since.
+    """
+
+    conversation: NodeConversation
+    split_seq: int
+    generation: int
+    task: asyncio.Task[str]
+
+    def is_current(self, conversation: NodeConversation) -> bool:
+        return (
+            conversation is self.conversation and conversation.rewrite_generation == self.generation
+        )
+
+
 # ---------------------------------------------------------------------------
 # EventLoopNode
 # ---------------------------------------------------------------------------
@@ -191,6 +228,8 @@ def __init__(
         # Client-facing input blocking state
         self._input_ready = asyncio.Event()
         self._shutdown = False
+        self._speculative: _SpeculativeCompaction | None = None
+        self._spillover: SpilloverStore | None = None
 
     def validate_input(self, ctx: NodeContext) -> list[str]:
         """Validate hard requirements only.
@@ -210,6 +249,12 @@ def validate_input(self, ctx: NodeContext) -> list[str]:
 
     async def execute(self, ctx: NodeContext) -> NodeResult:
         """Run the event loop."""
+        try:
+            return await self._execute_loop(ctx)
+        finally:
+            self._cancel_speculative_compaction()
+
+    async def _execute_loop(self, ctx: NodeContext) -> NodeResult:
         start_time = time.time()
         total_input_tokens = 0
         total_output_tokens = 0
@@ -345,7 +390,9 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
             # 6c. Publish iteration event
             await self._publish_iteration(stream_id, node_id, iteration)
 
-            # 6d. Pre-turn compaction check (tiered)
+            # 6d. Pre-turn compaction check (tiered).  A finished background
+            # summary is swapped in first so the blocking path is rarely hit.
+            await self._apply_speculative_compaction(ctx, conversation)
             if conversation.needs_compaction():
                 await self._compact_tiered(ctx, conversation, accumulator)
 
@@ -432,6 +479,8 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
             # 6e''. Post-turn compaction check (catches tool-result bloat)
             if conversation.needs_compaction():
                 await self._compact_tiered(ctx, conversation, accumulator)
+            else:
+                self._start_speculative_compaction(ctx, conversation)
 
             # 6e'''. Empty response guard — if the LLM returned nothing
             # (no text, no real tools, no set_output) and all required
@@ -1181,7 +1230,9 @@ async def _run_single_turn(
                         )
                     else:
                         result = raw
-                    results_by_id[tc.tool_use_id] = self._truncate_tool_result(result, tc.tool_name)
+                    results_by_id[tc.tool_use_id] = await self._truncate_tool_result(
+                        result, tc.tool_name
+                    )
 
             # Phase 3: record results into conversation in original order,
             # build logged/real lists, and publish completed events.
@@ -1504,8 +1555,9 @@ async def _evaluate(
 
     @staticmethod
     def _extract_tool_call_history(
-        conversation: NodeConversation,
+        conversation: NodeConversation | None = None,
         max_entries: int = 30,
+        messages: list[Message] | None = None,
     ) -> str:
         """Build a compact tool call history from the conversation.
 
@@ -1535,7 +1587,10 @@ def _summarize_input(name: str, args: dict) -> str:
                 return args.get("filename", "")
             return ""
 
-        for msg in conversation.messages:
+        if messages is None:
+            messages = conversation.messages if conversation is not None else []
+
+        for msg in messages:
             if msg.role == "assistant" and msg.tool_calls:
                 for tc in msg.tool_calls:
                     func = tc.get("function", {})
@@ -1640,7 +1695,7 @@ async def _execute_tool(self, tc: ToolCallEvent) -> ToolResult:
             result = await result
         return result
 
-    def _truncate_tool_result(
+    async def _truncate_tool_result(
         self,
         result: ToolResult,
         tool_name: str,
@@ -1648,8 +1703,9 @@ def _truncate_tool_result(
         """Truncate a large tool result to keep the conversation context small.
 
         If *spillover_dir* is configured and the result exceeds
-        *max_tool_result_chars*, the full content is written to a file and
-        the in-context result is replaced with a preview + filename reference.
+        *max_tool_result_chars*, the full content is written to a file (via
+        :class:`SpilloverStore`, off the event loop) and the in-context
+        result is replaced with a preview + filename reference.
         Without *spillover_dir*, large results are truncated with a note.
 
         Small results (and errors) pass through unchanged.
@@ -1658,21 +1714,31 @@ def _truncate_tool_result(
         if limit <= 0 or result.is_error or len(result.content) <= limit:
             return result
 
-        # load_data is the designated mechanism for reading spilled files.
-        # Don't re-spill (circular), but DO truncate with a pagination hint.
-        if tool_name == "load_data":
+        # load_data/query_data are the designated mechanism for reading
+        # spilled files.  Don't re-spill (circular), but DO truncate with a
+        # pagination hint.
+        if tool_name in ("load_data", "query_data"):
             preview_chars = max(limit - 300, limit // 2)
             preview = result.content[:preview_chars]
+            if tool_name == "load_data":
+                hint = (
+                    "Use offset_lines and limit_lines (or offset_bytes and "
+                    "limit_bytes) to read smaller chunks, e.g. "
+                    "load_data(filename=..., offset_lines=0, limit_lines=100)."
+                )
+            else:
+                hint = (
+                    "Use a smaller limit_records or a JSONPath 'path' to select "
+                    "fewer fields, e.g. query_data(filename=..., limit_records=10)."
+                )
             truncated = (
-                f"[load_data result: {len(result.content)} chars — "
-                f"too large for context. Use offset_bytes and limit_bytes parameters "
-                f"to read smaller chunks, e.g. "
-                f"load_data(filename=..., offset_bytes=0, limit_bytes=5000).]\n\n"
+                f"[{tool_name} result: {len(result.content)} chars — "
+                f"too large for context. {hint}]\n\n"
                 f"Preview:\n{preview}…"
             )
             logger.info(
-                "load_data result truncated: %d → %d chars "
-                "(use offset_bytes/limit_bytes to paginate)",
+                "%s result truncated: %d → %d chars (paginate to read the rest)",
+                tool_name,
                 len(result.content),
                 len(truncated),
             )
@@ -1688,23 +1754,13 @@ def _truncate_tool_result(
 
         spill_dir = self._config.spillover_dir
         if spill_dir:
-            spill_path = Path(spill_dir)
-            spill_path.mkdir(parents=True, exist_ok=True)
-            # Use tool_use_id for uniqueness, sanitise for filesystem
-            safe_id = result.tool_use_id.replace("/", "_")[:60]
-            filename = f"tool_{tool_name}_{safe_id}.txt"
-
-            # Pretty-print JSON content so load_data's line-based
-            # pagination works correctly.  Compact JSON (no newlines)
-            # would produce a single line that defeats pagination.
-            write_content = result.content
-            try:
-                parsed = json.loads(result.content)
-                write_content = json.dumps(parsed, indent=2, ensure_ascii=False)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                pass  # Not JSON — write as-is
-
-            (spill_path / filename).write_text(write_content, encoding="utf-8")
+            if self._spillover is None:
+                self._spillover = SpilloverStore(
+                    spill_dir,
+                    max_bytes=self._config.spillover_max_bytes,
+                    compress=self._config.spillover_compress,
+                )
+            filename = await self._spillover.spill(tool_name, result.tool_use_id, result.content)
 
             truncated = (
                 f"[Result from {tool_name}: {len(result.content)} chars — "
@@ -1751,9 +1807,18 @@ async def _compact_tiered(
         | 80-100%        | Normal: LLM summary, keep 4 recent messages |
         | 100-120%       | Aggressive: LLM summary, keep 2 recent      |
         | >= 120%        | Emergency: static summary, keep 1 recent     |
+
+        Below the emergency tier, a background summary that is already in
+        flight (see :meth:`_start_speculative_compaction`) is awaited and
+        applied first, since it finishes sooner than a fresh LLM call.
         """
         ratio = conversation.usage_ratio()
 
+        if ratio < 1.2 and await self._apply_speculative_compaction(ctx, conversation, wait=True):
+            if not conversation.needs_compaction():
+                return
+            ratio = conversation.usage_ratio()
+
         # --- Tier 0: Prune old tool results (zero-cost, no LLM call) ---
         protect = max(2000, self._config.max_history_tokens // 12)
         pruned = await conversation.prune_old_tool_results(
@@ -1818,7 +1883,16 @@ async def _compact_tiered(
             summary = await self._generate_compaction_summary(ctx, conversation)
             await conversation.compact(summary, keep_recent=4, phase_graduated=_phase_grad)
 
-        new_ratio = conversation.usage_ratio()
+        await self._report_compaction(ctx, level, ratio, conversation.usage_ratio())
+
+    async def _report_compaction(
+        self,
+        ctx: NodeContext,
+        level: str,
+        ratio: float,
+        new_ratio: float,
+    ) -> None:
+        """Log a completed compaction and publish CONTEXT_COMPACTED."""
         logger.info(
             "Compaction complete (%s): %.0f%% -> %.0f%%",
             level,
@@ -1861,11 +1935,20 @@ async def _generate_compaction_summary(
         conversation: NodeConversation,
     ) -> str:
         """Use LLM to generate a conversation summary for compaction."""
-        tool_history = self._extract_tool_call_history(conversation)
+        try:
+            return self._summarize_messages(ctx, conversation.messages)
+        except Exception as e:
+            logger.warning(f"Compaction summary generation failed: {e}")
+            tool_history = self._extract_tool_call_history(conversation)
+            if tool_history:
+                return f"Previous conversation context (summary unavailable).\n\n{tool_history}"
+            return "Previous conversation context (summary unavailable)."
 
-        messages_text = "\n".join(
-            f"[{m.role}]: {m.content[:200]}" for m in conversation.messages[-10:]
-        )
+    def _summarize_messages(self, ctx: NodeContext, messages: list[Message]) -> str:
+        """Ask the LLM for a summary of *messages*.  Raises on LLM failure."""
+        tool_history = self._extract_tool_call_history(messages=messages)
+
+        messages_text = "\n".join(f"[{m.role}]: {m.content[:200]}" for m in messages[-10:])
         prompt = (
             "Summarize this conversation so far in 2-3 sentences, "
             "preserving key decisions and results:\n\n"
@@ -1881,24 +1964,104 @@ async def _generate_compaction_summary(
         # Dynamic budget: reasoning models (o1, gpt-5-mini) spend max_tokens on
         # internal thinking. 500 leaves nothing for the actual summary.
         summary_budget = max(1024, self._config.max_history_tokens // 10)
+        response = ctx.llm.complete(
+            messages=[{"role": "user", "content": prompt}],
+            system=("Summarize conversations concisely. Always preserve the tool history section."),
+            max_tokens=summary_budget,
+        )
+        summary = response.content
+        # Ensure tool history is present even if LLM dropped it
+        if tool_history and "TOOLS ALREADY CALLED" not in summary:
+            summary += "\n\n" + tool_history
+        return summary
+
+    # -------------------------------------------------------------------
+    # Speculative (background) compaction
+    # -------------------------------------------------------------------
+
+    def _start_speculative_compaction(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+    ) -> None:
+        """Summarize the older prefix in the background once usage is high.
+
+        The prefix is the part a normal compaction would discard.  Its
+        summary is produced in a worker thread (``LLMProvider.complete`` is
+        blocking) while the loop continues, and applied at a later turn
+        boundary by :meth:`_apply_speculative_compaction`.
+        """
+        threshold = self._config.speculative_compaction_threshold
+        if threshold is None or self._speculative is not None:
+            return
+        if conversation.usage_ratio() < threshold:
+            return
+
+        phase_grad = getattr(ctx, "continuous_mode", False)
+        split = conversation.compaction_split(keep_recent=4, phase_graduated=phase_grad)
+        messages = conversation.messages
+        if split <= 1 or split >= len(messages):
+            return
+
+        prefix = messages[:split]
+        task = asyncio.create_task(asyncio.to_thread(self._summarize_messages, ctx, prefix))
+        self._speculative = _SpeculativeCompaction(
+            conversation=conversation,
+            split_seq=messages[split].seq,
+            generation=conversation.rewrite_generation,
+            task=task,
+        )
+        logger.info(
+            "[%s] Speculative compaction started (usage %.0f%%, %d messages)",
+            ctx.node_id,
+            conversation.usage_ratio() * 100,
+            len(prefix),
+        )
+
+    async def _apply_speculative_compaction(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+        wait: bool = False,
+    ) -> bool:
+        """Swap in a finished background summary if its prefix is unchanged.
+
+        Returns True when the conversation was compacted.  With *wait*, an
+        in-flight summary is awaited instead of being left for a later turn.
+        Stale or failed summaries are discarded.
+        """
+        spec = self._speculative
+        if spec is None:
+            return False
+        if not spec.is_current(conversation):
+            self._cancel_speculative_compaction()
+            return False
+        if not spec.task.done():
+            if not wait:
+                return False
+            await asyncio.wait({spec.task})
+
+        self._speculative = None
         try:
-            response = ctx.llm.complete(
-                messages=[{"role": "user", "content": prompt}],
-                system=(
-                    "Summarize conversations concisely. Always preserve the tool history section."
-                ),
-                max_tokens=summary_budget,
-            )
-            summary = response.content
-            # Ensure tool history is present even if LLM dropped it
-            if tool_history and "TOOLS ALREADY CALLED" not in summary:
-                summary += "\n\n" + tool_history
-            return summary
+            summary = spec.task.result()
         except Exception as e:
-            logger.warning(f"Compaction summary generation failed: {e}")
-            if tool_history:
-                return f"Previous conversation context (summary unavailable).\n\n{tool_history}"
-            return "Previous conversation context (summary unavailable)."
+            logger.warning("Speculative compaction summary failed: %s", e)
+            return False
+        # The prefix may have been rewritten while we were waiting.
+        if not spec.is_current(conversation):
+            return False
+
+        ratio = conversation.usage_ratio()
+        if not await conversation.compact_before(spec.split_seq, summary):
+            return False
+        await self._report_compaction(ctx, "speculative", ratio, conversation.usage_ratio())
+        return True
+
+    def _cancel_speculative_compaction(self) -> None:
+        """Drop any in-flight background summary."""
+        if self._speculative is not None:
+            self._speculative.task.cancel()
+            self._speculative = None
 
     def _build_emergency_summary(
         self,
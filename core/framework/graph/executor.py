@@ -1516,6 +1516,8 @@ def _get_node_implementation(
                     max_history_tokens=lc.get("max_history_tokens", 32000),
                     max_tool_result_chars=lc.get("max_tool_result_chars", 3_000),
                     spillover_dir=spillover,
+                    spillover_max_bytes=lc.get("spillover_max_bytes", 256 * 1024 * 1024),
+                    spillover_compress=lc.get("spillover_compress", False),
                 ),
                 tool_executor=self.tool_executor,
                 conversation_store=conv_store,
@@ -85,6 +85,7 @@ def __init__(
         judge: HybridJudge | None = None,
         config: ExecutorConfig | None = None,
         approval_callback: ApprovalCallback | None = None,
+        sandbox: CodeSandbox | None = None,
     ):
         """
         Initialize the FlexibleGraphExecutor.
@@ -99,6 +100,8 @@ def __init__(
             config: Executor configuration
             approval_callback: Callback for human-in-the-loop approval.
                 If None, steps requiring approval will pause execution.
+            sandbox: Sandbox for code steps (e.g. a ProcessPoolSandbox);
+                defaults to an in-process CodeSandbox
         """
         self.runtime = runtime
         self.llm = llm
@@ -118,7 +121,7 @@ def __init__(
             tools=tools,
             tool_executor=tool_executor,
             functions=functions,
-            sandbox=CodeSandbox(),
+            sandbox=sandbox or CodeSandbox(),
         )
 
     async def execute_plan(
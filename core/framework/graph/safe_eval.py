@@ -2,6 +2,8 @@
 import operator
 from typing import Any
 
+from framework.graph.code_cache import code_cache
+
 # Safe operators whitelist
 SAFE_OPERATORS = {
     ast.Add: operator.add,
@@ -244,7 +246,8 @@ def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
     full_context.update(SAFE_FUNCTIONS)
 
     try:
-        tree = ast.parse(expr, mode="eval")
+        # Parsed trees are only read by the visitor, so they can be shared
+        tree = code_cache.get_or_build("safe_eval", expr, lambda: ast.parse(expr, mode="eval"))
     except SyntaxError as e:
         raise SyntaxError(f"Invalid syntax in expression: {e}") from e
 
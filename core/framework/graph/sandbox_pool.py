@@ -0,0 +1,402 @@
+"""
+Process-Pool Code Sandbox.
+
+CodeSandbox runs plan code inside the host process and enforces its
+timeout with SIGALRM, which only works on the main thread and cannot
+bound memory or CPU.  ProcessPoolSandbox keeps the same interface but
+runs every snippet in one of a few warm worker processes:
+
+1. Workers are forked from a forkserver and import the sandbox and the
+   allowed modules before taking work, so a task never pays for start-up.
+   Neither imports the ``framework`` package (see sandbox_worker).
+2. Each worker caps its address space (RLIMIT_AS) and gets a fresh CPU
+   budget (RLIMIT_CPU) per task; exceeding it kills the worker.
+3. The parent enforces the wall-clock timeout by killing the worker, so
+   code stuck in C (e.g. huge integer powers) cannot hang the caller.
+4. Inputs and results cross the pipe as pickles (protocol 5).  Results
+   are unpickled with a whitelist of plain data types; anything else is
+   returned as its repr.
+5. Tasks run concurrently, one per worker; execute_async() waits on a
+   thread so the event loop stays free.
+
+Workers that crash, time out or have run ``max_tasks_per_worker`` tasks
+are replaced.
+
+Usage:
+    with ProcessPoolSandbox(workers=4, memory_limit_mb=512) as sandbox:
+        result = await sandbox.execute_async("result = sum(range(10))")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import runpy
+import signal
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from framework.graph import sandbox_worker
+from framework.graph.code_sandbox import (
+    ALLOWED_MODULES,
+    CodeSandbox,
+    CodeSandboxError,
+    SandboxResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extra time the parent waits past timeout_seconds before killing a worker,
+# so the worker's own SIGALRM timeout can report first.
+KILL_GRACE_SECONDS = 1.0
+
+# Classes a worker result may contain, by (module, name)
+_SAFE_GLOBALS = {
+    *(
+        ("builtins", name)
+        for name in (
+            "bool",
+            "bytearray",
+            "bytes",
+            "complex",
+            "dict",
+            "float",
+            "frozenset",
+            "int",
+            "list",
+            "range",
+            "set",
+            "slice",
+            "str",
+            "tuple",
+        )
+    ),
+    ("collections", "Counter"),
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("collections", "deque"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("decimal", "Decimal"),
+    ("fractions", "Fraction"),
+}
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _SAFE_GLOBALS:
+            raise pickle.UnpicklingError(f"'{module}.{name}' is not allowed in sandbox results")
+        return super().find_class(module, name)
+
+
+def restricted_loads(data: bytes) -> Any:
+    """Unpickle data produced by sandboxed code, allowing only plain data types."""
+    return _RestrictedUnpickler(io.BytesIO(data)).load()
+
+
+# --- Parent side ---
+
+
+@functools.cache
+def _mp_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        # The forkserver is shared by the whole process, so this runs once.
+        # Stdlib only: the default preload would import __main__, and with
+        # it possibly the framework package.
+        ctx.set_forkserver_preload(["runpy", *sorted(ALLOWED_MODULES)])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class _Worker:
+    def __init__(self, ctx: Any, sandbox_kwargs: dict[str, Any], memory_limit_mb: int | None):
+        self.conn, child_conn = ctx.Pipe()
+        worker_args = {
+            "conn": child_conn,
+            "sandbox_kwargs": sandbox_kwargs,
+            "memory_limit_mb": memory_limit_mb,
+        }
+        self.process = ctx.Process(
+            target=runpy.run_path,
+            args=(sandbox_worker.__file__,),
+            kwargs={
+                "init_globals": {"worker_args": worker_args},
+                "run_name": sandbox_worker.RUN_NAME,
+            },
+            name="sandbox-worker",
+            daemon=True,
+        )
+        try:
+            self.process.start()
+        except (EOFError, OSError) as e:
+            self.conn.close()
+            raise CodeSandboxError(f"Could not start sandbox worker: {e!r}") from e
+        finally:
+            child_conn.close()
+        self.tasks = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+def _exit_reason(exitcode: int | None) -> str:
+    if exitcode is not None and exitcode < 0:
+        sig = -exitcode
+        if sig == getattr(signal, "SIGXCPU", None):
+            return "CPU time limit exceeded"
+        if sig == signal.SIGKILL:
+            return "Sandbox worker was killed (out of memory?)"
+        return f"Sandbox worker died with signal {signal.Signals(sig).name}"
+    return f"Sandbox worker exited unexpectedly (exit code {exitcode})"
+
+
+def _decode_value(encoded: tuple[str, Any]) -> Any:
+    kind, payload = encoded
+    if kind == "pickle":
+        try:
+            return restricted_loads(payload)
+        except Exception:
+            return "<unserializable value>"
+    return payload
+
+
+def _shutdown_workers(idle: queue.Queue, workers: set[_Worker]) -> None:
+    for worker in list(workers):
+        worker.kill()
+    workers.clear()
+    while not idle.empty():
+        idle.get_nowait()
+
+
+class ProcessPoolSandbox(CodeSandbox):
+    """
+    CodeSandbox that runs code in a pool of warm, resource-limited worker processes.
+
+    Drop-in replacement for CodeSandbox (e.g. WorkerNode(sandbox=...)).
+    Validation still happens in the parent, so rejected code never
+    reaches a worker.  Inputs that cannot be pickled are left out of the
+    worker's namespace.
+
+    Usage:
+        sandbox = ProcessPoolSandbox(workers=4, timeout_seconds=5)
+        result = sandbox.execute("result = x * 2", inputs={"x": 21})
+        sandbox.close()
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: int = 10,
+        allowed_modules: set[str] | None = None,
+        safe_builtins: dict[str, Any] | None = None,
+        workers: int | None = None,
+        memory_limit_mb: int | None = 512,
+        cpu_time_seconds: float | None = None,
+        max_tasks_per_worker: int = 100,
+    ):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            timeout_seconds: Wall-clock limit per task
+            allowed_modules: Modules sandboxed code may import
+            safe_builtins: Builtins available to sandboxed code
+            workers: Number of worker processes (default: CPU count, at most 4)
+            memory_limit_mb: Address-space limit per worker, None for no limit
+            cpu_time_seconds: CPU-time limit per task (default: timeout_seconds)
+            max_tasks_per_worker: Replace a worker after this many tasks
+        """
+        super().__init__(timeout_seconds, allowed_modules, safe_builtins)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_time_seconds = cpu_time_seconds or timeout_seconds
+        self.max_tasks_per_worker = max_tasks_per_worker
+
+        self._ctx = _mp_context()
+        self._sandbox_kwargs = {
+            "timeout_seconds": timeout_seconds,
+            "allowed_modules": set(self.allowed_modules),
+            "safe_builtins": self.safe_builtins,
+        }
+        # One entry per slot; None marks a slot whose worker failed to start
+        self._idle: queue.Queue[_Worker | None] = queue.Queue()
+        self._all: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="sandbox-pool"
+        )
+        self._finalizer = weakref.finalize(self, _shutdown_workers, self._idle, self._all)
+        try:
+            for _ in range(self.workers):
+                self._idle.put(self._spawn())
+        except CodeSandboxError:
+            self.close()
+            raise
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self._sandbox_kwargs, self.memory_limit_mb)
+        with self._lock:
+            self._all.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._all.discard(worker)
+
+    def _checkin(self, worker: _Worker, healthy: bool) -> None:
+        if self._closed:
+            self._retire(worker)
+            return
+        if not healthy or worker.tasks >= self.max_tasks_per_worker or not worker.alive:
+            self._retire(worker)
+            try:
+                worker = self._spawn()
+            except CodeSandboxError as e:
+                logger.warning(f"{e}; retrying on the next task")
+                worker = None
+        self._idle.put(worker)
+
+    def _run(
+        self,
+        kind: str,
+        code: str,
+        inputs: dict[str, Any],
+        extract_vars: list[str] | None,
+    ) -> SandboxResult:
+        if self._closed:
+            return SandboxResult(success=False, error="Sandbox pool is closed")
+
+        payload = {}
+        for name, value in inputs.items():
+            try:
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                logger.debug(f"Input '{name}' cannot be sent to the sandbox, skipping")
+                continue
+            payload[name] = value
+        request = pickle.dumps(
+            (kind, code, payload, extract_vars, self.cpu_time_seconds),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        worker = self._idle.get()
+        if worker is None or not worker.alive:
+            if worker is not None:
+                self._retire(worker)
+            try:
+                worker = self._spawn()
+            except CodeSandboxError as e:
+                self._idle.put(None)
+                return SandboxResult(success=False, error=str(e))
+        healthy = False
+        start = time.monotonic()
+        try:
+            worker.tasks += 1
+            try:
+                worker.conn.send_bytes(request)
+                ready = worker.conn.poll(self.timeout_seconds + KILL_GRACE_SECONDS)
+            except (BrokenPipeError, OSError):
+                worker.process.join(timeout=1)
+                return SandboxResult(success=False, error=_exit_reason(worker.process.exitcode))
+            if not ready:
+                return SandboxResult(
+                    success=False,
+                    error=f"Code execution timed out after {self.timeout_seconds} seconds",
+                    execution_time_ms=int((time.monotonic() - start) * 1000),
+                )
+            try:
+                reply = restricted_loads(worker.conn.recv_bytes())
+            except (EOFError, OSError):
+                worker.process.join(timeout=1)
+                return SandboxResult(
+                    success=False,
+                    error=_exit_reason(worker.process.exitcode),
+                    execution_time_ms=int((time.monotonic() - start) * 1000),
+                )
+            healthy = True
+        finally:
+            self._checkin(worker, healthy)
+
+        return SandboxResult(
+            success=reply["success"],
+            result=_decode_value(reply["result"]),
+            error=reply["error"],
+            stdout=reply["stdout"],
+            variables={k: _decode_value(v) for k, v in reply["variables"].items()},
+            execution_time_ms=reply["execution_time_ms"],
+        )
+
+    def execute(
+        self,
+        code: str,
+        inputs: dict[str, Any] | None = None,
+        extract_vars: list[str] | None = None,
+    ) -> SandboxResult:
+        """Execute code in a worker process; blocks until a worker is free."""
+        try:
+            issues, _ = self._validate_and_compile(code)
+        except (SyntaxError, ValueError) as e:
+            return SandboxResult(success=False, error=f"{type(e).__name__}: {e}")
+        if issues:
+            return SandboxResult(
+                success=False,
+                error=f"Code validation failed: {'; '.join(issues)}",
+            )
+        return self._run("exec", code, inputs or {}, extract_vars)
+
+    def execute_expression(
+        self,
+        expression: str,
+        inputs: dict[str, Any] | None = None,
+    ) -> SandboxResult:
+        """Evaluate a single expression in a worker process."""
+        return self._run("expression", expression, inputs or {}, None)
+
+    async def execute_async(
+        self,
+        code: str,
+        inputs: dict[str, Any] | None = None,
+        extract_vars: list[str] | None = None,
+    ) -> SandboxResult:
+        """Execute code in a worker process without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self.execute, code, inputs, extract_vars)
+        )
+
+    def close(self) -> None:
+        """Stop all workers."""
+        self._closed = True
+        self._executor.shutdown(wait=False)
+        self._finalizer()
+
+    def __enter__(self) -> ProcessPoolSandbox:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
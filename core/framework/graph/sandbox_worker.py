@@ -0,0 +1,110 @@
+"""
+Worker process of ProcessPoolSandbox.
+
+Runs as a script (``runpy.run_path``) rather than as
+``framework.graph.sandbox_worker``: importing any ``framework`` module the
+normal way runs ``framework/__init__``, which pulls in the LLM providers
+(litellm fetches its model cost map on import).  A worker only needs
+CodeSandbox, so it loads ``framework.graph.code_sandbox`` under bare
+package modules and keeps to the standard library otherwise.
+
+Imports at module level must stay stdlib-only.
+"""
+
+import importlib
+import math
+import pickle
+import signal
+import sys
+import types
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# run_name the parent passes to runpy.run_path; see the bottom of this file
+RUN_NAME = "__sandbox_worker__"
+REPR_LIMIT = 1000
+
+
+def _encode_value(value: Any) -> tuple[str, Any]:
+    try:
+        return ("pickle", pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        text = repr(value)
+        return ("repr", text[:REPR_LIMIT])
+
+
+def _set_limit(limit: int, soft: int) -> None:
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(limit, (soft, hard))
+
+
+def _load_code_sandbox() -> Any:
+    """Import CodeSandbox without running the ``framework`` package __init__ files."""
+    graph_dir = Path(__file__).resolve().parent
+    for name, path in (("framework", graph_dir.parent), ("framework.graph", graph_dir)):
+        if name not in sys.modules:
+            package = types.ModuleType(name)
+            package.__path__ = [str(path)]
+            sys.modules[name] = package
+    return importlib.import_module("framework.graph.code_sandbox").CodeSandbox
+
+
+def worker_main(
+    conn: Connection,
+    sandbox_kwargs: dict[str, Any],
+    memory_limit_mb: int | None,
+) -> None:
+    """Serve sandbox requests from *conn* until the parent goes away."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C is the parent's business
+    if resource is not None and memory_limit_mb:
+        _set_limit(resource.RLIMIT_AS, memory_limit_mb * 1024 * 1024)
+    sandbox = _load_code_sandbox()(**sandbox_kwargs)
+    # Warm up, so the first task that imports them does not pay for it
+    for name in sorted(sandbox.allowed_modules):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    while True:
+        try:
+            request = pickle.loads(conn.recv_bytes())
+        except (EOFError, OSError):
+            return
+        kind, code, inputs, extract_vars, cpu_seconds = request
+
+        if resource is not None and cpu_seconds:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            used = usage.ru_utime + usage.ru_stime
+            _set_limit(resource.RLIMIT_CPU, math.ceil(used + cpu_seconds))
+
+        if kind == "expression":
+            result = sandbox.execute_expression(code, inputs)
+        else:
+            result = sandbox.execute(code, inputs, extract_vars)
+
+        reply = {
+            "success": result.success,
+            "error": result.error,
+            "stdout": result.stdout,
+            "execution_time_ms": result.execution_time_ms,
+            "result": _encode_value(result.result),
+            "variables": {k: _encode_value(v) for k, v in result.variables.items()},
+        }
+        try:
+            conn.send_bytes(pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL))
+        except (BrokenPipeError, OSError):
+            return
+
+
+if __name__ == RUN_NAME:
+    # The parent passes the arguments as init_globals
+    worker_main(**globals()["worker_args"])
@@ -266,7 +266,7 @@ async def _dispatch(
             return await self._execute_function(action, inputs)
 
         elif action.action_type == ActionType.CODE_EXECUTION:
-            return self._execute_code(action, inputs, context)
+            return await self._execute_code(action, inputs, context)
 
         else:
             return StepExecutionResult(
@@ -569,7 +569,7 @@ async def _execute_function(
                 executor_type="function",
             )
 
-    def _execute_code(
+    async def _execute_code(
         self,
         action: ActionSpec,
         inputs: dict[str, Any],
@@ -588,8 +588,8 @@ def _execute_code(
         # Merge inputs with context for code
         code_inputs = {**context, **inputs}
 
-        # Execute in sandbox
-        sandbox_result = self.sandbox.execute(code, code_inputs)
+        # Execute in sandbox (off the event loop for ProcessPoolSandbox)
+        sandbox_result = await self.sandbox.execute_async(code, code_inputs)
 
         if sandbox_result.success:
             return StepExecutionResult(
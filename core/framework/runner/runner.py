@@ -682,6 +682,8 @@ def _setup_agent_runtime(self, tools: list, tool_executor: Callable | None) -> N
                 isolation_level=async_ep.isolation_level,
                 priority=async_ep.priority,
                 max_concurrent=async_ep.max_concurrent,
+                weight=async_ep.weight,
+                max_queued=async_ep.max_queued,
             )
             entry_points.append(ep)
 
@@ -0,0 +1,301 @@
+"""
+Admission Control - Runtime-wide concurrency budget shared by all streams.
+
+Each ExecutionStream limits its own concurrency, but without a shared
+budget a burst on one entry point can oversubscribe the LLM quota and
+starve the others. The AdmissionController owns one global pool of
+execution slots and decides which queued execution runs next:
+
+- Higher-priority triggers are admitted first
+- Among equal priorities, entry points share slots by weighted fair
+  queueing (start-time fair queueing over virtual time)
+- Per-entry-point max_concurrent is still respected
+- Queues are bounded; triggers beyond the limit are rejected up front
+- Queue-wait latency is recorded per entry point
+
+Example:
+    controller = AdmissionController(max_concurrent=20)
+    controller.register("webhook", weight=1.0, max_concurrent=10, max_queued=100)
+    controller.register("api", weight=3.0, max_concurrent=10)
+
+    ticket = controller.submit("webhook", priority=0)  # may raise AdmissionRejectedError
+    try:
+        await ticket.wait()
+        ...  # run the execution
+    finally:
+        controller.release(ticket)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Number of recent queue-wait samples kept per entry point for percentiles
+WAIT_SAMPLE_SIZE = 1000
+
+
+class AdmissionRejectedError(RuntimeError):
+    """A trigger was rejected because the admission queue is full."""
+
+    pass
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """A single execution's place in the admission queue."""
+
+    stream_id: str
+    priority: int
+    seq: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted_at: float | None = None
+    state: str = "queued"  # queued, admitted, released, cancelled
+
+    async def wait(self) -> None:
+        """Wait until the controller grants this ticket a slot."""
+        await asyncio.shield(self.future)
+
+    @property
+    def wait_seconds(self) -> float | None:
+        """Time spent queued, once admitted."""
+        if self.admitted_at is None:
+            return None
+        return self.admitted_at - self.enqueued_at
+
+
+@dataclass
+class _StreamQueue:
+    """Per-entry-point queue and accounting."""
+
+    weight: float = 1.0
+    max_concurrent: int | None = None
+    max_queued: int | None = None
+    heap: list[tuple[int, int, AdmissionTicket]] = field(default_factory=list)
+    queued: int = 0
+    running: int = 0
+    virtual_time: float = 0.0
+    admitted: int = 0
+    rejected: int = 0
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLE_SIZE))
+    max_wait: float = 0.0
+
+    def head(self) -> AdmissionTicket | None:
+        """Highest-priority live ticket, discarding cancelled ones."""
+        while self.heap and self.heap[0][2].state != "queued":
+            heapq.heappop(self.heap)
+        return self.heap[0][2] if self.heap else None
+
+    def can_run(self) -> bool:
+        return self.max_concurrent is None or self.running < self.max_concurrent
+
+
+class AdmissionController:
+    """
+    Global concurrency budget with priority and weighted fair queueing.
+
+    Not thread-safe: all calls must come from the runtime's event loop.
+    """
+
+    def __init__(self, max_concurrent: int = 100, max_queued: int | None = None):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrent: Executions allowed to run at once across all streams
+            max_queued: Optional cap on queued executions across all streams
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self._streams: dict[str, _StreamQueue] = {}
+        self._seq = itertools.count()
+        self._in_use = 0
+        self._queued = 0
+        self._virtual_time = 0.0
+
+    def register(
+        self,
+        stream_id: str,
+        weight: float = 1.0,
+        max_concurrent: int | None = None,
+        max_queued: int | None = None,
+    ) -> None:
+        """
+        Register (or reconfigure) an entry point.
+
+        Args:
+            stream_id: Entry point / stream identifier
+            weight: Share of the global budget relative to other streams
+            max_concurrent: Per-stream running limit (None = only the global budget)
+            max_queued: Per-stream queue limit (None = unbounded)
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        queue = self._streams.setdefault(stream_id, _StreamQueue())
+        queue.weight = weight
+        queue.max_concurrent = max_concurrent
+        queue.max_queued = max_queued
+
+    def submit(self, stream_id: str, priority: int = 0) -> AdmissionTicket:
+        """
+        Queue an execution for admission.
+
+        Called synchronously when a trigger arrives so that overload is
+        reported to the caller instead of surfacing later in a background task.
+
+        Args:
+            stream_id: Registered entry point
+            priority: Higher values are admitted first
+
+        Returns:
+            Ticket to wait on and release
+
+        Raises:
+            KeyError: If the stream is not registered
+            AdmissionRejectedError: If the stream or global queue is full
+        """
+        queue = self._streams[stream_id]
+        if queue.max_queued is not None and queue.queued >= queue.max_queued:
+            queue.rejected += 1
+            raise AdmissionRejectedError(
+                f"Admission queue for '{stream_id}' is full ({queue.max_queued} queued)"
+            )
+        if self.max_queued is not None and self._queued >= self.max_queued:
+            queue.rejected += 1
+            raise AdmissionRejectedError(
+                f"Runtime admission queue is full ({self.max_queued} queued)"
+            )
+
+        ticket = AdmissionTicket(
+            stream_id=stream_id,
+            priority=priority,
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        if queue.queued == 0:
+            # A stream returning from idle must not cash in credit it
+            # accumulated while it had nothing to run
+            queue.virtual_time = max(queue.virtual_time, self._virtual_time)
+        heapq.heappush(queue.heap, (-priority, ticket.seq, ticket))
+        queue.queued += 1
+        self._queued += 1
+
+        self._dispatch()
+        return ticket
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """
+        Give back a ticket's slot, or withdraw it from the queue.
+
+        Idempotent, so it is safe to call from both a finally block and a
+        task done-callback.
+        """
+        queue = self._streams.get(ticket.stream_id)
+        if ticket.state == "queued":
+            ticket.state = "cancelled"
+            if queue is not None:
+                queue.queued -= 1
+            self._queued -= 1
+            if not ticket.future.done():
+                ticket.future.cancel()
+        elif ticket.state == "admitted":
+            ticket.state = "released"
+            if queue is not None:
+                queue.running -= 1
+            self._in_use -= 1
+        else:
+            return
+        self._dispatch()
+
+    def _pick(self) -> _StreamQueue | None:
+        """Choose the stream whose head ticket runs next."""
+        best: _StreamQueue | None = None
+        best_key: tuple[int, float] | None = None
+        for queue in self._streams.values():
+            if not queue.can_run():
+                continue
+            head = queue.head()
+            if head is None:
+                continue
+            key = (-head.priority, queue.virtual_time)
+            if best_key is None or key < best_key:
+                best, best_key = queue, key
+        return best
+
+    def _dispatch(self) -> None:
+        """Admit queued tickets while global slots are free."""
+        while self._in_use < self.max_concurrent:
+            queue = self._pick()
+            if queue is None:
+                return
+            _, _, ticket = heapq.heappop(queue.heap)
+
+            self._virtual_time = queue.virtual_time
+            queue.virtual_time += 1.0 / queue.weight
+            queue.queued -= 1
+            queue.running += 1
+            queue.admitted += 1
+            self._queued -= 1
+            self._in_use += 1
+
+            ticket.state = "admitted"
+            ticket.admitted_at = time.monotonic()
+            wait = ticket.admitted_at - ticket.enqueued_at
+            queue.waits.append(wait)
+            queue.max_wait = max(queue.max_wait, wait)
+            ticket.future.set_result(None)
+
+    # === STATS AND MONITORING ===
+
+    @staticmethod
+    def _wait_stats(samples: list[float], max_wait: float) -> dict[str, float]:
+        if not samples:
+            return {"avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "avg_ms": statistics.fmean(ordered) * 1000,
+            "p50_ms": statistics.median(ordered) * 1000,
+            "p95_ms": p95 * 1000,
+            "max_ms": max_wait * 1000,
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get global and per-stream admission statistics."""
+        streams = {}
+        all_waits: list[float] = []
+        for stream_id, queue in self._streams.items():
+            all_waits.extend(queue.waits)
+            streams[stream_id] = {
+                "weight": queue.weight,
+                "max_concurrent": queue.max_concurrent,
+                "max_queued": queue.max_queued,
+                "queued": queue.queued,
+                "running": queue.running,
+                "admitted": queue.admitted,
+                "rejected": queue.rejected,
+                "queue_wait": self._wait_stats(list(queue.waits), queue.max_wait),
+            }
+
+        max_wait = max((q.max_wait for q in self._streams.values()), default=0.0)
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "in_use": self._in_use,
+            "available_slots": self.max_concurrent - self._in_use,
+            "queued": self._queued,
+            "admitted": sum(q.admitted for q in self._streams.values()),
+            "rejected": sum(q.rejected for q in self._streams.values()),
+            "queue_wait": self._wait_stats(all_waits, max_wait),
+            "streams": streams,
+        }
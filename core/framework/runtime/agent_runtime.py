@@ -7,6 +7,7 @@
 
 import asyncio
 import logging
+import os
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,6 +15,7 @@
 
 from framework.graph.checkpoint_config import CheckpointConfig
 from framework.graph.executor import ExecutionResult
+from framework.runtime.admission import AdmissionController, AdmissionRejectedError
 from framework.runtime.event_bus import EventBus
 from framework.runtime.execution_stream import EntryPointSpec, ExecutionStream
 from framework.runtime.outcome_aggregator import OutcomeAggregator
@@ -33,7 +35,9 @@
 class AgentRuntimeConfig:
     """Configuration for AgentRuntime."""
 
+    # Runtime-wide admission budget shared by all entry points
     max_concurrent_executions: int = 100
+    max_queued_executions: int | None = None  # Triggers beyond this are rejected
     cache_ttl: float = 60.0
     batch_interval: float = 0.1
     max_history: int = 1000
@@ -44,6 +48,18 @@ class AgentRuntimeConfig:
     webhook_port: int = 8080
     webhook_routes: list[dict] = field(default_factory=list)
     # Each dict: {"source_id": str, "path": str, "methods": ["POST"], "secret": str|None}
+    # Worker mode (see framework.runtime.worker_pool): run executions in this
+    # many processes, each building its runtime via worker_factory
+    # ("package.module:function", called with worker_factory_kwargs)
+    worker_processes: int = 0
+    worker_factory: str | None = None
+    worker_factory_kwargs: dict[str, Any] = field(default_factory=dict)
+    # Durable execution queue: record accepted triggers in
+    # {storage_path}/execution_queue.db and, on start, resume executions a
+    # crash left unfinished from their latest checkpoint (always on in
+    # worker mode)
+    durable_queue: bool = False
+    max_recovery_attempts: int = 3  # Give up on executions that keep crashing
 
 
 class AgentRuntime:
@@ -145,6 +161,10 @@ def __init__(
         self._state_manager = SharedStateManager()
         self._event_bus = EventBus(max_history=self._config.max_history)
         self._outcome_aggregator = OutcomeAggregator(goal, self._event_bus)
+        self._admission = AdmissionController(
+            max_concurrent=self._config.max_concurrent_executions,
+            max_queued=self._config.max_queued_executions,
+        )
 
         # LLM and tools
         self._llm = llm
@@ -160,6 +180,18 @@ def __init__(
         # Event-driven entry point subscriptions
         self._event_subscriptions: list[str] = []
 
+        # Durable queue and worker processes (created on start)
+        self._execution_queue: Any = None
+        self._worker_pool: Any = None
+        self._queue_owner_id: str | None = None
+        self._lease_task: asyncio.Task | None = None
+        self._completion_watchers: set[asyncio.Task] = set()
+        self._completions_since_prune = 0
+        self._recovered_executions = 0
+        self._stopping = False
+        if self._config.worker_processes > 0 and not self._config.worker_factory:
+            raise ValueError("worker_processes requires worker_factory")
+
         # State
         self._running = False
         self._lock = asyncio.Lock()
@@ -212,8 +244,14 @@ def unregister_entry_point(self, entry_point_id: str) -> bool:
             return True
         return False
 
-    async def start(self) -> None:
-        """Start the agent runtime and all registered entry points."""
+    async def start(self, serve_triggers: bool = True) -> None:
+        """
+        Start the agent runtime and all registered entry points.
+
+        Args:
+            serve_triggers: Start the webhook server and event-driven entry
+                points. Worker processes pass False: their parent owns triggers.
+        """
         if self._running:
             return
 
@@ -221,31 +259,26 @@ async def start(self) -> None:
             # Start storage
             await self._storage.start()
 
-            # Create streams for each entry point
-            for ep_id, spec in self._entry_points.items():
-                stream = ExecutionStream(
-                    stream_id=ep_id,
-                    entry_spec=spec,
-                    graph=self.graph,
-                    goal=self.goal,
-                    state_manager=self._state_manager,
-                    storage=self._storage,
-                    outcome_aggregator=self._outcome_aggregator,
-                    event_bus=self._event_bus,
-                    llm=self._llm,
-                    tools=self._tools,
-                    tool_executor=self._tool_executor,
-                    result_retention_max=self._config.execution_result_max,
-                    result_retention_ttl_seconds=self._config.execution_result_ttl_seconds,
-                    runtime_log_store=self._runtime_log_store,
-                    session_store=self._session_store,
-                    checkpoint_config=self._checkpoint_config,
+            if self.worker_mode or self._config.durable_queue:
+                from framework.runtime.execution_queue import ExecutionQueue, owner_id
+
+                self._execution_queue = await asyncio.to_thread(
+                    ExecutionQueue, self._storage.base_path / "execution_queue.db"
                 )
-                await stream.start()
-                self._streams[ep_id] = stream
+                self._queue_owner_id = owner_id("runtime")
+            if self.worker_mode:
+                # Requeue leftovers before workers start claiming
+                await self._recover_executions()
+                await self._start_worker_pool()
+            else:
+                # Workers run the entry point streams in worker mode
+                await self._start_streams()
+                if self._execution_queue is not None:
+                    await self._start_queue_tracking()
+                    await self._recover_executions()
 
             # Start webhook server if routes are configured
-            if self._config.webhook_routes:
+            if serve_triggers and self._config.webhook_routes:
                 from framework.runtime.webhook_server import (
                     WebhookRoute,
                     WebhookServer,
@@ -273,7 +306,7 @@ async def start(self) -> None:
             from framework.runtime.event_bus import EventType as _ET
 
             for ep_id, spec in self._entry_points.items():
-                if spec.trigger_type != "event":
+                if not serve_triggers or spec.trigger_type != "event":
                     continue
 
                 tc = spec.trigger_config
@@ -288,7 +321,7 @@ async def start(self) -> None:
                 # Capture ep_id in closure
                 def _make_handler(entry_point_id: str):
                     async def _on_event(event):
-                        if self._running and entry_point_id in self._streams:
+                        if self._running and (entry_point_id in self._streams or self.worker_mode):
                             await self.trigger(entry_point_id, {"event": event.to_dict()})
 
                     return _on_event
@@ -302,7 +335,186 @@ async def _on_event(event):
                 self._event_subscriptions.append(sub_id)
 
             self._running = True
-            logger.info(f"AgentRuntime started with {len(self._streams)} streams")
+            if self.worker_mode:
+                logger.info(
+                    f"AgentRuntime started with {self._config.worker_processes} worker processes"
+                )
+            else:
+                logger.info(f"AgentRuntime started with {len(self._streams)} streams")
+
+    async def _start_streams(self) -> None:
+        """Create and start an ExecutionStream for each entry point."""
+        for ep_id, spec in self._entry_points.items():
+            self._admission.register(
+                ep_id,
+                weight=spec.weight,
+                max_concurrent=spec.max_concurrent,
+                max_queued=spec.max_queued,
+            )
+            stream = ExecutionStream(
+                stream_id=ep_id,
+                entry_spec=spec,
+                graph=self.graph,
+                goal=self.goal,
+                state_manager=self._state_manager,
+                storage=self._storage,
+                outcome_aggregator=self._outcome_aggregator,
+                event_bus=self._event_bus,
+                llm=self._llm,
+                tools=self._tools,
+                tool_executor=self._tool_executor,
+                result_retention_max=self._config.execution_result_max,
+                result_retention_ttl_seconds=self._config.execution_result_ttl_seconds,
+                runtime_log_store=self._runtime_log_store,
+                session_store=self._session_store,
+                checkpoint_config=self._checkpoint_config,
+                admission=self._admission,
+            )
+            await stream.start()
+            self._streams[ep_id] = stream
+
+    async def _start_queue_tracking(self) -> None:
+        """Hold this runtime's owner lease and mark executions in flight as they start."""
+        from framework.runtime.event_bus import EventType
+
+        owners = {self._queue_owner_id: os.getpid()}
+        await asyncio.to_thread(self._execution_queue.renew_leases, owners)
+        self._lease_task = asyncio.create_task(self._renew_lease(owners))
+        self._event_subscriptions.append(
+            self._event_bus.subscribe(
+                event_types=[EventType.EXECUTION_STARTED],
+                handler=self._on_execution_started,
+            )
+        )
+
+    async def _renew_lease(self, owners: dict[str, int]) -> None:
+        from framework.runtime.execution_queue import LEASE_SECONDS
+
+        while True:
+            await asyncio.sleep(LEASE_SECONDS / 3)
+            try:
+                await asyncio.to_thread(self._execution_queue.renew_leases, owners)
+            except Exception as e:
+                logger.warning(f"Failed to renew execution queue lease: {e}")
+
+    async def _on_execution_started(self, event) -> None:
+        # Triggers are recorded as queued; they count as an attempt only
+        # once they hold an execution slot
+        queue = self._execution_queue
+        if queue is not None and event.execution_id:
+            await asyncio.to_thread(queue.start, event.execution_id, self._queue_owner_id)
+
+    async def _start_worker_pool(self) -> None:
+        """Spawn worker processes consuming the execution queue."""
+        from framework.runtime.worker_pool import WorkerPool
+
+        self._worker_pool = WorkerPool(
+            queue=self._execution_queue,
+            factory=self._config.worker_factory,
+            workers=self._config.worker_processes,
+            event_bus=self._event_bus,
+            factory_kwargs=self._config.worker_factory_kwargs,
+        )
+        await self._worker_pool.start()
+
+    async def _recover_executions(self) -> None:
+        """
+        Resume executions a previous process accepted but never finished.
+
+        Executions that had started resume from their latest checkpoint
+        (or from the beginning if none was written). In worker mode they
+        are put back in the queue; otherwise they restart on this runtime's
+        streams. Executions whose owner still holds its lease are running
+        in another process sharing the queue and are left alone.
+        """
+        from framework.runtime.execution_queue import IN_FLIGHT, checkpoint_resume_state
+
+        queue = self._execution_queue
+        live_owners = await asyncio.to_thread(queue.live_owners)
+        # Nothing runs here yet, so rows left under our own ID are orphans
+        live_owners.discard(self._queue_owner_id)
+        for item in await asyncio.to_thread(queue.unfinished):
+            if item.worker_id in live_owners:
+                continue
+            if item.status != IN_FLIGHT and item.worker_id is None and self.worker_mode:
+                continue  # never started; workers will claim it as is
+
+            if item.attempts >= self._config.max_recovery_attempts:
+                logger.error(f"Abandoning execution {item.id} after {item.attempts} attempts")
+                await asyncio.to_thread(
+                    queue.fail, item.id, f"Abandoned after {item.attempts} interrupted attempts"
+                )
+                continue
+
+            session_state = item.session_state
+            if item.status == IN_FLIGHT:
+                session_state = await checkpoint_resume_state(self._storage.base_path, item)
+
+            if self.worker_mode:
+                await asyncio.to_thread(queue.reschedule, item.id, session_state)
+            else:
+                stream = self._streams.get(item.entry_point)
+                if stream is None:
+                    await asyncio.to_thread(
+                        queue.fail, item.id, f"Entry point '{item.entry_point}' not registered"
+                    )
+                    continue
+                # Reserve it before the stream can start it (see _on_execution_started)
+                await asyncio.to_thread(
+                    queue.reschedule, item.id, session_state, self._queue_owner_id
+                )
+                try:
+                    await stream.execute(
+                        item.input_data,
+                        item.correlation_id,
+                        session_state,
+                        priority=item.priority,
+                        execution_id=item.id,
+                    )
+                except AdmissionRejectedError as e:
+                    logger.warning(f"Execution {item.id} not recovered yet: {e}")
+                    await asyncio.to_thread(queue.reschedule, item.id, session_state)
+                    continue
+                self._watch_completion(stream, item.id)
+
+            self._recovered_executions += 1
+            logger.info(
+                f"Recovered execution {item.id}"
+                + (
+                    f" from checkpoint {session_state['resume_from_checkpoint']}"
+                    if session_state and "resume_from_checkpoint" in session_state
+                    else ""
+                )
+            )
+
+        await asyncio.to_thread(
+            queue.prune_finished,
+            keep=self._config.execution_result_max,
+            older_than_seconds=self._config.execution_result_ttl_seconds,
+        )
+
+    def _watch_completion(self, stream: ExecutionStream, execution_id: str) -> None:
+        """Mark a durably queued in-process execution finished when it ends."""
+        task = asyncio.create_task(self._record_completion(stream, execution_id))
+        self._completion_watchers.add(task)
+        task.add_done_callback(self._completion_watchers.discard)
+
+    async def _record_completion(self, stream: ExecutionStream, execution_id: str) -> None:
+        result = await stream.wait_for_completion(execution_id)
+        if self._stopping or result is None:
+            # Cut short by shutdown: stays in flight and is recovered on restart
+            return
+        queue = self._execution_queue
+        await asyncio.to_thread(queue.complete, execution_id, result)
+
+        self._completions_since_prune += 1
+        if self._completions_since_prune >= 100:
+            self._completions_since_prune = 0
+            await asyncio.to_thread(
+                queue.prune_finished,
+                keep=self._config.execution_result_max,
+                older_than_seconds=self._config.execution_result_ttl_seconds,
+            )
 
     async def stop(self) -> None:
         """Stop the agent runtime and all streams."""
@@ -320,12 +532,35 @@ async def stop(self) -> None:
                 await self._webhook_server.stop()
                 self._webhook_server = None
 
+            # Executions cut short from here on stay unfinished in the
+            # durable queue so the next start resumes them
+            self._stopping = True
+
             # Stop all streams
             for stream in self._streams.values():
                 await stream.stop()
 
             self._streams.clear()
 
+            if self._completion_watchers:
+                await asyncio.gather(*self._completion_watchers, return_exceptions=True)
+
+            if self._lease_task is not None:
+                self._lease_task.cancel()
+                self._lease_task = None
+                # Executions cut short are now free for any runtime to recover
+                await asyncio.to_thread(self._execution_queue.drop_leases, [self._queue_owner_id])
+
+            # Stop worker processes (their unfinished executions stay queued)
+            if self._worker_pool is not None:
+                await self._worker_pool.stop()
+                self._worker_pool = None
+
+            if self._execution_queue is not None:
+                self._execution_queue.close()
+                self._execution_queue = None
+            self._stopping = False
+
             # Stop storage
             await self._storage.stop()
 
@@ -338,17 +573,20 @@ async def trigger(
         input_data: dict[str, Any],
         correlation_id: str | None = None,
         session_state: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> str:
         """
         Trigger execution at a specific entry point.
 
-        Non-blocking - returns immediately with execution ID.
+        Non-blocking - returns immediately with execution ID. The execution
+        waits in the runtime-wide admission queue until a slot is free.
 
         Args:
             entry_point_id: Which entry point to trigger
             input_data: Input data for the execution
             correlation_id: Optional ID to correlate related executions
             session_state: Optional session state to resume from (with paused_at, memory)
+            priority: Admission priority (defaults to the entry point's priority)
 
         Returns:
             Execution ID for tracking
@@ -356,15 +594,102 @@ async def trigger(
         Raises:
             ValueError: If entry point not found
             RuntimeError: If runtime not running
+            AdmissionRejectedError: If the admission queue is full
         """
         if not self._running:
             raise RuntimeError("AgentRuntime is not running")
 
+        if self.worker_mode:
+            return await self._enqueue(
+                entry_point_id, input_data, correlation_id, session_state, priority
+            )
+
         stream = self._streams.get(entry_point_id)
         if stream is None:
             raise ValueError(f"Entry point '{entry_point_id}' not found")
 
-        return await stream.execute(input_data, correlation_id, session_state)
+        queue = self._execution_queue
+        if queue is None:
+            return await stream.execute(
+                input_data, correlation_id, session_state, priority=priority
+            )
+
+        # Record the trigger as queued for this runtime before the stream can
+        # start it; it is marked in flight once it gets a slot
+        resume_session_id = session_state.get("resume_session_id") if session_state else None
+        execution_id = resume_session_id or self._session_store.generate_session_id()
+        spec = self._entry_points[entry_point_id]
+        try:
+            await asyncio.to_thread(
+                queue.enqueue,
+                execution_id,
+                entry_point_id,
+                input_data,
+                correlation_id=correlation_id or execution_id,
+                session_state=session_state,
+                priority=spec.priority if priority is None else priority,
+                worker_id=self._queue_owner_id,
+            )
+        except ValueError as e:
+            logger.warning(f"Execution {execution_id} not recorded in durable queue: {e}")
+            return await stream.execute(
+                input_data,
+                correlation_id,
+                session_state,
+                priority=priority,
+                execution_id=execution_id,
+            )
+
+        try:
+            await stream.execute(
+                input_data,
+                correlation_id,
+                session_state,
+                priority=priority,
+                execution_id=execution_id,
+            )
+        except Exception as e:
+            await asyncio.to_thread(queue.fail, execution_id, str(e))
+            raise
+        self._watch_completion(stream, execution_id)
+        return execution_id
+
+    async def _enqueue(
+        self,
+        entry_point_id: str,
+        input_data: dict[str, Any],
+        correlation_id: str | None,
+        session_state: dict[str, Any] | None,
+        priority: int | None,
+    ) -> str:
+        """Worker mode: record the trigger in the durable queue for a worker."""
+        spec = self._entry_points.get(entry_point_id)
+        if spec is None:
+            raise ValueError(f"Entry point '{entry_point_id}' not found")
+
+        queue = self._execution_queue
+        if spec.max_queued is not None:
+            if await asyncio.to_thread(queue.count, entry_point=entry_point_id) >= spec.max_queued:
+                raise AdmissionRejectedError(
+                    f"Admission queue for '{entry_point_id}' is full ({spec.max_queued} queued)"
+                )
+        max_queued = self._config.max_queued_executions
+        if max_queued is not None and await asyncio.to_thread(queue.count) >= max_queued:
+            raise AdmissionRejectedError(f"Runtime admission queue is full ({max_queued} queued)")
+
+        resume_session_id = session_state.get("resume_session_id") if session_state else None
+        execution_id = resume_session_id or self._session_store.generate_session_id()
+        await asyncio.to_thread(
+            queue.enqueue,
+            execution_id,
+            entry_point_id,
+            input_data,
+            correlation_id=correlation_id or execution_id,
+            session_state=session_state,
+            priority=spec.priority if priority is None else priority,
+        )
+        self._worker_pool.notify()
+        return execution_id
 
     async def trigger_and_wait(
         self,
@@ -372,6 +697,7 @@ async def trigger_and_wait(
         input_data: dict[str, Any],
         timeout: float | None = None,
         session_state: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> ExecutionResult | None:
         """
         Trigger execution and wait for completion.
@@ -381,11 +707,16 @@ async def trigger_and_wait(
             input_data: Input data for the execution
             timeout: Maximum time to wait (seconds)
             session_state: Optional session state to resume from (with paused_at, memory)
+            priority: Admission priority (defaults to the entry point's priority)
 
         Returns:
             ExecutionResult or None if timeout
         """
-        exec_id = await self.trigger(entry_point_id, input_data, session_state=session_state)
+        exec_id = await self.trigger(
+            entry_point_id, input_data, session_state=session_state, priority=priority
+        )
+        if self.worker_mode:
+            return await self._worker_pool.wait_for_completion(exec_id, timeout)
         stream = self._streams.get(entry_point_id)
         if stream is None:
             raise ValueError(f"Entry point '{entry_point_id}' not found")
@@ -405,6 +736,8 @@ async def inject_input(self, node_id: str, content: str) -> bool:
         Returns:
             True if input was delivered, False if no matching node found
         """
+        if self._worker_pool is not None:
+            return await self._worker_pool.inject_input(node_id, content)
         for stream in self._streams.values():
             if await stream.inject_input(node_id, content):
                 return True
@@ -435,6 +768,8 @@ async def cancel_execution(
         Returns:
             True if cancelled, False if not found
         """
+        if self._worker_pool is not None:
+            return await self._worker_pool.cancel(execution_id)
         stream = self._streams.get(entry_point_id)
         if stream is None:
             return False
@@ -456,6 +791,8 @@ def get_execution_result(
         execution_id: str,
     ) -> ExecutionResult | None:
         """Get result of a completed execution."""
+        if self._worker_pool is not None:
+            return self._worker_pool.get_result(execution_id)
         stream = self._streams.get(entry_point_id)
         if stream:
             return stream.get_result(execution_id)
@@ -502,6 +839,16 @@ def get_stats(self) -> dict:
             "running": self._running,
             "entry_points": len(self._entry_points),
             "streams": stream_stats,
+            "admission": self._admission.get_stats(),
+            "workers": self._worker_pool.get_stats() if self._worker_pool else None,
+            "execution_queue": (
+                {
+                    **self._execution_queue.get_stats(),
+                    "recovered": self._recovered_executions,
+                }
+                if self._execution_queue is not None
+                else None
+            ),
             "goal_id": self.goal.id,
             "outcome_aggregator": self._outcome_aggregator.get_stats(),
             "event_bus": self._event_bus.get_stats(),
@@ -515,6 +862,11 @@ def state_manager(self) -> SharedStateManager:
         """Access the shared state manager."""
         return self._state_manager
 
+    @property
+    def admission(self) -> AdmissionController:
+        """Access the runtime-wide admission controller."""
+        return self._admission
+
     @property
     def event_bus(self) -> EventBus:
         """Access the event bus."""
@@ -530,6 +882,16 @@ def webhook_server(self) -> Any:
         """Access the webhook server (None if no webhook entry points)."""
         return self._webhook_server
 
+    @property
+    def storage_path(self) -> Path:
+        """Root directory for sessions, logs and the execution queue."""
+        return self._storage.base_path
+
+    @property
+    def worker_mode(self) -> bool:
+        """True if executions run in worker processes."""
+        return self._config.worker_processes > 0
+
     @property
     def is_running(self) -> bool:
         """Check if runtime is running."""
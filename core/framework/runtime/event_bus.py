@@ -107,6 +107,19 @@ def to_dict(self) -> dict:
             "correlation_id": self.correlation_id,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AgentEvent":
+        """Rebuild an event from ``to_dict()`` output (e.g. from a worker process)."""
+        return cls(
+            type=EventType(data["type"]),
+            stream_id=data["stream_id"],
+            node_id=data.get("node_id"),
+            execution_id=data.get("execution_id"),
+            data=data.get("data") or {},
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data.get("correlation_id"),
+        )
+
 
 # Type for event handlers
 EventHandler = Callable[[AgentEvent], Awaitable[None]]
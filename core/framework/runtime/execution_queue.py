@@ -0,0 +1,565 @@
+"""
+Execution Queue - Durable, multi-process queue of triggered executions.
+
+Backed by a single SQLite file (WAL mode) so that several processes can
+enqueue and claim work safely without a broker. Each row is one
+execution and moves through:
+
+    queued -> in_flight -> completed | failed
+    queued -> cancelled
+
+Claims happen inside ``BEGIN IMMEDIATE`` transactions, so two workers can
+never claim the same row. If a worker dies, its in-flight rows are put
+back with ``requeue_worker()``. After a crash of the whole process,
+``unfinished()`` lists everything that was accepted but never finished,
+and ``checkpoint_resume_state()`` points a rerun at its latest checkpoint.
+
+Every owner of rows (a runtime running executions in-process, or a
+worker) holds a lease that it renews with ``renew_leases()``. Several
+runtimes, possibly on different hosts, may share one queue file; rows
+whose owner is in ``live_owners()`` are still running somewhere and must
+not be recovered.
+
+All methods are blocking; call them via ``asyncio.to_thread`` from async
+code. One ExecutionQueue instance may be shared between threads.
+"""
+
+import dataclasses
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from framework.graph.executor import ExecutionResult
+from framework.storage.checkpoint_store import CheckpointStore
+
+QUEUED = "queued"
+IN_FLIGHT = "in_flight"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+# An owner whose lease was not renewed for this long is considered dead.
+# Owners renew at least every LEASE_SECONDS / 3.
+LEASE_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    entry_point TEXT NOT NULL,
+    input_data TEXT NOT NULL,
+    correlation_id TEXT,
+    session_state TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_executions_status
+    ON executions (status, priority DESC, seq);
+CREATE TABLE IF NOT EXISTS owners (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class QueuedExecution:
+    """One row of the execution queue."""
+
+    id: str
+    entry_point: str
+    input_data: dict[str, Any]
+    correlation_id: str | None = None
+    session_state: dict[str, Any] | None = None
+    priority: int = 0
+    status: str = QUEUED
+    worker_id: str | None = None
+    attempts: int = 0
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @classmethod
+    def _from_row(cls, row: sqlite3.Row) -> "QueuedExecution":
+        return cls(
+            id=row["id"],
+            entry_point=row["entry_point"],
+            input_data=json.loads(row["input_data"]),
+            correlation_id=row["correlation_id"],
+            session_state=json.loads(row["session_state"]) if row["session_state"] else None,
+            priority=row["priority"],
+            status=row["status"],
+            worker_id=row["worker_id"],
+            attempts=row["attempts"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
+
+    def to_execution_result(self) -> ExecutionResult | None:
+        """Rebuild the ExecutionResult of a finished execution."""
+        if self.result is not None:
+            known = {f.name for f in dataclasses.fields(ExecutionResult)}
+            return ExecutionResult(**{k: v for k, v in self.result.items() if k in known})
+        if self.status in (FAILED, CANCELLED):
+            return ExecutionResult(success=False, error=self.error or f"Execution {self.status}")
+        return None
+
+
+def owner_id(kind: str) -> str:
+    """Owner ID for rows run by this process, unique across hosts sharing a queue."""
+    return f"{kind}-{socket.gethostname()}-{os.getpid()}"
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        return True  # os.kill(pid, 0) would terminate it; rely on the lease
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _dumps(value: Any) -> str:
+    # Results may carry values JSON can't represent (datetimes, sets...)
+    return json.dumps(value, default=str)
+
+
+class ExecutionQueue:
+    """
+    SQLite-backed queue of executions shared by a runtime and its workers.
+
+    Example:
+        queue = ExecutionQueue(storage_path / "execution_queue.db")
+        queue.enqueue("session_...", "webhook", {"ticket_id": "123"})
+
+        # In a worker process
+        item = queue.claim("worker-0", entry_points=["webhook"])
+        ...
+        queue.complete(item.id, result)
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0):
+        """
+        Open (or create) the queue database.
+
+        Args:
+            path: SQLite file path
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout,
+            isolation_level=None,  # explicit transactions only
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # === PRODUCER ===
+
+    def enqueue(
+        self,
+        execution_id: str,
+        entry_point: str,
+        input_data: dict[str, Any],
+        correlation_id: str | None = None,
+        session_state: dict[str, Any] | None = None,
+        priority: int = 0,
+        worker_id: str | None = None,
+    ) -> QueuedExecution:
+        """
+        Record a newly accepted execution.
+
+        A finished execution may be enqueued again under the same ID (e.g.
+        resuming a paused session); its previous result is discarded.
+
+        Passing ``worker_id`` reserves the execution for that owner (a
+        runtime running it in-process): workers do not claim it, and it
+        stays queued until ``start()`` marks it in flight.
+
+        Raises:
+            ValueError: If the execution is already queued or in flight
+        """
+        item = QueuedExecution(
+            id=execution_id,
+            entry_point=entry_point,
+            input_data=input_data,
+            correlation_id=correlation_id,
+            session_state=session_state,
+            priority=priority,
+        )
+        item.worker_id = worker_id
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO executions (id, entry_point, input_data, correlation_id,"
+                " session_state, priority, status, worker_id, attempts, created_at, started_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET entry_point = excluded.entry_point,"
+                " input_data = excluded.input_data, correlation_id = excluded.correlation_id,"
+                " session_state = excluded.session_state, priority = excluded.priority,"
+                " status = excluded.status, worker_id = excluded.worker_id,"
+                " attempts = excluded.attempts, result = NULL, error = NULL,"
+                " created_at = excluded.created_at, started_at = excluded.started_at,"
+                " finished_at = NULL"
+                f" WHERE executions.status IN ({', '.join(repr(s) for s in FINISHED_STATUSES)})",
+                (
+                    item.id,
+                    item.entry_point,
+                    _dumps(item.input_data),
+                    item.correlation_id,
+                    _dumps(item.session_state) if item.session_state is not None else None,
+                    item.priority,
+                    item.status,
+                    item.worker_id,
+                    item.attempts,
+                    item.created_at,
+                    item.started_at,
+                ),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Execution '{execution_id}' is already queued or running")
+        return item
+
+    def cancel(self, execution_id: str) -> bool:
+        """Cancel an execution that has not been claimed yet."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE executions SET status = ?, error = ?, finished_at = ?"
+                " WHERE id = ? AND status = ?",
+                (CANCELLED, "Execution cancelled", time.time(), execution_id, QUEUED),
+            )
+        return cursor.rowcount > 0
+
+    # === CONSUMER ===
+
+    def claim(
+        self, worker_id: str, entry_points: Collection[str] | None = None
+    ) -> QueuedExecution | None:
+        """
+        Atomically take the next queued execution.
+
+        Args:
+            worker_id: Recorded on the row so it can be requeued if the worker dies
+            entry_points: Only claim executions for these entry points
+
+        Returns:
+            The claimed execution (now in flight), or None if nothing is queued
+        """
+        query = "SELECT * FROM executions WHERE status = ? AND worker_id IS NULL"
+        params: list[Any] = [QUEUED]
+        if entry_points is not None:
+            if not entry_points:
+                return None
+            query += f" AND entry_point IN ({', '.join('?' * len(entry_points))})"
+            params.extend(entry_points)
+        query += " ORDER BY priority DESC, seq LIMIT 1"
+
+        with self._transaction() as conn:
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            started_at = time.time()
+            conn.execute(
+                "UPDATE executions SET status = ?, worker_id = ?, attempts = attempts + 1,"
+                " started_at = ? WHERE seq = ?",
+                (IN_FLIGHT, worker_id, started_at, row["seq"]),
+            )
+
+        item = QueuedExecution._from_row(row)
+        item.status = IN_FLIGHT
+        item.worker_id = worker_id
+        item.attempts += 1
+        item.started_at = started_at
+        return item
+
+    def start(self, execution_id: str, worker_id: str) -> bool:
+        """
+        Mark an execution reserved by ``worker_id`` in flight once it runs.
+
+        Returns:
+            False if the execution is not queued for that owner
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE executions SET status = ?, attempts = attempts + 1, started_at = ?"
+                " WHERE id = ? AND status = ? AND worker_id = ?",
+                (IN_FLIGHT, time.time(), execution_id, QUEUED, worker_id),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, execution_id: str, result: ExecutionResult) -> None:
+        """Store the result of an execution and mark it finished."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE executions SET status = ?, result = ?, error = ?, finished_at = ?"
+                " WHERE id = ?",
+                (
+                    COMPLETED if result.success else FAILED,
+                    _dumps(dataclasses.asdict(result)),
+                    result.error,
+                    time.time(),
+                    execution_id,
+                ),
+            )
+
+    def fail(self, execution_id: str, error: str) -> None:
+        """Mark an execution failed without a result."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE executions SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED, error, time.time(), execution_id),
+            )
+
+    def release(self, execution_id: str) -> None:
+        """Put a claimed execution back at the front of its priority level."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE executions SET status = ?, worker_id = NULL,"
+                " attempts = MAX(attempts - 1, 0) WHERE id = ? AND status = ?",
+                (QUEUED, execution_id, IN_FLIGHT),
+            )
+
+    def fail_queued(self, error: str) -> list[str]:
+        """
+        Fail every execution still waiting to be claimed.
+
+        Returns:
+            IDs of the failed executions
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT id FROM executions WHERE status = ?", (QUEUED,)).fetchall()
+            conn.execute(
+                "UPDATE executions SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                (FAILED, error, time.time(), QUEUED),
+            )
+        return [row["id"] for row in rows]
+
+    def requeue_worker(self, worker_id: str) -> list[str]:
+        """
+        Return a dead worker's in-flight executions to the queue.
+
+        Returns:
+            IDs of the requeued executions
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id FROM executions WHERE status = ? AND worker_id = ?",
+                (IN_FLIGHT, worker_id),
+            ).fetchall()
+            conn.execute(
+                "UPDATE executions SET status = ?, worker_id = NULL"
+                " WHERE status = ? AND worker_id = ?",
+                (QUEUED, IN_FLIGHT, worker_id),
+            )
+        return [row["id"] for row in rows]
+
+    def reschedule(
+        self,
+        execution_id: str,
+        session_state: dict[str, Any] | None,
+        worker_id: str | None = None,
+    ) -> None:
+        """
+        Rerun an unfinished execution with new session state.
+
+        Args:
+            execution_id: Execution left unfinished by a crash
+            session_state: State to resume from (e.g. its latest checkpoint)
+            worker_id: Reserve it for this owner (see ``enqueue()``); None lets
+                any worker claim it
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE executions SET status = ?, worker_id = ?, session_state = ? WHERE id = ?",
+                (
+                    QUEUED,
+                    worker_id,
+                    _dumps(session_state) if session_state else None,
+                    execution_id,
+                ),
+            )
+
+    # === OWNER LEASES ===
+
+    def renew_leases(self, owners: dict[str, int]) -> None:
+        """
+        Record that owners running on this host are alive.
+
+        Args:
+            owners: Owner ID -> process ID
+        """
+        now = time.time()
+        host = socket.gethostname()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO owners (id, host, pid, heartbeat_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET host = excluded.host, pid = excluded.pid,"
+                " heartbeat_at = excluded.heartbeat_at",
+                [(owner, host, pid, now) for owner, pid in owners.items()],
+            )
+            # Expired leases mean the same as missing ones
+            conn.execute("DELETE FROM owners WHERE heartbeat_at < ?", (now - LEASE_SECONDS,))
+
+    def drop_leases(self, owners: Collection[str]) -> None:
+        """Give up the leases of owners that stopped running executions."""
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM owners WHERE id = ?", [(owner,) for owner in owners])
+
+    def live_owners(self) -> set[str]:
+        """
+        Owners that may still be running their executions.
+
+        An owner is live while its lease is fresh and, on this host, while
+        its process exists, so a crashed local owner is dead immediately.
+        """
+        host = socket.gethostname()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, host, pid FROM owners WHERE heartbeat_at >= ?",
+                (time.time() - LEASE_SECONDS,),
+            ).fetchall()
+        return {row["id"] for row in rows if row["host"] != host or _pid_alive(row["pid"])}
+
+    # === QUERIES ===
+
+    def unfinished(self) -> list[QueuedExecution]:
+        """Queued and in-flight executions, in the order they would be claimed."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM executions WHERE status IN (?, ?) ORDER BY priority DESC, seq",
+                (QUEUED, IN_FLIGHT),
+            ).fetchall()
+        return [QueuedExecution._from_row(row) for row in rows]
+
+    def get(self, execution_id: str) -> QueuedExecution | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM executions WHERE id = ?", (execution_id,)
+            ).fetchone()
+        return QueuedExecution._from_row(row) if row else None
+
+    def count(self, status: str = QUEUED, entry_point: str | None = None) -> int:
+        """Number of executions in a status, optionally for one entry point."""
+        query = "SELECT COUNT(*) FROM executions WHERE status = ?"
+        params: list[Any] = [status]
+        if entry_point is not None:
+            query += " AND entry_point = ?"
+            params.append(entry_point)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def get_stats(self) -> dict[str, int]:
+        """Execution counts per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM executions GROUP BY status"
+            ).fetchall()
+        stats = dict.fromkeys((QUEUED, IN_FLIGHT, *FINISHED_STATUSES), 0)
+        stats.update({row[0]: row[1] for row in rows})
+        return stats
+
+    def prune_finished(
+        self, keep: int | None = None, older_than_seconds: float | None = None
+    ) -> int:
+        """
+        Delete finished executions beyond the retention limits.
+
+        Args:
+            keep: Keep at most this many of the most recently finished rows
+            older_than_seconds: Delete rows finished longer ago than this
+
+        Returns:
+            Number of rows deleted
+        """
+        finished = f"status IN ({', '.join('?' * len(FINISHED_STATUSES))})"
+        deleted = 0
+        with self._transaction() as conn:
+            if older_than_seconds is not None:
+                cursor = conn.execute(
+                    f"DELETE FROM executions WHERE {finished} AND finished_at < ?",
+                    (*FINISHED_STATUSES, time.time() - older_than_seconds),
+                )
+                deleted += cursor.rowcount
+            if keep is not None:
+                cursor = conn.execute(
+                    f"DELETE FROM executions WHERE {finished} AND seq NOT IN"
+                    f" (SELECT seq FROM executions WHERE {finished}"
+                    " ORDER BY finished_at DESC LIMIT ?)",
+                    (*FINISHED_STATUSES, *FINISHED_STATUSES, keep),
+                )
+                deleted += cursor.rowcount
+        return deleted
+
+
+async def checkpoint_resume_state(
+    storage_path: str | Path, item: QueuedExecution
+) -> dict[str, Any] | None:
+    """
+    Session state that resumes an interrupted execution from its latest checkpoint.
+
+    Args:
+        storage_path: Runtime storage root (sessions live in ``sessions/{id}``)
+        item: Execution that was cut short
+
+    Returns:
+        The execution's own session state extended with ``resume_session_id``
+        and ``resume_from_checkpoint``, or its original session state if no
+        checkpoint was written (checkpointing disabled, or it crashed early)
+    """
+    store = CheckpointStore(Path(storage_path) / "sessions" / item.id)
+    index = await store.load_index()
+    if not index or not index.latest_checkpoint_id:
+        return item.session_state
+    return {
+        **(item.session_state or {}),
+        "resume_session_id": item.id,
+        "resume_from_checkpoint": index.latest_checkpoint_id,
+    }
@@ -12,7 +12,8 @@
 import time
 import uuid
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -26,6 +27,7 @@
     from framework.graph.edge import GraphSpec
     from framework.graph.goal import Goal
     from framework.llm.provider import LLMProvider, Tool
+    from framework.runtime.admission import AdmissionController, AdmissionTicket
     from framework.runtime.event_bus import EventBus
     from framework.runtime.outcome_aggregator import OutcomeAggregator
     from framework.storage.concurrent import ConcurrentStorage
@@ -44,8 +46,10 @@ class EntryPointSpec:
     trigger_type: str  # "webhook", "api", "timer", "event", "manual"
     trigger_config: dict[str, Any] = field(default_factory=dict)
     isolation_level: str = "shared"  # "isolated" | "shared" | "synchronized"
-    priority: int = 0
+    priority: int = 0  # Default admission priority for triggers (higher = sooner)
     max_concurrent: int = 10  # Max concurrent executions for this entry point
+    weight: float = 1.0  # Share of the runtime-wide budget vs. other entry points
+    max_queued: int | None = None  # Queued triggers beyond this are rejected
 
     def get_isolation_level(self) -> IsolationLevel:
         """Convert string isolation level to enum."""
@@ -117,6 +121,7 @@ def __init__(
         runtime_log_store: Any = None,
         session_store: "SessionStore | None" = None,
         checkpoint_config: CheckpointConfig | None = None,
+        admission: "AdmissionController | None" = None,
     ):
         """
         Initialize execution stream.
@@ -136,6 +141,9 @@ def __init__(
             runtime_log_store: Optional RuntimeLogStore for per-execution logging
             session_store: Optional SessionStore for unified session storage
             checkpoint_config: Optional checkpoint configuration for resumable sessions
+            admission: Optional runtime-wide AdmissionController. When set it
+                replaces the stream's own semaphore; the stream must already be
+                registered with it.
         """
         self.stream_id = stream_id
         self.entry_spec = entry_spec
@@ -153,6 +161,7 @@ def __init__(
         self._runtime_log_store = runtime_log_store
         self._checkpoint_config = checkpoint_config
         self._session_store = session_store
+        self._admission = admission
 
         # Create stream-scoped runtime
         self._runtime = StreamRuntime(
@@ -225,7 +234,7 @@ async def stop(self) -> None:
         self._running = False
 
         # Cancel all active executions
-        for _, task in self._execution_tasks.items():
+        for task in list(self._execution_tasks.values()):
             if not task.done():
                 task.cancel()
                 try:
@@ -276,6 +285,8 @@ async def execute(
         input_data: dict[str, Any],
         correlation_id: str | None = None,
         session_state: dict[str, Any] | None = None,
+        priority: int | None = None,
+        execution_id: str | None = None,
     ) -> str:
         """
         Queue an execution and return its ID.
@@ -286,9 +297,15 @@ async def execute(
             input_data: Input data for this execution
             correlation_id: Optional ID to correlate related executions
             session_state: Optional session state to resume from (with paused_at, memory)
+            priority: Admission priority (defaults to the entry point's priority)
+            execution_id: Optional ID assigned upstream (e.g. by a durable queue)
 
         Returns:
             Execution ID for tracking
+
+        Raises:
+            RuntimeError: If the stream is not running
+            AdmissionRejectedError: If the admission queue is full
         """
         if not self._running:
             raise RuntimeError(f"ExecutionStream '{self.stream_id}' is not running")
@@ -297,21 +314,22 @@ async def execute(
         # continues in the same session directory instead of creating a new one.
         resume_session_id = session_state.get("resume_session_id") if session_state else None
 
-        if resume_session_id:
-            execution_id = resume_session_id
-        elif self._session_store:
-            execution_id = self._session_store.generate_session_id()
-        else:
-            # Fallback to old format if SessionStore not available (shouldn't happen)
-            import warnings
-
-            warnings.warn(
-                "SessionStore not available, using deprecated exec_* ID format. "
-                "Please ensure AgentRuntime is properly initialized.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            execution_id = f"exec_{self.stream_id}_{uuid.uuid4().hex[:8]}"
+        if execution_id is None:
+            if resume_session_id:
+                execution_id = resume_session_id
+            elif self._session_store:
+                execution_id = self._session_store.generate_session_id()
+            else:
+                # Fallback to old format if SessionStore not available (shouldn't happen)
+                import warnings
+
+                warnings.warn(
+                    "SessionStore not available, using deprecated exec_* ID format. "
+                    "Please ensure AgentRuntime is properly initialized.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                execution_id = f"exec_{self.stream_id}_{uuid.uuid4().hex[:8]}"
 
         if correlation_id is None:
             correlation_id = execution_id
@@ -327,23 +345,51 @@ async def execute(
             session_state=session_state,
         )
 
+        # Reserve a place in the runtime-wide queue so overload is rejected
+        # before the execution is registered
+        ticket = None
+        if self._admission is not None:
+            ticket = self._admission.submit(
+                self.stream_id,
+                priority=self.entry_spec.priority if priority is None else priority,
+            )
+
         async with self._lock:
             self._active_executions[execution_id] = ctx
             self._completion_events[execution_id] = asyncio.Event()
 
         # Start execution task
-        task = asyncio.create_task(self._run_execution(ctx))
+        task = asyncio.create_task(self._run_execution(ctx, ticket))
+        if ticket is not None:
+            # Also covers tasks cancelled before they ever started running
+            task.add_done_callback(lambda _: self._admission.release(ticket))
         self._execution_tasks[execution_id] = task
 
         logger.debug(f"Queued execution {execution_id} for stream {self.stream_id}")
         return execution_id
 
-    async def _run_execution(self, ctx: ExecutionContext) -> None:
+    @asynccontextmanager
+    async def _execution_slot(self, ticket: "AdmissionTicket | None") -> AsyncIterator[None]:
+        """Hold a runtime admission slot, or the stream's own semaphore."""
+        if ticket is None:
+            async with self._semaphore:
+                yield
+            return
+
+        try:
+            await ticket.wait()
+            yield
+        finally:
+            self._admission.release(ticket)
+
+    async def _run_execution(
+        self, ctx: ExecutionContext, ticket: "AdmissionTicket | None" = None
+    ) -> None:
         """Run a single execution within the stream."""
         execution_id = ctx.id
 
-        # Acquire semaphore to limit concurrency
-        async with self._semaphore:
+        # Acquire an execution slot to limit concurrency
+        async with self._execution_slot(ticket):
             ctx.status = "running"
 
             try:
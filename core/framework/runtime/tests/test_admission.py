@@ -0,0 +1,163 @@
+"""
+Tests for the runtime-wide AdmissionController.
+"""
+
+import asyncio
+
+import pytest
+
+from framework.runtime.admission import AdmissionController, AdmissionRejectedError
+
+
+def _admitted(tickets):
+    return [t.future.done() and not t.future.cancelled() for t in tickets]
+
+
+class TestAdmissionController:
+    """Tests for budget, fairness, priorities and rejection."""
+
+    @pytest.mark.asyncio
+    async def test_global_budget_caps_running(self):
+        controller = AdmissionController(max_concurrent=2)
+        controller.register("a")
+        controller.register("b")
+
+        tickets = [controller.submit(s) for s in ("a", "b", "a", "b")]
+
+        assert _admitted(tickets) == [True, True, False, False]
+        controller.release(tickets[0])
+        assert _admitted(tickets) == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_share(self):
+        controller = AdmissionController(max_concurrent=1)
+        controller.register("heavy", weight=3.0)
+        controller.register("light", weight=1.0)
+        running = controller.submit("light")
+
+        queued = []
+        for _ in range(8):
+            queued.append(controller.submit("heavy"))
+            queued.append(controller.submit("light"))
+
+        # The blocker counts towards light's share
+        order = [running.stream_id]
+        for _ in range(7):
+            controller.release(running)
+            running = next(t for t in queued if t.state == "admitted")
+            order.append(running.stream_id)
+
+        assert order.count("heavy") == 6
+        assert order.count("light") == 2
+
+    @pytest.mark.asyncio
+    async def test_burst_on_one_stream_does_not_starve_another(self):
+        controller = AdmissionController(max_concurrent=2)
+        controller.register("webhook")
+        controller.register("api")
+
+        burst = [controller.submit("webhook") for _ in range(50)]
+        api = controller.submit("api")
+        assert not api.future.done()
+
+        controller.release(burst[0])
+
+        assert api.future.done()
+
+    @pytest.mark.asyncio
+    async def test_per_stream_limit_respected(self):
+        controller = AdmissionController(max_concurrent=10)
+        controller.register("a", max_concurrent=1)
+
+        first, second = controller.submit("a"), controller.submit("a")
+
+        assert _admitted([first, second]) == [True, False]
+        assert controller.get_stats()["available_slots"] == 9
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_admitted_first(self):
+        controller = AdmissionController(max_concurrent=1)
+        controller.register("a")
+        controller.register("b")
+        running = controller.submit("a")
+
+        low = controller.submit("a", priority=0)
+        high = controller.submit("b", priority=5)
+        controller.release(running)
+
+        assert _admitted([low, high]) == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_queue_limits_reject(self):
+        controller = AdmissionController(max_concurrent=1, max_queued=3)
+        controller.register("a", max_queued=1)
+        controller.register("b")
+        controller.submit("a")
+        controller.submit("a")
+
+        with pytest.raises(AdmissionRejectedError, match="'a'"):
+            controller.submit("a")
+
+        controller.submit("b")
+        controller.submit("b")
+        with pytest.raises(AdmissionRejectedError, match="Runtime"):
+            controller.submit("b")
+
+        stats = controller.get_stats()
+        assert stats["rejected"] == 2
+        assert stats["streams"]["a"]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent_and_withdraws_queued(self):
+        controller = AdmissionController(max_concurrent=1)
+        controller.register("a")
+        running = controller.submit("a")
+        queued = controller.submit("a")
+
+        controller.release(queued)
+        controller.release(queued)
+        assert queued.future.cancelled()
+        assert controller.get_stats()["queued"] == 0
+
+        controller.release(running)
+        controller.release(running)
+        assert controller.get_stats()["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        controller = AdmissionController(max_concurrent=1)
+        controller.register("a")
+        running = controller.submit("a")
+        queued = controller.submit("a")
+
+        async def wait_then_release():
+            try:
+                await queued.wait()
+            finally:
+                controller.release(queued)
+
+        task = asyncio.create_task(wait_then_release())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        controller.release(running)
+
+        assert controller.get_stats()["in_use"] == 0
+        assert controller.submit("a").future.done()
+
+    @pytest.mark.asyncio
+    async def test_wait_latency_recorded(self):
+        controller = AdmissionController(max_concurrent=1)
+        controller.register("a")
+        running = controller.submit("a")
+        queued = controller.submit("a")
+
+        await asyncio.sleep(0.05)
+        controller.release(running)
+        await queued.wait()
+
+        wait = controller.get_stats()["streams"]["a"]["queue_wait"]
+        assert queued.wait_seconds >= 0.05
+        assert wait["max_ms"] >= 50
+        assert wait["p95_ms"] >= wait["p50_ms"]
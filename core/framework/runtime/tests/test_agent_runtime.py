@@ -20,7 +20,8 @@
 from framework.graph.edge import AsyncEntryPointSpec, EdgeCondition, EdgeSpec, GraphSpec
 from framework.graph.goal import Constraint, SuccessCriterion
 from framework.graph.node import NodeSpec
-from framework.runtime.agent_runtime import AgentRuntime, create_agent_runtime
+from framework.runtime.admission import AdmissionRejectedError
+from framework.runtime.agent_runtime import AgentRuntime, AgentRuntimeConfig, create_agent_runtime
 from framework.runtime.event_bus import AgentEvent, EventBus, EventType
 from framework.runtime.execution_stream import EntryPointSpec
 from framework.runtime.outcome_aggregator import OutcomeAggregator
@@ -500,6 +501,53 @@ async def test_trigger_requires_running(self, sample_graph, sample_goal, temp_st
         with pytest.raises(RuntimeError, match="not running"):
             await runtime.trigger("webhook", {"test": "data"})
 
+    @pytest.mark.asyncio
+    async def test_global_admission_budget(self, sample_graph, sample_goal, temp_storage):
+        """Test that triggers share a runtime-wide budget and overload is rejected."""
+        runtime = AgentRuntime(
+            graph=sample_graph,
+            goal=sample_goal,
+            storage_path=temp_storage,
+            config=AgentRuntimeConfig(max_concurrent_executions=1, max_queued_executions=2),
+        )
+        runtime.register_entry_point(
+            EntryPointSpec(
+                id="webhook",
+                name="Webhook Handler",
+                entry_node="process-webhook",
+                trigger_type="webhook",
+                max_queued=1,
+            )
+        )
+        runtime.register_entry_point(
+            EntryPointSpec(
+                id="api",
+                name="API Handler",
+                entry_node="process-api",
+                trigger_type="api",
+                weight=2.0,
+            )
+        )
+
+        await runtime.start()
+        try:
+            await runtime.trigger("webhook", {"n": 1})
+            await runtime.trigger("webhook", {"n": 2})
+            with pytest.raises(AdmissionRejectedError):
+                await runtime.trigger("webhook", {"n": 3})
+            await runtime.trigger("api", {"n": 4}, priority=5)
+
+            stats = runtime.get_stats()["admission"]
+            assert stats["in_use"] == 1
+            assert stats["queued"] == 2
+            assert stats["rejected"] == 1
+            assert stats["streams"]["api"]["weight"] == 2.0
+        finally:
+            await runtime.stop()
+
+        assert runtime.admission.get_stats()["in_use"] == 0
+        assert runtime.admission.get_stats()["queued"] == 0
+
 
 # === GraphSpec Validation Tests ===
 
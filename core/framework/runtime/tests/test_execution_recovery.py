@@ -0,0 +1,219 @@
+"""
+Tests for the durable execution queue and crash recovery in AgentRuntime.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from framework.graph.checkpoint_config import CheckpointConfig
+from framework.llm.mock import MockLLMProvider
+from framework.runtime.agent_runtime import AgentRuntime, AgentRuntimeConfig, create_agent_runtime
+from framework.runtime.execution_queue import ExecutionQueue, checkpoint_resume_state
+from framework.runtime.execution_stream import EntryPointSpec
+from framework.runtime.tests.test_worker_pool import (
+    SlowMockLLM,
+    _entry_points,
+    _goal,
+    _graph,
+    _wait_until,
+)
+from framework.schemas.checkpoint import Checkpoint
+from framework.storage.checkpoint_store import CheckpointStore
+
+
+def _durable_runtime(storage_path: Path, **config) -> AgentRuntime:
+    return create_agent_runtime(
+        graph=_graph(),
+        goal=_goal(),
+        storage_path=storage_path,
+        entry_points=_entry_points(),
+        llm=MockLLMProvider(),
+        config=AgentRuntimeConfig(durable_queue=True, **config),
+        checkpoint_config=CheckpointConfig(enabled=True),
+        enable_logging=False,
+    )
+
+
+async def _save_checkpoint(storage_path: Path, session_id: str) -> Checkpoint:
+    checkpoint = Checkpoint.create(
+        checkpoint_type="node_complete",
+        session_id=session_id,
+        current_node="prior",
+        execution_path=["prior"],
+        shared_memory={"text": "restored"},
+        next_node="echo",
+    )
+    await CheckpointStore(storage_path / "sessions" / session_id).save_checkpoint(checkpoint)
+    return checkpoint
+
+
+def _seed_in_flight(
+    storage_path: Path, execution_id: str, attempts: int = 1, owner: str = "runtime-dead"
+) -> None:
+    queue = ExecutionQueue(storage_path / "execution_queue.db")
+    queue.enqueue(execution_id, "default", {"text": "hi"}, worker_id=owner)
+    queue.start(execution_id, owner)
+    for _ in range(attempts - 1):
+        queue.reschedule(execution_id, None, owner)
+        queue.start(execution_id, owner)
+    queue.close()
+
+
+@pytest.fixture
+def temp_storage():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestCheckpointResumeState:
+    """Tests for resolving where an interrupted execution continues."""
+
+    @pytest.mark.asyncio
+    async def test_without_checkpoint_keeps_session_state(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("session_a", "ep", {}, session_state={"memory": {"x": 1}})
+
+        state = await checkpoint_resume_state(temp_storage, queue.get("session_a"))
+
+        assert state == {"memory": {"x": 1}}
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_latest_checkpoint(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("session_a", "ep", {})
+        checkpoint = await _save_checkpoint(temp_storage, "session_a")
+
+        state = await checkpoint_resume_state(temp_storage, queue.get("session_a"))
+
+        assert state == {
+            "resume_session_id": "session_a",
+            "resume_from_checkpoint": checkpoint.checkpoint_id,
+        }
+
+
+class TestDurableQueue:
+    """AgentRuntime recording and recovering triggers in the durable queue."""
+
+    @pytest.mark.asyncio
+    async def test_trigger_recorded_until_completed(self, temp_storage):
+        runtime = _durable_runtime(temp_storage)
+        await runtime.start()
+        try:
+            exec_id = await runtime.trigger("default", {"text": "hi"})
+            queue = runtime._execution_queue
+            assert queue.get(exec_id).status in ("queued", "in_flight", "completed")
+
+            await _wait_until(lambda: queue.get(exec_id).status == "completed")
+            assert queue.get(exec_id).to_execution_result().success
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_in_flight_execution_resumes_from_checkpoint(self, temp_storage):
+        _seed_in_flight(temp_storage, "session_crashed")
+        await _save_checkpoint(temp_storage, "session_crashed")
+
+        runtime = _durable_runtime(temp_storage)
+        await runtime.start()
+        try:
+            stream = runtime.get_stream("default")
+            result = await stream.wait_for_completion("session_crashed", timeout=30)
+
+            assert result is not None and result.success
+            assert result.path == ["prior", "echo"]
+            assert runtime.get_stats()["execution_queue"]["recovered"] == 1
+
+            queue = runtime._execution_queue
+            await _wait_until(lambda: queue.get("session_crashed").status == "completed")
+            assert queue.get("session_crashed").attempts == 2
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_repeatedly_interrupted_execution_abandoned(self, temp_storage):
+        _seed_in_flight(temp_storage, "session_poison", attempts=3)
+
+        runtime = _durable_runtime(temp_storage, max_recovery_attempts=3)
+        await runtime.start()
+        try:
+            assert runtime.get_stats()["execution_queue"]["recovered"] == 0
+        finally:
+            await runtime.stop()
+
+        item = ExecutionQueue(temp_storage / "execution_queue.db").get("session_poison")
+        assert item.status == "failed"
+        assert "3 interrupted attempts" in item.error
+
+    @pytest.mark.asyncio
+    async def test_execution_waiting_for_admission_stays_queued(self, temp_storage):
+        runtime = create_agent_runtime(
+            graph=_graph(),
+            goal=_goal(),
+            storage_path=temp_storage,
+            entry_points=[
+                EntryPointSpec(
+                    id="default",
+                    name="Default",
+                    entry_node="echo",
+                    trigger_type="manual",
+                    max_concurrent=1,
+                )
+            ],
+            llm=SlowMockLLM(1.0),
+            config=AgentRuntimeConfig(durable_queue=True),
+            enable_logging=False,
+        )
+        await runtime.start()
+        try:
+            first = await runtime.trigger("default", {"text": "one"})
+            second = await runtime.trigger("default", {"text": "two"})
+            queue = runtime._execution_queue
+            await _wait_until(lambda: queue.get(first).status == "in_flight")
+
+            waiting = queue.get(second)
+            assert waiting.status == "queued"
+            assert waiting.attempts == 0
+
+            await _wait_until(lambda: queue.get(second).status == "completed")
+            assert queue.get(second).attempts == 1
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_execution_of_live_owner_not_recovered(self, temp_storage):
+        _seed_in_flight(temp_storage, "session_elsewhere", owner="runtime-other")
+        queue = ExecutionQueue(temp_storage / "execution_queue.db")
+        queue.renew_leases({"runtime-other": os.getpid()})  # a process that is alive
+
+        runtime = _durable_runtime(temp_storage)
+        await runtime.start()
+        try:
+            assert runtime.get_stats()["execution_queue"]["recovered"] == 0
+            item = queue.get("session_elsewhere")
+            assert item.status == "in_flight"
+            assert item.worker_id == "runtime-other"
+        finally:
+            await runtime.stop()
+            queue.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="dead pids are only detected via os.kill")
+    async def test_execution_of_crashed_local_owner_recovered(self, temp_storage):
+        _seed_in_flight(temp_storage, "session_crashed", owner="runtime-crashed")
+        queue = ExecutionQueue(temp_storage / "execution_queue.db")
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        queue.renew_leases({"runtime-crashed": process.pid})  # fresh lease, dead process
+        queue.close()
+
+        runtime = _durable_runtime(temp_storage)
+        await runtime.start()
+        try:
+            assert runtime.get_stats()["execution_queue"]["recovered"] == 1
+        finally:
+            await runtime.stop()
@@ -0,0 +1,345 @@
+"""
+Tests for the durable ExecutionQueue and AgentRuntime worker mode.
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from framework.graph import Goal
+from framework.graph.edge import GraphSpec
+from framework.graph.executor import ExecutionResult
+from framework.graph.node import NodeSpec
+from framework.llm.mock import MockLLMProvider
+from framework.runtime import worker_pool
+from framework.runtime.agent_runtime import AgentRuntime, AgentRuntimeConfig, create_agent_runtime
+from framework.runtime.event_bus import EventType
+from framework.runtime.execution_queue import ExecutionQueue
+from framework.runtime.execution_stream import EntryPointSpec
+
+FACTORY = "framework.runtime.tests.test_worker_pool:build_runtime"
+
+
+class SlowMockLLM(MockLLMProvider):
+    """Mock LLM that takes a while to answer."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def complete(self, *args, **kwargs):
+        time.sleep(self.delay)
+        return super().complete(*args, **kwargs)
+
+
+def _graph() -> GraphSpec:
+    return GraphSpec(
+        id="echo-graph",
+        goal_id="echo-goal",
+        entry_node="echo",
+        terminal_nodes=["echo"],
+        nodes=[
+            NodeSpec(
+                id="echo",
+                name="Echo",
+                description="Echo the input",
+                node_type="llm_generate",
+                input_keys=["text"],
+                output_keys=["result"],
+            )
+        ],
+        edges=[],
+    )
+
+
+def _goal() -> Goal:
+    return Goal(id="echo-goal", name="Echo", description="Echo input", success_criteria=[])
+
+
+def _entry_points() -> list[EntryPointSpec]:
+    return [EntryPointSpec(id="default", name="Default", entry_node="echo", trigger_type="manual")]
+
+
+def build_runtime(storage_path: str, delay: float = 0.0) -> AgentRuntime:
+    """Worker factory: the same agent, with a mock LLM."""
+    return create_agent_runtime(
+        graph=_graph(),
+        goal=_goal(),
+        storage_path=storage_path,
+        entry_points=_entry_points(),
+        llm=SlowMockLLM(delay) if delay else MockLLMProvider(),
+        enable_logging=False,
+    )
+
+
+def failing_runtime(storage_path: str, failures: int) -> AgentRuntime:
+    """Worker factory that crashes on its first ``failures`` calls."""
+    calls = Path(storage_path) / "factory_calls"
+    with open(calls, "a") as f:
+        f.write(".")
+    if calls.stat().st_size <= failures:
+        raise RuntimeError("transient startup failure")
+    return build_runtime(storage_path)
+
+
+def _worker_runtime(
+    storage_path: Path,
+    workers: int,
+    delay: float = 0.0,
+    factory: str = FACTORY,
+    factory_kwargs: dict | None = None,
+) -> AgentRuntime:
+    return create_agent_runtime(
+        graph=_graph(),
+        goal=_goal(),
+        storage_path=storage_path,
+        entry_points=_entry_points(),
+        config=AgentRuntimeConfig(
+            worker_processes=workers,
+            worker_factory=factory,
+            worker_factory_kwargs=factory_kwargs
+            or {"storage_path": str(storage_path), "delay": delay},
+        ),
+        enable_logging=False,
+    )
+
+
+async def _wait_until(predicate, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.05)
+
+
+@pytest.fixture
+def temp_storage():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestExecutionQueue:
+    """Tests for the SQLite-backed execution queue."""
+
+    def test_claims_by_priority_then_fifo(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "ep", {})
+        queue.enqueue("b", "ep", {}, priority=5)
+        queue.enqueue("c", "ep", {})
+
+        claimed = [queue.claim("w").id for _ in range(3)]
+
+        assert claimed == ["b", "a", "c"]
+        assert queue.claim("w") is None
+
+    def test_claim_filters_entry_points(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "webhook", {})
+
+        assert queue.claim("w", entry_points=["api"]) is None
+        assert queue.claim("w", entry_points=["api", "webhook"]).id == "a"
+
+    def test_concurrent_claims_never_duplicate(self, temp_storage):
+        path = temp_storage / "q.db"
+        seed = ExecutionQueue(path)
+        for i in range(200):
+            seed.enqueue(f"e{i}", "ep", {"i": i})
+
+        claimed: list[str] = []
+        lock = threading.Lock()
+
+        def consume(worker_id: str) -> None:
+            # Separate connections, as separate processes would have
+            queue = ExecutionQueue(path)
+            while (item := queue.claim(worker_id)) is not None:
+                with lock:
+                    claimed.append(item.id)
+            queue.close()
+
+        threads = [threading.Thread(target=consume, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(claimed) == sorted(f"e{i}" for i in range(200))
+
+    def test_result_round_trip(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "ep", {"x": 1}, correlation_id="corr")
+        queue.claim("w")
+
+        queue.complete("a", ExecutionResult(success=True, output={"y": 2}, path=["n"]))
+
+        item = queue.get("a")
+        assert item.status == "completed"
+        assert item.correlation_id == "corr"
+        result = item.to_execution_result()
+        assert result.success is True
+        assert result.output == {"y": 2}
+        assert result.path == ["n"]
+
+    def test_requeue_dead_worker(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "ep", {})
+        queue.enqueue("b", "ep", {})
+        queue.claim("dead")
+        queue.claim("alive")
+
+        assert queue.requeue_worker("dead") == ["a"]
+        item = queue.claim("alive")
+        assert item.id == "a"
+        assert item.attempts == 2
+
+    def test_reserved_execution_not_claimed_until_started(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "ep", {}, worker_id="runtime-x")
+
+        assert queue.claim("w") is None
+        assert queue.start("a", "other") is False
+        assert queue.start("a", "runtime-x") is True
+        item = queue.get("a")
+        assert item.status == "in_flight"
+        assert item.attempts == 1
+
+    def test_reenqueue_only_when_finished(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        queue.enqueue("a", "ep", {})
+
+        with pytest.raises(ValueError, match="already queued"):
+            queue.enqueue("a", "ep", {})
+
+        queue.claim("w")
+        queue.fail("a", "boom")
+        queue.enqueue("a", "ep", {"retry": True})
+
+        item = queue.get("a")
+        assert item.status == "queued"
+        assert item.error is None
+        assert item.input_data == {"retry": True}
+
+    def test_cancel_and_prune(self, temp_storage):
+        queue = ExecutionQueue(temp_storage / "q.db")
+        for name in "abc":
+            queue.enqueue(name, "ep", {})
+
+        assert queue.cancel("a") is True
+        assert queue.cancel("a") is False
+        queue.claim("w")  # b
+        queue.complete("b", ExecutionResult(success=True))
+
+        assert queue.prune_finished(keep=1) == 1
+        assert queue.get_stats()["queued"] == 1
+
+
+class TestWorkerMode:
+    """AgentRuntime executing in worker processes."""
+
+    def test_requires_factory(self, temp_storage):
+        with pytest.raises(ValueError, match="worker_factory"):
+            AgentRuntime(
+                graph=_graph(),
+                goal=_goal(),
+                storage_path=temp_storage,
+                config=AgentRuntimeConfig(worker_processes=2),
+            )
+
+    @pytest.mark.asyncio
+    async def test_executes_in_workers_and_forwards_events(self, temp_storage):
+        runtime = _worker_runtime(temp_storage, workers=2)
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        runtime.subscribe_to_events(
+            event_types=[EventType.EXECUTION_STARTED, EventType.EXECUTION_COMPLETED],
+            handler=on_event,
+        )
+        await runtime.start()
+        try:
+            assert runtime.get_stream("default") is None  # no local streams
+
+            results = await asyncio.gather(
+                *(
+                    runtime.trigger_and_wait("default", {"text": f"hi {i}"}, timeout=60)
+                    for i in range(4)
+                )
+            )
+            assert all(r is not None and r.success for r in results)
+            assert all(r.output["result"] == "mock_result_value" for r in results)
+
+            await _wait_until(
+                lambda: sum(e.type == EventType.EXECUTION_COMPLETED for e in events) == 4
+            )
+            stats = runtime.get_stats()["workers"]
+            assert len(stats["workers"]) == 2
+            assert stats["queue"]["completed"] == 4
+            assert stats["events_forwarded"] >= 8
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses SIGKILL")
+    async def test_dead_worker_is_replaced_and_work_requeued(self, temp_storage):
+        runtime = _worker_runtime(temp_storage, workers=1, delay=2.0)
+        await runtime.start()
+        try:
+            exec_id = await runtime.trigger("default", {"text": "hi"})
+            queue = runtime._execution_queue
+            await _wait_until(lambda: queue.get(exec_id).status == "in_flight")
+
+            (worker,) = runtime._worker_pool._workers.values()
+            os.kill(worker.process.pid, signal.SIGKILL)
+
+            result = await runtime.trigger_and_wait("default", {"text": "again"}, timeout=60)
+            assert result is not None and result.success
+
+            first = await runtime._worker_pool.wait_for_completion(exec_id, timeout=60)
+            assert first is not None and first.success
+            assert queue.get(exec_id).attempts == 2
+            assert runtime.get_stats()["workers"]["restarts"] >= 1
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_failing_to_start_is_respawned(self, temp_storage, monkeypatch):
+        monkeypatch.setattr(worker_pool, "RESPAWN_BACKOFF_SECONDS", 0.01)
+        monkeypatch.setattr(worker_pool, "MAX_START_FAILURES", 100)
+        runtime = _worker_runtime(
+            temp_storage,
+            workers=1,
+            factory=f"{__name__}:failing_runtime",
+            factory_kwargs={"storage_path": str(temp_storage), "failures": 1},
+        )
+        await runtime.start()
+        try:
+            result = await runtime.trigger_and_wait("default", {"text": "hi"}, timeout=60)
+            assert result is not None and result.success
+            assert runtime.get_stats()["workers"]["restarts"] >= 1
+        finally:
+            await runtime.stop()
+
+    @pytest.mark.asyncio
+    async def test_queued_work_fails_when_no_worker_can_start(self, temp_storage, monkeypatch):
+        monkeypatch.setattr(worker_pool, "RESPAWN_BACKOFF_SECONDS", 0.01)
+        runtime = _worker_runtime(
+            temp_storage,
+            workers=1,
+            factory=f"{__name__}:failing_runtime",
+            factory_kwargs={"storage_path": str(temp_storage), "failures": 1000},
+        )
+        await runtime.start()
+        try:
+            result = await runtime.trigger_and_wait("default", {"text": "hi"}, timeout=60)
+            assert result is not None and not result.success
+            assert "transient startup failure" in result.error
+        finally:
+            await runtime.stop()
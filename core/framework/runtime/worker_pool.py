@@ -0,0 +1,618 @@
+"""
+Worker Pool - Runs AgentRuntime executions in worker processes.
+
+A single AgentRuntime runs every execution on one asyncio loop, so
+CPU-bound work (parsing large tool results, output cleaning, compaction,
+sandboxed code) from concurrent executions shares one core. In worker
+mode the parent runtime only accepts triggers:
+
+    trigger() -> ExecutionQueue (SQLite) -> worker processes
+                                               |  own AgentRuntime +
+                                               |  ExecutionStreams
+    parent EventBus  <-- events / results -----+
+
+Worker processes cannot receive the parent's graph, LLM provider or tool
+executor (they are not picklable), so each one builds its own runtime
+from a factory given as ``"package.module:function"``. The factory is
+called with ``worker_factory_kwargs`` and must return an AgentRuntime
+(not started) for the same agent; it may be a coroutine function.
+
+The parent owns webhooks and event-driven entry points; workers only run
+executions. Events emitted in a worker are re-published on the parent's
+EventBus, and results are stored in the queue so they survive the worker.
+If a worker dies, its in-flight executions are requeued and the worker
+is replaced. Workers that crash while starting up are respawned with a
+capped exponential backoff; while no worker manages to start, queued
+executions are failed instead of waiting forever.
+"""
+
+import asyncio
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from framework.graph.executor import ExecutionResult
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+from framework.runtime.execution_queue import (
+    FINISHED_STATUSES,
+    LEASE_SECONDS,
+    ExecutionQueue,
+    checkpoint_resume_state,
+    owner_id,
+)
+
+if TYPE_CHECKING:
+    from framework.runtime.agent_runtime import AgentRuntime
+
+logger = logging.getLogger(__name__)
+
+# Idle workers re-check the queue this often even without a wake-up
+POLL_INTERVAL_SECONDS = 0.5
+# Time a worker gets to finish cleanly on stop() before it is terminated
+STOP_TIMEOUT_SECONDS = 10.0
+# Time to wait for workers to answer an inject_input() broadcast
+INJECT_TIMEOUT_SECONDS = 5.0
+# Delay before respawning a worker that failed to start, doubled per
+# consecutive failure up to the maximum
+RESPAWN_BACKOFF_SECONDS = 0.5
+RESPAWN_BACKOFF_MAX_SECONDS = 30.0
+# Consecutive startup failures, with no worker running, before queued
+# executions are failed
+MAX_START_FAILURES = 3
+
+
+def load_factory(spec: str) -> Any:
+    """Resolve a ``"package.module:function"`` factory reference."""
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"Worker factory must look like 'package.module:function', got {spec!r}")
+    target: Any = importlib.import_module(module_name)
+    for part in attr.split("."):
+        target = getattr(target, part)
+    return target
+
+
+@dataclass
+class _WorkerHandle:
+    """Parent-side view of one worker process."""
+
+    worker_id: str
+    process: Any  # multiprocessing.process.BaseProcess
+    conn: Connection
+    ready: bool = False
+    error: str | None = None
+    started_at: float = field(default_factory=time.time)
+
+
+class WorkerPool:
+    """
+    Parent side of worker mode: spawns workers and relays their output.
+
+    Example:
+        pool = WorkerPool(
+            queue=ExecutionQueue(storage_path / "execution_queue.db"),
+            factory="my_agent.runtime:build_runtime",
+            workers=4,
+            event_bus=event_bus,
+        )
+        await pool.start()
+        queue.enqueue(exec_id, "webhook", {"ticket_id": "123"})
+        pool.notify()
+        result = await pool.wait_for_completion(exec_id)
+        await pool.stop()
+    """
+
+    def __init__(
+        self,
+        queue: ExecutionQueue,
+        factory: str,
+        workers: int,
+        event_bus: EventBus,
+        factory_kwargs: dict[str, Any] | None = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            queue: Queue shared with the workers
+            factory: ``"package.module:function"`` building the worker runtime
+            workers: Number of worker processes
+            event_bus: Parent bus that worker events are re-published on
+            factory_kwargs: Keyword arguments for the factory (must be picklable)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        load_factory(factory)  # fail fast on typos, in the parent
+        self._queue = queue
+        self._factory = factory
+        self._factory_kwargs = factory_kwargs or {}
+        self._num_workers = workers
+        self._event_bus = event_bus
+
+        # Workers build their own runtime; they must not inherit the
+        # parent's loop, threads or open connections
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: dict[str, _WorkerHandle] = {}
+        self._workers_lock = threading.Lock()
+        self._worker_ids = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader: threading.Thread | None = None
+        self._running = False
+        # Held while deciding to spawn, so stop() never misses a new worker
+        self._spawn_lock = threading.Lock()
+        self._respawn_timers: set[threading.Timer] = set()
+        self._start_failures = 0
+        self._start_error: str | None = None
+
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._inject_requests: dict[int, tuple[asyncio.Future, set[str]]] = {}
+        self._inject_ids = itertools.count()
+        self._events_forwarded = 0
+        self._restarts = 0
+
+    # === LIFECYCLE ===
+
+    async def start(self) -> None:
+        """Spawn the workers and start relaying their messages."""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        for _ in range(self._num_workers):
+            self._spawn()
+        self._reader = threading.Thread(
+            target=self._read_loop, name="hive-worker-pool-reader", daemon=True
+        )
+        self._reader.start()
+
+    async def stop(self) -> None:
+        """
+        Stop all workers.
+
+        Executions still running are left in flight and requeued, so they
+        run again on the next start instead of being lost.
+        """
+        if not self._running:
+            return
+        with self._spawn_lock:
+            self._running = False
+            for timer in self._respawn_timers:
+                timer.cancel()
+            self._respawn_timers.clear()
+        with self._workers_lock:
+            handles = list(self._workers.values())
+        for handle in handles:
+            self._send(handle, ("stop",))
+
+        def _join() -> None:
+            deadline = time.monotonic() + STOP_TIMEOUT_SECONDS
+            for handle in handles:
+                handle.process.join(max(0.0, deadline - time.monotonic()))
+                if handle.process.is_alive():
+                    logger.warning(f"Worker {handle.worker_id} did not stop; terminating")
+                    handle.process.terminate()
+                    handle.process.join()
+
+        await asyncio.to_thread(_join)
+        if self._reader is not None:
+            await asyncio.to_thread(self._reader.join)
+            self._reader = None
+
+        for handle in handles:
+            handle.conn.close()
+            await asyncio.to_thread(self._queue.requeue_worker, handle.worker_id)
+        await asyncio.to_thread(self._queue.drop_leases, [h.worker_id for h in handles])
+        with self._workers_lock:
+            self._workers.clear()
+
+        for futures in self._waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._waiters.clear()
+
+    def _spawn(self) -> _WorkerHandle:
+        worker_id = f"{owner_id('worker')}-{next(self._worker_ids)}"
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, child_conn, str(self._queue.path), self._factory),
+            kwargs={"factory_kwargs": self._factory_kwargs},
+            name=f"hive-{worker_id}",
+            # Not a daemon: agent code may start its own processes
+            # (e.g. ProcessPoolSandbox). Workers exit when the pipe closes.
+            daemon=False,
+        )
+        process.start()
+        child_conn.close()
+        # Lease before the worker can claim anything
+        self._queue.renew_leases({worker_id: process.pid})
+        handle = _WorkerHandle(worker_id=worker_id, process=process, conn=parent_conn)
+        with self._workers_lock:
+            self._workers[worker_id] = handle
+        logger.info(f"Started {worker_id} (pid {process.pid})")
+        return handle
+
+    # === PARENT -> WORKERS ===
+
+    def _send(self, handle: _WorkerHandle, message: tuple) -> bool:
+        try:
+            handle.conn.send(message)
+            return True
+        except (OSError, ValueError):
+            return False  # worker is gone; the reader thread handles it
+
+    def _broadcast(self, message: tuple) -> list[str]:
+        with self._workers_lock:
+            handles = list(self._workers.values())
+        return [h.worker_id for h in handles if self._send(h, message)]
+
+    def notify(self) -> None:
+        """Tell idle workers that new executions are queued."""
+        self._broadcast(("wake",))
+
+    async def cancel(self, execution_id: str) -> bool:
+        """Cancel a queued or running execution."""
+        if await asyncio.to_thread(self._queue.cancel, execution_id):
+            self._resolve(execution_id)
+            return True
+        item = await asyncio.to_thread(self._queue.get, execution_id)
+        if item is None or item.status in FINISHED_STATUSES:
+            return False
+        self._broadcast(("cancel", execution_id))
+        return True
+
+    async def inject_input(self, node_id: str, content: str) -> bool:
+        """Deliver user input to whichever worker runs ``node_id``."""
+        request_id = next(self._inject_ids)
+        future = self._loop.create_future()
+        pending = set(self._broadcast(("inject", request_id, node_id, content)))
+        if not pending:
+            return False
+        self._inject_requests[request_id] = (future, pending)
+        try:
+            return await asyncio.wait_for(future, INJECT_TIMEOUT_SECONDS)
+        except TimeoutError:
+            return False
+        finally:
+            self._inject_requests.pop(request_id, None)
+
+    # === RESULTS ===
+
+    async def wait_for_completion(
+        self, execution_id: str, timeout: float | None = None
+    ) -> ExecutionResult | None:
+        """Wait for an execution to finish in a worker."""
+        future = self._loop.create_future()
+        self._waiters.setdefault(execution_id, []).append(future)
+        try:
+            # It may have finished before we started waiting
+            item = await asyncio.to_thread(self._queue.get, execution_id)
+            if item is not None and item.status in FINISHED_STATUSES:
+                return item.to_execution_result()
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return await asyncio.to_thread(self.get_result, execution_id)
+        except TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(execution_id, [])
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                self._waiters.pop(execution_id, None)
+
+    def get_result(self, execution_id: str) -> ExecutionResult | None:
+        """Result of a finished execution, read from the queue."""
+        item = self._queue.get(execution_id)
+        return item.to_execution_result() if item else None
+
+    def _resolve(self, execution_id: str) -> None:
+        for future in self._waiters.get(execution_id, []):
+            if not future.done():
+                future.set_result(None)
+
+    def _inject_reply(self, request_id: int, worker_id: str, delivered: bool) -> None:
+        entry = self._inject_requests.get(request_id)
+        if entry is None:
+            return
+        future, pending = entry
+        pending.discard(worker_id)
+        if not future.done() and (delivered or not pending):
+            future.set_result(delivered)
+
+    # === WORKERS -> PARENT ===
+
+    def _read_loop(self) -> None:
+        """Relay worker messages to the parent loop; replace dead workers."""
+        renew_at = time.monotonic() + LEASE_SECONDS / 3
+        while True:
+            with self._workers_lock:
+                by_conn = {h.conn: h for h in self._workers.values()}
+            if by_conn and time.monotonic() >= renew_at:
+                renew_at = time.monotonic() + LEASE_SECONDS / 3
+                self._queue.renew_leases({h.worker_id: h.process.pid for h in by_conn.values()})
+            if not by_conn:
+                if not self._running:
+                    return
+                time.sleep(0.05)
+                continue
+            for conn in wait(list(by_conn), timeout=0.2):
+                handle = by_conn[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    self._on_worker_exit(handle)
+                    continue
+                self._dispatch(handle, message)
+
+    def _dispatch(self, handle: _WorkerHandle, message: tuple) -> None:
+        kind = message[0]
+        loop = self._loop
+        if kind == "event":
+            event = AgentEvent.from_dict(json.loads(message[1]))
+            self._events_forwarded += 1
+            asyncio.run_coroutine_threadsafe(self._event_bus.publish(event), loop)
+        elif kind == "done":
+            loop.call_soon_threadsafe(self._resolve, message[1])
+        elif kind == "inject_reply":
+            loop.call_soon_threadsafe(self._inject_reply, message[1], handle.worker_id, message[2])
+        elif kind == "ready":
+            handle.ready = True
+            self._start_failures = 0
+            self._start_error = None
+        elif kind == "error":
+            handle.error = message[1]
+            logger.error(f"{handle.worker_id} failed: {message[1]}")
+
+    def _on_worker_exit(self, handle: _WorkerHandle) -> None:
+        with self._workers_lock:
+            if self._workers.get(handle.worker_id) is not handle:
+                return
+            del self._workers[handle.worker_id]
+        handle.process.join(timeout=1)
+        handle.conn.close()
+
+        # Inject requests waiting on this worker will not get an answer
+        for request_id, (_, pending) in list(self._inject_requests.items()):
+            if handle.worker_id in pending:
+                self._loop.call_soon_threadsafe(
+                    self._inject_reply, request_id, handle.worker_id, False
+                )
+
+        if not self._running:
+            return
+        requeued = self._queue.requeue_worker(handle.worker_id)
+        self._queue.drop_leases([handle.worker_id])
+        logger.warning(
+            f"{handle.worker_id} exited (code {handle.process.exitcode}); "
+            f"requeued {len(requeued)} execution(s)"
+        )
+        if handle.ready:
+            self._respawn()
+            return
+
+        # Crashed while building its runtime: back off before retrying so a
+        # persistent failure does not turn into a spawn loop
+        self._start_failures += 1
+        self._start_error = handle.error or self._start_error
+        delay = min(
+            RESPAWN_BACKOFF_SECONDS * 2 ** (self._start_failures - 1),
+            RESPAWN_BACKOFF_MAX_SECONDS,
+        )
+        logger.error(f"{handle.worker_id} failed to start; retrying in {delay:.1f}s")
+        if self._start_failures >= MAX_START_FAILURES and not self._has_ready_worker():
+            self._fail_queued(self._start_error or f"exit code {handle.process.exitcode}")
+
+        timer = threading.Timer(delay, self._on_respawn_timer)
+        timer.daemon = True
+        with self._spawn_lock:
+            if not self._running:
+                return
+            self._respawn_timers.add(timer)
+        timer.start()
+
+    def _on_respawn_timer(self) -> None:
+        with self._spawn_lock:
+            self._respawn_timers.discard(threading.current_thread())
+        self._respawn()
+
+    def _respawn(self) -> None:
+        with self._spawn_lock:
+            if not self._running:
+                return
+            self._restarts += 1
+            self._spawn()
+
+    def _has_ready_worker(self) -> bool:
+        with self._workers_lock:
+            return any(h.ready for h in self._workers.values())
+
+    def _fail_queued(self, reason: str) -> None:
+        """Fail queued executions while no worker can start to run them."""
+        failed = self._queue.fail_queued(f"No worker process could start: {reason}")
+        if not failed:
+            return
+        logger.error(f"Failed {len(failed)} queued execution(s): no worker process could start")
+        for execution_id in failed:
+            self._loop.call_soon_threadsafe(self._resolve, execution_id)
+
+    # === STATS ===
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._workers_lock:
+            workers = {
+                h.worker_id: {"pid": h.process.pid, "ready": h.ready, "alive": h.process.is_alive()}
+                for h in self._workers.values()
+            }
+        return {
+            "workers": workers,
+            "configured_workers": self._num_workers,
+            "restarts": self._restarts,
+            "events_forwarded": self._events_forwarded,
+            "queue": self._queue.get_stats(),
+        }
+
+
+# === WORKER PROCESS ===
+
+
+class _Worker:
+    """Child side of worker mode: claims executions and runs them locally."""
+
+    def __init__(self, worker_id: str, conn: Connection, queue: ExecutionQueue):
+        self.worker_id = worker_id
+        self._conn = conn
+        self._queue = queue
+        self._send_lock = threading.Lock()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._active: dict[str, asyncio.Task] = {}
+
+    def _send(self, message: tuple) -> None:
+        with self._send_lock:
+            try:
+                self._conn.send(message)
+            except (OSError, ValueError):
+                self._stopping = True  # parent is gone
+
+    async def run(self, runtime: "AgentRuntime") -> None:
+        self._runtime = runtime
+        self._loop = asyncio.get_running_loop()
+        await runtime.start(serve_triggers=False)
+        runtime.subscribe_to_events(event_types=list(EventType), handler=self._forward_event)
+
+        capacity = runtime.admission.max_concurrent
+        entry_points = [spec.id for spec in runtime.get_entry_points()]
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        self._send(("ready", self.worker_id))
+
+        try:
+            while not self._stopping:
+                if len(self._active) < capacity:
+                    item = await asyncio.to_thread(self._queue.claim, self.worker_id, entry_points)
+                    if item is not None:
+                        await self._start(item)
+                        continue
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), POLL_INTERVAL_SECONDS)
+                except TimeoutError:
+                    pass
+        finally:
+            # Executions cut short here stay in flight; the parent requeues them
+            self._stopping = True
+            await runtime.stop()
+
+    async def _start(self, item) -> None:
+        from framework.runtime.admission import AdmissionRejectedError
+
+        stream = self._runtime.get_stream(item.entry_point)
+        session_state = item.session_state
+        if item.attempts > 1:
+            # A previous attempt was cut short: continue from its latest checkpoint
+            session_state = await checkpoint_resume_state(self._runtime.storage_path, item)
+        try:
+            execution_id = await stream.execute(
+                item.input_data,
+                item.correlation_id,
+                session_state,
+                priority=item.priority,
+                execution_id=item.id,
+            )
+        except AdmissionRejectedError:
+            # Local per-entry-point queue is full; let another worker take it
+            await asyncio.to_thread(self._queue.release, item.id)
+            self._wake.clear()
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            return
+        except Exception as e:
+            await asyncio.to_thread(self._queue.fail, item.id, str(e))
+            self._send(("done", item.id))
+            return
+        self._active[execution_id] = asyncio.create_task(self._watch(stream, execution_id))
+
+    async def _watch(self, stream, execution_id: str) -> None:
+        try:
+            result = await stream.wait_for_completion(execution_id)
+            if self._stopping or result is None:
+                return
+            await asyncio.to_thread(self._queue.complete, execution_id, result)
+            self._send(("done", execution_id))
+        finally:
+            self._active.pop(execution_id, None)
+            self._wake.set()
+
+    async def _forward_event(self, event: AgentEvent) -> None:
+        # JSON keeps non-picklable payloads from breaking the pipe
+        self._send(("event", json.dumps(event.to_dict(), default=str)))
+
+    def _read_loop(self) -> None:
+        """Receive parent commands on a thread and hand them to the loop."""
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                message = ("stop",)
+            self._loop.call_soon_threadsafe(self._handle, message)
+            if message[0] == "stop":
+                return
+
+    def _handle(self, message: tuple) -> None:
+        kind = message[0]
+        if kind == "wake":
+            self._wake.set()
+        elif kind == "stop":
+            self._stopping = True
+            self._wake.set()
+        elif kind == "cancel":
+            self._loop.create_task(self._cancel(message[1]))
+        elif kind == "inject":
+            self._loop.create_task(self._inject(*message[1:]))
+
+    async def _cancel(self, execution_id: str) -> None:
+        item = await asyncio.to_thread(self._queue.get, execution_id)
+        if item is not None and item.worker_id == self.worker_id:
+            await self._runtime.cancel_execution(item.entry_point, execution_id)
+
+    async def _inject(self, request_id: int, node_id: str, content: str) -> None:
+        delivered = await self._runtime.inject_input(node_id, content)
+        self._send(("inject_reply", request_id, delivered))
+
+
+def _worker_main(
+    worker_id: str,
+    conn: Connection,
+    queue_path: str,
+    factory: str,
+    factory_kwargs: dict[str, Any] | None = None,
+) -> None:
+    """Entry point of a worker process."""
+    queue = ExecutionQueue(Path(queue_path))
+    worker = _Worker(worker_id, conn, queue)
+
+    async def _main() -> None:
+        runtime = load_factory(factory)(**(factory_kwargs or {}))
+        if inspect.isawaitable(runtime):
+            runtime = await runtime
+        if runtime.worker_mode:
+            raise RuntimeError("Worker factory must build a runtime with worker_processes=0")
+        await worker.run(runtime)
+
+    try:
+        asyncio.run(_main())
+    except Exception as e:
+        logger.exception(f"{worker_id} crashed")
+        worker._send(("error", f"{type(e).__name__}: {e}"))
+        raise SystemExit(1) from e
+    finally:
+        queue.close()
+        conn.close()
@@ -0,0 +1,206 @@
+"""Spillover store for oversized tool results.
+
+When a tool result is too large for the conversation context,
+EventLoopNode writes the full content here and keeps only a preview in
+the conversation.  The agent reads it back with ``load_data``.
+
+Directory layout::
+
+    {directory}/
+        tool_web_search_call_1_3f2a9c0d1e4b.txt      # spilled result
+        tool_github_list_call_7_8d1e0f2a3b4c.txt.gz  # ... gzip-compressed
+        .index/
+            spillover.json                # manifest: hash -> file, size, last use
+            spillover.lock                # guards the manifest across stores
+            tool_web_search_call_1_3f2a9c0d1e4b.txt.idx
+
+Identical results are written once: the manifest maps the content's
+SHA-256 to the file that already holds it, and filenames carry a prefix
+of that hash so different content never shares a file.  The directory is
+bounded by ``max_bytes``; least-recently-used spill files are evicted
+first.  Files not created by the store (e.g. written with ``save_data``)
+are never touched.
+
+Every node builds its own store on the session's ``data/`` directory, so
+the manifest is re-read under a file lock on each spill rather than
+cached per instance.
+
+Line index (``.index/{filename}.idx``) — shared with ``load_data``:
+
+    8 bytes   magic ``HIVEIDX1``
+    3 x u64   size and mtime_ns of the indexed file, number of lines
+    n x u64   byte offset at which each line starts
+
+All integers are little-endian.  For ``.gz`` files the offsets refer to
+the decompressed content.  An index whose size/mtime no longer match the
+file is stale and must be ignored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+from framework.utils.io import atomic_write, file_lock
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".index"
+INDEX_MAGIC = b"HIVEIDX1"
+_MANIFEST_NAME = "spillover.json"
+_LOCK_NAME = "spillover.lock"
+_HEADER = struct.Struct("<8sQQQ")
+
+
+def line_offsets(data: bytes) -> array:
+    """Return the start offset of every line in *data*."""
+    offsets = array("Q", [0]) if data else array("Q")
+    find = data.find
+    pos = find(b"\n")
+    end = len(data)
+    while pos != -1 and pos + 1 < end:
+        offsets.append(pos + 1)
+        pos = find(b"\n", pos + 1)
+    return offsets
+
+
+def write_line_index(path: Path, offsets: array) -> None:
+    """Write the line index sidecar for *path* (see module docstring)."""
+    stat = path.stat()
+    index_path = path.parent / INDEX_DIRNAME / f"{path.name}.idx"
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    if sys.byteorder != "little":
+        offsets = array("Q", offsets)
+        offsets.byteswap()
+    with atomic_write(index_path, mode="wb", encoding=None) as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)))
+        f.write(offsets.tobytes())
+
+
+class SpilloverStore:
+    """Content-addressed, size-bounded store for spilled tool results.
+
+    All disk work runs in a worker thread via :meth:`spill`, so the
+    event loop never blocks on ``mkdir``/JSON formatting/``write``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        compress: bool = False,
+    ) -> None:
+        self._dir = Path(directory)
+        self._max_bytes = max_bytes
+        self._compress = compress
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    async def spill(self, tool_name: str, tool_use_id: str, content: str) -> str:
+        """Store *content* and return the filename ``load_data`` should use."""
+        return await asyncio.to_thread(self.spill_sync, tool_name, tool_use_id, content)
+
+    def spill_sync(self, tool_name: str, tool_use_id: str, content: str) -> str:
+        """Blocking implementation of :meth:`spill`."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        with self._locked():
+            manifest = self._load_manifest()
+            entry = manifest.get(digest)
+            if entry is not None and (self._dir / entry["filename"]).exists():
+                entry["last_used"] = time.time()
+                self._save_manifest(manifest)
+                logger.info("Spillover dedup hit: %s", entry["filename"])
+                return entry["filename"]
+
+            # tool_use_id keeps the name readable; the digest keeps it unique
+            # (ids are truncated, and one id may be spilled twice)
+            safe_id = tool_use_id.replace("/", "_")[:60]
+            filename = f"tool_{tool_name}_{safe_id}_{digest[:12]}.txt"
+            if self._compress:
+                filename += ".gz"
+
+            data = self._format(content).encode("utf-8")
+            path = self._dir / filename
+            self._dir.mkdir(parents=True, exist_ok=True)
+            if self._compress:
+                path.write_bytes(gzip.compress(data, compresslevel=5))
+            else:
+                path.write_bytes(data)
+            write_line_index(path, line_offsets(data))
+
+            manifest[digest] = {
+                "filename": filename,
+                "tool_name": tool_name,
+                "size_bytes": path.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._evict(manifest, keep=digest)
+            self._save_manifest(manifest)
+            return filename
+
+    def stats(self) -> dict[str, int]:
+        """Number of spilled files and their total size on disk."""
+        manifest = self._load_manifest()  # replaced atomically; no lock needed
+        return {
+            "files": len(manifest),
+            "total_bytes": sum(e["size_bytes"] for e in manifest.values()),
+        }
+
+    # --- internals -----------------------------------------------------------
+
+    @staticmethod
+    def _format(content: str) -> str:
+        # Pretty-print JSON content so load_data's line-based
+        # pagination works correctly.  Compact JSON (no newlines)
+        # would produce a single line that defeats pagination.
+        try:
+            parsed = json.loads(content)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return content  # Not JSON — write as-is
+        return json.dumps(parsed, indent=2, ensure_ascii=False)
+
+    def _evict(self, manifest: dict[str, dict[str, Any]], keep: str) -> None:
+        """Drop least-recently-used spill files until under the quota."""
+        total = sum(e["size_bytes"] for e in manifest.values())
+        if total <= self._max_bytes:
+            return
+        for digest, entry in sorted(manifest.items(), key=lambda kv: kv[1]["last_used"]):
+            if total <= self._max_bytes:
+                break
+            if digest == keep:
+                continue
+            name = entry["filename"]
+            (self._dir / name).unlink(missing_ok=True)
+            (self._dir / INDEX_DIRNAME / f"{name}.idx").unlink(missing_ok=True)
+            total -= entry["size_bytes"]
+            del manifest[digest]
+            logger.info("Spillover quota exceeded — evicted %s", name)
+
+    def _locked(self):
+        return file_lock(self._dir / INDEX_DIRNAME / _LOCK_NAME)
+
+    def _load_manifest(self) -> dict[str, dict[str, Any]]:
+        # Always read from disk: other stores on this directory may have
+        # spilled or evicted since our last call
+        path = self._dir / INDEX_DIRNAME / _MANIFEST_NAME
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict[str, dict[str, Any]]) -> None:
+        path = self._dir / INDEX_DIRNAME / _MANIFEST_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path) as f:
+            json.dump(manifest, f)
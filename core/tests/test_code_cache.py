@@ -0,0 +1,126 @@
+"""Tests for the compiled-code cache shared by CodeSandbox and safe_eval."""
+
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from framework.graph.code_cache import CompiledCodeCache, code_cache
+from framework.graph.code_sandbox import CodeSandbox, CodeValidator, safe_eval, safe_exec
+from framework.graph.safe_eval import safe_eval as safe_eval_expr
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    code_cache.clear()
+    yield
+    code_cache.clear()
+
+
+class TestCompiledCodeCache:
+    """Tests for the LRU itself."""
+
+    def test_builds_once_per_source(self):
+        cache = CompiledCodeCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_build("k", "x = 1", build) == "value"
+        assert cache.get_or_build("k", "x = 1", build) == "value"
+
+        assert len(calls) == 1
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_kind_is_part_of_the_key(self):
+        cache = CompiledCodeCache()
+
+        assert cache.get_or_build("a", "x", lambda: 1) == 1
+        assert cache.get_or_build("b", "x", lambda: 2) == 2
+
+    def test_evicts_least_recently_used(self):
+        cache = CompiledCodeCache(max_entries=2)
+        cache.get_or_build("k", "one", lambda: 1)
+        cache.get_or_build("k", "two", lambda: 2)
+        cache.get_or_build("k", "one", lambda: 1)  # refresh "one"
+        cache.get_or_build("k", "three", lambda: 3)
+
+        assert cache.get_or_build("k", "one", lambda: "rebuilt") == 1
+        assert cache.get_or_build("k", "two", lambda: "rebuilt") == "rebuilt"
+
+    def test_failures_are_not_cached(self):
+        cache = CompiledCodeCache()
+
+        def fail():
+            raise SyntaxError("bad")
+
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                cache.get_or_build("k", "(", fail)
+        assert cache.stats()["entries"] == 0
+
+
+class TestSandboxCaching:
+    """CodeSandbox and safe_eval skip parse/validate/compile on repeats."""
+
+    def test_execute_validates_and_compiles_once(self):
+        sandbox = CodeSandbox()
+        with patch.object(CodeValidator, "validate", wraps=sandbox.validator.validate) as validate:
+            for i in range(5):
+                result = sandbox.execute("result = x * 2", inputs={"x": i})
+                assert result.result == i * 2
+
+        assert validate.call_count == 1
+
+    def test_safe_exec_shares_cache_between_sandboxes(self):
+        safe_exec("result = 1 + 1")
+        misses = code_cache.stats()["misses"]
+
+        assert safe_exec("result = 1 + 1").result == 2
+        assert code_cache.stats()["misses"] == misses
+
+    def test_rejected_code_stays_rejected(self):
+        for _ in range(3):
+            result = safe_exec("import os")
+            assert result.success is False
+            assert "validation failed" in result.error
+        assert code_cache.stats()["hits"] == 2
+
+    def test_custom_validator_uses_separate_entries(self):
+        strict = CodeSandbox()
+        strict.validator = CodeValidator(blocked_nodes={ast.For})
+
+        assert safe_exec("for i in range(2):\n    x = i").success is True
+        assert strict.execute("for i in range(2):\n    x = i").success is False
+
+    def test_compile_time_errors_still_reported(self):
+        result = safe_exec("return 1")
+
+        assert result.success is False
+        assert "SyntaxError" in result.error
+
+    def test_execute_expression_cached(self):
+        for i in range(3):
+            assert safe_eval("a + 1", inputs={"a": i}).result == i + 1
+
+        assert code_cache.stats() == {"entries": 1, "hits": 2, "misses": 1}
+
+    def test_execute_expression_syntax_error(self):
+        result = safe_eval("a +")
+
+        assert result.success is False
+        assert "Syntax error" in result.error
+
+    def test_graph_safe_eval_reuses_parsed_tree(self):
+        with patch("framework.graph.safe_eval.ast.parse", wraps=ast.parse) as parse:
+            for i in range(4):
+                assert safe_eval_expr("x > 2 and y", {"x": i, "y": True}) == (i > 2)
+
+        assert parse.call_count == 1
+
+    def test_graph_safe_eval_syntax_error(self):
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                safe_eval_expr("x >")
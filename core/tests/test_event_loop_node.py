@@ -947,6 +947,84 @@ async def test_non_recoverable_stream_error_raises(self, runtime, node_spec, mem
             await node.execute(ctx)
 
 
+# ===========================================================================
+# Speculative (background) compaction
+# ===========================================================================
+
+
+class TestSpeculativeCompaction:
+    async def _filled_conversation(self, n: int = 8) -> NodeConversation:
+        # 8 messages x 340 chars ~= 680 tokens -> 68% of a 1000-token budget
+        conv = NodeConversation(max_history_tokens=1000)
+        for i in range(n // 2):
+            await conv.add_user_message(f"question {i} " + "q" * 328)
+            await conv.add_assistant_message(f"answer {i} " + "a" * 330)
+        return conv
+
+    @pytest.mark.asyncio
+    async def test_summary_applied_at_turn_boundary(self, runtime, node_spec, memory):
+        conv = await self._filled_conversation()
+        ctx = build_ctx(runtime, node_spec, memory, MockStreamingLLM())
+        node = EventLoopNode(config=LoopConfig(max_history_tokens=1000))
+
+        node._start_speculative_compaction(ctx, conv)
+        assert node._speculative is not None
+        await node._speculative.task
+
+        # The loop kept going while the summary was produced
+        await conv.add_user_message("latest")
+        assert await node._apply_speculative_compaction(ctx, conv) is True
+
+        msgs = conv.messages
+        assert msgs[0].content == "Summary of conversation."
+        assert [m.content for m in msgs[-1:]] == ["latest"]
+        assert len(msgs) == 6  # summary + 4 kept + latest
+        assert node._speculative is None
+
+    @pytest.mark.asyncio
+    async def test_stale_summary_discarded(self, runtime, node_spec, memory):
+        conv = await self._filled_conversation()
+        ctx = build_ctx(runtime, node_spec, memory, MockStreamingLLM())
+        node = EventLoopNode(config=LoopConfig(max_history_tokens=1000))
+
+        node._start_speculative_compaction(ctx, conv)
+        await conv.compact("blocking summary", keep_recent=2)
+        before = conv.messages
+
+        assert await node._apply_speculative_compaction(ctx, conv, wait=True) is False
+        assert conv.messages == before
+        assert node._speculative is None
+
+    @pytest.mark.asyncio
+    async def test_not_started_below_watermark_or_disabled(self, runtime, node_spec, memory):
+        ctx = build_ctx(runtime, node_spec, memory, MockStreamingLLM())
+
+        small = await self._filled_conversation(n=4)
+        node = EventLoopNode(config=LoopConfig(max_history_tokens=1000))
+        node._start_speculative_compaction(ctx, small)
+        assert node._speculative is None
+
+        conv = await self._filled_conversation()
+        disabled = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=None)
+        )
+        disabled._start_speculative_compaction(ctx, conv)
+        assert disabled._speculative is None
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_leaves_conversation_intact(self, runtime, node_spec, memory):
+        conv = await self._filled_conversation()
+        llm = MockStreamingLLM()
+        llm.complete = MagicMock(side_effect=RuntimeError("rate limited"))
+        ctx = build_ctx(runtime, node_spec, memory, llm)
+        node = EventLoopNode(config=LoopConfig(max_history_tokens=1000))
+
+        node._start_speculative_compaction(ctx, conv)
+        before = conv.messages
+        assert await node._apply_speculative_compaction(ctx, conv, wait=True) is False
+        assert conv.messages == before
+
+
 # ===========================================================================
 # OutputAccumulator unit tests
 # ===========================================================================
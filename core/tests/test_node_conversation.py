@@ -365,6 +365,102 @@ async def test_export_summary_output_keys(self):
         assert "output_keys" not in conv2.export_summary()
 
 
+# ===================================================================
+# LLM message cache and orphan repair
+# ===================================================================
+
+
+def _fresh_llm_messages(conv: NodeConversation) -> list[dict[str, Any]]:
+    """Uncached reference serialization of *conv*."""
+    return NodeConversation._repair_orphaned_tool_calls([m.to_llm_dict() for m in conv.messages])
+
+
+class TestLLMMessageCache:
+    @pytest.mark.asyncio
+    async def test_orphaned_tool_call_repaired(self):
+        conv = NodeConversation()
+        await conv.add_user_message("weather?")
+        await conv.add_assistant_message("", tool_calls=SAMPLE_TOOL_CALLS)
+        await conv.add_user_message("still there?")
+
+        llm = conv.to_llm_messages()
+        assert [m["role"] for m in llm] == ["user", "assistant", "tool", "user"]
+        assert llm[2]["tool_call_id"] == "call_1"
+        assert llm[2]["content"] == "ERROR: Tool execution was interrupted."
+
+    @pytest.mark.asyncio
+    async def test_pending_tool_call_not_frozen_in_cache(self):
+        """A trailing tool-call block is re-scanned once its result arrives."""
+        conv = NodeConversation()
+        await conv.add_user_message("weather?")
+        await conv.add_assistant_message("", tool_calls=SAMPLE_TOOL_CALLS)
+        assert conv.to_llm_messages()[-1]["content"].startswith("ERROR:")
+
+        await conv.add_tool_result("call_1", "sunny")
+        llm = conv.to_llm_messages()
+        assert len(llm) == 3
+        assert llm[-1]["content"] == "sunny"
+
+    @pytest.mark.asyncio
+    async def test_incremental_matches_fresh_serialization(self):
+        conv = NodeConversation()
+        for i in range(5):
+            await conv.add_user_message(f"q{i}")
+            assert conv.to_llm_messages() == _fresh_llm_messages(conv)
+            await conv.add_assistant_message("", tool_calls=SAMPLE_TOOL_CALLS)
+            assert conv.to_llm_messages() == _fresh_llm_messages(conv)
+            if i % 2 == 0:
+                await conv.add_tool_result("call_1", f"r{i}")
+            assert conv.to_llm_messages() == _fresh_llm_messages(conv)
+
+    @pytest.mark.asyncio
+    async def test_returned_list_is_independent(self):
+        conv = NodeConversation()
+        await conv.add_user_message("a")
+        await conv.add_assistant_message("b")
+        first = conv.to_llm_messages()
+        first.append({"role": "user", "content": "injected"})
+        assert len(conv.to_llm_messages()) == 2
+
+    @pytest.mark.asyncio
+    async def test_prune_refreshes_cached_dicts(self):
+        conv = NodeConversation()
+        for i in range(4):
+            await conv.add_user_message(f"q{i}")
+            await conv.add_assistant_message(
+                "",
+                tool_calls=[{"id": f"c{i}", "type": "function", "function": {"name": "t"}}],
+            )
+            await conv.add_tool_result(f"c{i}", "x" * 4000)
+        conv.to_llm_messages()
+
+        pruned = await conv.prune_old_tool_results(protect_tokens=1000, min_prune_tokens=100)
+        assert pruned > 0
+        llm = conv.to_llm_messages()
+        assert llm == _fresh_llm_messages(conv)
+        assert llm[2]["content"].startswith("[Pruned tool result")
+
+    @pytest.mark.asyncio
+    async def test_compact_and_clear_refresh_cache(self):
+        conv = NodeConversation()
+        for i in range(4):
+            await conv.add_user_message(f"q{i}")
+            await conv.add_assistant_message(f"a{i}")
+        conv.to_llm_messages()
+
+        await conv.compact("summary", keep_recent=2)
+        assert conv.to_llm_messages() == [
+            {"role": "user", "content": "summary"},
+            {"role": "user", "content": "q3"},
+            {"role": "assistant", "content": "a3"},
+        ]
+
+        await conv.clear()
+        assert conv.to_llm_messages() == []
+        await conv.add_user_message("again")
+        assert conv.to_llm_messages() == [{"role": "user", "content": "again"}]
+
+
 # ===================================================================
 # Output-key extraction
 # ===================================================================
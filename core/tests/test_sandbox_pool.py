@@ -0,0 +1,203 @@
+"""Tests for the process-pool code sandbox."""
+
+import asyncio
+import datetime
+import os
+import pickle
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from framework.graph import sandbox_pool, sandbox_worker
+from framework.graph.code_sandbox import CodeSandboxError
+from framework.graph.sandbox_pool import ProcessPoolSandbox, restricted_loads
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="requires resource limits")
+
+BUSY_LOOP = "n = 0\nwhile True:\n    n += 1"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    sandbox = ProcessPoolSandbox(workers=2, timeout_seconds=2)
+    yield sandbox
+    sandbox.close()
+
+
+class TestProcessPoolSandbox:
+    """Tests for ProcessPoolSandbox execution and limits."""
+
+    def test_executes_code_with_inputs(self, pool):
+        result = pool.execute("y = x * 2\nresult = y + 1", inputs={"x": 20})
+
+        assert result.success is True
+        assert result.result == 41
+        assert result.variables["y"] == 40
+
+    def test_execute_expression(self, pool):
+        result = pool.execute_expression("a + b", inputs={"a": 2, "b": 3})
+
+        assert result.success is True
+        assert result.result == 5
+
+    def test_validation_rejects_before_reaching_worker(self, pool):
+        result = pool.execute("import os")
+
+        assert result.success is False
+        assert "validation failed" in result.error
+
+    def test_runtime_error_reported(self, pool):
+        result = pool.execute("result = 1 / 0")
+
+        assert result.success is False
+        assert "ZeroDivisionError" in result.error
+
+    def test_data_types_round_trip(self, pool):
+        when = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        result = pool.execute(
+            "result = {'when': when, 'items': set(items)}",
+            inputs={"when": when, "items": [1, 2, 2]},
+        )
+
+        assert result.result == {"when": when, "items": {1, 2}}
+
+    def test_unpicklable_values_returned_as_repr(self, pool):
+        result = pool.execute("result = (lambda: 1)")
+
+        assert result.success is True
+        assert "lambda" in result.result
+
+    def test_unpicklable_inputs_are_skipped(self, pool):
+        result = pool.execute("result = x + 1", inputs={"callback": lambda: None, "x": 1})
+
+        assert result.success is True
+        assert result.result == 2
+
+    def test_wall_clock_timeout_kills_worker(self):
+        with ProcessPoolSandbox(workers=1, timeout_seconds=1, cpu_time_seconds=30) as sandbox:
+            started = time.monotonic()
+            # Big integer arithmetic never returns to the interpreter loop,
+            # so the worker's own SIGALRM cannot interrupt it
+            result = sandbox.execute("result = 10 ** (10 ** 9)")
+            elapsed = time.monotonic() - started
+
+            assert result.success is False
+            assert "timed out" in result.error
+            assert elapsed < 5
+            # The pool replaced the worker
+            assert sandbox.execute("result = 1").result == 1
+
+    def test_cpu_limit_kills_worker(self):
+        with ProcessPoolSandbox(workers=1, timeout_seconds=20, cpu_time_seconds=1) as sandbox:
+            result = sandbox.execute(BUSY_LOOP)
+
+            assert result.success is False
+            assert "CPU time limit" in result.error
+            assert sandbox.execute("result = 2").result == 2
+
+    def test_memory_limit(self):
+        with ProcessPoolSandbox(workers=1, memory_limit_mb=256) as sandbox:
+            result = sandbox.execute("data = 'x' * (1024 * 1024 * 1024)")
+
+            assert result.success is False
+            assert "MemoryError" in result.error
+
+    def test_workers_recycled_after_max_tasks(self):
+        with ProcessPoolSandbox(workers=1, max_tasks_per_worker=2) as sandbox:
+            for i in range(5):
+                assert sandbox.execute(f"result = {i}").result == i
+
+    @pytest.mark.asyncio
+    async def test_execute_async_does_not_block_loop(self, pool):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        result = await pool.execute_async("n = 0\nfor i in range(3_000_000):\n    n += i")
+        task.cancel()
+
+        assert result.success is True
+        assert ticks > 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs two CPUs")
+    async def test_tasks_run_in_parallel(self, pool):
+        code = "n = 0\nfor i in range(5_000_000):\n    n += i"
+        started = time.monotonic()
+        await pool.execute_async(code)
+        single = time.monotonic() - started
+
+        started = time.monotonic()
+        results = await asyncio.gather(pool.execute_async(code), pool.execute_async(code))
+        both = time.monotonic() - started
+
+        assert all(r.success for r in results)
+        assert both < single * 1.6
+
+    def test_closed_pool_rejects_work(self):
+        sandbox = ProcessPoolSandbox(workers=1)
+        sandbox.close()
+
+        result = sandbox.execute("result = 1")
+
+        assert result.success is False
+        assert "closed" in result.error
+
+    def test_worker_start_failure_raises(self, monkeypatch):
+        def fail(self):
+            raise EOFError("unexpected EOF")
+
+        monkeypatch.setattr(sandbox_pool._mp_context().Process, "start", fail)
+
+        with pytest.raises(CodeSandboxError, match="Could not start sandbox worker"):
+            ProcessPoolSandbox(workers=1)
+
+    def test_worker_respawn_failure_returns_result(self, monkeypatch):
+        with ProcessPoolSandbox(workers=1) as sandbox:
+            worker = sandbox._idle.get()
+            worker.kill()
+            sandbox._idle.put(worker)
+
+            with monkeypatch.context() as m:
+                m.setattr(sandbox_pool._Worker, "__init__", _fail_start)
+                result = sandbox.execute("result = 1")
+
+            assert result.success is False
+            assert "Could not start sandbox worker" in result.error
+            assert sandbox.execute("result = 3").result == 3
+
+    def test_worker_does_not_import_framework_package(self):
+        script = (
+            "import runpy, sys\n"
+            f"runpy.run_path({sandbox_worker.__file__!r})['_load_code_sandbox']()\n"
+            "print(sorted({'framework.llm', 'litellm'} & set(sys.modules)))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+        assert out.returncode == 0, out.stderr
+        assert out.stdout.strip() == "[]"
+
+
+def _fail_start(self, *args, **kwargs):
+    raise CodeSandboxError("Could not start sandbox worker: EOFError()")
+
+
+class TestRestrictedLoads:
+    """Tests for the whitelist unpickler used on worker results."""
+
+    def test_allows_plain_data(self):
+        value = {"a": [1, 2.5, "x"], "b": frozenset({1}), "c": datetime.timedelta(seconds=3)}
+
+        assert restricted_loads(pickle.dumps(value)) == value
+
+    def test_rejects_other_globals(self):
+        with pytest.raises(pickle.UnpicklingError):
+            restricted_loads(pickle.dumps(Path("/etc/passwd")))
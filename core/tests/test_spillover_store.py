@@ -0,0 +1,167 @@
+"""Tests for SpilloverStore and EventLoopNode tool-result spillover."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import struct
+
+import pytest
+
+from framework.graph.event_loop_node import EventLoopNode, LoopConfig
+from framework.llm.provider import ToolResult
+from framework.storage.spillover_store import (
+    INDEX_DIRNAME,
+    INDEX_MAGIC,
+    SpilloverStore,
+    line_offsets,
+)
+
+
+def read_index(path):
+    raw = (path.parent / INDEX_DIRNAME / f"{path.name}.idx").read_bytes()
+    magic, size, mtime_ns, count = struct.unpack_from("<8sQQQ", raw)
+    offsets = list(struct.unpack_from(f"<{count}Q", raw, 32))
+    return magic, size, mtime_ns, offsets
+
+
+class TestLineOffsets:
+    def test_offsets(self):
+        assert list(line_offsets(b"a\nbb\nccc")) == [0, 2, 5]
+
+    def test_trailing_newline_adds_no_line(self):
+        assert list(line_offsets(b"a\nb\n")) == [0, 2]
+
+    def test_empty(self):
+        assert list(line_offsets(b"")) == []
+
+
+class TestSpilloverStore:
+    @pytest.mark.asyncio
+    async def test_spill_pretty_prints_json_and_writes_index(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        content = json.dumps([{"id": i} for i in range(3)])
+
+        filename = await store.spill("search", "call_1", content)
+
+        path = tmp_path / filename
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        assert filename == f"tool_search_call_1_{digest[:12]}.txt"
+        text = path.read_text()
+        assert json.loads(text) == json.loads(content)
+        assert "\n" in text
+
+        magic, size, mtime_ns, offsets = read_index(path)
+        assert magic == INDEX_MAGIC
+        assert size == path.stat().st_size
+        assert mtime_ns == path.stat().st_mtime_ns
+        assert offsets == list(line_offsets(text.encode()))
+
+    @pytest.mark.asyncio
+    async def test_identical_content_deduplicated(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        first = await store.spill("search", "call_1", "x" * 5000)
+        second = await store.spill("search", "call_2", "x" * 5000)
+
+        assert first == second
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == [first]
+        assert store.stats()["files"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dedup_survives_new_store_instance(self, tmp_path):
+        first = await SpilloverStore(tmp_path).spill("a", "call_1", "payload" * 100)
+        second = await SpilloverStore(tmp_path).spill("b", "call_2", "payload" * 100)
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_deleted_file_is_rewritten(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        filename = await store.spill("a", "call_1", "payload" * 100)
+        (tmp_path / filename).unlink()
+
+        again = await store.spill("a", "call_2", "payload" * 100)
+        assert (tmp_path / again).exists()
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_under_quota(self, tmp_path):
+        store = SpilloverStore(tmp_path, max_bytes=2500)
+        a = await store.spill("t", "a", "a" * 1000)
+        b = await store.spill("t", "b", "b" * 1000)
+        await store.spill("t", "a2", "a" * 1000)  # touch a -> b is now LRU
+        c = await store.spill("t", "c", "c" * 1000)
+
+        assert (tmp_path / a).exists()
+        assert not (tmp_path / b).exists()
+        assert not (tmp_path / INDEX_DIRNAME / f"{b}.idx").exists()
+        assert (tmp_path / c).exists()
+        assert store.stats()["total_bytes"] <= 2500
+
+    @pytest.mark.asyncio
+    async def test_quota_shared_between_stores_on_one_directory(self, tmp_path):
+        # Each EventLoopNode builds its own store on the session data dir
+        first = SpilloverStore(tmp_path, max_bytes=2500)
+        second = SpilloverStore(tmp_path, max_bytes=2500)
+        await asyncio.gather(
+            *((first if i % 2 else second).spill("t", f"call_{i}", str(i) * 1000) for i in range(6))
+        )
+
+        spilled = [p for p in tmp_path.iterdir() if p.is_file()]
+        assert sum(p.stat().st_size for p in spilled) <= 2500
+        assert first.stats()["files"] == len(spilled)
+
+    @pytest.mark.asyncio
+    async def test_long_ids_with_shared_prefix_do_not_collide(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        prefix = "call_" + "x" * 60
+
+        a = await store.spill("t", prefix + "a", "first" * 100)
+        b = await store.spill("t", prefix + "b", "second" * 100)
+
+        assert a != b
+        assert (tmp_path / a).read_text() == "first" * 100
+
+    @pytest.mark.asyncio
+    async def test_eviction_never_touches_unmanaged_files(self, tmp_path):
+        (tmp_path / "report.json").write_text("r" * 5000)
+        store = SpilloverStore(tmp_path, max_bytes=100)
+        await store.spill("t", "a", "a" * 1000)
+        await store.spill("t", "b", "b" * 1000)
+        assert (tmp_path / "report.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_compressed_spill(self, tmp_path):
+        store = SpilloverStore(tmp_path, compress=True)
+        content = "line\n" * 1000
+
+        filename = await store.spill("t", "call_1", content)
+
+        assert filename.endswith(".txt.gz")
+        assert gzip.decompress((tmp_path / filename).read_bytes()).decode() == content
+        _, _, _, offsets = read_index(tmp_path / filename)
+        assert len(offsets) == 1000
+        assert offsets[1] == 5
+
+
+class TestEventLoopSpillover:
+    @pytest.mark.asyncio
+    async def test_large_result_spilled_and_referenced(self, tmp_path):
+        node = EventLoopNode(
+            config=LoopConfig(max_tool_result_chars=500, spillover_dir=str(tmp_path))
+        )
+        result = ToolResult(tool_use_id="call_9", content="z" * 2000)
+
+        truncated = await node._truncate_tool_result(result, "fetch")
+
+        (path,) = tmp_path.glob("tool_fetch_call_9_*.txt")
+        assert f"saved to '{path.name}'" in truncated.content
+        assert path.read_text() == "z" * 2000
+
+    @pytest.mark.asyncio
+    async def test_small_result_untouched(self, tmp_path):
+        node = EventLoopNode(config=LoopConfig(spillover_dir=str(tmp_path)))
+        result = ToolResult(tool_use_id="call_1", content="small")
+
+        assert await node._truncate_tool_result(result, "fetch") is result
+        assert not tmp_path.exists() or not any(tmp_path.iterdir())
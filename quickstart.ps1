@@ -950,9 +950,9 @@ if ($credKey) {
     New-Item -ItemType Directory -Path $credCredsDir -Force | Out-Null
     New-Item -ItemType Directory -Path $credMetaDir  -Force | Out-Null
 
-    $indexFile = Join-Path $credMetaDir "index.json"
+    $indexFile = Join-Path $credMetaDir "index.jsonl"
     if (-not (Test-Path $indexFile)) {
-        "{}" | Set-Content -Path $indexFile -Encoding UTF8
+        New-Item -ItemType File -Path $indexFile | Out-Null
     }
 
     Write-Ok "Credential store initialized at ~/.hive/credentials/"
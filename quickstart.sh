@@ -875,10 +875,8 @@ if [ -n "$HIVE_CREDENTIAL_KEY" ]; then
     mkdir -p "$HIVE_CRED_DIR/credentials"
     mkdir -p "$HIVE_CRED_DIR/metadata"
 
-    # Initialize the metadata index
-    if [ ! -f "$HIVE_CRED_DIR/metadata/index.json" ]; then
-        echo '{"credentials": {}, "version": "1.0"}' > "$HIVE_CRED_DIR/metadata/index.json"
-    fi
+    # Initialize the metadata index journal
+    touch "$HIVE_CRED_DIR/metadata/index.jsonl"
 
     echo -e "${GREEN}  ✓ Credential store initialized at ~/.hive/credentials/${NC}"
 
@@ -59,7 +59,13 @@
 from .gcp_vision import GCP_VISION_CREDENTIALS
 from .github import GITHUB_CREDENTIALS
 from .google_maps import GOOGLE_MAPS_CREDENTIALS
-from .health_check import HealthCheckResult, check_credential_health
+from .health_check import (
+    HealthCheckCache,
+    HealthCheckResult,
+    check_credential_health,
+    check_credentials_health,
+    check_credentials_health_sync,
+)
 from .hubspot import HUBSPOT_CREDENTIALS
 from .llm import LLM_CREDENTIALS
 from .news import NEWS_CREDENTIALS
@@ -102,6 +108,9 @@
     # Health check utilities
     "HealthCheckResult",
     "check_credential_health",
+    "check_credentials_health",
+    "check_credentials_health_sync",
+    "HealthCheckCache",
     # Browser utilities for OAuth2 flows
     "open_browser",
     "get_aden_auth_url",
@@ -19,6 +19,7 @@
             "vision_image_properties",
             "vision_web_detection",
             "vision_safe_search",
+            "vision_analyze",
         ],
         required=True,
         startup_required=False,
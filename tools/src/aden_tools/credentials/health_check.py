@@ -4,11 +4,24 @@
 Validates that stored credentials are valid before agent execution.
 Each integration has a lightweight health check that makes a minimal API call
 to verify the credential works.
+
+check_credentials_health() runs many checks concurrently (bounded, with a
+per-check timeout), so validating every configured integration costs
+about one round-trip.  Definitive results are cached for a short TTL,
+keyed by a hash of the credential value; transient failures (timeouts,
+connection errors) are never cached.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Protocol
 
 import httpx
@@ -611,3 +624,132 @@ def check_credential_health(
         return checker.check(credential_value, kwargs["cse_id"])
 
     return checker.check(credential_value)
+
+
+class HealthCheckCache:
+    """Short-lived cache of health check results, keyed by credential hash."""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: dict[str, tuple[float, HealthCheckResult]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(credential_name: str, credential_value: str, **kwargs: Any) -> str:
+        """Hash of the check inputs; the credential value itself is never stored."""
+        digest = hashlib.sha256()
+        extra = sorted(f"{k}={v}" for k, v in kwargs.items())
+        for part in (credential_name, credential_value, *extra):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> HealthCheckResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: str, result: HealthCheckResult) -> None:
+        if "error" in result.details:
+            return  # Timeouts and connection errors say nothing about the credential
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                now = time.monotonic()
+                self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+                while len(self._entries) >= self._max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self._ttl, result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+health_check_cache = HealthCheckCache()
+
+
+async def check_credentials_health(
+    credentials: Mapping[str, str | tuple[str, dict[str, Any]]],
+    max_concurrency: int = 8,
+    timeout: float = 15.0,
+    use_cache: bool = True,
+) -> dict[str, HealthCheckResult]:
+    """
+    Check many credentials concurrently.
+
+    Each check runs check_credential_health() on a worker thread; at most
+    ``max_concurrency`` run at once and each is abandoned after ``timeout``
+    seconds.
+
+    Args:
+        credentials: Credential name -> value, or -> (value, checker kwargs)
+            (e.g. ``{"google_search": (api_key, {"cse_id": cse_id})}``)
+        max_concurrency: Maximum number of checks in flight
+        timeout: Per-check timeout in seconds
+        use_cache: Serve and store results in the shared result cache
+
+    Returns:
+        Credential name -> HealthCheckResult, in input order
+
+    Example:
+        >>> results = asyncio.run(check_credentials_health({"hubspot": "pat-xxx"}))
+        >>> invalid = [name for name, r in results.items() if not r.valid]
+    """
+    max_concurrency = max(1, min(max_concurrency, len(credentials) or 1))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Own pool: the default to_thread() pool may be smaller than max_concurrency
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="health-check")
+    loop = asyncio.get_running_loop()
+
+    async def run(name: str, entry: str | tuple[str, dict[str, Any]]) -> HealthCheckResult:
+        value, kwargs = entry if isinstance(entry, tuple) else (entry, {})
+        key = HealthCheckCache.key(name, value, **kwargs)
+        if use_cache:
+            cached = health_check_cache.get(key)
+            if cached is not None:
+                return cached
+        async with semaphore:
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(
+                        executor, partial(check_credential_health, name, value, **kwargs)
+                    ),
+                    timeout,
+                )
+            except TimeoutError:
+                return HealthCheckResult(
+                    valid=False,
+                    message=f"Health check for '{name}' timed out after {timeout:g}s",
+                    details={"error": "timeout"},
+                )
+            except Exception as e:
+                return HealthCheckResult(
+                    valid=False,
+                    message=f"Health check for '{name}' failed: {e}",
+                    details={"error": str(e)},
+                )
+        if use_cache:
+            health_check_cache.put(key, result)
+        return result
+
+    names = list(credentials)
+    try:
+        results = await asyncio.gather(*(run(name, credentials[name]) for name in names))
+    finally:
+        # Timed-out checks finish in the background, bounded by the checkers' HTTP timeouts
+        executor.shutdown(wait=False)
+    return dict(zip(names, results, strict=True))
+
+
+def check_credentials_health_sync(
+    credentials: Mapping[str, str | tuple[str, dict[str, Any]]],
+    **kwargs: Any,
+) -> dict[str, HealthCheckResult]:
+    """Blocking wrapper around check_credentials_health() for non-async callers."""
+    return asyncio.run(check_credentials_health(credentials, **kwargs))
@@ -26,13 +26,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from .base import CredentialError, CredentialSpec
 
 if TYPE_CHECKING:
     from framework.credentials import CredentialStore
 
+    from .health_check import HealthCheckResult
+
 
 class CredentialStoreAdapter:
     """
@@ -117,6 +120,15 @@ def is_available(self, name: str) -> bool:
         value = self._store.get(name)
         return value is not None and value != ""
 
+    def _available(self, names: list[str]) -> set[str]:
+        """Names among *names* that are available, loaded in a single batch."""
+        credentials = self._store.get_credentials(names)
+        return {
+            name
+            for name, credential in credentials.items()
+            if credential.get_default_key() not in (None, "")
+        }
+
     def get_credential_for_tool(self, tool_name: str) -> str | None:
         """
         Get the credential name required by a tool.
@@ -139,22 +151,17 @@ def get_missing_for_tools(self, tool_names: list[str]) -> list[tuple[str, Creden
         Returns:
             List of (credential_name, spec) tuples for missing credentials
         """
-        missing: list[tuple[str, CredentialSpec]] = []
-        checked: set[str] = set()
-
-        for tool_name in tool_names:
-            cred_name = self._tool_to_cred.get(tool_name)
-            if cred_name is None:
-                continue
-            if cred_name in checked:
-                continue
-            checked.add(cred_name)
-
-            spec = self._specs[cred_name]
-            if spec.required and not self.is_available(cred_name):
-                missing.append((cred_name, spec))
-
-        return missing
+        return self._missing_for(self._tool_to_cred.get(name) for name in tool_names)
+
+    def _missing_for(self, cred_names: Iterable[str | None]) -> list[tuple[str, CredentialSpec]]:
+        """Required credentials among *cred_names* that are not available, in order."""
+        required = [
+            name
+            for name in dict.fromkeys(cred_names)
+            if name is not None and self._specs[name].required
+        ]
+        available = self._available(required)
+        return [(name, self._specs[name]) for name in required if name not in available]
 
     def validate_for_tools(self, tool_names: list[str]) -> None:
         """
@@ -172,22 +179,7 @@ def validate_for_tools(self, tool_names: list[str]) -> None:
 
     def get_missing_for_node_types(self, node_types: list[str]) -> list[tuple[str, CredentialSpec]]:
         """Get list of missing credentials for the given node types."""
-        missing: list[tuple[str, CredentialSpec]] = []
-        checked: set[str] = set()
-
-        for node_type in node_types:
-            cred_name = self._node_type_to_cred.get(node_type)
-            if cred_name is None:
-                continue
-            if cred_name in checked:
-                continue
-            checked.add(cred_name)
-
-            spec = self._specs[cred_name]
-            if spec.required and not self.is_available(cred_name):
-                missing.append((cred_name, spec))
-
-        return missing
+        return self._missing_for(self._node_type_to_cred.get(node) for node in node_types)
 
     def validate_for_node_types(self, node_types: list[str]) -> None:
         """
@@ -210,15 +202,46 @@ def validate_startup(self) -> None:
         Raises:
             CredentialError: If any startup-required credentials are missing
         """
-        missing: list[tuple[str, CredentialSpec]] = []
-
-        for cred_name, spec in self._specs.items():
-            if spec.startup_required and not self.is_available(cred_name):
-                missing.append((cred_name, spec))
+        names = [name for name, spec in self._specs.items() if spec.startup_required]
+        available = self._available(names)
+        missing = [(name, self._specs[name]) for name in names if name not in available]
 
         if missing:
             raise CredentialError(self._format_startup_error(missing))
 
+    def check_health(
+        self, names: list[str] | None = None, **kwargs: Any
+    ) -> dict[str, HealthCheckResult]:
+        """
+        Health-check available credentials concurrently.
+
+        Args:
+            names: Credentials to check (default: every known credential).
+                Unavailable ones are skipped.
+            **kwargs: Passed to check_credentials_health() (max_concurrency,
+                timeout, use_cache)
+
+        Returns:
+            Credential name -> HealthCheckResult for each available credential
+        """
+        from .health_check import check_credentials_health_sync
+
+        names = list(self._specs) if names is None else names
+        values = {
+            name: credential.get_default_key()
+            for name, credential in self._store.get_credentials(names).items()
+            if credential.get_default_key() not in (None, "")
+        }
+        checks: dict[str, str | tuple[str, dict[str, Any]]] = {
+            name: values[name] for name in names if name in values
+        }
+        # Google Custom Search needs its engine ID alongside the API key
+        if "google_search" in checks:
+            cse_id = values.get("google_cse") or self._store.get("google_cse")
+            if cse_id:
+                checks["google_search"] = (values["google_search"], {"cse_id": cse_id})
+        return check_credentials_health_sync(checks, **kwargs)
+
     # --- New CredentialStore Features ---
 
     def get_key(self, credential_id: str, key_name: str) -> str | None:
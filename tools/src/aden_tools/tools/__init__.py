@@ -115,6 +115,7 @@ def register_all_tools(
         "example_tool",
         "web_search",
         "web_scrape",
+        "web_scrape_many",
         "pdf_read",
         "get_current_time",
         "view_file",
@@ -126,6 +127,7 @@ def register_all_tools(
         "grep_search",
         "execute_command_tool",
         "load_data",
+        "query_data",
         "save_data",
         "append_data",
         "edit_data",
@@ -143,6 +145,7 @@ def register_all_tools(
         "excel_sheet_list",
         "excel_sql",
         "excel_search",
+        "excel_convert_columnar",
         "apollo_enrich_person",
         "apollo_enrich_company",
         "apollo_search_people",
@@ -252,6 +255,7 @@ def register_all_tools(
         "vision_image_properties",
         "vision_web_detection",
         "vision_safe_search",
+        "vision_analyze",
         "telegram_send_message",
         "telegram_send_document",
         "maps_geocode",
@@ -5,6 +5,8 @@
 
 from fastmcp import FastMCP
 
+from ...utils.csv_index import EmptyCSVError, get_csv_index
+from ...utils.sql_engine import DEFAULT_MAX_ROWS, get_sql_engine
 from ..file_system_toolkits.security import get_secure_path
 
 
@@ -19,10 +21,14 @@ def csv_read(
         session_id: str,
         limit: int | None = None,
         offset: int = 0,
+        columns: list[str] | None = None,
     ) -> dict:
         """
         Read a CSV file and return its contents.
 
+        Rows are located through a cached row-offset index, so paging through
+        a large file with offset/limit only parses the requested rows.
+
         Args:
             path: Path to the CSV file (relative to session sandbox)
             workspace_id: Workspace identifier
@@ -30,6 +36,7 @@ def csv_read(
             session_id: Session identifier
             limit: Maximum number of rows to return (None = all rows)
             offset: Number of rows to skip from the beginning
+            columns: Only return these columns (None = all columns)
 
         Returns:
             dict with success status, data, and metadata
@@ -45,41 +52,34 @@ def csv_read(
             if not path.lower().endswith(".csv"):
                 return {"error": "File must have .csv extension"}
 
-            # Read CSV
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-
-                columns = list(reader.fieldnames)
+            index_cache = get_csv_index()
+            index = index_cache.get(secure_path)
 
-                # Apply offset and limit
-                rows = []
-                for i, row in enumerate(reader):
-                    if i < offset:
-                        continue
-                    if limit is not None and len(rows) >= limit:
-                        break
-                    rows.append(row)
+            if columns is not None:
+                unknown = [c for c in columns if c not in index.columns]
+                if unknown:
+                    return {
+                        "error": f"Unknown columns: {', '.join(unknown)}",
+                        "available_columns": index.columns,
+                    }
 
-            # Get total row count (re-read for accurate count)
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1
+            rows = index_cache.read_rows(secure_path, index, offset, limit, columns)
+            selected = columns if columns is not None else list(index.columns)
 
             return {
                 "success": True,
                 "path": path,
-                "columns": columns,
-                "column_count": len(columns),
+                "columns": selected,
+                "column_count": len(selected),
                 "rows": rows,
                 "row_count": len(rows),
-                "total_rows": total_rows,
+                "total_rows": index.nonempty_row_count,
                 "offset": offset,
                 "limit": limit,
             }
 
+        except EmptyCSVError:
+            return {"error": "CSV file is empty or has no headers"}
         except csv.Error as e:
             return {"error": f"CSV parsing error: {str(e)}"}
         except UnicodeDecodeError:
@@ -177,12 +177,10 @@ def csv_append(
             if not rows:
                 return {"error": "rows cannot be empty"}
 
-            # Read existing columns
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-                columns = list(reader.fieldnames)
+            # Read existing columns from the index
+            index_cache = get_csv_index()
+            index = index_cache.get(secure_path)
+            columns = index.columns
 
             # Append rows
             with open(secure_path, "a", encoding="utf-8", newline="") as f:
@@ -192,10 +190,8 @@ def csv_append(
                     filtered_row = {k: v for k, v in row.items() if k in columns}
                     writer.writerow(filtered_row)
 
-            # Get new total row count
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1  # Subtract header
+            # Index only the appended rows for the new total
+            total_rows = index_cache.extend(secure_path, index).nonempty_row_count
 
             return {
                 "success": True,
@@ -204,6 +200,8 @@ def csv_append(
                 "total_rows": total_rows,
             }
 
+        except EmptyCSVError:
+            return {"error": "CSV file is empty or has no headers"}
         except csv.Error as e:
             return {"error": f"CSV parsing error: {str(e)}"}
         except UnicodeDecodeError:
@@ -242,27 +240,20 @@ def csv_info(
             # Get file size
             file_size = os.path.getsize(secure_path)
 
-            # Read headers and count rows
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-
-                columns = list(reader.fieldnames)
-
-                # Count rows
-                total_rows = sum(1 for _ in reader)
+            # Headers and row count come from the cached row index
+            index = get_csv_index().get(secure_path)
 
             return {
                 "success": True,
                 "path": path,
-                "columns": columns,
-                "column_count": len(columns),
-                "total_rows": total_rows,
+                "columns": list(index.columns),
+                "column_count": len(index.columns),
+                "total_rows": index.row_count,
                 "file_size_bytes": file_size,
             }
 
+        except EmptyCSVError:
+            return {"error": "CSV file is empty or has no headers"}
         except csv.Error as e:
             return {"error": f"CSV parsing error: {str(e)}"}
         except UnicodeDecodeError:
@@ -277,11 +268,14 @@ def csv_sql(
         agent_id: str,
         session_id: str,
         query: str,
+        max_rows: int = DEFAULT_MAX_ROWS,
     ) -> dict:
         """
         Query a CSV file using SQL (powered by DuckDB).
 
         The CSV file is loaded as a table named 'data'. Use standard SQL syntax.
+        The file is parsed once and cached, so follow-up queries on the same
+        (unchanged) file skip the load.
 
         Args:
             path: Path to the CSV file (relative to session sandbox)
@@ -290,9 +284,11 @@ def csv_sql(
             session_id: Session identifier
             query: SQL query to execute. The CSV is available as table 'data'.
                    Example: "SELECT * FROM data WHERE price > 100 ORDER BY name LIMIT 10"
+            max_rows: Maximum number of rows to return (default: 1000).
+                      'truncated' is True when the query produced more.
 
         Returns:
-            dict with query results, columns, and row count
+            dict with query results, columns, row count and query time
 
         Examples:
             # Filter rows
@@ -309,7 +305,7 @@ def csv_sql(
             query="SELECT * FROM data WHERE LOWER(name) LIKE '%phone%'"
         """
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -351,31 +347,28 @@ def csv_sql(
                 if keyword in query_upper:
                     return {"error": f"'{keyword}' is not allowed in queries"}
 
-            # Execute query using in-memory DuckDB
-            con = duckdb.connect(":memory:")
-            try:
-                # Load CSV as 'data' table
+            if max_rows < 1:
+                return {"error": "max_rows must be at least 1"}
+
+            def load(con) -> list[str]:
                 con.execute(f"CREATE TABLE data AS SELECT * FROM read_csv_auto('{secure_path}')")
+                return ["data"]
+
+            result = get_sql_engine().query(secure_path, load, query, max_rows=max_rows)
 
-                # Execute user query
-                result = con.execute(query)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-
-                # Convert to list of dicts
-                rows_as_dicts = [dict(zip(columns, row, strict=False)) for row in rows]
-
-                return {
-                    "success": True,
-                    "path": path,
-                    "query": query,
-                    "columns": columns,
-                    "column_count": len(columns),
-                    "rows": rows_as_dicts,
-                    "row_count": len(rows_as_dicts),
-                }
-            finally:
-                con.close()
+            return {
+                "success": True,
+                "path": path,
+                "query": query,
+                "columns": result["columns"],
+                "column_count": len(result["columns"]),
+                "rows": result["rows"],
+                "row_count": result["row_count"],
+                "truncated": result["truncated"],
+                "cached": result["cached"],
+                "load_time_ms": result["load_time_ms"],
+                "query_time_ms": result["query_time_ms"],
+            }
 
         except Exception as e:
             error_msg = str(e)
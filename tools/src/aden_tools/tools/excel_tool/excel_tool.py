@@ -1,12 +1,21 @@
 """Excel Tool - Read and manipulate Excel files (.xlsx, .xlsm)."""
 
 import os
-from datetime import datetime
 from typing import Any
 
 from fastmcp import FastMCP
 
+from ...utils.sql_engine import DEFAULT_MAX_ROWS, get_sql_engine
 from ..file_system_toolkits.security import get_secure_path
+from .workbook_cache import (
+    ROW_COLUMN,
+    SheetData,
+    SheetNotFoundError,
+    convert_cell_value as _convert_cell_value,
+    get_workbook_cache,
+    parquet_source,
+    sql_identifier,
+)
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -41,7 +50,7 @@ def excel_read(
             return {"error": "offset and limit must be non-negative"}
 
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -59,87 +68,69 @@ def excel_read(
             if not path.lower().endswith((".xlsx", ".xlsm")):
                 return {"error": "File must have .xlsx or .xlsm extension"}
 
-            # Load workbook in read-only mode for better performance
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
-
+            # Sheets are parsed once per file version and then paged from memory
+            cache = get_workbook_cache()
             try:
-                # Get the specified sheet or active sheet
+                ws = cache.sheet(secure_path, sheet)
+            except SheetNotFoundError:
                 if sheet:
-                    if sheet not in wb.sheetnames:
-                        return {
-                            "error": f"Sheet '{sheet}' not found. Available sheets: {wb.sheetnames}"
-                        }
-                    ws = wb[sheet]
-                else:
-                    ws = wb.active
-
-                if ws is None:
-                    return {"error": "Workbook has no active sheet"}
-
-                # Read all rows
-                all_rows = []
-                for row in ws.iter_rows(values_only=True):
-                    # Convert cell values to serializable format
-                    converted_row = [_convert_cell_value(cell) for cell in row]
-                    all_rows.append(converted_row)
-
-                if not all_rows:
                     return {
-                        "success": True,
-                        "path": path,
-                        "sheet_name": ws.title,
-                        "columns": [],
-                        "column_count": 0,
-                        "rows": [],
-                        "row_count": 0,
-                        "total_rows": 0,
-                        "offset": offset,
-                        "limit": limit,
+                        "error": f"Sheet '{sheet}' not found. "
+                        f"Available sheets: {cache.sheet_names(secure_path)}"
                     }
+                return {"error": "Workbook has no active sheet"}
 
-                # First row as headers
-                columns = all_rows[0] if all_rows else []
-                data_rows = all_rows[1:]  # Rows without header
-
-                # Apply offset and limit to data rows
-                total_rows = len(data_rows)
-                if offset > 0:
-                    data_rows = data_rows[offset:]
-                if limit is not None:
-                    data_rows = data_rows[:limit]
-
-                # Convert rows to list of dicts with column names as keys
-                rows_as_dicts = []
-                for row in data_rows:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        if i < len(columns) and columns[i]:
-                            col_name = columns[i]
-                        else:
-                            col_name = f"Column_{i + 1}"
-                        row_dict[str(col_name)] = value
-                    rows_as_dicts.append(row_dict)
-
-                # Format column names
-                formatted_columns = [
-                    str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(columns)
-                ]
-
+            if ws.header is None:
                 return {
                     "success": True,
                     "path": path,
-                    "sheet_name": ws.title,
-                    "columns": formatted_columns,
-                    "column_count": len(columns),
-                    "rows": rows_as_dicts,
-                    "row_count": len(rows_as_dicts),
-                    "total_rows": total_rows,
+                    "sheet_name": ws.name,
+                    "columns": [],
+                    "column_count": 0,
+                    "rows": [],
+                    "row_count": 0,
+                    "total_rows": 0,
                     "offset": offset,
                     "limit": limit,
                 }
 
-            finally:
-                wb.close()
+            # First row as headers
+            columns = [_convert_cell_value(cell) for cell in ws.header]
+
+            # Apply offset and limit to data rows
+            total_rows = len(ws.rows)
+            end = total_rows if limit is None else offset + limit
+            data_rows = ws.rows[offset:end]
+
+            # Convert rows to list of dicts with column names as keys
+            rows_as_dicts = []
+            for row in data_rows:
+                row_dict = {}
+                for i, value in enumerate(row):
+                    if i < len(columns) and columns[i]:
+                        col_name = columns[i]
+                    else:
+                        col_name = f"Column_{i + 1}"
+                    row_dict[str(col_name)] = _convert_cell_value(value)
+                rows_as_dicts.append(row_dict)
+
+            # Format column names
+            formatted_columns = [
+                str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(columns)
+            ]
+
+            return {
+                "success": True,
+                "path": path,
+                "sheet_name": ws.name,
+                "columns": formatted_columns,
+                "column_count": len(columns),
+                "rows": rows_as_dicts,
+                "row_count": len(rows_as_dicts),
+                "total_rows": total_rows,
+                "offset": offset,
+                "limit": limit,
+            }
 
         except Exception as e:
             return {"error": f"Failed to read Excel file: {str(e)}"}
@@ -349,7 +340,7 @@ def excel_info(
             dict with file metadata (sheets, columns per sheet, row counts, file size)
         """
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -370,48 +361,33 @@ def excel_info(
             # Get file size
             file_size = os.path.getsize(secure_path)
 
-            # Load workbook in read-only mode
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
-
-            try:
-                sheets_info = []
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-
-                    # Get columns from first row
-                    columns = []
-                    first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
-                    if first_row:
-                        columns = [
-                            str(c) if c is not None else f"Column_{i + 1}"
-                            for i, c in enumerate(first_row)
-                        ]
-
-                    # Count rows (excluding header)
-                    row_count = 0
-                    for _ in ws.iter_rows(min_row=2, values_only=True):
-                        row_count += 1
-
-                    sheets_info.append(
-                        {
-                            "name": sheet_name,
-                            "columns": columns,
-                            "column_count": len(columns),
-                            "row_count": row_count,
-                        }
-                    )
-
-                return {
-                    "success": True,
-                    "path": path,
-                    "file_size_bytes": file_size,
-                    "sheet_count": len(wb.sheetnames),
-                    "sheet_names": wb.sheetnames,
-                    "sheets": sheets_info,
-                }
+            # Column names and row counts come from the parsed-workbook cache
+            cache = get_workbook_cache()
+            sheet_names = cache.sheet_names(secure_path)
+            columnar = cache.columnar_sheets(secure_path)
+
+            sheets_info = []
+            for sheet_name in sheet_names:
+                ws = cache.sheet(secure_path, sheet_name)
+                columns = ws.headers
+                sheets_info.append(
+                    {
+                        "name": sheet_name,
+                        "columns": columns,
+                        "column_count": len(columns),
+                        "row_count": len(ws.rows),
+                        "columnar": sheet_name in columnar,
+                    }
+                )
 
-            finally:
-                wb.close()
+            return {
+                "success": True,
+                "path": path,
+                "file_size_bytes": file_size,
+                "sheet_count": len(sheet_names),
+                "sheet_names": sheet_names,
+                "sheets": sheets_info,
+            }
 
         except Exception as e:
             return {"error": f"Failed to get Excel info: {str(e)}"}
@@ -478,12 +454,15 @@ def excel_sql(
         session_id: str,
         query: str,
         sheet: str | None = None,
+        max_rows: int = DEFAULT_MAX_ROWS,
     ) -> dict:
         """
         Query an Excel file using SQL (powered by DuckDB).
 
         Each sheet is available as a table with its sheet name (spaces replaced
         with underscores). Use 'data' as alias for the specified/active sheet.
+        The workbook is loaded once and cached, so follow-up queries on the
+        same (unchanged) file skip the load.
 
         Args:
             path: Path to the Excel file (relative to session sandbox)
@@ -493,9 +472,11 @@ def excel_sql(
             query: SQL query. Use 'data' for the target sheet, or sheet names
                    (with spaces as underscores) to query/join multiple sheets.
             sheet: Sheet to use as 'data' table (default: first sheet)
+            max_rows: Maximum number of rows to return (default: 1000).
+                      'truncated' is True when the query produced more.
 
         Returns:
-            dict with query results, columns, and row count
+            dict with query results, columns, row count and query time
 
         Examples:
             # Simple query on default sheet
@@ -508,7 +489,7 @@ def excel_sql(
             query="SELECT s.*, p.name FROM Sales s JOIN Products p ON s.product_id = p.id"
         """
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -518,7 +499,7 @@ def excel_sql(
             }
 
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -560,90 +541,63 @@ def excel_sql(
                 if keyword in query_upper:
                     return {"error": f"'{keyword}' is not allowed in queries"}
 
-            # Load workbook
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
+            if max_rows < 1:
+                return {"error": "max_rows must be at least 1"}
 
-            try:
-                # Determine target sheet for 'data' alias
-                if sheet:
-                    if sheet not in wb.sheetnames:
-                        return {"error": (f"Sheet '{sheet}' not found. Available: {wb.sheetnames}")}
-                    target_sheet = sheet
-                else:
-                    target_sheet = wb.sheetnames[0]
-
-                # Load all sheets into DuckDB
-                import pandas as pd
-
-                con = duckdb.connect(":memory:")
-
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    rows = list(ws.iter_rows(values_only=True))
-
-                    if not rows:
-                        continue
-
-                    # Headers from first row
-                    headers = [
-                        str(c) if c is not None else f"Column_{i + 1}"
-                        for i, c in enumerate(rows[0])
-                    ]
-
-                    # Data rows
-                    records = []
-                    for row in rows[1:]:
-                        record = {}
-                        for i, val in enumerate(row):
-                            col = headers[i] if i < len(headers) else f"Column_{i + 1}"
-                            record[col] = _convert_cell_value(val)
-                        records.append(record)
-
-                    # Create table (sanitize name: spaces -> underscores)
-                    table_name = sheet_name.replace(" ", "_").replace("-", "_")
-                    if records:
-                        df = pd.DataFrame(records)
-                        con.register(f"temp_{table_name}", df)
+            cache = get_workbook_cache()
+            columnar = cache.columnar_sheets(secure_path)
+
+            def load(con) -> list[str]:
+                sheet_names = cache.sheet_names(secure_path)
+                for sheet_name in sheet_names:
+                    if sheet_name in columnar:
+                        # Query the Parquet snapshot in place
+                        source = parquet_source(columnar[sheet_name]["file"])
                         con.execute(
-                            f'CREATE TABLE "{table_name}" AS SELECT * FROM temp_{table_name}'
+                            f'CREATE VIEW "{_table_name(sheet_name)}" AS '
+                            f"SELECT * EXCLUDE ({ROW_COLUMN}) FROM {source}"
                         )
                     else:
-                        # Empty table
-                        cols_sql = ", ".join(f'"{h}" VARCHAR' for h in headers)
-                        con.execute(f'CREATE TABLE "{table_name}" ({cols_sql})')
-
-                    # Create 'data' alias for target sheet
-                    if sheet_name == target_sheet:
-                        con.execute(f'CREATE VIEW data AS SELECT * FROM "{table_name}"')
-
-                all_sheet_names = list(wb.sheetnames)
-
-            finally:
-                wb.close()
-
-            # Execute query (workbook already closed, only DuckDB needed)
-            try:
-                result = con.execute(query)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-            finally:
-                con.close()
-
-            # Convert to dicts
-            rows_as_dicts = [dict(zip(columns, row, strict=False)) for row in rows]
+                        _load_sheet(con, cache.sheet(secure_path, sheet_name))
+                return sheet_names
+
+            def alias_target(cur, sheet_names: list[str]) -> None:
+                if not sheet_names:
+                    raise SheetNotFoundError("Workbook has no sheets")
+                if sheet and sheet not in sheet_names:
+                    raise SheetNotFoundError(f"Sheet '{sheet}' not found. Available: {sheet_names}")
+                table_name = _table_name(sheet or sheet_names[0])
+                cur.execute(f'CREATE TEMP VIEW data AS SELECT * FROM "{table_name}"')
+
+            result = get_sql_engine().query(
+                secure_path,
+                load,
+                query,
+                variant=",".join(sorted(columnar)),
+                setup=alias_target,
+                max_rows=max_rows,
+                allowed_paths=[info["file"] for info in columnar.values()],
+            )
+            all_sheet_names = result["tables"]
 
             return {
                 "success": True,
                 "path": path,
-                "target_sheet": target_sheet,
+                "target_sheet": sheet or all_sheet_names[0],
                 "available_sheets": all_sheet_names,
                 "query": query,
-                "columns": columns,
-                "column_count": len(columns),
-                "rows": rows_as_dicts,
-                "row_count": len(rows_as_dicts),
+                "columns": result["columns"],
+                "column_count": len(result["columns"]),
+                "rows": result["rows"],
+                "row_count": result["row_count"],
+                "truncated": result["truncated"],
+                "cached": result["cached"],
+                "load_time_ms": result["load_time_ms"],
+                "query_time_ms": result["query_time_ms"],
             }
 
+        except SheetNotFoundError as e:
+            return {"error": str(e)}
         except Exception as e:
             error_msg = str(e)
             if "Catalog Error" in error_msg or "Table" in error_msg:
@@ -681,7 +635,7 @@ def excel_search(
             dict with list of matches containing sheet, row, column, and value
         """
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -710,92 +664,224 @@ def excel_search(
             # Prepare search term
             term = search_term if case_sensitive else search_term.lower()
 
-            # Load workbook
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
+            cache = get_workbook_cache()
+            sheet_names = cache.sheet_names(secure_path)
+            sheets_to_search = [sheet] if sheet else sheet_names
 
-            try:
-                sheets_to_search = [sheet] if sheet else wb.sheetnames
-
-                if sheet and sheet not in wb.sheetnames:
-                    return {"error": f"Sheet '{sheet}' not found. Available: {wb.sheetnames}"}
-
-                matches = []
-                for sheet_name in sheets_to_search:
-                    ws = wb[sheet_name]
-
-                    # Get headers for column names
-                    headers = []
-                    first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
-                    if first_row:
-                        headers = [
-                            str(c) if c is not None else f"Column_{i + 1}"
-                            for i, c in enumerate(first_row)
-                        ]
-
-                    # Search data rows only (skip header row)
-                    for row_idx, row in enumerate(
-                        ws.iter_rows(min_row=2, values_only=True), start=2
-                    ):
-                        for col_idx, cell_value in enumerate(row):
-                            if cell_value is None:
-                                continue
-
-                            # Convert to string for comparison
-                            cell_str = str(cell_value)
-                            compare_val = cell_str if case_sensitive else cell_str.lower()
-
-                            # Check match
-                            is_match = False
-                            if match_type == "contains":
-                                is_match = term in compare_val
-                            elif match_type == "exact":
-                                is_match = term == compare_val
-                            elif match_type == "starts_with":
-                                is_match = compare_val.startswith(term)
-                            elif match_type == "ends_with":
-                                is_match = compare_val.endswith(term)
-
-                            if is_match:
-                                col_name = (
-                                    headers[col_idx]
-                                    if col_idx < len(headers)
-                                    else f"Column_{col_idx + 1}"
-                                )
-                                matches.append(
-                                    {
-                                        "sheet": sheet_name,
-                                        "row": row_idx,
-                                        "column": col_name,
-                                        "column_index": col_idx + 1,
-                                        "value": _convert_cell_value(cell_value),
-                                    }
-                                )
+            if sheet and sheet not in sheet_names:
+                return {"error": f"Sheet '{sheet}' not found. Available: {sheet_names}"}
 
-                return {
-                    "success": True,
-                    "path": path,
-                    "search_term": search_term,
-                    "match_type": match_type,
-                    "case_sensitive": case_sensitive,
-                    "sheets_searched": sheets_to_search,
-                    "matches": matches,
-                    "match_count": len(matches),
-                }
+            columnar = cache.columnar_sheets(secure_path)
 
-            finally:
-                wb.close()
+            matches = []
+            for sheet_name in sheets_to_search:
+                if sheet_name in columnar:
+                    # Scan the Parquet snapshot one column at a time
+                    info = columnar[sheet_name]
+                    headers = info["headers"]
+                    hits = _search_columnar(info, term, case_sensitive, match_type)
+                else:
+                    ws = cache.sheet(secure_path, sheet_name)
+                    headers = ws.headers
+                    hits = _search_rows(ws, term, case_sensitive, match_type)
+
+                for row_idx, col_idx, cell_value in hits:
+                    col_name = (
+                        headers[col_idx] if col_idx < len(headers) else f"Column_{col_idx + 1}"
+                    )
+                    matches.append(
+                        {
+                            "sheet": sheet_name,
+                            "row": row_idx,
+                            "column": col_name,
+                            "column_index": col_idx + 1,
+                            "value": _convert_cell_value(cell_value),
+                        }
+                    )
+
+            return {
+                "success": True,
+                "path": path,
+                "search_term": search_term,
+                "match_type": match_type,
+                "case_sensitive": case_sensitive,
+                "sheets_searched": sheets_to_search,
+                "matches": matches,
+                "match_count": len(matches),
+            }
 
         except Exception as e:
             return {"error": f"Search failed: {str(e)}"}
 
+    @mcp.tool()
+    def excel_convert_columnar(
+        path: str,
+        workspace_id: str,
+        agent_id: str,
+        session_id: str,
+        sheet: str | None = None,
+    ) -> dict:
+        """
+        Convert sheets to a columnar (Parquet) snapshot for faster SQL and search.
+
+        Do this once for a large workbook you will query repeatedly: afterwards
+        excel_sql reads the snapshot directly and excel_search scans it column
+        by column instead of walking every cell. The snapshot is tied to the
+        current version of the file and is ignored once the file changes.
 
-def _convert_cell_value(value: Any) -> Any:
-    """Convert Excel cell values to JSON-serializable types."""
-    if value is None:
-        return None
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, (int, float, str, bool)):
-        return value
-    # For any other type, convert to string
-    return str(value)
+        Args:
+            path: Path to the Excel file (relative to session sandbox)
+            workspace_id: Workspace identifier
+            agent_id: Agent identifier
+            session_id: Session identifier
+            sheet: Sheet to convert (default: all sheets)
+
+        Returns:
+            dict with the converted sheets, their row/column counts and snapshot size
+        """
+        try:
+            import duckdb  # noqa: F401
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return {
+                "error": (
+                    "openpyxl and DuckDB are required. Install with: "
+                    "pip install openpyxl duckdb  or  pip install tools[excel,sql]"
+                )
+            }
+
+        try:
+            secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
+
+            if not os.path.exists(secure_path):
+                return {"error": f"File not found: {path}"}
+
+            if not path.lower().endswith((".xlsx", ".xlsm")):
+                return {"error": "File must have .xlsx or .xlsm extension"}
+
+            cache = get_workbook_cache()
+            sheet_names = cache.sheet_names(secure_path)
+            if sheet and sheet not in sheet_names:
+                return {"error": f"Sheet '{sheet}' not found. Available: {sheet_names}"}
+
+            to_convert = [sheet] if sheet else sheet_names
+            columnar = cache.convert_columnar(secure_path, to_convert)
+
+            return {
+                "success": True,
+                "path": path,
+                "converted_sheets": [
+                    {
+                        "name": name,
+                        "row_count": columnar[name]["row_count"],
+                        "column_count": len(columnar[name]["columns"]),
+                    }
+                    for name in to_convert
+                ],
+                "columnar_sheets": sorted(columnar),
+                "snapshot_bytes": sum(os.path.getsize(info["file"]) for info in columnar.values()),
+            }
+
+        except Exception as e:
+            return {"error": f"Failed to convert Excel file: {str(e)}"}
+
+
+def _table_name(sheet_name: str) -> str:
+    """DuckDB table name for a sheet (spaces and hyphens -> underscores)."""
+    return sheet_name.replace(" ", "_").replace("-", "_")
+
+
+def _matches(value: str, term: str, match_type: str) -> bool:
+    if match_type == "contains":
+        return term in value
+    if match_type == "exact":
+        return term == value
+    if match_type == "starts_with":
+        return value.startswith(term)
+    return value.endswith(term)
+
+
+def _search_rows(
+    ws: SheetData, term: str, case_sensitive: bool, match_type: str
+) -> list[tuple[int, int, Any]]:
+    """(row number, column index, value) of matching cells in the parsed sheet."""
+    hits = []
+    # Search data rows only (skip header row)
+    for row_idx, row in enumerate(ws.rows, start=2):
+        for col_idx, cell_value in enumerate(row):
+            if cell_value is None:
+                continue
+
+            # Convert to string for comparison
+            cell_str = str(cell_value)
+            compare_val = cell_str if case_sensitive else cell_str.lower()
+            if _matches(compare_val, term, match_type):
+                hits.append((row_idx, col_idx, cell_value))
+    return hits
+
+
+_DUCKDB_MATCH = {
+    "contains": "contains({value}, ?)",
+    "exact": "{value} = ?",
+    "starts_with": "starts_with({value}, ?)",
+    "ends_with": "ends_with({value}, ?)",
+}
+
+
+def _search_columnar(
+    info: dict[str, Any], term: str, case_sensitive: bool, match_type: str
+) -> list[tuple[int, int, Any]]:
+    """Like _search_rows, against a Parquet snapshot (values compared as stored)."""
+    import duckdb
+
+    source = parquet_source(info["file"])
+    hits = []
+    con = duckdb.connect()
+    try:
+        for col_idx, column in enumerate(info["columns"]):
+            ident = sql_identifier(column)
+            value = f"CAST({ident} AS VARCHAR)"
+            if not case_sensitive:
+                value = f"lower({value})"
+            condition = _DUCKDB_MATCH[match_type].format(value=value)
+            rows = con.execute(
+                f"SELECT {ROW_COLUMN}, {ident} FROM {source} "
+                f"WHERE {ident} IS NOT NULL AND {condition}",
+                [term],
+            ).fetchall()
+            hits.extend((row_idx, col_idx, cell_value) for row_idx, cell_value in rows)
+    finally:
+        con.close()
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+    return hits
+
+
+def _load_sheet(con: Any, ws: SheetData) -> None:
+    """Create a DuckDB table for *ws* (skipped when the sheet is empty)."""
+    import pandas as pd
+
+    if ws.header is None:
+        return
+
+    # Headers from first row
+    headers = ws.headers
+
+    # Data rows
+    records = []
+    for row in ws.rows:
+        record = {}
+        for i, val in enumerate(row):
+            col = headers[i] if i < len(headers) else f"Column_{i + 1}"
+            record[col] = _convert_cell_value(val)
+        records.append(record)
+
+    table_name = _table_name(ws.name)
+    if records:
+        df = pd.DataFrame(records)
+        con.register(f"temp_{table_name}", df)
+        con.execute(f'CREATE TABLE "{table_name}" AS SELECT * FROM "temp_{table_name}"')
+        con.unregister(f"temp_{table_name}")
+    else:
+        # Empty table
+        cols_sql = ", ".join(f'"{h}" VARCHAR' for h in headers)
+        con.execute(f'CREATE TABLE "{table_name}" ({cols_sql})')
@@ -0,0 +1,290 @@
+"""
+Parsed-workbook cache and columnar sheet snapshots for the Excel tools.
+
+openpyxl is slow even in read-only mode: every cell of a sheet goes
+through the XML parser.  :class:`WorkbookCache` streams each sheet once
+per file version (path + mtime + size) and keeps the raw row values, so
+paging through a sheet with ``excel_read`` or running ``excel_info`` /
+``excel_search`` again skips openpyxl entirely.  Sheets are parsed
+lazily, only when a tool asks for them, and the cache is bounded by
+file count and a total cell budget.
+
+:meth:`WorkbookCache.convert_columnar` additionally writes sheets to
+Parquet (via DuckDB) under ``HIVE_EXCEL_COLUMNAR_DIR`` (default
+``~/.hive/cache/excel_columnar``).  ``excel_sql`` then reads those files
+directly and ``excel_search`` scans them column by column.  Snapshots
+belong to one file version and are ignored once the workbook changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+DEFAULT_COLUMNAR_DIR = "~/.hive/cache/excel_columnar"
+ROW_COLUMN = "__row"
+
+
+def convert_cell_value(value: Any) -> Any:
+    """Convert Excel cell values to JSON-serializable types."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    # For any other type, convert to string
+    return str(value)
+
+
+@dataclass
+class SheetData:
+    """Raw cell values of one sheet."""
+
+    name: str
+    header: tuple[Any, ...] | None  # first row, None for an empty sheet
+    rows: list[tuple[Any, ...]]  # data rows after the header
+
+    @property
+    def headers(self) -> list[str]:
+        """Header names, with ``Column_N`` for blank header cells."""
+        if not self.header:
+            return []
+        return [str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(self.header)]
+
+    @property
+    def cells(self) -> int:
+        return len(self.header or ()) + sum(len(row) for row in self.rows)
+
+
+@dataclass
+class _Workbook:
+    sheet_names: list[str]
+    active: str | None
+    sheets: dict[str, SheetData] = field(default_factory=dict)
+
+    @property
+    def cells(self) -> int:
+        return sum(sheet.cells for sheet in self.sheets.values())
+
+
+class SheetNotFoundError(Exception):
+    """Requested sheet is not part of the workbook."""
+
+
+class WorkbookCache:
+    """LRU of parsed workbooks, one per file version."""
+
+    def __init__(self, max_files: int = 8, max_cells: int = 5_000_000) -> None:
+        self._max_files = max_files
+        self._max_cells = max_cells
+        self._entries: OrderedDict[tuple[str, int, int], _Workbook] = OrderedDict()
+        self._lock = threading.Lock()
+        self.sheet_parses = 0
+
+    @staticmethod
+    def _key(path: str) -> tuple[str, int, int]:
+        real = os.path.realpath(path)
+        st = os.stat(real)
+        return (real, st.st_mtime_ns, st.st_size)
+
+    def _workbook(self, path: str) -> tuple[tuple[str, int, int], _Workbook]:
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return key, entry
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(key[0], read_only=True, data_only=True)
+        try:
+            active = wb.active
+            entry = _Workbook(list(wb.sheetnames), active.title if active is not None else None)
+        finally:
+            wb.close()
+        with self._lock:
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            self._evict()
+        return key, entry
+
+    def sheet_names(self, path: str) -> list[str]:
+        return list(self._workbook(path)[1].sheet_names)
+
+    def active_sheet(self, path: str) -> str | None:
+        return self._workbook(path)[1].active
+
+    def sheet(self, path: str, name: str | None = None) -> SheetData:
+        """Return the parsed sheet *name* (default: the active sheet).
+
+        Raises:
+            SheetNotFoundError: No such sheet, or no active sheet.
+        """
+        key, entry = self._workbook(path)
+        name = name or entry.active
+        if name is None or name not in entry.sheet_names:
+            raise SheetNotFoundError(name)
+        with self._lock:
+            sheet = entry.sheets.get(name)
+        if sheet is not None:
+            return sheet
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(key[0], read_only=True, data_only=True)
+        try:
+            rows = wb[name].iter_rows(values_only=True)
+            header = next(rows, None)
+            sheet = SheetData(name, header, list(rows))
+        finally:
+            wb.close()
+        self.sheet_parses += 1
+        with self._lock:
+            entry.sheets[name] = sheet
+            self._evict()
+        return sheet
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        total = sum(entry.cells for entry in self._entries.values())
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_files or total > self._max_cells
+        ):
+            _, entry = self._entries.popitem(last=False)
+            total -= entry.cells
+
+    # --- columnar snapshots --------------------------------------------------
+
+    @staticmethod
+    def _columnar_dir(key: tuple[str, int, int]) -> Path:
+        base = Path(os.getenv("HIVE_EXCEL_COLUMNAR_DIR") or DEFAULT_COLUMNAR_DIR).expanduser()
+        file_dir = base / hashlib.sha256(key[0].encode("utf-8")).hexdigest()[:32]
+        return file_dir / f"{key[1]}-{key[2]}"
+
+    def columnar_sheets(self, path: str) -> dict[str, dict[str, Any]]:
+        """Snapshots for the current file version: sheet name -> manifest entry.
+
+        Each entry has ``file`` (Parquet path), ``columns`` (names in the
+        Parquet file, positionally matching the sheet) and ``headers``.
+        """
+        version_dir = self._columnar_dir(self._key(path))
+        try:
+            manifest = json.loads((version_dir / "manifest.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        sheets = {}
+        for name, info in manifest.get("sheets", {}).items():
+            parquet = version_dir / info["file"]
+            if parquet.exists():
+                sheets[name] = {**info, "file": str(parquet)}
+        return sheets
+
+    def convert_columnar(self, path: str, names: list[str]) -> dict[str, dict[str, Any]]:
+        """Write sheets *names* to Parquet and return the updated snapshot map."""
+        import duckdb
+        import pandas as pd
+
+        key = self._key(path)
+        version_dir = self._columnar_dir(key)
+        # Snapshots of older versions of this file are dead weight
+        if version_dir.parent.exists():
+            for old in version_dir.parent.iterdir():
+                if old != version_dir:
+                    shutil.rmtree(old, ignore_errors=True)
+        version_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = version_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = {"sheets": {}}
+
+        con = duckdb.connect()
+        try:
+            for name in names:
+                sheet = self.sheet(path, name)
+                columns = _frame_columns(sheet)
+                data: dict[str, list[Any]] = {
+                    ROW_COLUMN: list(range(2, len(sheet.rows) + 2)),
+                }
+                for i, column in enumerate(columns):
+                    data[column] = [
+                        convert_cell_value(row[i]) if i < len(row) else None for row in sheet.rows
+                    ]
+                frame = pd.DataFrame(data, dtype=object)
+                file_name = f"sheet_{hashlib.sha256(name.encode('utf-8')).hexdigest()[:16]}.parquet"
+                con.register("sheet_frame", frame)
+                con.execute(
+                    f"COPY (SELECT * FROM sheet_frame) TO '{_sql_path(version_dir / file_name)}' "
+                    "(FORMAT PARQUET)"
+                )
+                con.unregister("sheet_frame")
+                manifest["sheets"][name] = {
+                    "file": file_name,
+                    "columns": columns,
+                    "headers": sheet.headers,
+                    "row_count": len(sheet.rows),
+                }
+        finally:
+            con.close()
+
+        tmp = manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        tmp.replace(manifest_path)
+        return self.columnar_sheets(path)
+
+
+def _frame_columns(sheet: SheetData) -> list[str]:
+    """Unique column names covering every cell position of *sheet*."""
+    width = max([len(sheet.header or ())] + [len(row) for row in sheet.rows])
+    headers = sheet.headers
+    names: list[str] = []
+    seen: set[str] = set()
+    for i in range(width):
+        base = headers[i] if i < len(headers) else f"Column_{i + 1}"
+        name, n = base, 2
+        while name in seen or name == ROW_COLUMN:
+            name, n = f"{base}_{n}", n + 1
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def _sql_path(path: Path) -> str:
+    return str(path).replace("'", "''")
+
+
+def sql_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def parquet_source(file: str) -> str:
+    """``read_parquet(...)`` expression for a snapshot file."""
+    return f"read_parquet('{_sql_path(Path(file))}')"
+
+
+_cache: WorkbookCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_workbook_cache() -> WorkbookCache:
+    """Return the process-wide parsed-workbook cache shared by the Excel tools."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = WorkbookCache()
+        return _cache
@@ -10,12 +10,19 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any
 
+from jsonpath_ng.ext import parse as parse_jsonpath
 from mcp.server.fastmcp import FastMCP
 
 from aden_tools.credentials.browser import open_browser
 
+from .index import data_size, line_index, open_data, read_range, read_ranges, record_index
+
+_JSONL_SUFFIXES = (".jsonl", ".ndjson", ".jsonl.gz", ".ndjson.gz")
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register data management tools with the MCP server."""
@@ -70,6 +77,8 @@ def load_data(
         data_dir: str,
         offset_bytes: int = 0,
         limit_bytes: int = 10000,
+        offset_lines: int | None = None,
+        limit_lines: int = 200,
     ) -> dict:
         """
         Purpose
@@ -87,12 +96,17 @@ def load_data(
             Uses byte offsets for O(1) seeking (works with huge files)
             Automatically trims to valid UTF-8 character boundaries
             Returns exactly limit_bytes or less (rounded to safe boundary)
+            Passing offset_lines switches to line-based paging; a line index
+            is built on first access so later pages seek directly
+            Compressed spill files (.gz) are decompressed transparently
 
         Args:
             filename: The filename to load (as shown in spillover messages or save_data results).
             data_dir: Absolute path to the data directory.
             offset_bytes: Byte offset to start reading from. Default 0.
             limit_bytes: Max number of bytes to return. Default 10000 (10KB).
+            offset_lines: Line number (0-based) to start from. Enables line paging.
+            limit_lines: Max number of lines to return in line paging. Default 200.
 
         Returns:
             Dict with content, pagination info, and metadata
@@ -101,6 +115,7 @@ def load_data(
             load_data('emails.jsonl', '/data')                           # first 10KB
             load_data('emails.jsonl', '/data', offset_bytes=10000)       # next 10KB
             load_data('large.txt', '/data', limit_bytes=50000)           # first 50KB
+            load_data('tool_x.txt', '/data', offset_lines=400)           # lines 400-599
         """
         if not filename or ".." in filename or "/" in filename or "\\" in filename:
             return {"error": "Invalid filename"}
@@ -114,7 +129,10 @@ def load_data(
             if not path.exists():
                 return {"error": f"File not found: {filename}"}
 
-            file_size = path.stat().st_size
+            if offset_lines is not None:
+                return _load_lines(path, filename, int(offset_lines), int(limit_lines))
+
+            file_size = data_size(path)
 
             # Handle edge case: offset beyond file size
             if offset_bytes >= file_size:
@@ -129,7 +147,7 @@ def load_data(
                     "has_more": False,
                 }
 
-            with open(path, "rb") as f:
+            with open_data(path) as f:
                 # O(1) seek to byte offset
                 f.seek(offset_bytes)
 
@@ -169,6 +187,158 @@ def load_data(
         except Exception as e:
             return {"error": f"Failed to load data: {str(e)}"}
 
+    def _load_lines(path: Path, filename: str, offset_lines: int, limit_lines: int) -> dict:
+        """Line-based page of *path*, seeking via the cached line index."""
+        offset_lines = max(0, offset_lines)
+        limit_lines = max(1, limit_lines)
+        index = line_index(path)
+        total_lines = len(index)
+
+        bounds = index.slice(offset_lines, offset_lines + limit_lines + 1)
+        if len(bounds) == 0:
+            raw = b""
+        elif len(bounds) > limit_lines:
+            raw = read_range(path, bounds[0], bounds[-1])
+        else:
+            raw = read_range(path, bounds[0], None)
+        lines_read = min(len(bounds), limit_lines)
+
+        return {
+            "success": True,
+            "filename": filename,
+            "content": raw.decode("utf-8", errors="replace"),
+            "offset_lines": offset_lines,
+            "lines_read": lines_read,
+            "next_offset_lines": offset_lines + lines_read,
+            "total_lines": total_lines,
+            "has_more": offset_lines + lines_read < total_lines,
+        }
+
+    @mcp.tool()
+    def query_data(
+        filename: str,
+        data_dir: str,
+        offset_records: int = 0,
+        limit_records: int = 50,
+        path: str = "",
+    ) -> dict:
+        """
+        Purpose
+            Read parsed JSON records from a data file by record number,
+            optionally selecting fields with a JSONPath expression.
+
+        When to use
+            Page through JSONL files or spilled JSON arrays record by record
+            ("records 500-549") instead of by bytes or lines.
+            Pull only the fields you need out of large JSON results.
+
+        Rules & Constraints
+            filename must match a file in data_dir
+            JSONL (.jsonl/.ndjson): one record per line
+            JSON array: one record per top-level element
+            Any other JSON document is a single record
+            Record offsets are indexed on first access, so later pages seek
+            directly to the requested record
+
+        Args:
+            filename: The filename to query (as shown in spillover messages or save_data results).
+            data_dir: Absolute path to the data directory.
+            offset_records: Index (0-based) of the first record to return. Default 0.
+            limit_records: Max number of records to return. Default 50.
+            path: Optional JSONPath applied to each record, e.g. '$.name' or
+                '$.items[*].id'. Each record is replaced by the list of matches.
+
+        Returns:
+            Dict with records, pagination info, and total_records
+
+        Examples:
+            query_data('tool_github_list_stargazers_abc.txt', '/data')
+            query_data('events.jsonl', '/data', offset_records=500, limit_records=20)
+            query_data('results.json', '/data', path='$.login')
+        """
+        if not filename or ".." in filename or "/" in filename or "\\" in filename:
+            return {"error": "Invalid filename"}
+        if not data_dir:
+            return {"error": "data_dir is required"}
+
+        try:
+            offset_records = max(0, int(offset_records))
+            limit_records = max(1, int(limit_records))
+            file_path = Path(data_dir) / filename
+            if not file_path.exists():
+                return {"error": f"File not found: {filename}"}
+
+            expr = None
+            if path:
+                try:
+                    expr = parse_jsonpath(path)
+                except Exception as e:
+                    return {"error": f"Invalid JSONPath '{path}': {e}"}
+
+            fmt, total, raw_records = _read_records(file_path, offset_records, limit_records)
+            records: list[Any] = []
+            for raw in raw_records:
+                # Indexed records come back as raw bytes; a plain JSON
+                # document is already parsed (and may itself be a string)
+                record = json.loads(raw) if isinstance(raw, bytes) else raw
+                if expr is not None:
+                    record = [m.value for m in expr.find(record)]
+                records.append(record)
+
+            return {
+                "success": True,
+                "filename": filename,
+                "format": fmt,
+                "records": records,
+                "offset_records": offset_records,
+                "records_read": len(records),
+                "next_offset_records": offset_records + len(records),
+                "total_records": total,
+                "has_more": offset_records + len(records) < total,
+            }
+        except json.JSONDecodeError as e:
+            return {"error": f"File is not valid JSON/JSONL: {e}"}
+        except Exception as e:
+            return {"error": f"Failed to query data: {str(e)}"}
+
+    def _read_records(path: Path, offset: int, limit: int) -> tuple[str, int, list[Any]]:
+        """Return (format, total_records, raw records in the requested range)."""
+        if not path.name.endswith(_JSONL_SUFFIXES):
+            index = record_index(path)
+            if index is not None:
+                bounds = index.slice(offset, offset + limit + 1)
+                raws = []
+                for raw in read_ranges(path, zip(bounds, bounds[1:], strict=False)):
+                    raw = raw.rstrip()
+                    raws.append(raw[:-1] if raw.endswith(b",") else raw)
+                return "json_array", len(index) - 1, raws
+
+            if not _looks_like_jsonl(path):
+                with open_data(path) as f:
+                    doc = json.loads(f.read())
+                return "json", 1, [doc] if offset == 0 else []
+
+        index = line_index(path)
+        bounds = index.slice(offset, offset + limit + 1)
+        ranges = [
+            (start, bounds[i + 1] if i + 1 < len(bounds) else None)
+            for i, start in enumerate(bounds[:limit])
+        ]
+        raws = [raw for raw in (r.strip() for r in read_ranges(path, ranges)) if raw]
+        return "jsonl", len(index), raws
+
+    def _looks_like_jsonl(path: Path) -> bool:
+        """True when the first line alone is a complete JSON value."""
+        with open_data(path) as f:
+            first = f.readline(1 << 20).strip()
+        if not first:
+            return False
+        try:
+            json.loads(first)
+        except json.JSONDecodeError:
+            return False
+        return True
+
     @mcp.tool()
     def serve_file_to_user(
         filename: str, data_dir: str, label: str = "", open_in_browser: bool = False
@@ -0,0 +1,266 @@
+"""
+Sidecar offset indexes for random access into large data files.
+
+An index lists the byte offset at which each line (or JSON array
+element) of a data file starts, so ``load_data``/``query_data`` can seek
+straight to "line 40 000" or "record 500" instead of scanning from the
+top.  Indexes live next to the data in ``{data_dir}/.index/`` and are
+built on first access.  Only the slice of offsets a page needs is read
+back, so a page costs the same on a 1 KB file and a multi-GB one.
+
+Format (shared with the framework's SpilloverStore, which writes line
+indexes eagerly for spilled results)::
+
+    8 bytes   magic ``HIVEIDX1``
+    3 x u64   size and mtime_ns of the indexed file, number of entries
+    n x u64   byte offset at which each entry starts
+
+All integers are little-endian.  For ``.gz`` files offsets refer to the
+decompressed content.  An index whose size/mtime no longer match the
+file is stale and is rebuilt.
+
+Record indexes for top-level JSON arrays (``.ridx``) use the same
+layout with one extra trailing entry: the offset of the closing ``]``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+INDEX_DIRNAME = ".index"
+LINE_SUFFIX = ".idx"
+RECORD_SUFFIX = ".ridx"
+
+_MAGIC = b"HIVEIDX1"
+_HEADER = struct.Struct("<8sQQQ")
+_CHUNK = 1 << 20
+
+_WS = re.compile(rb"\s*")
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+
+
+class OffsetIndex:
+    """Read-only view over an index sidecar; offsets are read on demand."""
+
+    def __init__(self, index_path: Path, count: int) -> None:
+        self._path = index_path
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def slice(self, start: int, stop: int) -> array:
+        """Offsets for entries ``[start, stop)`` (clamped to the index)."""
+        start = max(0, min(start, self._count))
+        stop = max(start, min(stop, self._count))
+        offsets = array("Q")
+        if stop > start:
+            with open(self._path, "rb") as f:
+                f.seek(_HEADER.size + start * 8)
+                offsets.frombytes(f.read((stop - start) * 8))
+            if sys.byteorder != "little":
+                offsets.byteswap()
+        return offsets
+
+
+def open_data(path: Path):
+    """Open a data file for binary reading, decompressing ``.gz`` files."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def data_size(path: Path) -> int:
+    """Size of the (decompressed) content of a data file."""
+    stat = path.stat()
+    if path.suffix != ".gz":
+        return stat.st_size
+    return _gz_size(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _gz_size(path: str, size: int, mtime_ns: int) -> int:
+    # Keyed on size/mtime so a rewritten file is measured again; measuring
+    # means decompressing the whole file, so it must not happen per page
+    with gzip.open(path, "rb") as f:
+        return f.seek(0, os.SEEK_END)
+
+
+def line_index(path: Path) -> OffsetIndex:
+    """Return the line index for *path*, building it if missing or stale."""
+    index = _open_index(path, LINE_SUFFIX)
+    if index is None:
+        _write_index(path, LINE_SUFFIX, _scan_lines(path))
+        index = _open_index(path, LINE_SUFFIX)
+    return index
+
+
+def record_index(path: Path) -> OffsetIndex | None:
+    """Return the element index of a top-level JSON array file.
+
+    Returns None when the file is not a JSON array.
+    """
+    index = _open_index(path, RECORD_SUFFIX)
+    if index is None:
+        offsets = _scan_array_records(path)
+        if offsets is None:
+            return None
+        _write_index(path, RECORD_SUFFIX, offsets)
+        index = _open_index(path, RECORD_SUFFIX)
+    return index
+
+
+def read_range(path: Path, start: int, end: int | None) -> bytes:
+    """Read bytes ``[start, end)`` of the (decompressed) data file."""
+    with open_data(path) as f:
+        f.seek(start)
+        return f.read() if end is None else f.read(max(0, end - start))
+
+
+def read_ranges(path: Path, ranges: Iterable[tuple[int, int | None]]) -> list[bytes]:
+    """Read several ascending byte ranges of the data file with one open."""
+    chunks = []
+    with open_data(path) as f:
+        for start, end in ranges:
+            f.seek(start)
+            chunks.append(f.read() if end is None else f.read(max(0, end - start)))
+    return chunks
+
+
+# --- internals ---------------------------------------------------------------
+
+
+def _index_path(path: Path, suffix: str) -> Path:
+    return path.parent / INDEX_DIRNAME / f"{path.name}{suffix}"
+
+
+def _open_index(path: Path, suffix: str) -> OffsetIndex | None:
+    index_path = _index_path(path, suffix)
+    try:
+        with open(index_path, "rb") as f:
+            magic, size, mtime_ns, count = _HEADER.unpack(f.read(_HEADER.size))
+        stat = path.stat()
+        if magic != _MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return None
+        if index_path.stat().st_size != _HEADER.size + count * 8:
+            return None
+    except (OSError, struct.error):
+        return None
+    return OffsetIndex(index_path, count)
+
+
+def _write_index(path: Path, suffix: str, offsets: array) -> None:
+    stat = path.stat()
+    index_path = _index_path(path, suffix)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    if sys.byteorder != "little":
+        offsets = array("Q", offsets)
+        offsets.byteswap()
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)))
+        f.write(offsets.tobytes())
+    tmp_path.replace(index_path)
+
+
+def _map(path: Path):
+    """Memory-map a plain file (None for empty files)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _scan_lines(path: Path) -> array:
+    offsets = array("Q")
+    if path.suffix == ".gz":
+        base = 0
+        pending_start = True
+        with gzip.open(path, "rb") as f:
+            while chunk := f.read(_CHUNK):
+                if pending_start:
+                    offsets.append(base)
+                    pending_start = False
+                pos = chunk.find(b"\n")
+                while pos != -1:
+                    if pos + 1 < len(chunk):
+                        offsets.append(base + pos + 1)
+                    else:
+                        pending_start = True
+                    pos = chunk.find(b"\n", pos + 1)
+                base += len(chunk)
+        return offsets
+
+    buf = _map(path)
+    if buf is None:
+        return offsets
+    try:
+        offsets.append(0)
+        end = len(buf)
+        pos = buf.find(b"\n")
+        while pos != -1 and pos + 1 < end:
+            offsets.append(pos + 1)
+            pos = buf.find(b"\n", pos + 1)
+    finally:
+        buf.close()
+    return offsets
+
+
+def _scan_array_records(path: Path) -> array | None:
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return _array_offsets(f.read())
+    buf = _map(path)
+    if buf is None:
+        return None
+    try:
+        return _array_offsets(buf)
+    finally:
+        buf.close()
+
+
+def _array_offsets(buf) -> array | None:
+    """Start offsets of top-level array elements plus the closing ``]``."""
+    pos = _WS.match(buf, 0).end()
+    if buf[pos : pos + 1] != b"[":
+        return None
+    pos = _WS.match(buf, pos + 1).end()
+    offsets = array("Q")
+    if buf[pos : pos + 1] == b"]":
+        offsets.append(pos)
+        return offsets
+
+    offsets.append(pos)
+    depth = 1
+    while True:
+        m = _STRUCTURAL.search(buf, pos)
+        if m is None:
+            return None  # unterminated array
+        char = m.group()
+        at = m.start()
+        if char == b'"':
+            s = _STRING.match(buf, at)
+            if s is None:
+                return None
+            pos = s.end()
+            continue
+        if char in (b"[", b"{"):
+            depth += 1
+        elif char in (b"]", b"}"):
+            depth -= 1
+            if depth == 0:
+                offsets.append(at)
+                return offsets
+        elif depth == 1:  # comma between top-level elements
+            offsets.append(_WS.match(buf, at + 1).end())
+        pos = at + 1
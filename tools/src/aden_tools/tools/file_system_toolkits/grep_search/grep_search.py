@@ -4,6 +4,7 @@
 from mcp.server.fastmcp import FastMCP
 
 from ..security import WORKSPACES_DIR, get_secure_path
+from .search_engine import collect_files, compile_pattern, search_files, trigram_indexes
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -17,12 +18,17 @@ def grep_search(
         agent_id: str,
         session_id: str,
         recursive: bool = False,
+        max_results: int = 1000,
+        include: str | None = None,
+        exclude: str | None = None,
+        use_index: bool = False,
     ) -> dict:
         """
         Search for a pattern in a file or directory within the session sandbox.
 
         Use this when you need to find specific content or patterns in files using regex.
-        Set recursive=True to search through all subdirectories.
+        Set recursive=True to search through all subdirectories. Binary files and files
+        over 10MB are skipped.
 
         Args:
             path: The path to search in (file or directory, relative to session root)
@@ -31,6 +37,11 @@ def grep_search(
             agent_id: The ID of the agent
             session_id: The ID of the current session
             recursive: Whether to search recursively in directories (default: False)
+            max_results: Stop after this many matches (default: 1000)
+            include: Only search files matching this glob, e.g. "*.py"
+            exclude: Skip files matching this glob, e.g. "*.min.js"
+            use_index: Keep a trigram index of the session directory to skip files
+                that cannot match; speeds up repeated searches (default: False)
 
         Returns:
             Dict with search results and match details, or error dict
@@ -38,57 +49,49 @@ def grep_search(
         # 1. Early Regex Validation (Issue #55 Acceptance Criteria)
         # Using .msg for a cleaner, less noisy error response
         try:
-            regex = re.compile(pattern)
+            compiled = compile_pattern(pattern)
         except re.error as e:
             return {"error": f"Invalid regex pattern: {e.msg}"}
+        if max_results < 1:
+            return {"error": "max_results must be at least 1"}
 
         try:
             secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
             # Use session dir root for relative path calculations
             session_root = os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id)
 
-            matches = []
+            files = collect_files(secure_path, recursive, include, exclude)
+            index = trigram_indexes.get(session_root) if use_index else None
+            found, truncated, stats = search_files(files, compiled, max_results, index)
 
-            if os.path.isfile(secure_path):
-                files = [secure_path]
-            elif recursive:
-                files = []
-                for root, _, filenames in os.walk(secure_path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
-            else:
-                files = [
-                    os.path.join(secure_path, f)
-                    for f in os.listdir(secure_path)
-                    if os.path.isfile(os.path.join(secure_path, f))
-                ]
+            matches = [
+                {
+                    # Calculate relative path for display
+                    "file": os.path.relpath(file_path, session_root),
+                    "line_number": line_number,
+                    "line_content": line.strip(),
+                }
+                for file_path, line_number, line in found
+            ]
 
-            for file_path in files:
-                # Calculate relative path for display
-                display_path = os.path.relpath(file_path, session_root)
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            if regex.search(line):
-                                matches.append(
-                                    {
-                                        "file": display_path,
-                                        "line_number": i,
-                                        "line_content": line.strip(),
-                                    }
-                                )
-                except (UnicodeDecodeError, PermissionError):
-                    # Skips files that cannot be decoded or lack permissions
-                    continue
-
-            return {
+            result = {
                 "success": True,
                 "pattern": pattern,
                 "path": path,
                 "recursive": recursive,
                 "matches": matches,
                 "total_matches": len(matches),
+                "truncated": truncated,
+                "files_searched": stats.files_searched,
+                "files_skipped": {
+                    "binary": stats.skipped_binary,
+                    "too_large": stats.skipped_large,
+                    "unreadable": stats.skipped_unreadable,
+                },
             }
+            if index is not None:
+                result["files_pruned_by_index"] = stats.pruned_by_index
+            return result
 
         # 2. Specific Exception Handling (Issue #55 Requirements)
         except FileNotFoundError:
@@ -0,0 +1,375 @@
+"""
+Search engine behind grep_search.
+
+Files are memory-mapped and scanned with a bytes regex compiled from the
+same pattern; each candidate line is then confirmed with the original
+``str`` regex, so results match a line-by-line ``regex.search`` exactly.
+Patterns whose meaning can change when run over a whole buffer (``\\A``,
+``\\Z``, lookarounds, DOTALL) skip the bytes pass, as do Unicode-sensitive
+patterns (``\\w``, ``\\d``, ``(?i)``...) on files containing non-ASCII
+bytes.  Binary files (NUL in the first 8KB) and files over the size
+limit are skipped and reported.
+
+Files are searched on a thread pool in walk order; once ``max_results``
+matches are collected the remaining work is cancelled.  ``re`` holds the
+GIL, so the pool mostly overlaps file I/O and page faults.
+
+An optional per-directory trigram index (:class:`TrigramIndex`) keeps a
+64K-bit bitmap of the lowercased byte trigrams of every file, refreshed
+by mtime/size.  Searches with literal runs of 3+ characters skip files
+whose bitmap lacks one of the run's trigrams.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import io
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+MAX_FILE_BYTES = 10 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+# Constructs whose result differs between a whole-buffer and a per-line search
+_LINE_UNSAFE = re.compile(r"\\[AZzn]|\n|\(\?<?[=!]|\(\?[a-zA-Z]*s")
+# Constructs that match differently on UTF-8 bytes than on decoded text
+_UNICODE_SENSITIVE = re.compile(r"\\[wWbBdDsS]|\(\?[a-zA-Z]*i|[.\[]")
+_REGEX_META = set(".^$*+?{}[]()|\\")
+
+
+@dataclass
+class SearchStats:
+    files_searched: int = 0
+    skipped_binary: int = 0
+    skipped_large: int = 0
+    skipped_unreadable: int = 0
+    pruned_by_index: int = 0
+
+
+@dataclass
+class CompiledPattern:
+    regex: re.Pattern[str]
+    bytes_regex: re.Pattern[bytes] | None
+    unicode_sensitive: bool
+    crlf_sensitive: bool  # ``$`` does not match before ``\r\n`` on raw bytes
+    trigrams: list[bytes] = field(default_factory=list)
+
+
+def compile_pattern(pattern: str) -> CompiledPattern:
+    """Compile *pattern*; raises re.error when it is invalid."""
+    regex = re.compile(pattern)
+    bytes_regex = None
+    if pattern.isascii() and not _LINE_UNSAFE.search(pattern):
+        try:
+            bytes_regex = re.compile(pattern.encode("ascii"), re.MULTILINE)
+        except re.error:
+            bytes_regex = None
+    trigrams = []
+    case_insensitive = bool(regex.flags & re.IGNORECASE)
+    for run in _required_literals(pattern):
+        data = run.encode("utf-8")
+        if case_insensitive and not run.isascii():
+            continue  # bytes.lower() only folds ASCII
+        data = data.lower()
+        trigrams.extend(data[i : i + 3] for i in range(len(data) - 2))
+    return CompiledPattern(
+        regex,
+        bytes_regex,
+        bool(_UNICODE_SENSITIVE.search(pattern)),
+        "$" in pattern,
+        list(dict.fromkeys(trigrams)),
+    )
+
+
+def _required_literals(pattern: str) -> list[str]:
+    """Literal runs every match must contain.
+
+    Conservative: only top-level literals are considered (anything inside a
+    group may be optional), and alternation disables extraction entirely.
+    """
+    if "|" in pattern:
+        return []
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    i = 0
+
+    def flush() -> None:
+        if len(current) >= 3:
+            runs.append("".join(current))
+        current.clear()
+
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            if nxt.isalnum() or depth:
+                flush()  # character class, special escape or inside a group
+            else:
+                current.append(nxt)
+            i += 2
+        elif ch in "*?{":
+            if current:
+                current.pop()  # the preceding char is optional
+            flush()
+            if ch == "{":
+                end = pattern.find("}", i)
+                i = len(pattern) if end == -1 else end
+            i += 1
+        elif ch == "[":
+            flush()
+            end = pattern.find("]", i + 2)
+            i = len(pattern) if end == -1 else end + 1
+        elif ch == "(":
+            flush()
+            depth += 1
+            i += 1
+        elif ch == ")":
+            flush()
+            depth = max(0, depth - 1)
+            i += 1
+        elif ch in _REGEX_META:
+            flush()
+            i += 1
+        elif depth:
+            i += 1
+        else:
+            current.append(ch)
+            i += 1
+    flush()
+    return runs
+
+
+def _trigram_hash(gram: bytes) -> int:
+    return int.from_bytes(gram, "big") % 65521
+
+
+def trigram_bitmap(data: bytes) -> bytes:
+    """64K-bit bitmap of the lowercased byte trigrams of *data*."""
+    lower = data.lower()
+    grams = {lower[i : i + 3] for i in range(len(lower) - 2)}
+    bits = bytearray(8192)
+    for gram in grams:
+        h = _trigram_hash(gram)
+        bits[h >> 3] |= 1 << (h & 7)
+    return bytes(bits)
+
+
+def _bitmap_has_all(bitmap: bytes, trigrams: list[bytes]) -> bool:
+    for gram in trigrams:
+        h = _trigram_hash(gram)
+        if not bitmap[h >> 3] & (1 << (h & 7)):
+            return False
+    return True
+
+
+class TrigramIndex:
+    """Trigram bitmaps for the files under one directory."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, int, bytes]] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def may_match(self, path: str, st: os.stat_result, data: Any, trigrams: list[bytes]) -> bool:
+        """False when *path* certainly lacks one of *trigrams*."""
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None or entry[:2] != (st.st_mtime_ns, st.st_size):
+            entry = (st.st_mtime_ns, st.st_size, trigram_bitmap(bytes(data)))
+            with self._lock:
+                self._entries[path] = entry
+                self.builds += 1
+        return _bitmap_has_all(entry[2], trigrams)
+
+
+class _IndexRegistry:
+    """LRU of trigram indexes keyed by session directory."""
+
+    def __init__(self, max_dirs: int = 8) -> None:
+        self._max_dirs = max_dirs
+        self._indexes: OrderedDict[str, TrigramIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, root: str) -> TrigramIndex:
+        root = os.path.realpath(root)
+        with self._lock:
+            index = self._indexes.get(root)
+            if index is None:
+                index = self._indexes[root] = TrigramIndex()
+            self._indexes.move_to_end(root)
+            while len(self._indexes) > self._max_dirs:
+                self._indexes.popitem(last=False)
+            return index
+
+
+trigram_indexes = _IndexRegistry()
+
+
+def collect_files(
+    root: str, recursive: bool, include: str | None, exclude: str | None
+) -> list[str]:
+    """Files under *root* (or *root* itself), filtered by glob, in walk order."""
+    if os.path.isfile(root):
+        return [root]
+    if recursive:
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            files.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+    else:
+        files = [
+            os.path.join(root, name)
+            for name in sorted(os.listdir(root))
+            if os.path.isfile(os.path.join(root, name))
+        ]
+
+    def wanted(path: str) -> bool:
+        rel = os.path.relpath(path, root)
+        name = os.path.basename(path)
+        if include and not (fnmatch.fnmatch(rel, include) or fnmatch.fnmatch(name, include)):
+            return False
+        if exclude and (fnmatch.fnmatch(rel, exclude) or fnmatch.fnmatch(name, exclude)):
+            return False
+        return True
+
+    return [path for path in files if wanted(path)]
+
+
+def _normalize_line(raw: bytes) -> str:
+    line = raw.decode("utf-8", errors="replace")
+    if line.endswith("\r\n"):
+        line = line[:-2] + "\n"
+    return line
+
+
+def search_file(
+    path: str,
+    compiled: CompiledPattern,
+    limit: int,
+    stats: SearchStats,
+    stats_lock: threading.Lock,
+    index: TrigramIndex | None = None,
+    max_file_bytes: int | None = None,
+) -> list[tuple[int, str]]:
+    """Return up to *limit* (line number, line) matches in *path*."""
+    if max_file_bytes is None:
+        max_file_bytes = MAX_FILE_BYTES
+
+    def count(attr: str) -> None:
+        with stats_lock:
+            setattr(stats, attr, getattr(stats, attr) + 1)
+
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size > max_file_bytes:
+                count("skipped_large")
+                return []
+            if st.st_size == 0:
+                count("files_searched")
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if b"\0" in mm[:BINARY_SNIFF_BYTES]:
+                    count("skipped_binary")
+                    return []
+                if index is not None and compiled.trigrams:
+                    if not index.may_match(path, st, mm, compiled.trigrams):
+                        count("pruned_by_index")
+                        return []
+                count("files_searched")
+                use_bytes = (
+                    compiled.bytes_regex is not None
+                    and not (compiled.unicode_sensitive and _NON_ASCII.search(mm))
+                    and not (compiled.crlf_sensitive and mm.find(b"\r") != -1)
+                )
+                if use_bytes:
+                    return _scan_bytes(mm, compiled, limit)
+                return _scan_text(bytes(mm), compiled.regex, limit)
+    except (OSError, ValueError):
+        count("skipped_unreadable")
+        return []
+
+
+def _scan_bytes(mm: Any, compiled: CompiledPattern, limit: int) -> list[tuple[int, str]]:
+    assert compiled.bytes_regex is not None
+    matches: list[tuple[int, str]] = []
+    pos = 0
+    line_number = 1
+    counted_to = 0
+    size = len(mm)
+    while len(matches) < limit and pos <= size:
+        m = compiled.bytes_regex.search(mm, pos)
+        if m is None:
+            break
+        line_start = mm.rfind(b"\n", 0, m.start()) + 1
+        line_end = mm.find(b"\n", m.start())
+        line_end = size if line_end == -1 else line_end + 1
+        line_number += mm[counted_to:line_start].count(b"\n")
+        counted_to = line_start
+        line = _normalize_line(mm[line_start:line_end])
+        if compiled.regex.search(line):
+            matches.append((line_number, line))
+        if line_end == line_start:
+            break
+        pos = line_end
+    return matches
+
+
+def _scan_text(data: bytes, regex: re.Pattern[str], limit: int) -> list[tuple[int, str]]:
+    matches: list[tuple[int, str]] = []
+    text = io.StringIO(data.decode("utf-8", errors="replace"), newline=None)
+    for i, line in enumerate(text, 1):
+        if regex.search(line):
+            matches.append((i, line))
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def search_files(
+    files: list[str],
+    compiled: CompiledPattern,
+    max_results: int,
+    index: TrigramIndex | None = None,
+    max_file_bytes: int | None = None,
+) -> tuple[list[tuple[str, int, str]], bool, SearchStats]:
+    """Search *files* in parallel; results keep file order.
+
+    Returns:
+        (matches as (path, line number, line), truncated, stats)
+    """
+    stats = SearchStats()
+    stats_lock = threading.Lock()
+    stop = threading.Event()
+
+    def work(path: str) -> list[tuple[int, str]]:
+        if stop.is_set():
+            return []
+        return search_file(
+            path, compiled, max_results + 1, stats, stats_lock, index, max_file_bytes
+        )
+
+    results: list[tuple[str, int, str]] = []
+    truncated = False
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(work, path) for path in files]
+        for path, future in zip(files, futures, strict=True):
+            if truncated:
+                future.cancel()
+                continue
+            for line_number, line in future.result():
+                if len(results) >= max_results:
+                    truncated = True
+                    stop.set()
+                    break
+                results.append((path, line_number, line))
+    return results, truncated, stats
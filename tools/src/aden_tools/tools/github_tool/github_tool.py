@@ -10,17 +10,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 GITHUB_API_BASE = "https://api.github.com"
 
+# Resources addressed by a full commit SHA never change
+_COMMIT_SHA = re.compile(r"(?<![0-9a-f])[0-9a-f]{40}(?![0-9a-f])")
+IMMUTABLE_TTL_SECONDS = 24 * 3600
+
 
 def _sanitize_path_param(param: str, param_name: str = "parameter") -> str:
     """
@@ -61,11 +73,93 @@ def _sanitize_error_message(error: Exception) -> str:
     return f"Network error: {error_str}"
 
 
+@dataclass
+class _CachedResponse:
+    body: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    fresh_until: float
+
+
+class _ResponseCache:
+    """
+    LRU cache of GitHub GET responses, revalidated with ETag/Last-Modified.
+
+    Cached bodies are sent back as ``If-None-Match``/``If-Modified-Since``
+    on the next read; GitHub answers 304 Not Modified (which does not count
+    against the rate limit) when nothing changed.  Responses for immutable
+    resources (URLs or refs pinned to a commit SHA) are served without a
+    request until their TTL expires.  Entries are keyed per token, so
+    different credentials never see each other's data.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, max_entries: int = 1024):
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, _CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str, url: str, params: dict[str, Any] | None) -> tuple:
+        token_id = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return (token_id, url, tuple(sorted((params or {}).items())))
+
+    def get(self, key: tuple) -> _CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: _CachedResponse) -> None:
+        size = len(entry.body)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self._max_bytes or len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_revalidated(self, entry: _CachedResponse, fresh_until: float) -> None:
+        with self._lock:
+            self.revalidated += 1
+            entry.fresh_until = fresh_until
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+            }
+
+
 class _GitHubClient:
     """Internal client wrapping GitHub REST API v3 calls."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache: _ResponseCache | None = None):
         self._token = token
+        self._cache = cache
 
     @property
     def _headers(self) -> dict[str, str]:
@@ -75,6 +169,62 @@ def _headers(self) -> dict[str, str]:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """GET through the response cache (if any), revalidating stale entries."""
+        kwargs: dict[str, Any] = {"params": params} if params is not None else {}
+        if self._cache is None:
+            return http_client.get(url, headers=self._headers, timeout=30.0, **kwargs)
+
+        cache = self._cache
+        key = cache.key(self._token, url, params)
+        entry = cache.get(key)
+        now = time.time()
+        if entry is not None and entry.fresh_until > now:
+            cache.record_hit()
+            return self._from_cache(entry)
+
+        headers = self._headers
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = http_client.get(url, headers=headers, timeout=30.0, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.record_revalidated(entry, self._fresh_until(url, params, now))
+            return self._from_cache(entry)
+
+        cache.record_miss()
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            fresh_until = self._fresh_until(url, params, now)
+            if etag or last_modified or fresh_until > now:
+                cache.put(
+                    key,
+                    _CachedResponse(
+                        body=response.content,
+                        content_type=response.headers.get("Content-Type", "application/json"),
+                        etag=etag,
+                        last_modified=last_modified,
+                        fresh_until=fresh_until,
+                    ),
+                )
+        return response
+
+    @staticmethod
+    def _fresh_until(url: str, params: dict[str, Any] | None, now: float) -> float:
+        """Expiry for responses that may be served without revalidation."""
+        ref = str((params or {}).get("ref", ""))
+        if _COMMIT_SHA.search(url) or _COMMIT_SHA.fullmatch(ref):
+            return now + IMMUTABLE_TTL_SECONDS
+        return now
+
+    @staticmethod
+    def _from_cache(entry: _CachedResponse) -> httpx.Response:
+        return httpx.Response(200, content=entry.body, headers={"Content-Type": entry.content_type})
+
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle GitHub API response format."""
         if response.status_code == 401:
@@ -123,12 +273,7 @@ def list_repos(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
-            url,
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(url, params=params)
         return self._handle_response(response)
 
     def get_repo(
@@ -139,11 +284,7 @@ def get_repo(
         """Get repository information."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}",
-            headers=self._headers,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}")
         return self._handle_response(response)
 
     def search_repos(
@@ -160,12 +301,7 @@ def search_repos(
         if sort:
             params["sort"] = sort
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/search/repositories",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/search/repositories", params=params)
         return self._handle_response(response)
 
     # --- Issues ---
@@ -187,12 +323,7 @@ def list_issues(
             "page": max(1, page),
         }
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues", params=params)
         return self._handle_response(response)
 
     def get_issue(
@@ -204,11 +335,7 @@ def get_issue(
         """Get a specific issue."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
-            headers=self._headers,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}")
         return self._handle_response(response)
 
     def create_issue(
@@ -231,7 +358,7 @@ def create_issue(
         if assignees:
             payload["assignees"] = assignees
 
-        response = httpx.post(
+        response = http_client.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
             headers=self._headers,
             json=payload,
@@ -262,7 +389,7 @@ def update_issue(
         if labels is not None:
             payload["labels"] = labels
 
-        response = httpx.patch(
+        response = http_client.patch(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
             headers=self._headers,
             json=payload,
@@ -289,12 +416,7 @@ def list_pull_requests(
             "page": max(1, page),
         }
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls", params=params)
         return self._handle_response(response)
 
     def get_pull_request(
@@ -306,11 +428,7 @@ def get_pull_request(
         """Get a specific pull request."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}",
-            headers=self._headers,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}")
         return self._handle_response(response)
 
     def create_pull_request(
@@ -335,7 +453,7 @@ def create_pull_request(
         if body:
             payload["body"] = body
 
-        response = httpx.post(
+        response = http_client.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
             headers=self._headers,
             json=payload,
@@ -356,12 +474,7 @@ def search_code(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/search/code",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/search/code", params=params)
         return self._handle_response(response)
 
     # --- Branches ---
@@ -379,12 +492,7 @@ def list_branches(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches", params=params)
         return self._handle_response(response)
 
     def get_branch(
@@ -397,11 +505,7 @@ def get_branch(
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
         branch = _sanitize_path_param(branch, "branch")
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches/{branch}",
-            headers=self._headers,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches/{branch}")
         return self._handle_response(response)
 
     # --- Stargazers ---
@@ -421,12 +525,7 @@ def list_stargazers(
             "page": max(1, page),
         }
 
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/stargazers",
-            headers=self._headers,
-            params=params,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/stargazers", params=params)
         return self._handle_response(response)
 
     # --- Users ---
@@ -437,11 +536,7 @@ def get_user_profile(
     ) -> dict[str, Any]:
         """Get a user's public profile."""
         username = _sanitize_path_param(username, "username")
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/users/{username}",
-            headers=self._headers,
-            timeout=30.0,
-        )
+        response = self._get(f"{GITHUB_API_BASE}/users/{username}")
         return self._handle_response(response)
 
     def get_user_emails(
@@ -465,11 +560,8 @@ def get_user_emails(
                 emails[profile["email"]] = "profile"
 
         # 2. Check recent public events for commit emails
-        response = httpx.get(
-            f"{GITHUB_API_BASE}/users/{username}/events/public",
-            headers=self._headers,
-            params={"per_page": 30},
-            timeout=30.0,
+        response = self._get(
+            f"{GITHUB_API_BASE}/users/{username}/events/public", params={"per_page": 30}
         )
         if response.status_code == 200:
             for event in response.json():
@@ -494,6 +586,9 @@ def register_tools(
 ) -> None:
     """Register GitHub tools with the MCP server."""
 
+    # Shared by every call on this server so repeated reads revalidate
+    response_cache = _ResponseCache()
+
     def _get_token() -> str | None:
         """Get GitHub token from credential manager or environment."""
         if credentials is not None:
@@ -517,7 +612,7 @@ def _get_client() -> _GitHubClient | dict[str, str]:
                     "Get a token at https://github.com/settings/tokens"
                 ),
             }
-        return _GitHubClient(token)
+        return _GitHubClient(token, cache=response_cache)
 
     # --- Repositories ---
 
@@ -11,13 +11,15 @@
 from __future__ import annotations
 
 import os
-import time
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+from aden_tools.utils.result_cache import ResultCache
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -25,6 +27,11 @@
 NEWSDATA_ARCHIVE_URL = "https://newsdata.io/api/1/archive"
 FINLIGHT_URL = "https://api.finlight.me/v2/articles"
 
+# News goes stale quickly: cache for 15 minutes, serve stale for another
+# 45 while refreshing in the background.
+CACHE_TTL_SECONDS = 15 * 60
+CACHE_STALE_SECONDS = 45 * 60
+
 
 def register_tools(
     mcp: FastMCP,
@@ -32,6 +39,8 @@ def register_tools(
 ) -> None:
     """Register news tools with the MCP server."""
 
+    result_cache = ResultCache.default()
+
     def _get_credentials() -> dict[str, str | None]:
         """Get available news credentials."""
         if credentials is not None:
@@ -194,18 +203,10 @@ def _search_newsdata(
         if sources:
             params["sources"] = sources
 
-        max_retries = 3
-        for attempt in range(max_retries + 1):
-            response = httpx.get(url, params=params, timeout=30.0)
-
-            if response.status_code == 429 and attempt < max_retries:
-                time.sleep(2**attempt)
-                continue
-
-            if response.status_code != 200:
-                return _newsdata_error(response)
-
-            break
+        # 429s are retried with backoff by the shared HTTP client
+        response = http_client.get(url, params=params, timeout=30.0)
+        if response.status_code != 200:
+            return _newsdata_error(response)
 
         data = response.json()
         results = _parse_newsdata_results(data)
@@ -246,18 +247,9 @@ def _search_finlight(
         json_body = {k: v for k, v in body.items() if v not in (None, "", [])}
         headers = {"X-API-KEY": api_key, "Accept": "application/json"}
 
-        max_retries = 3
-        for attempt in range(max_retries + 1):
-            response = httpx.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
-
-            if response.status_code == 429 and attempt < max_retries:
-                time.sleep(2**attempt)
-                continue
-
-            if response.status_code != 200:
-                return _finlight_error(response)
-
-            break
+        response = http_client.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
+        if response.status_code != 200:
+            return _finlight_error(response)
 
         data = response.json()
         results = _parse_finlight_results(data, include_sentiment=include_sentiment)
@@ -279,6 +271,30 @@ def _search_with_fallback(
         newsdata_key: str | None,
         finlight_key: str | None,
         search_kwargs: dict,
+    ) -> dict:
+        """Cached front of :func:`_search_providers`."""
+        return result_cache.get_or_fetch(
+            "news",
+            {
+                "newsdata": bool(newsdata_key),
+                "finlight": bool(finlight_key),
+                **search_kwargs,
+            },
+            lambda: _search_providers(
+                newsdata_key=newsdata_key,
+                finlight_key=finlight_key,
+                search_kwargs=search_kwargs,
+            ),
+            ttl=CACHE_TTL_SECONDS,
+            stale_ttl=CACHE_STALE_SECONDS,
+            credential=f"{newsdata_key or ''}:{finlight_key or ''}",
+        )
+
+    def _search_providers(
+        *,
+        newsdata_key: str | None,
+        finlight_key: str | None,
+        search_kwargs: dict,
     ) -> dict:
         """Try primary provider; fall back to secondary only on failure."""
         primary = (
@@ -3,20 +3,186 @@
 
 Uses pypdf to read PDF documents and extract text content
 along with metadata.
+
+Extracted page text is cached per file (keyed by path, mtime and size),
+so paging through a document only parses each page once.  Large
+extractions are fanned out across a small process pool so long reports
+don't stall the tools server, and ``max_chars`` returns pages
+incrementally with a continuation range.
 """
 
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
 from pypdf import PdfReader
 
+logger = logging.getLogger(__name__)
+
+# Extractions with at least this many uncached pages go to the process pool
+PARALLEL_MIN_PAGES = 32
+PAGES_PER_TASK = 16
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+CACHE_MAX_FILES = 16
+CACHE_MAX_CHARS = 50_000_000
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _extract_page_texts(path: str, indices: list[int]) -> list[str]:
+    """Extract text for the 0-indexed *indices* (runs in a pool worker)."""
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in indices]
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    """Return the shared extraction pool, or None on single-core hosts."""
+    global _pool
+    if MAX_WORKERS < 2:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: the server process is multi-threaded, so forking is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _discard_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+@dataclass
+class _PdfDocument:
+    """Cached state for one version of a PDF file."""
+
+    total_pages: int
+    metadata: dict[str, Any] | None
+    pages: dict[int, str] = field(default_factory=dict)
+    chars: int = 0
+
+
+class _PdfTextCache:
+    """LRU of extracted page text keyed by (path, mtime, size)."""
+
+    def __init__(self, max_files: int = CACHE_MAX_FILES, max_chars: int = CACHE_MAX_CHARS):
+        self._max_files = max_files
+        self._max_chars = max_chars
+        self._docs: OrderedDict[tuple[str, int, int], _PdfDocument] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Path, st: os.stat_result) -> tuple[str, int, int]:
+        return (str(path), st.st_mtime_ns, st.st_size)
+
+    def get(self, path: Path, st: os.stat_result) -> _PdfDocument | None:
+        with self._lock:
+            doc = self._docs.get(self._key(path, st))
+            if doc is not None:
+                self._docs.move_to_end(self._key(path, st))
+            return doc
+
+    def put(self, path: Path, st: os.stat_result, doc: _PdfDocument) -> _PdfDocument:
+        with self._lock:
+            # Drop older versions of the same file
+            for key in [k for k in self._docs if k[0] == str(path)]:
+                del self._docs[key]
+            self._docs[self._key(path, st)] = doc
+            self._evict()
+        return doc
+
+    def add_pages(self, doc: _PdfDocument, texts: dict[int, str]) -> None:
+        with self._lock:
+            for i, text in texts.items():
+                if i not in doc.pages:
+                    doc.pages[i] = text
+                    doc.chars += len(text)
+            self._evict()
+
+    def _evict(self) -> None:
+        total = sum(doc.chars for doc in self._docs.values())
+        while len(self._docs) > 1 and (
+            len(self._docs) > self._max_files or total > self._max_chars
+        ):
+            _, doc = self._docs.popitem(last=False)
+            total -= doc.chars
+
+
+def _read_metadata(reader: PdfReader) -> dict[str, Any] | None:
+    meta = reader.metadata
+    if not meta:
+        return None
+    return {
+        "title": meta.get("/Title"),
+        "author": meta.get("/Author"),
+        "subject": meta.get("/Subject"),
+        "creator": meta.get("/Creator"),
+        "producer": meta.get("/Producer"),
+        "created": str(meta.get("/CreationDate")) if meta.get("/CreationDate") else None,
+        "modified": str(meta.get("/ModDate")) if meta.get("/ModDate") else None,
+    }
+
+
+def _format_pages(indices: list[int]) -> str:
+    """Render 0-indexed *indices* as a ``pages`` argument ('4-9' or '2,5,7')."""
+    numbers = [i + 1 for i in indices]
+    if numbers == list(range(numbers[0], numbers[-1] + 1)):
+        return str(numbers[0]) if len(numbers) == 1 else f"{numbers[0]}-{numbers[-1]}"
+    return ",".join(str(n) for n in numbers)
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register PDF read tools with the MCP server."""
 
+    text_cache = _PdfTextCache()
+
+    def extract_pages(
+        path: Path, reader: PdfReader | None, doc: _PdfDocument, indices: list[int]
+    ) -> PdfReader | None:
+        """Fill *doc* with text for any of *indices* not already cached.
+
+        Returns the reader used (opened on demand) so later windows can reuse it.
+        """
+        missing = [i for i in dict.fromkeys(indices) if i not in doc.pages]
+        if not missing:
+            return reader
+
+        pool = _get_pool() if len(missing) >= PARALLEL_MIN_PAGES else None
+        if pool is not None:
+            chunks = [
+                missing[n : n + PAGES_PER_TASK] for n in range(0, len(missing), PAGES_PER_TASK)
+            ]
+            try:
+                futures = [pool.submit(_extract_page_texts, str(path), c) for c in chunks]
+                for chunk, future in zip(chunks, futures, strict=True):
+                    text_cache.add_pages(doc, dict(zip(chunk, future.result(), strict=True)))
+                return reader
+            except Exception as e:
+                # Broken pool or unpicklable failure: finish in-process
+                logger.warning("Parallel PDF extraction failed, falling back: %s", e)
+                _discard_pool()
+                missing = [i for i in missing if i not in doc.pages]
+
+        if reader is None:
+            reader = PdfReader(path)
+        text_cache.add_pages(doc, {i: reader.pages[i].extract_text() or "" for i in missing})
+        return reader
+
     def parse_page_range(
         pages: str | None,
         total_pages: int,
@@ -92,12 +258,15 @@ def pdf_read(
         pages: str | None = None,
         max_pages: int = 100,
         include_metadata: bool = True,
+        max_chars: int | None = None,
     ) -> dict:
         """
         Read and extract text content from a PDF file.
 
         Returns text content with page markers and optional metadata.
         Use for reading PDFs, reports, documents, or any PDF file.
+        Extracted pages are cached, so reading further ranges of the same
+        file is fast.
 
         Args:
             file_path: Path to the PDF file to read (absolute or relative)
@@ -105,6 +274,9 @@ def pdf_read(
                 '1-10' for range, '1,3,5' for specific
             max_pages: Maximum number of pages to process (1-1000, memory safety)
             include_metadata: Include PDF metadata (author, title, creation date, etc.)
+            max_chars: Stop after this many characters of content (at least one
+                page is always returned). When pages remain, the result has
+                has_more=True and next_pages to pass as ``pages`` to continue.
 
         Returns:
             Dict with extracted text and metadata, or error dict
@@ -129,14 +301,22 @@ def pdf_read(
             elif max_pages > 1000:
                 max_pages = 1000
 
-            # Open and read PDF
-            reader = PdfReader(path)
+            st = path.stat()
+            reader = None
+            doc = text_cache.get(path, st)
+            if doc is None:
+                # Open and read PDF
+                reader = PdfReader(path)
+
+                # Check for encryption
+                if reader.is_encrypted:
+                    return {"error": "Cannot read encrypted PDF. Password required."}
 
-            # Check for encryption
-            if reader.is_encrypted:
-                return {"error": "Cannot read encrypted PDF. Password required."}
+                doc = text_cache.put(
+                    path, st, _PdfDocument(len(reader.pages), _read_metadata(reader))
+                )
 
-            total_pages = len(reader.pages)
+            total_pages = doc.total_pages
 
             # Parse page range
             page_info = parse_page_range(pages, total_pages, max_pages)
@@ -145,11 +325,26 @@ def pdf_read(
 
             page_indices = page_info["indices"]
 
-            # Extract text from pages
-            content_parts = []
-            for i in page_indices:
-                page_text = reader.pages[i].extract_text() or ""
-                content_parts.append(f"--- Page {i + 1} ---\n{page_text}")
+            # Extract text from pages, a window at a time when there is a char budget
+            window = len(page_indices)
+            if max_chars is not None:
+                window = PAGES_PER_TASK * max(MAX_WORKERS, 1)
+            content_parts: list[str] = []
+            char_count = 0
+            done = 0
+            budget_hit = False
+            while done < len(page_indices) and not budget_hit:
+                batch = page_indices[done : done + window]
+                reader = extract_pages(path, reader, doc, batch)
+                for i in batch:
+                    part = f"--- Page {i + 1} ---\n{doc.pages[i]}"
+                    added = len(part) + (2 if content_parts else 0)
+                    if max_chars is not None and content_parts and char_count + added > max_chars:
+                        budget_hit = True
+                        break
+                    content_parts.append(part)
+                    char_count += added
+                    done += 1
 
             content = "\n\n".join(content_parts)
 
@@ -157,11 +352,15 @@ def pdf_read(
                 "path": str(path),
                 "name": path.name,
                 "total_pages": total_pages,
-                "pages_extracted": len(page_indices),
+                "pages_extracted": done,
                 "content": content,
                 "char_count": len(content),
             }
 
+            if budget_hit:
+                result["has_more"] = True
+                result["next_pages"] = _format_pages(page_indices[done:])
+
             # Surface truncation information when requested pages exceed max_pages
             if page_info.get("truncated"):
                 requested = page_info.get("requested_pages", len(page_indices))
@@ -172,19 +371,8 @@ def pdf_read(
                 )
 
             # Add metadata if requested
-            if include_metadata and reader.metadata:
-                meta = reader.metadata
-                result["metadata"] = {
-                    "title": meta.get("/Title"),
-                    "author": meta.get("/Author"),
-                    "subject": meta.get("/Subject"),
-                    "creator": meta.get("/Creator"),
-                    "producer": meta.get("/Producer"),
-                    "created": str(meta.get("/CreationDate"))
-                    if meta.get("/CreationDate")
-                    else None,
-                    "modified": str(meta.get("/ModDate")) if meta.get("/ModDate") else None,
-                }
+            if include_metadata and doc.metadata:
+                result["metadata"] = dict(doc.metadata)
 
             return result
 
@@ -23,21 +23,40 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.result_cache import ResultCache
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 SERPAPI_BASE = "https://serpapi.com/search.json"
 SERPAPI_ACCOUNT = "https://serpapi.com/account.json"
 
+# Scholar and patent records change rarely; every SerpAPI call costs quota
+CACHE_TTL_SECONDS = 24 * 3600
+CACHE_STALE_SECONDS = 7 * 24 * 3600
+
 
 class _SerpAPIClient:
     """Internal client wrapping SerpAPI HTTP calls."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: ResultCache | None = None):
         self._api_key = api_key
+        self._cache = cache
 
     def _request(self, params: dict[str, Any]) -> dict[str, Any]:
-        """Make a GET request to SerpAPI."""
+        """Make a GET request to SerpAPI, through the result cache if any."""
+        if self._cache is None:
+            return self._fetch(params)
+        return self._cache.get_or_fetch(
+            "serpapi",
+            dict(params),
+            lambda: self._fetch(params),
+            ttl=CACHE_TTL_SECONDS,
+            stale_ttl=CACHE_STALE_SECONDS,
+            credential=self._api_key,
+        )
+
+    def _fetch(self, params: dict[str, Any]) -> dict[str, Any]:
         params["api_key"] = self._api_key
         response = httpx.get(SERPAPI_BASE, params=params, timeout=30.0)
 
@@ -142,6 +161,8 @@ def register_tools(
 ) -> None:
     """Register SerpAPI tools with the MCP server."""
 
+    result_cache = ResultCache.default()
+
     def _get_api_key() -> str | None:
         """Get SerpAPI API key from credential store or environment."""
         if credentials is not None:
@@ -159,7 +180,7 @@ def _get_client() -> _SerpAPIClient | dict[str, str]:
                     "via credential store. Get a key at https://serpapi.com/manage-api-key"
                 ),
             }
-        return _SerpAPIClient(api_key)
+        return _SerpAPIClient(api_key, cache=result_cache)
 
     @mcp.tool()
     def scholar_search(
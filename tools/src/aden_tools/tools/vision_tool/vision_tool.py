@@ -11,6 +11,7 @@
 - Image properties (colors, crop hints)
 - Web detection (similar images)
 - Safe search (content moderation)
+- Batched multi-feature analysis of many images (vision_analyze)
 
 API Reference: https://cloud.google.com/vision/docs
 """
@@ -18,68 +19,303 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 VISION_API_URL = "https://vision.googleapis.com/v1/images:annotate"
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+# images:annotate accepts at most 16 images per call and a 10MB JSON body.
+MAX_IMAGES_PER_REQUEST = 16
+MAX_REQUEST_BYTES = 8 * 1024 * 1024
+IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _parse_labels(result: dict[str, Any]) -> dict[str, Any]:
+    labels = [
+        {"description": label["description"], "score": round(label["score"], 3)}
+        for label in result.get("labelAnnotations", [])
+    ]
+    return {"labels": labels}
+
+
+def _parse_text(result: dict[str, Any]) -> dict[str, Any]:
+    annotations = result.get("textAnnotations", [])
+    if not annotations:
+        return {"text": "", "blocks": []}
+
+    # First annotation is full text
+    full_text = annotations[0].get("description", "")
+    blocks = [
+        {
+            "text": ann.get("description", ""),
+            "bounds": ann.get("boundingPoly", {}).get("vertices", []),
+        }
+        for ann in annotations[1:]
+    ]
+    return {"text": full_text, "blocks": blocks}
+
+
+def _parse_faces(result: dict[str, Any]) -> dict[str, Any]:
+    faces = []
+    for face in result.get("faceAnnotations", []):
+        faces.append(
+            {
+                "joy": face.get("joyLikelihood", "UNKNOWN"),
+                "sorrow": face.get("sorrowLikelihood", "UNKNOWN"),
+                "anger": face.get("angerLikelihood", "UNKNOWN"),
+                "surprise": face.get("surpriseLikelihood", "UNKNOWN"),
+                "confidence": round(face.get("detectionConfidence", 0), 3),
+                "bounds": face.get("boundingPoly", {}).get("vertices", []),
+            }
+        )
+    return {"faces": faces}
+
+
+def _parse_objects(result: dict[str, Any]) -> dict[str, Any]:
+    objects = [
+        {
+            "name": obj.get("name", ""),
+            "score": round(obj.get("score", 0), 3),
+            "bounds": obj.get("boundingPoly", {}).get("normalizedVertices", []),
+        }
+        for obj in result.get("localizedObjectAnnotations", [])
+    ]
+    return {"objects": objects}
+
+
+def _parse_logos(result: dict[str, Any]) -> dict[str, Any]:
+    logos = [
+        {
+            "description": logo.get("description", ""),
+            "score": round(logo.get("score", 0), 3),
+        }
+        for logo in result.get("logoAnnotations", [])
+    ]
+    return {"logos": logos}
+
+
+def _parse_landmarks(result: dict[str, Any]) -> dict[str, Any]:
+    landmarks = []
+    for lm in result.get("landmarkAnnotations", []):
+        location = {}
+        locations = lm.get("locations", [])
+        if locations:
+            lat_lng = locations[0].get("latLng", {})
+            location = {
+                "latitude": lat_lng.get("latitude"),
+                "longitude": lat_lng.get("longitude"),
+            }
+        landmarks.append(
+            {
+                "description": lm.get("description", ""),
+                "score": round(lm.get("score", 0), 3),
+                "location": location,
+            }
+        )
+    return {"landmarks": landmarks}
+
+
+def _parse_properties(result: dict[str, Any]) -> dict[str, Any]:
+    # Extract colors
+    colors = []
+    color_info = result.get("imagePropertiesAnnotation", {})
+    dominant_colors = color_info.get("dominantColors", {}).get("colors", [])
+    for color in dominant_colors[:5]:
+        rgb = color.get("color", {})
+        colors.append(
+            {
+                "red": int(rgb.get("red", 0)),
+                "green": int(rgb.get("green", 0)),
+                "blue": int(rgb.get("blue", 0)),
+                "score": round(color.get("score", 0), 3),
+                "pixel_fraction": round(color.get("pixelFraction", 0), 3),
+            }
+        )
+
+    # Extract crop hints
+    crop_hints = []
+    hints_annotation = result.get("cropHintsAnnotation", {})
+    for hint in hints_annotation.get("cropHints", []):
+        crop_hints.append(
+            {
+                "bounds": hint.get("boundingPoly", {}).get("vertices", []),
+                "confidence": round(hint.get("confidence", 0), 3),
+            }
+        )
+
+    return {"colors": colors, "crop_hints": crop_hints}
+
+
+def _parse_web(result: dict[str, Any]) -> dict[str, Any]:
+    web = result.get("webDetection", {})
+
+    web_entities = [
+        {
+            "description": entity.get("description", ""),
+            "score": round(entity.get("score", 0), 3),
+        }
+        for entity in web.get("webEntities", [])[:10]
+    ]
+
+    similar_images = [img.get("url", "") for img in web.get("visuallySimilarImages", [])[:5]]
+
+    pages_with_image = [
+        {"url": page.get("url", ""), "title": page.get("pageTitle", "")}
+        for page in web.get("pagesWithMatchingImages", [])[:5]
+    ]
+
+    return {
+        "web_entities": web_entities,
+        "similar_images": similar_images,
+        "pages_with_image": pages_with_image,
+    }
+
+
+def _parse_safe_search(result: dict[str, Any]) -> dict[str, Any]:
+    safe = result.get("safeSearchAnnotation", {})
+    return {
+        "adult": safe.get("adult", "UNKNOWN"),
+        "spoof": safe.get("spoof", "UNKNOWN"),
+        "medical": safe.get("medical", "UNKNOWN"),
+        "violence": safe.get("violence", "UNKNOWN"),
+        "racy": safe.get("racy", "UNKNOWN"),
+    }
+
+
+# feature name -> (API feature types, accepts maxResults, parser)
+FEATURES: dict[str, tuple[tuple[str, ...], bool, Callable[[dict[str, Any]], dict[str, Any]]]] = {
+    "labels": (("LABEL_DETECTION",), True, _parse_labels),
+    "text": (("TEXT_DETECTION",), False, _parse_text),
+    "faces": (("FACE_DETECTION",), True, _parse_faces),
+    "objects": (("OBJECT_LOCALIZATION",), True, _parse_objects),
+    "logos": (("LOGO_DETECTION",), True, _parse_logos),
+    "landmarks": (("LANDMARK_DETECTION",), True, _parse_landmarks),
+    "properties": (("IMAGE_PROPERTIES", "CROP_HINTS"), False, _parse_properties),
+    "web": (("WEB_DETECTION",), False, _parse_web),
+    "safe_search": (("SAFE_SEARCH_DETECTION",), False, _parse_safe_search),
+}
+
+
+def _api_features(features: list[str], max_results: int) -> list[dict[str, Any]]:
+    api_features: list[dict[str, Any]] = []
+    for name in features:
+        types, takes_max, _ = FEATURES[name]
+        for feature_type in types:
+            entry: dict[str, Any] = {"type": feature_type}
+            if takes_max:
+                entry["maxResults"] = max_results
+            api_features.append(entry)
+    return api_features
+
+
+class _ImageCache:
+    """
+    Base64-encoded image content keyed by SHA-256 of the bytes.
+
+    Local files are looked up by (path, mtime, size) first, so an
+    unchanged file is neither re-read nor re-encoded; identical content
+    under different paths shares one entry.
+    """
+
+    def __init__(self, max_bytes: int = IMAGE_CACHE_BYTES):
+        self._max_bytes = max_bytes
+        self._encoded: OrderedDict[str, str] = OrderedDict()
+        self._files: dict[tuple[str, int, int], str] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load(self, file_path: Path, st: os.stat_result) -> tuple[str, str]:
+        """Return (digest, base64 content) for *file_path*."""
+        file_key = (str(file_path.resolve()), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            digest = self._files.get(file_key)
+            if digest is not None and digest in self._encoded:
+                self._encoded.move_to_end(digest)
+                return digest, self._encoded[digest]
+
+        content = file_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._files[file_key] = digest
+            encoded = self._encoded.get(digest)
+            if encoded is None:
+                encoded = base64.b64encode(content).decode("utf-8")
+                self._encoded[digest] = encoded
+                self._size += len(encoded)
+                self._evict()
+            return digest, encoded
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and len(self._encoded) > 1:
+            digest, encoded = self._encoded.popitem(last=False)
+            self._size -= len(encoded)
+            for key in [k for k, v in self._files.items() if v == digest]:
+                del self._files[key]
 
 
 class _VisionClient:
     """Internal client for Google Cloud Vision API."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, image_cache: _ImageCache | None = None):
         self._api_key = api_key
+        self._image_cache = image_cache or _ImageCache()
 
-    def _load_image(self, image_source: str) -> dict[str, Any] | dict[str, str]:
+    def _resolve_image(self, image_source: str) -> tuple[str, dict[str, Any]]:
         """
         Load image from URL or local file.
 
         Returns:
-            Image dict for API request, or error dict if failed.
+            (dedupe key, image dict for API request), or ("", error dict) if failed.
         """
-        # Check if URL
+        # URLs are fetched by the Vision API itself
         if image_source.startswith(("http://", "https://")):
-            return {"source": {"imageUri": image_source}}
+            return f"url:{image_source}", {"source": {"imageUri": image_source}}
 
         # Local file
         file_path = Path(image_source)
         if not file_path.exists():
-            return {"error": f"File not found: {image_source}"}
+            return "", {"error": f"File not found: {image_source}"}
 
         if not file_path.is_file():
-            return {"error": f"Not a file: {image_source}"}
+            return "", {"error": f"Not a file: {image_source}"}
 
         # Check file size
-        file_size = file_path.stat().st_size
-        if file_size > MAX_FILE_SIZE:
-            size_mb = file_size / (1024 * 1024)
-            return {"error": f"File exceeds 10MB limit ({size_mb:.1f}MB)"}
+        st = file_path.stat()
+        if st.st_size > MAX_FILE_SIZE:
+            size_mb = st.st_size / (1024 * 1024)
+            return "", {"error": f"File exceeds 10MB limit ({size_mb:.1f}MB)"}
 
-        # Read and encode
+        # Read and encode (cached by content hash)
         try:
-            content = file_path.read_bytes()
-            encoded = base64.b64encode(content).decode("utf-8")
-            return {"content": encoded}
+            digest, encoded = self._image_cache.load(file_path, st)
+            return f"sha256:{digest}", {"content": encoded}
         except Exception as e:
-            return {"error": f"Failed to read file: {str(e)}"}
+            return "", {"error": f"Failed to read file: {str(e)}"}
 
-    def _call_api(
-        self, image_data: dict[str, Any], features: list[dict[str, Any]]
-    ) -> dict[str, Any]:
-        """Make request to Vision API."""
+    def _load_image(self, image_source: str) -> dict[str, Any] | dict[str, str]:
+        """Load image from URL or local file, or return an error dict."""
+        return self._resolve_image(image_source)[1]
+
+    def _annotate(self, requests: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send *requests* in one images:annotate call."""
         try:
-            response = httpx.post(
+            response = http_client.post(
                 VISION_API_URL,
                 params={"key": self._api_key},
-                json={"requests": [{"image": image_data, "features": features}]},
+                json={"requests": requests},
                 timeout=30.0,
             )
             return self._handle_response(response)
@@ -105,245 +341,131 @@ def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         responses = data.get("responses", [])
         if not responses:
             return {"error": "Empty response from API"}
+        return {"responses": responses}
 
-        result = responses[0]
+    @staticmethod
+    def _image_error(result: dict[str, Any]) -> dict[str, str] | None:
         if "error" in result:
             return {"error": result["error"].get("message", "Unknown API error")}
+        return None
 
-        return result
+    def _call_api(
+        self, image_data: dict[str, Any], features: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Make request to Vision API for a single image."""
+        batch = self._annotate([{"image": image_data, "features": features}])
+        if "error" in batch:
+            return batch
 
-    def detect_labels(self, image_source: str, max_results: int = 10) -> dict[str, Any]:
-        """Detect labels in image."""
+        result = batch["responses"][0]
+        return self._image_error(result) or result
+
+    def _detect(self, image_source: str, feature: str, max_results: int = 0) -> dict[str, Any]:
+        """Run one feature against one image."""
         image_data = self._load_image(image_source)
         if "error" in image_data:
             return image_data
 
-        result = self._call_api(
-            image_data, [{"type": "LABEL_DETECTION", "maxResults": max_results}]
-        )
+        result = self._call_api(image_data, _api_features([feature], max_results))
         if "error" in result:
             return result
+        return FEATURES[feature][2](result)
 
-        labels = [
-            {"description": label["description"], "score": round(label["score"], 3)}
-            for label in result.get("labelAnnotations", [])
-        ]
-        return {"labels": labels}
+    def detect_labels(self, image_source: str, max_results: int = 10) -> dict[str, Any]:
+        """Detect labels in image."""
+        return self._detect(image_source, "labels", max_results)
 
     def detect_text(self, image_source: str) -> dict[str, Any]:
         """Detect text in image (OCR)."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(image_data, [{"type": "TEXT_DETECTION"}])
-        if "error" in result:
-            return result
-
-        annotations = result.get("textAnnotations", [])
-        if not annotations:
-            return {"text": "", "blocks": []}
-
-        # First annotation is full text
-        full_text = annotations[0].get("description", "")
-        blocks = [
-            {
-                "text": ann.get("description", ""),
-                "bounds": ann.get("boundingPoly", {}).get("vertices", []),
-            }
-            for ann in annotations[1:]
-        ]
-        return {"text": full_text, "blocks": blocks}
+        return self._detect(image_source, "text")
 
     def detect_faces(self, image_source: str, max_results: int = 10) -> dict[str, Any]:
         """Detect faces and emotions in image."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(image_data, [{"type": "FACE_DETECTION", "maxResults": max_results}])
-        if "error" in result:
-            return result
-
-        faces = []
-        for face in result.get("faceAnnotations", []):
-            faces.append(
-                {
-                    "joy": face.get("joyLikelihood", "UNKNOWN"),
-                    "sorrow": face.get("sorrowLikelihood", "UNKNOWN"),
-                    "anger": face.get("angerLikelihood", "UNKNOWN"),
-                    "surprise": face.get("surpriseLikelihood", "UNKNOWN"),
-                    "confidence": round(face.get("detectionConfidence", 0), 3),
-                    "bounds": face.get("boundingPoly", {}).get("vertices", []),
-                }
-            )
-        return {"faces": faces}
+        return self._detect(image_source, "faces", max_results)
 
     def localize_objects(self, image_source: str, max_results: int = 10) -> dict[str, Any]:
         """Detect objects with bounding boxes."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(
-            image_data, [{"type": "OBJECT_LOCALIZATION", "maxResults": max_results}]
-        )
-        if "error" in result:
-            return result
-
-        objects = [
-            {
-                "name": obj.get("name", ""),
-                "score": round(obj.get("score", 0), 3),
-                "bounds": obj.get("boundingPoly", {}).get("normalizedVertices", []),
-            }
-            for obj in result.get("localizedObjectAnnotations", [])
-        ]
-        return {"objects": objects}
+        return self._detect(image_source, "objects", max_results)
 
     def detect_logos(self, image_source: str, max_results: int = 5) -> dict[str, Any]:
         """Detect logos in image."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(image_data, [{"type": "LOGO_DETECTION", "maxResults": max_results}])
-        if "error" in result:
-            return result
-
-        logos = [
-            {
-                "description": logo.get("description", ""),
-                "score": round(logo.get("score", 0), 3),
-            }
-            for logo in result.get("logoAnnotations", [])
-        ]
-        return {"logos": logos}
+        return self._detect(image_source, "logos", max_results)
 
     def detect_landmarks(self, image_source: str, max_results: int = 5) -> dict[str, Any]:
         """Detect landmarks in image."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(
-            image_data, [{"type": "LANDMARK_DETECTION", "maxResults": max_results}]
-        )
-        if "error" in result:
-            return result
-
-        landmarks = []
-        for lm in result.get("landmarkAnnotations", []):
-            location = {}
-            locations = lm.get("locations", [])
-            if locations:
-                lat_lng = locations[0].get("latLng", {})
-                location = {
-                    "latitude": lat_lng.get("latitude"),
-                    "longitude": lat_lng.get("longitude"),
-                }
-            landmarks.append(
-                {
-                    "description": lm.get("description", ""),
-                    "score": round(lm.get("score", 0), 3),
-                    "location": location,
-                }
-            )
-        return {"landmarks": landmarks}
+        return self._detect(image_source, "landmarks", max_results)
 
     def get_image_properties(self, image_source: str) -> dict[str, Any]:
         """Get image properties (colors, crop hints)."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(
-            image_data,
-            [{"type": "IMAGE_PROPERTIES"}, {"type": "CROP_HINTS"}],
-        )
-        if "error" in result:
-            return result
-
-        # Extract colors
-        colors = []
-        color_info = result.get("imagePropertiesAnnotation", {})
-        dominant_colors = color_info.get("dominantColors", {}).get("colors", [])
-        for color in dominant_colors[:5]:
-            rgb = color.get("color", {})
-            colors.append(
-                {
-                    "red": int(rgb.get("red", 0)),
-                    "green": int(rgb.get("green", 0)),
-                    "blue": int(rgb.get("blue", 0)),
-                    "score": round(color.get("score", 0), 3),
-                    "pixel_fraction": round(color.get("pixelFraction", 0), 3),
-                }
-            )
-
-        # Extract crop hints
-        crop_hints = []
-        hints_annotation = result.get("cropHintsAnnotation", {})
-        for hint in hints_annotation.get("cropHints", []):
-            crop_hints.append(
-                {
-                    "bounds": hint.get("boundingPoly", {}).get("vertices", []),
-                    "confidence": round(hint.get("confidence", 0), 3),
-                }
-            )
-
-        return {"colors": colors, "crop_hints": crop_hints}
+        return self._detect(image_source, "properties")
 
     def web_detection(self, image_source: str) -> dict[str, Any]:
         """Find similar images and web references."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
-
-        result = self._call_api(image_data, [{"type": "WEB_DETECTION"}])
-        if "error" in result:
-            return result
-
-        web = result.get("webDetection", {})
-
-        web_entities = [
-            {
-                "description": entity.get("description", ""),
-                "score": round(entity.get("score", 0), 3),
-            }
-            for entity in web.get("webEntities", [])[:10]
-        ]
-
-        similar_images = [img.get("url", "") for img in web.get("visuallySimilarImages", [])[:5]]
-
-        pages_with_image = [
-            {"url": page.get("url", ""), "title": page.get("pageTitle", "")}
-            for page in web.get("pagesWithMatchingImages", [])[:5]
-        ]
-
-        return {
-            "web_entities": web_entities,
-            "similar_images": similar_images,
-            "pages_with_image": pages_with_image,
-        }
+        return self._detect(image_source, "web")
 
     def safe_search(self, image_source: str) -> dict[str, Any]:
         """Detect inappropriate content."""
-        image_data = self._load_image(image_source)
-        if "error" in image_data:
-            return image_data
+        return self._detect(image_source, "safe_search")
 
-        result = self._call_api(image_data, [{"type": "SAFE_SEARCH_DETECTION"}])
-        if "error" in result:
-            return result
+    def analyze(
+        self, image_sources: list[str], features: list[str], max_results: int = 10
+    ) -> dict[str, Any]:
+        """
+        Run several features against several images in as few calls as possible.
 
-        safe = result.get("safeSearchAnnotation", {})
-        return {
-            "adult": safe.get("adult", "UNKNOWN"),
-            "spoof": safe.get("spoof", "UNKNOWN"),
-            "medical": safe.get("medical", "UNKNOWN"),
-            "violence": safe.get("violence", "UNKNOWN"),
-            "racy": safe.get("racy", "UNKNOWN"),
-        }
+        Duplicate images are sent once. Images are packed into calls of at
+        most MAX_IMAGES_PER_REQUEST images and MAX_REQUEST_BYTES of
+        inline content.
+        """
+        api_features = _api_features(features, max_results)
+        results: list[dict[str, Any]] = [{"image_source": src} for src in image_sources]
+
+        # dedupe key -> (image dict, indexes into results)
+        unique: dict[str, tuple[dict[str, Any], list[int]]] = {}
+        for i, src in enumerate(image_sources):
+            key, image_data = self._resolve_image(src)
+            if "error" in image_data:
+                results[i].update(image_data)
+                continue
+            unique.setdefault(key, (image_data, []))[1].append(i)
+
+        batches: list[list[tuple[dict[str, Any], list[int]]]] = []
+        batch_bytes = 0
+        for image_data, indexes in unique.values():
+            size = len(image_data.get("content", ""))
+            if (
+                not batches
+                or len(batches[-1]) >= MAX_IMAGES_PER_REQUEST
+                or (batches[-1] and batch_bytes + size > MAX_REQUEST_BYTES)
+            ):
+                batches.append([])
+                batch_bytes = 0
+            batches[-1].append((image_data, indexes))
+            batch_bytes += size
+
+        for batch in batches:
+            response = self._annotate(
+                [{"image": image_data, "features": api_features} for image_data, _ in batch]
+            )
+            for n, (_, indexes) in enumerate(batch):
+                if "error" in response:
+                    annotated = {"error": response["error"]}
+                elif n >= len(response["responses"]):
+                    annotated = {"error": "Missing response from API"}
+                else:
+                    result = response["responses"][n]
+                    annotated = self._image_error(result) or {}
+                    if not annotated:
+                        for name in features:
+                            parsed = FEATURES[name][2](result)
+                            if name == "safe_search":
+                                annotated["safe_search"] = parsed
+                            else:
+                                annotated.update(parsed)
+                for i in indexes:
+                    results[i].update(annotated)
+
+        return {"results": results, "features": features, "api_calls": len(batches)}
 
 
 def register_tools(
@@ -352,6 +474,8 @@ def register_tools(
 ) -> None:
     """Register Google Cloud Vision tools with the MCP server."""
 
+    image_cache = _ImageCache()
+
     def _get_api_key() -> str | None:
         """Get API key from credentials or environment."""
         if credentials is not None:
@@ -366,7 +490,7 @@ def _get_client() -> _VisionClient | dict[str, str]:
                 "error": "GOOGLE_CLOUD_VISION_API_KEY not configured",
                 "help": "Get an API key at https://console.cloud.google.com/apis/credentials",
             }
-        return _VisionClient(api_key)
+        return _VisionClient(api_key, image_cache)
 
     @mcp.tool()
     def vision_detect_labels(
@@ -534,3 +658,46 @@ def vision_safe_search(image_source: str) -> dict:
         if isinstance(client, dict):
             return client
         return client.safe_search(image_source)
+
+    @mcp.tool()
+    def vision_analyze(
+        image_sources: list[str],
+        features: list[str] | None = None,
+        max_results: int = 10,
+    ) -> dict:
+        """
+        Run several analyses on one or more images in a single batched request.
+
+        Prefer this over calling the individual vision_* tools repeatedly: every
+        image and feature goes into as few API calls as possible, and local
+        files already seen are not re-read.
+
+        Args:
+            image_sources: URLs or local file paths of the images (1-64)
+            features: Any of "labels", "text", "faces", "objects", "logos",
+                "landmarks", "properties", "web", "safe_search"
+                (default: labels, text, objects)
+            max_results: Maximum results per feature where applicable (1-100, default 10)
+
+        Returns:
+            Dict with one result per image (in input order, each carrying the
+            fields of the matching single-feature tools or an error), the
+            features requested, and the number of API calls made
+        """
+        if not image_sources:
+            return {"error": "image_sources must contain at least one image"}
+        if len(image_sources) > 64:
+            return {"error": "At most 64 images per call"}
+        features = features or ["labels", "text", "objects"]
+        unknown = [name for name in features if name not in FEATURES]
+        if unknown:
+            return {
+                "error": f"Unknown features: {', '.join(unknown)}",
+                "help": f"Valid features: {', '.join(FEATURES)}",
+            }
+        features = list(dict.fromkeys(features))
+
+        client = _get_client()
+        if isinstance(client, dict):
+            return client
+        return client.analyze(image_sources, features, min(max(1, max_results), 100))
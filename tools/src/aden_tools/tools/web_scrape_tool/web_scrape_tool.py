@@ -4,13 +4,28 @@
 Uses Playwright with stealth for headless browser scraping,
 enabling JavaScript-rendered content and bot detection evasion.
 Uses BeautifulSoup for HTML parsing and content extraction.
+
+Fetching is tiered: a plain pooled HTTP GET is tried first, and the page
+is only rendered in a browser when the static HTML is empty, a
+JavaScript-only shell, a bot challenge, or lacks the requested selector.
+Browsers are long-lived: a bounded :class:`BrowserPool` keeps Chromium
+processes with a pre-warmed context each and hands them out per page,
+so a scrape costs a page load rather than a browser launch.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urljoin
 
+import httpx
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from playwright.async_api import (
@@ -20,6 +35,8 @@
 )
 from playwright_stealth import Stealth
 
+from aden_tools.utils import http_client
+
 # Browser-like User-Agent for actual page requests
 BROWSER_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -27,21 +44,402 @@
     "Chrome/131.0.0.0 Safari/537.36"
 )
 
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# Upper bound on waiting for the page to settle after DOMContentLoaded
+READY_TIMEOUT_MS = 5000
+
+# lxml parses several times faster than the stdlib parser
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Static pages with scripts and less text than this are treated as JS shells
+MIN_STATIC_TEXT_CHARS = 200
+
+# Statuses that usually mean bot protection; a real browser may get through
+_GATED_STATUSES = frozenset({401, 403, 429, 503})
+_CHALLENGE_TITLES = ("just a moment", "attention required", "access denied")
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Any
+    context: Any
+    pages_served: int = 0
+    broken: bool = False
+
+    def mark_broken(self, *_: Any) -> None:
+        self.broken = True
+
+
+class BrowserPool:
+    """
+    Bounded pool of headless Chromium browsers with pre-warmed contexts.
+
+    Each slot owns one browser process and one browser context; a page is
+    opened in the slot's context per scrape and closed afterwards.  At most
+    ``size`` pages render concurrently.  A slot is recycled (browser closed
+    and relaunched lazily) after ``max_pages_per_browser`` pages, or when its
+    browser disconnects or its context closes (e.g. the browser crashed).
+    Errors of an individual page (DNS failures, timeouts, HTTP errors) leave
+    the browser in service.
+
+    Playwright objects are bound to the event loop that created them; if the
+    pool is used from a different loop it starts over.  Pools still holding
+    browsers are closed at interpreter exit.
+    """
+
+    def __init__(self, size: int = 2, max_pages_per_browser: int = 50) -> None:
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright_cm: Any = None
+        self._playwright: Any = None
+        self._slots: asyncio.LifoQueue[_BrowserSlot | None] | None = None
+        self._start_lock: asyncio.Lock | None = None
+        self.launches = 0
+        _pools.add(self)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Yield a fresh stealth page in a pooled context."""
+        await self._ensure_started()
+        assert self._slots is not None
+        slot = await self._slots.get()
+        page = None
+        try:
+            if slot is None:
+                slot = await self._launch()
+            page = await slot.context.new_page()
+            await Stealth().apply_stealth_async(page)
+            slot.pages_served += 1
+            yield page
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except PlaywrightError:
+                    pass  # a dead browser is caught by _release
+            await self._release(slot)
+
+    async def close(self) -> None:
+        """Close every idle browser and stop Playwright."""
+        if self._slots is not None:
+            while not self._slots.empty():
+                slot = self._slots.get_nowait()
+                if slot is not None:
+                    await self._close_slot(slot)
+        if self._playwright_cm is not None:
+            try:
+                await self._playwright_cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+        self._reset()
+
+    # --- internals -----------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._loop = None
+        self._playwright_cm = None
+        self._playwright = None
+        self._slots = None
+        self._start_lock = None
+
+    async def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset()
+            self._loop = loop
+            self._start_lock = asyncio.Lock()
+            # LIFO so a warm browser is reused before a new one is launched
+            self._slots = asyncio.LifoQueue()
+            for _ in range(self.size):
+                self._slots.put_nowait(None)  # launched on first use
+        assert self._start_lock is not None
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright_cm = async_playwright()
+                self._playwright = await self._playwright_cm.__aenter__()
+
+    async def _launch(self) -> _BrowserSlot:
+        browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        try:
+            context = await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=BROWSER_USER_AGENT,
+                locale="en-US",
+            )
+        except BaseException:
+            await browser.close()
+            raise
+        self.launches += 1
+        slot = _BrowserSlot(browser=browser, context=context)
+        browser.on("disconnected", slot.mark_broken)
+        context.on("close", slot.mark_broken)
+        return slot
+
+    async def _release(self, slot: _BrowserSlot | None) -> None:
+        if self._slots is None:
+            return
+        if slot is not None and (
+            slot.broken
+            or not slot.browser.is_connected()
+            or slot.pages_served >= self.max_pages_per_browser
+        ):
+            await self._close_slot(slot)
+            slot = None
+        self._slots.put_nowait(slot)
+
+    @staticmethod
+    async def _close_slot(slot: _BrowserSlot) -> None:
+        try:
+            await slot.browser.close()
+        except PlaywrightError:
+            pass
+
+
+_pools: weakref.WeakSet[BrowserPool] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Shut down pooled browsers whose event loop is still usable."""
+    for pool in list(_pools):
+        loop = pool._loop
+        if loop is None or loop.is_closed():
+            continue  # Playwright's driver exits, taking its browsers, with the loop
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(pool.close(), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(pool.close())
+        except Exception:
+            pass  # best effort while the interpreter shuts down
+
+
+def _needs_browser(soup: BeautifulSoup) -> bool:
+    """Whether static HTML is a bot challenge or asks for JavaScript.
+
+    Must be called before noise elements are stripped from *soup*.
+    """
+    title = soup.title.get_text(strip=True).lower() if soup.title else ""
+    if title.startswith(_CHALLENGE_TITLES):
+        return True
+    for noscript in soup.find_all("noscript"):
+        text = noscript.get_text(" ", strip=True).lower()
+        if "javascript" in text and ("enable" in text or "require" in text):
+            return True
+    return False
+
+
+def _extract(
+    soup: BeautifulSoup,
+    url: str,
+    final_url: str,
+    selector: str | None,
+    include_links: bool,
+    max_length: int,
+) -> dict[str, Any]:
+    """Turn parsed HTML into the web_scrape result dict."""
+    # Remove noise elements
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]):
+        tag.decompose()
+
+    # Get title and description
+    title = soup.title.get_text(strip=True) if soup.title else ""
+
+    description = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc:
+        description = meta_desc.get("content", "")
+
+    # Target content
+    if selector:
+        content_elem = soup.select_one(selector)
+        if not content_elem:
+            return {"error": f"No elements found matching selector: {selector}"}
+        text = content_elem.get_text(separator=" ", strip=True)
+    else:
+        # Auto-detect main content
+        main_content = (
+            soup.find("article")
+            or soup.find("main")
+            or soup.find(attrs={"role": "main"})
+            or soup.find(class_=["content", "post", "entry", "article-body"])
+            or soup.find("body")
+        )
+        text = main_content.get_text(separator=" ", strip=True) if main_content else ""
+
+    # Clean up whitespace
+    text = " ".join(text.split())
+
+    # Truncate if needed
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+
+    result: dict[str, Any] = {
+        "url": url,
+        "title": title,
+        "description": description,
+        "content": text,
+        "length": len(text),
+    }
+
+    # Extract links if requested
+    if include_links:
+        links: list[dict[str, str]] = []
+        for a in soup.find_all("a", href=True)[:50]:
+            href = a["href"]
+            # Convert relative URLs to absolute URLs (final URL after redirects)
+            absolute_href = urljoin(final_url, href)
+            link_text = a.get_text(strip=True)
+            if link_text and absolute_href:
+                links.append({"text": link_text, "href": absolute_href})
+        result["links"] = links
+
+    return result
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register web scrape tools with the MCP server."""
 
+    pool = BrowserPool()
+
+    async def _render(url: str, selector: str | None) -> tuple[str, str] | dict:
+        """Load *url* in a pooled browser; return (html, final_url) or an error dict."""
+        async with pool.page() as page:
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+
+            if response is None:
+                return {"error": "Navigation failed: no response received"}
+
+            if response.status != 200:
+                return {"error": f"HTTP {response.status}: Failed to fetch URL"}
+
+            # Validate Content-Type
+            content_type = response.headers.get("content-type", "").lower()
+            if not any(t in content_type for t in HTML_CONTENT_TYPES):
+                return {
+                    "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
+                    "url": url,
+                    "skipped": True,
+                }
+
+            # Wait until the page is ready instead of sleeping a fixed time:
+            # the target element if one was requested, else network idle.
+            try:
+                if selector:
+                    await page.wait_for_selector(selector, timeout=READY_TIMEOUT_MS)
+                else:
+                    await page.wait_for_load_state("networkidle", timeout=READY_TIMEOUT_MS)
+            except PlaywrightTimeout:
+                pass  # long-polling pages never go idle; use what has rendered
+
+            return await page.content(), str(response.url)
+
+    async def _fetch_static(
+        url: str, selector: str | None, include_links: bool, max_length: int
+    ) -> dict[str, Any] | None:
+        """Serve *url* from a plain HTTP GET; None means "use the browser"."""
+        try:
+            response = await http_client.aget(
+                url,
+                headers={
+                    "User-Agent": BROWSER_USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9",
+                },
+                follow_redirects=True,
+                timeout=15.0,
+                max_retries=0,  # the browser is the retry
+            )
+        except httpx.HTTPError:
+            return None
+
+        if response.status_code in _GATED_STATUSES:
+            return None
+        if response.status_code != 200:
+            return {"error": f"HTTP {response.status_code}: Failed to fetch URL"}
+
+        content_type = response.headers.get("content-type", "").lower()
+        if not any(t in content_type for t in HTML_CONTENT_TYPES):
+            return {
+                "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
+                "url": url,
+                "skipped": True,
+            }
+
+        soup = BeautifulSoup(response.text, HTML_PARSER)
+        has_scripts = soup.find("script") is not None
+        if _needs_browser(soup):
+            return None
+        result = _extract(soup, url, str(response.url), selector, include_links, max_length)
+        if "error" in result:
+            return None  # selector may only exist after rendering
+        if not result["content"]:
+            return None  # nothing in the static HTML; maybe the browser finds more
+        if has_scripts and result["length"] < MIN_STATIC_TEXT_CHARS:
+            return None
+        return result
+
+    async def _scrape(
+        url: str,
+        selector: str | None,
+        include_links: bool,
+        max_length: int,
+        force_browser: bool = False,
+    ) -> dict[str, Any]:
+        try:
+            # Validate URL
+            if not url.startswith(("http://", "https://")):
+                url = "https://" + url
+
+            # Validate max_length
+            max_length = max(1000, min(max_length, 500000))
+
+            if not force_browser:
+                result = await _fetch_static(url, selector, include_links, max_length)
+                if result is not None:
+                    result["fetched_with"] = "http"
+                    return result
+
+            rendered = await _render(url, selector)
+            if isinstance(rendered, dict):
+                result = rendered
+            else:
+                html_content, final_url = rendered
+                soup = BeautifulSoup(html_content, HTML_PARSER)
+                result = _extract(soup, url, final_url, selector, include_links, max_length)
+            result["fetched_with"] = "browser"
+            return result
+
+        except PlaywrightTimeout:
+            return {"error": "Request timed out", "fetched_with": "browser"}
+        except PlaywrightError as e:
+            return {"error": f"Browser error: {e!s}", "fetched_with": "browser"}
+        except Exception as e:
+            return {"error": f"Scraping failed: {e!s}"}
+
     @mcp.tool()
     async def web_scrape(
         url: str,
         selector: str | None = None,
         include_links: bool = False,
         max_length: int = 50000,
+        force_browser: bool = False,
     ) -> dict:
         """
         Scrape and extract text content from a webpage.
 
-        Uses a headless browser to render JavaScript and bypass bot detection.
+        Fetches the page over plain HTTP first and falls back to a headless
+        browser (rendering JavaScript, bypassing bot detection) when the static
+        HTML is empty, a JavaScript-only shell, or blocked.
         Use when you need to read the content of a specific URL,
         extract data from a website, or read articles/documentation.
 
@@ -50,134 +448,51 @@ async def web_scrape(
             selector: CSS selector to target specific content (e.g., 'article', '.main-content')
             include_links: Include extracted links in the response
             max_length: Maximum length of extracted text (1000-500000)
+            force_browser: Skip the plain HTTP attempt and always render in the browser
 
         Returns:
-            Dict with scraped content (url, title, description, content, length) or error dict
+            Dict with scraped content (url, title, description, content, length,
+            fetched_with: "http" or "browser") or error dict
         """
-        try:
-            # Validate URL
-            if not url.startswith(("http://", "https://")):
-                url = "https://" + url
+        return await _scrape(url, selector, include_links, max_length, force_browser)
 
-            # Validate max_length
-            max_length = max(1000, min(max_length, 500000))
+    @mcp.tool()
+    async def web_scrape_many(
+        urls: list[str],
+        selector: str | None = None,
+        include_links: bool = False,
+        max_length: int = 20000,
+    ) -> dict:
+        """
+        Scrape several webpages concurrently.
 
-            # Launch headless browser with stealth
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",
-                    ],
-                )
-                try:
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent=BROWSER_USER_AGENT,
-                        locale="en-US",
-                    )
-                    page = await context.new_page()
-                    await Stealth().apply_stealth_async(page)
-
-                    response = await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=60000,
-                    )
-
-                    # Give JS a moment to render dynamic content
-                    await page.wait_for_timeout(2000)
-
-                    if response is None:
-                        return {"error": "Navigation failed: no response received"}
-
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}: Failed to fetch URL"}
-
-                    # Validate Content-Type
-                    content_type = response.headers.get("content-type", "").lower()
-                    if not any(t in content_type for t in ["text/html", "application/xhtml+xml"]):
-                        return {
-                            "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
-                            "url": url,
-                            "skipped": True,
-                        }
-
-                    # Get fully rendered HTML
-                    html_content = await page.content()
-                finally:
-                    await browser.close()
-
-            # Parse rendered HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove noise elements
-            for tag in soup(
-                ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
-            ):
-                tag.decompose()
-
-            # Get title and description
-            title = soup.title.get_text(strip=True) if soup.title else ""
-
-            description = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc:
-                description = meta_desc.get("content", "")
-
-            # Target content
-            if selector:
-                content_elem = soup.select_one(selector)
-                if not content_elem:
-                    return {"error": f"No elements found matching selector: {selector}"}
-                text = content_elem.get_text(separator=" ", strip=True)
-            else:
-                # Auto-detect main content
-                main_content = (
-                    soup.find("article")
-                    or soup.find("main")
-                    or soup.find(attrs={"role": "main"})
-                    or soup.find(class_=["content", "post", "entry", "article-body"])
-                    or soup.find("body")
-                )
-                text = main_content.get_text(separator=" ", strip=True) if main_content else ""
-
-            # Clean up whitespace
-            text = " ".join(text.split())
-
-            # Truncate if needed
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-
-            result: dict[str, Any] = {
-                "url": url,
-                "title": title,
-                "description": description,
-                "content": text,
-                "length": len(text),
-            }
+        Same tiered fetch and extraction as web_scrape, applied to each URL.
+        Pages are fetched in parallel (rendering through the shared browser
+        pool when needed), so this is much faster than calling web_scrape once
+        per URL.
 
-            # Extract links if requested
-            if include_links:
-                links: list[dict[str, str]] = []
-                base_url = str(response.url)  # Use final URL after redirects
-                for a in soup.find_all("a", href=True)[:50]:
-                    href = a["href"]
-                    # Convert relative URLs to absolute URLs
-                    absolute_href = urljoin(base_url, href)
-                    link_text = a.get_text(strip=True)
-                    if link_text and absolute_href:
-                        links.append({"text": link_text, "href": absolute_href})
-                result["links"] = links
+        Args:
+            urls: URLs to scrape (at most 20)
+            selector: CSS selector applied to every page
+            include_links: Include extracted links in each result
+            max_length: Maximum length of extracted text per page (1000-500000)
 
-            return result
+        Returns:
+            Dict with one result per URL (in input order), plus success/error counts
+        """
+        if not urls:
+            return {"error": "urls cannot be empty"}
+        if len(urls) > 20:
+            return {"error": "At most 20 URLs can be scraped per call"}
 
-        except PlaywrightTimeout:
-            return {"error": "Request timed out"}
-        except PlaywrightError as e:
-            return {"error": f"Browser error: {e!s}"}
-        except Exception as e:
-            return {"error": f"Scraping failed: {e!s}"}
+        results = await asyncio.gather(
+            *(_scrape(url, selector, include_links, max_length) for url in urls)
+        )
+        failed = sum(1 for r in results if "error" in r)
+        return {
+            "results": list(results),
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "served_over_http": sum(1 for r in results if r.get("fetched_with") == "http"),
+        }
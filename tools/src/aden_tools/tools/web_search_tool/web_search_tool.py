@@ -11,15 +11,22 @@
 from __future__ import annotations
 
 import os
-import time
 from typing import TYPE_CHECKING, Literal
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+from aden_tools.utils.result_cache import ResultCache
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+# Web results change slowly; serve cached results for an hour, then
+# serve them for another day while refreshing in the background.
+CACHE_TTL_SECONDS = 3600
+CACHE_STALE_SECONDS = 24 * 3600
+
 
 def register_tools(
     mcp: FastMCP,
@@ -27,6 +34,8 @@ def register_tools(
 ) -> None:
     """Register web search tools with the MCP server."""
 
+    result_cache = ResultCache.default()
+
     def _search_google(
         query: str,
         num_results: int,
@@ -36,35 +45,27 @@ def _search_google(
         cse_id: str,
     ) -> dict:
         """Execute search using Google Custom Search API."""
-        max_retries = 3
-        for attempt in range(max_retries + 1):
-            response = httpx.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params={
-                    "key": api_key,
-                    "cx": cse_id,
-                    "q": query,
-                    "num": min(num_results, 10),
-                    "lr": f"lang_{language}",
-                    "gl": country,
-                },
-                timeout=30.0,
-            )
-
-            if response.status_code == 429 and attempt < max_retries:
-                time.sleep(2**attempt)
-                continue
-
-            if response.status_code == 401:
-                return {"error": "Invalid Google API key"}
-            elif response.status_code == 403:
-                return {"error": "Google API key not authorized or quota exceeded"}
-            elif response.status_code == 429:
-                return {"error": "Google rate limit exceeded. Try again later."}
-            elif response.status_code != 200:
-                return {"error": f"Google API request failed: HTTP {response.status_code}"}
-
-            break
+        response = http_client.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params={
+                "key": api_key,
+                "cx": cse_id,
+                "q": query,
+                "num": min(num_results, 10),
+                "lr": f"lang_{language}",
+                "gl": country,
+            },
+            timeout=30.0,
+        )
+
+        if response.status_code == 401:
+            return {"error": "Invalid Google API key"}
+        elif response.status_code == 403:
+            return {"error": "Google API key not authorized or quota exceeded"}
+        elif response.status_code == 429:
+            return {"error": "Google rate limit exceeded. Try again later."}
+        elif response.status_code != 200:
+            return {"error": f"Google API request failed: HTTP {response.status_code}"}
 
         data = response.json()
         results = []
@@ -91,34 +92,26 @@ def _search_brave(
         api_key: str,
     ) -> dict:
         """Execute search using Brave Search API."""
-        max_retries = 3
-        for attempt in range(max_retries + 1):
-            response = httpx.get(
-                "https://api.search.brave.com/res/v1/web/search",
-                params={
-                    "q": query,
-                    "count": min(num_results, 20),
-                    "country": country,
-                },
-                headers={
-                    "X-Subscription-Token": api_key,
-                    "Accept": "application/json",
-                },
-                timeout=30.0,
-            )
-
-            if response.status_code == 429 and attempt < max_retries:
-                time.sleep(2**attempt)
-                continue
-
-            if response.status_code == 401:
-                return {"error": "Invalid Brave API key"}
-            elif response.status_code == 429:
-                return {"error": "Brave rate limit exceeded. Try again later."}
-            elif response.status_code != 200:
-                return {"error": f"Brave API request failed: HTTP {response.status_code}"}
-
-            break
+        response = http_client.get(
+            "https://api.search.brave.com/res/v1/web/search",
+            params={
+                "q": query,
+                "count": min(num_results, 20),
+                "country": country,
+            },
+            headers={
+                "X-Subscription-Token": api_key,
+                "Accept": "application/json",
+            },
+            timeout=30.0,
+        )
+
+        if response.status_code == 401:
+            return {"error": "Invalid Brave API key"}
+        elif response.status_code == 429:
+            return {"error": "Brave rate limit exceeded. Try again later."}
+        elif response.status_code != 200:
+            return {"error": f"Brave API request failed: HTTP {response.status_code}"}
 
         data = response.json()
         results = []
@@ -185,6 +178,44 @@ def web_search(
         google_available = creds["google_api_key"] and creds["google_cse_id"]
         brave_available = bool(creds["brave_api_key"])
 
+        def search_google() -> dict:
+            return result_cache.get_or_fetch(
+                "web_search",
+                {
+                    "provider": "google",
+                    "query": query,
+                    "num_results": num_results,
+                    "country": country,
+                    "language": language,
+                },
+                lambda: _search_google(
+                    query,
+                    num_results,
+                    country,
+                    language,
+                    creds["google_api_key"],
+                    creds["google_cse_id"],
+                ),
+                ttl=CACHE_TTL_SECONDS,
+                stale_ttl=CACHE_STALE_SECONDS,
+                credential=f"{creds['google_api_key']}:{creds['google_cse_id']}",
+            )
+
+        def search_brave() -> dict:
+            return result_cache.get_or_fetch(
+                "web_search",
+                {
+                    "provider": "brave",
+                    "query": query,
+                    "num_results": num_results,
+                    "country": country,
+                },
+                lambda: _search_brave(query, num_results, country, creds["brave_api_key"]),
+                ttl=CACHE_TTL_SECONDS,
+                stale_ttl=CACHE_STALE_SECONDS,
+                credential=creds["brave_api_key"],
+            )
+
         try:
             if provider == "google":
                 if not google_available:
@@ -192,14 +223,7 @@ def web_search(
                         "error": "Google credentials not configured",
                         "help": "Set GOOGLE_API_KEY and GOOGLE_CSE_ID environment variables",
                     }
-                return _search_google(
-                    query,
-                    num_results,
-                    country,
-                    language,
-                    creds["google_api_key"],
-                    creds["google_cse_id"],
-                )
+                return search_google()
 
             elif provider == "brave":
                 if not brave_available:
@@ -207,20 +231,13 @@ def web_search(
                         "error": "Brave credentials not configured",
                         "help": "Set BRAVE_SEARCH_API_KEY environment variable",
                     }
-                return _search_brave(query, num_results, country, creds["brave_api_key"])
+                return search_brave()
 
             else:  # auto - try Brave first for backward compatibility
                 if brave_available:
-                    return _search_brave(query, num_results, country, creds["brave_api_key"])
+                    return search_brave()
                 elif google_available:
-                    return _search_google(
-                        query,
-                        num_results,
-                        country,
-                        language,
-                        creds["google_api_key"],
-                        creds["google_cse_id"],
-                    )
+                    return search_google()
                 else:
                     return {
                         "error": "No search credentials configured",
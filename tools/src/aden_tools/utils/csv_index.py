@@ -0,0 +1,284 @@
+"""
+Row-offset index for the CSV tools.
+
+``csv_read`` used to skip ``offset`` rows by parsing from the top and then
+re-read the whole file to count rows, so every page of a large CSV cost
+two full scans.  :class:`CSVIndexCache` scans a file once per version
+(path + mtime + size) and records the byte offset at which every data
+record starts, so a page becomes a seek plus ``limit`` parsed rows and
+row counts come straight from the index.
+
+Offsets are kept in a compact ``array`` (4 bytes per row for files under
+4GB) in memory, and for files of at least ``SIDECAR_MIN_BYTES`` also in
+a sidecar file under ``HIVE_CSV_INDEX_DIR`` (default
+``~/.hive/cache/csv_index``) so a restarted server doesn't rescan.
+Sidecars live outside the session sandbox so they never show up in the
+agent's file listings.
+
+Appends can extend an index in place (:meth:`CSVIndexCache.extend`)
+instead of rebuilding it.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = "~/.hive/cache/csv_index"
+SIDECAR_MIN_BYTES = 1024 * 1024
+_MAGIC = b"HIVECSVIDX1\n"
+
+
+class EmptyCSVError(ValueError):
+    """The file has no header row."""
+
+
+@dataclass
+class CSVIndex:
+    """Header and data-record offsets for one version of a CSV file."""
+
+    columns: list[str]
+    offsets: array  # byte offset where each data record starts (blank lines excluded)
+    empty_rows: int  # records whose fields are all empty, e.g. ",,"
+    size: int
+    mtime_ns: int
+
+    @property
+    def row_count(self) -> int:
+        """Records csv.DictReader would yield."""
+        return len(self.offsets)
+
+    @property
+    def nonempty_row_count(self) -> int:
+        """Records with at least one non-empty field."""
+        return len(self.offsets) - self.empty_rows
+
+
+class _OffsetLines:
+    """Line iterator over a binary file that tracks the next line's byte offset."""
+
+    def __init__(self, f: BinaryIO, start: int) -> None:
+        self._f = f
+        self.pos = start
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self._f.readline()
+        if not line:
+            raise StopIteration
+        self.pos += len(line)
+        return line.decode("utf-8")
+
+
+def _scan(f: BinaryIO, start: int, offsets: array) -> int:
+    """Append record offsets from *start* to EOF; return the all-empty record count."""
+    f.seek(start)
+    lines = _OffsetLines(f, start)
+    reader = csv.reader(lines)
+    empty = 0
+    while True:
+        record_start = lines.pos  # csv.reader pulls lines lazily, no read-ahead
+        try:
+            row = next(reader)
+        except StopIteration:
+            return empty
+        if not row:
+            continue  # blank line, skipped by DictReader too
+        offsets.append(record_start)
+        if not any(row):
+            empty += 1
+
+
+def _sidecar_dir() -> Path:
+    return Path(os.getenv("HIVE_CSV_INDEX_DIR") or DEFAULT_INDEX_DIR).expanduser()
+
+
+def _sidecar_path(path: str) -> Path:
+    return _sidecar_dir() / f"{hashlib.sha256(path.encode('utf-8')).hexdigest()[:32]}.idx"
+
+
+class CSVIndexCache:
+    """LRU of row-offset indexes, persisted as sidecars for large files."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CSVIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, path: str) -> CSVIndex:
+        """Return an up-to-date index for *path*, building it if needed.
+
+        Raises:
+            EmptyCSVError: The file has no header row.
+        """
+        path = os.path.realpath(path)
+        st = os.stat(path)
+        with self._lock:
+            index = self._entries.get(path)
+            if index is not None and (index.mtime_ns, index.size) == (st.st_mtime_ns, st.st_size):
+                self._entries.move_to_end(path)
+                return index
+
+        index = self._load_sidecar(path, st)
+        if index is None:
+            index = self._build(path, st)
+            self._save_sidecar(path, index)
+        self._remember(path, index)
+        return index
+
+    def extend(self, path: str, previous: CSVIndex) -> CSVIndex:
+        """Index records appended to *path* since *previous* was built.
+
+        Falls back to a full rebuild when the old content did not end with
+        a newline (the first appended record then continues the old last
+        line) or the file shrank.
+        """
+        path = os.path.realpath(path)
+        st = os.stat(path)
+        with open(path, "rb") as f:
+            tail_ok = previous.size > 0 and st.st_size >= previous.size
+            if tail_ok:
+                f.seek(previous.size - 1)
+                tail_ok = f.read(1) == b"\n"
+            if not tail_ok:
+                index = self._build(path, st)
+            else:
+                offsets = array(previous.offsets.typecode, previous.offsets)
+                if offsets.typecode == "I" and st.st_size > 0xFFFFFFFF:
+                    offsets = array("Q", offsets)
+                empty = previous.empty_rows + _scan(f, previous.size, offsets)
+                index = CSVIndex(previous.columns, offsets, empty, st.st_size, st.st_mtime_ns)
+        self._save_sidecar(path, index)
+        self._remember(path, index)
+        return index
+
+    def read_rows(
+        self,
+        path: str,
+        index: CSVIndex,
+        offset: int,
+        limit: int | None,
+        columns: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Parse up to *limit* records starting at data row *offset*.
+
+        Rows have csv.DictReader semantics; *columns* projects them.
+        """
+        if offset >= index.row_count or limit == 0:
+            return []
+        rows: list[dict[str, Any]] = []
+        with open(path, "rb") as raw:
+            raw.seek(index.offsets[offset])
+            text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            for row in csv.DictReader(text, fieldnames=index.columns):
+                if columns is not None:
+                    row = {name: row.get(name) for name in columns}
+                rows.append(row)
+                if limit is not None and len(rows) >= limit:
+                    break
+        return rows
+
+    def invalidate(self, path: str) -> None:
+        path = os.path.realpath(path)
+        with self._lock:
+            self._entries.pop(path, None)
+        _sidecar_path(path).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # --- internals -----------------------------------------------------------
+
+    def _build(self, path: str, st: os.stat_result) -> CSVIndex:
+        with open(path, "rb") as f:
+            lines = _OffsetLines(f, 0)
+            try:
+                columns = next(csv.reader(lines))
+            except StopIteration:
+                raise EmptyCSVError(path) from None
+            offsets = array("I" if st.st_size <= 0xFFFFFFFF else "Q")
+            empty = _scan(f, lines.pos, offsets)
+        self.builds += 1
+        return CSVIndex(columns, offsets, empty, st.st_size, st.st_mtime_ns)
+
+    def _remember(self, path: str, index: CSVIndex) -> None:
+        with self._lock:
+            self._entries[path] = index
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _save_sidecar(self, path: str, index: CSVIndex) -> None:
+        if index.size < SIDECAR_MIN_BYTES:
+            return
+        meta = {
+            "path": path,
+            "columns": index.columns,
+            "empty_rows": index.empty_rows,
+            "size": index.size,
+            "mtime_ns": index.mtime_ns,
+            "typecode": index.offsets.typecode,
+            "byteorder": sys.byteorder,
+        }
+        sidecar = _sidecar_path(path)
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            tmp = sidecar.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(_MAGIC)
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                index.offsets.tofile(f)
+            tmp.replace(sidecar)
+        except OSError as e:
+            logger.warning("Could not write CSV index for %s: %s", path, e)
+
+    def _load_sidecar(self, path: str, st: os.stat_result) -> CSVIndex | None:
+        if st.st_size < SIDECAR_MIN_BYTES:
+            return None
+        try:
+            with open(_sidecar_path(path), "rb") as f:
+                if f.readline() != _MAGIC:
+                    return None
+                meta = json.loads(f.readline())
+                if (
+                    meta["path"] != path
+                    or (meta["mtime_ns"], meta["size"]) != (st.st_mtime_ns, st.st_size)
+                    or meta["byteorder"] != sys.byteorder
+                ):
+                    return None
+                offsets = array(meta["typecode"])
+                offsets.frombytes(f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        return CSVIndex(meta["columns"], offsets, meta["empty_rows"], st.st_size, st.st_mtime_ns)
+
+
+_cache: CSVIndexCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_csv_index() -> CSVIndexCache:
+    """Return the process-wide index cache shared by the CSV tools."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CSVIndexCache()
+        return _cache
@@ -0,0 +1,451 @@
+"""
+Shared pooled HTTP client for aden_tools integrations.
+
+Module-level ``httpx.get``/``httpx.post`` open a new connection (TLS
+handshake included) for every call.  The functions here route requests
+through one process-wide ``httpx.Client`` (and one ``httpx.AsyncClient``
+per event loop), which keep per-host keep-alive connection pools.
+HTTP/2 is negotiated when the optional ``h2`` package is installed
+(``pip install httpx[http2]``).
+
+On top of pooling the layer adds:
+
+- Retries with exponential backoff for connection failures and for
+  429/502/503/504 responses.  ``Retry-After`` and
+  ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers are honoured;
+  when the server asks for a longer wait than ``max_retry_wait`` the
+  response is returned as-is so the caller can report the rate limit.
+  Non-idempotent requests (POST/PATCH) are only retried when the request
+  provably never reached the server (connect errors, 429).  File bodies
+  are rewound before a retry; bodies that cannot be rewound (generators,
+  unseekable streams) are sent only once.
+- Per-host request timing metrics, see :func:`stats`.
+
+Usage mirrors httpx::
+
+    from aden_tools.utils import http_client
+
+    response = http_client.get(url, headers=headers, params=params, timeout=30.0)
+    response = await http_client.apost(url, json=body)
+
+Tests can install an ``httpx.MockTransport`` with :func:`configure`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Raised before any byte of the request was sent — always safe to retry
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# May have reached the server — only retried for idempotent methods
+_TRANSIENT_ERRORS = (httpx.ReadError, httpx.RemoteProtocolError, httpx.WriteError)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry behaviour shared by all requests."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    max_retry_wait: float = 30.0
+
+
+@dataclass
+class HostStats:
+    """Request counters for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    status_counts: dict[int, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "status_counts": dict(self.status_counts),
+        }
+
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+_client_pid: int | None = None
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_transport: httpx.BaseTransport | None = None
+_async_transport: httpx.AsyncBaseTransport | None = None
+_policy = RetryPolicy()
+_stats: dict[str, HostStats] = {}
+_closing: set[asyncio.Future] = set()  # aclose() tasks scheduled by close()
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+
+
+def _http2_enabled() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_client() -> httpx.Client:
+    """Return the shared synchronous client, creating it on first use."""
+    global _client, _client_pid
+    with _lock:
+        # A client inherited across fork() shares sockets with the parent
+        if _client is None or _client_pid != os.getpid():
+            _client = httpx.Client(
+                http2=_transport is None and _http2_enabled(),
+                limits=_LIMITS,
+                timeout=_DEFAULT_TIMEOUT,
+                transport=_transport,
+            )
+            _client_pid = os.getpid()
+        return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=_async_transport is None and _http2_enabled(),
+                limits=_LIMITS,
+                timeout=_DEFAULT_TIMEOUT,
+                transport=_async_transport,
+            )
+            _async_clients[loop] = client
+        return client
+
+
+def configure(
+    *,
+    transport: httpx.BaseTransport | None = None,
+    async_transport: httpx.AsyncBaseTransport | None = None,
+    policy: RetryPolicy | None = None,
+) -> None:
+    """Replace the transports and/or retry policy.
+
+    Existing clients are closed so the next request picks up the change.
+    Pass ``httpx.MockTransport(handler)`` in tests.
+    """
+    global _transport, _async_transport, _policy
+    close()
+    with _lock:
+        _transport = transport
+        _async_transport = async_transport
+        if policy is not None:
+            _policy = policy
+
+
+def reset() -> None:
+    """Restore the default transports, retry policy and metrics."""
+    global _transport, _async_transport, _policy
+    close()
+    with _lock:
+        _transport = None
+        _async_transport = None
+        _policy = RetryPolicy()
+        _stats.clear()
+
+
+def close() -> None:
+    """Close the shared sync client and the per-loop async clients.
+
+    Async clients are closed on their own event loop, so from a coroutine
+    prefer :func:`aclose`, which waits for the current loop's client.
+    """
+    for loop, client in _detach_clients():
+        _schedule_aclose(loop, client)
+
+
+async def aclose() -> None:
+    """Like :func:`close`, but awaits the running loop's async client."""
+    current = asyncio.get_running_loop()
+    for loop, client in _detach_clients():
+        if loop is current:
+            await client.aclose()
+        else:
+            _schedule_aclose(loop, client)
+
+
+def _detach_clients() -> list[tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]:
+    """Close the sync client; hand back the async clients for closing."""
+    global _client
+    with _lock:
+        client, _client = _client, None
+        async_clients = list(_async_clients.items())
+        _async_clients.clear()
+    if client is not None:
+        client.close()
+    return async_clients
+
+
+def _schedule_aclose(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    if client.is_closed or loop.is_closed():
+        return  # a closed loop's connections are already gone
+
+    def start() -> None:
+        task = loop.create_task(client.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    try:
+        loop.call_soon_threadsafe(start)
+    except RuntimeError:
+        pass  # loop closed in the meantime
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    """Per-host request metrics since start-up (or the last :func:`reset`)."""
+    with _lock:
+        return {host: s.as_dict() for host, s in _stats.items()}
+
+
+# --- requests ----------------------------------------------------------------
+
+
+def request(
+    method: str, url: str, *, max_retries: int | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a request through the shared client, retrying transient failures.
+
+    Accepts the same keyword arguments as ``httpx.Client.request``
+    (params, headers, json, data, files, content, timeout, ...).
+    """
+    method = method.upper()
+    retries = _policy.max_retries if max_retries is None else max_retries
+    rewind = _rewinder(kwargs)
+    if rewind is None:
+        retries = 0
+    client = get_client()
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            response = client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            _record(url, start, None)
+            delay = _error_delay(e, method, attempt, retries)
+            if delay is None:
+                raise
+        else:
+            _record(url, start, response.status_code)
+            delay = _response_delay(response, method, attempt, retries)
+            if delay is None:
+                return response
+            response.close()
+        _record_retry(url)
+        logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, url, delay, attempt + 1)
+        time.sleep(delay)
+        rewind()
+        attempt += 1
+
+
+async def arequest(
+    method: str, url: str, *, max_retries: int | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Async counterpart of :func:`request`."""
+    method = method.upper()
+    retries = _policy.max_retries if max_retries is None else max_retries
+    rewind = _rewinder(kwargs)
+    if rewind is None:
+        retries = 0
+    client = get_async_client()
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            _record(url, start, None)
+            delay = _error_delay(e, method, attempt, retries)
+            if delay is None:
+                raise
+        else:
+            _record(url, start, response.status_code)
+            delay = _response_delay(response, method, attempt, retries)
+            if delay is None:
+                return response
+            await response.aclose()
+        _record_retry(url)
+        logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, url, delay, attempt + 1)
+        await asyncio.sleep(delay)
+        rewind()
+        attempt += 1
+
+
+def get(url: str, **kwargs: Any) -> httpx.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> httpx.Response:
+    return request("POST", url, **kwargs)
+
+
+def put(url: str, **kwargs: Any) -> httpx.Response:
+    return request("PUT", url, **kwargs)
+
+
+def patch(url: str, **kwargs: Any) -> httpx.Response:
+    return request("PATCH", url, **kwargs)
+
+
+def delete(url: str, **kwargs: Any) -> httpx.Response:
+    return request("DELETE", url, **kwargs)
+
+
+async def aget(url: str, **kwargs: Any) -> httpx.Response:
+    return await arequest("GET", url, **kwargs)
+
+
+async def apost(url: str, **kwargs: Any) -> httpx.Response:
+    return await arequest("POST", url, **kwargs)
+
+
+# --- retry decisions -----------------------------------------------------------
+
+
+def _rewinder(kwargs: dict[str, Any]) -> Callable[[], None] | None:
+    """Return a function that resets the request body for another attempt.
+
+    None when the body includes a stream that cannot be rewound; a failed
+    attempt may have consumed part of it, so the request is not retried.
+    """
+    streams = []
+    files = kwargs.get("files")
+    if files:
+        entries = files.values() if isinstance(files, dict) else [f for _, f in files]
+        streams.extend(f[1] if isinstance(f, tuple) else f for f in entries)
+    for key in ("content", "data"):
+        body = kwargs.get(key)
+        if body is not None and not isinstance(body, dict):
+            streams.append(body)
+
+    positions = []
+    for stream in streams:
+        if isinstance(stream, (bytes, str)):
+            continue
+        try:
+            if not stream.seekable():
+                return None
+            positions.append((stream, stream.tell()))
+        except (AttributeError, OSError, ValueError):
+            return None  # generator or other one-shot iterable
+
+    def rewind() -> None:
+        for stream, position in positions:
+            stream.seek(position)
+
+    return rewind
+
+
+def _backoff(attempt: int) -> float:
+    delay = min(_policy.backoff_max, _policy.backoff_base * (2**attempt))
+    return delay * (0.5 + random.random() / 2)
+
+
+def _error_delay(error: httpx.TransportError, method: str, attempt: int, retries: int):
+    if attempt >= retries:
+        return None
+    if isinstance(error, _CONNECT_ERRORS):
+        return _backoff(attempt)
+    if isinstance(error, _TRANSIENT_ERRORS) and method in IDEMPOTENT_METHODS:
+        return _backoff(attempt)
+    return None
+
+
+def _response_delay(response: httpx.Response, method: str, attempt: int, retries: int):
+    if attempt >= retries:
+        return None
+    status = response.status_code
+    rate_limited = status == 429 or (
+        status == 403 and response.headers.get("x-ratelimit-remaining") == "0"
+    )
+    if not rate_limited and (status not in RETRY_STATUSES or method not in IDEMPOTENT_METHODS):
+        return None
+
+    wait = rate_limit_wait(response.headers)
+    if wait is None:
+        return _backoff(attempt)
+    if wait > _policy.max_retry_wait:
+        return None  # let the caller surface the rate limit
+    return wait
+
+
+def rate_limit_wait(headers: httpx.Headers, now: float | None = None) -> float | None:
+    """Seconds the server asked us to wait, from Retry-After or X-RateLimit-*."""
+    now = time.time() if now is None else now
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                return max(0.0, when.timestamp() - now)
+
+    if headers.get("x-ratelimit-remaining") == "0":
+        reset_at = headers.get("x-ratelimit-reset")
+        try:
+            return max(0.0, float(reset_at) - now) if reset_at else None
+        except ValueError:
+            return None
+    return None
+
+
+# --- metrics -------------------------------------------------------------------
+
+
+def _host_stats(url: str) -> HostStats:
+    host = httpx.URL(url).host or "unknown"
+    host_stats = _stats.get(host)
+    if host_stats is None:
+        host_stats = _stats[host] = HostStats()
+    return host_stats
+
+
+def _record(url: str, start: float, status: int | None) -> None:
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    with _lock:
+        s = _host_stats(url)
+        s.requests += 1
+        s.total_ms += elapsed_ms
+        s.max_ms = max(s.max_ms, elapsed_ms)
+        if status is None:
+            s.errors += 1
+        else:
+            s.status_counts[status] = s.status_counts.get(status, 0) + 1
+
+
+def _record_retry(url: str) -> None:
+    with _lock:
+        _host_stats(url).retries += 1
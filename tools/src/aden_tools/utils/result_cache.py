@@ -0,0 +1,270 @@
+"""
+TTL cache for search-style tool results (web_search, news, SerpAPI).
+
+Research agents repeat near-identical queries within and across
+sessions.  :class:`ResultCache` keys results by namespace plus a
+normalized parameter dict (query case and whitespace folded, params
+sorted), keeps them in an in-memory LRU backed by a pluggable
+persistent backend (JSON files on disk by default), and serves:
+
+- fresh entries (age < ttl) directly,
+- stale entries (age < ttl + stale_ttl) directly while a background
+  thread refreshes them (stale-while-revalidate),
+- anything older by calling the provider.
+
+Error results are never cached.  Responses carry ``"cached": True``
+when served from the cache.  Callers pass the API credential used for
+the request; only a hash of it enters the key, so results fetched with
+one key or account are never served to another sharing the disk cache.
+
+Configuration (read when the cache is created):
+
+- ``HIVE_TOOL_CACHE_DIR``: directory for the disk backend
+  (default ``~/.hive/cache/tool_results``)
+- ``HIVE_TOOL_CACHE_DISABLED=1``: bypass caching entirely
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "~/.hive/cache/tool_results"
+
+
+class CacheBackend(Protocol):
+    """Persistent second level behind the in-memory LRU."""
+
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    def set(self, key: str, entry: dict[str, Any]) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class DiskCacheBackend:
+    """One JSON file per entry, evicting least-recently-used files over ``max_bytes``."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._dir = Path(directory).expanduser()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mtime doubles as last-use time for eviction
+        except OSError:
+            pass
+        return entry
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        try:
+            data = json.dumps(entry, default=str)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            try:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                tmp = self._path(key).with_suffix(".tmp")
+                tmp.write_text(data, encoding="utf-8")
+                tmp.replace(self._path(key))
+                self._evict()
+            except OSError as e:
+                logger.warning("Could not write tool result cache entry: %s", e)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        files = []
+        total = 0
+        for path in self._dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self._max_bytes:
+            return
+        for _, size, path in sorted(files):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def normalize_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Fold case/whitespace of the query and drop unset params."""
+    normalized: dict[str, Any] = {}
+    for name, value in params.items():
+        if value is None or value == "":
+            continue
+        if name == "query" and isinstance(value, str):
+            value = " ".join(value.lower().split())
+        normalized[name] = value
+    return normalized
+
+
+class ResultCache:
+    """Two-level (memory + backend) TTL cache with stale-while-revalidate."""
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        max_entries: int = 512,
+        enabled: bool = True,
+    ) -> None:
+        self._backend = backend
+        self._max_entries = max_entries
+        self.enabled = enabled
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def default(cls) -> ResultCache:
+        """Cache configured from the environment (see module docstring)."""
+        if os.getenv("HIVE_TOOL_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+            return cls(enabled=False)
+        directory = os.getenv("HIVE_TOOL_CACHE_DIR") or DEFAULT_CACHE_DIR
+        return cls(backend=DiskCacheBackend(directory))
+
+    @staticmethod
+    def make_key(namespace: str, params: dict[str, Any], credential: str | None = None) -> str:
+        credential_id = (
+            hashlib.sha256(credential.encode("utf-8")).hexdigest() if credential else None
+        )
+        payload = json.dumps(
+            [namespace, credential_id, normalize_params(params)], sort_keys=True, default=str
+        ).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_or_fetch(
+        self,
+        namespace: str,
+        params: dict[str, Any],
+        fetch: Callable[[], dict[str, Any]],
+        ttl: float,
+        stale_ttl: float = 0.0,
+        credential: str | None = None,
+    ) -> dict[str, Any]:
+        """Return the cached result for (*namespace*, *params*), or call *fetch*.
+
+        *credential* is the API key (or keys) *fetch* uses; entries are only
+        shared between calls made with the same credential.
+        """
+        if not self.enabled:
+            return fetch()
+
+        key = self.make_key(namespace, params, credential)
+        entry = self._lookup(key)
+        now = time.time()
+        if entry is not None:
+            age = now - entry["stored_at"]
+            if age < ttl:
+                self._count(namespace, "hits")
+                return self._serve(entry)
+            if age < ttl + stale_ttl:
+                self._count(namespace, "stale_hits")
+                self._refresh_in_background(namespace, key, fetch)
+                return self._serve(entry)
+
+        self._count(namespace, "misses")
+        result = fetch()
+        self._store(key, result)
+        return result
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters per namespace."""
+        with self._lock:
+            return {ns: dict(counts) for ns, counts in self._stats.items()}
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    # --- internals -----------------------------------------------------------
+
+    def _lookup(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if self._backend is None:
+            return None
+        entry = self._backend.get(key)
+        if entry is not None and "stored_at" in entry and "result" in entry:
+            self._remember(key, entry)
+            return entry
+        return None
+
+    def _store(self, key: str, result: dict[str, Any]) -> None:
+        if not isinstance(result, dict) or "error" in result:
+            return
+        entry = {"stored_at": time.time(), "result": copy.deepcopy(result)}
+        self._remember(key, entry)
+        if self._backend is not None:
+            self._backend.set(key, entry)
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _serve(entry: dict[str, Any]) -> dict[str, Any]:
+        result = copy.deepcopy(entry["result"])
+        result["cached"] = True
+        result["cache_age_seconds"] = round(time.time() - entry["stored_at"], 1)
+        return result
+
+    def _refresh_in_background(
+        self, namespace: str, key: str, fetch: Callable[[], dict[str, Any]]
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._store(key, fetch())
+                self._count(namespace, "refreshes")
+            except Exception as e:
+                logger.debug("Background refresh for %s failed: %s", namespace, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"cache-refresh-{namespace}", daemon=True).start()
+
+    def _count(self, namespace: str, counter: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(
+                namespace, {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+            )
+            counts[counter] += 1
@@ -0,0 +1,262 @@
+"""
+Cached DuckDB query engine for the csv_sql / excel_sql tools.
+
+Parsing a CSV or workbook into DuckDB is by far the most expensive part
+of an SQL tool call, and agents typically run several queries against
+the same file in a row.  The engine keeps one in-memory DuckDB database
+per loaded file, keyed by path + mtime + size, so only the first query
+pays the load.  Editing the file changes the key and forces a reload.
+
+Paths handed to the tools are resolved inside a session sandbox, so the
+cache is effectively session-scoped: sessions never share entries.
+
+The cache is bounded both by entry count and by a memory budget
+(approximated by the source file size) and evicts least-recently-used
+databases first.  An evicted database stays open until the last query
+running on it finishes.  Results are streamed with ``fetchmany`` up to a
+row cap instead of materializing everything with ``fetchall``.
+
+Cached databases are long-lived, so each query runs on its own cursor
+inside a transaction that is always rolled back, and once loaded a
+database can no longer change settings or touch files other than the
+ones it was given.  One query cannot leave anything behind for the
+next, whatever the tools' keyword checks miss.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_MAX_ROWS = 1000
+_FETCH_BATCH = 256
+
+
+@dataclass
+class _Entry:
+    con: Any  # duckdb.DuckDBPyConnection
+    cost: int
+    tables: list[str] = field(default_factory=list)
+    users: int = 0  # queries currently running on con
+    retired: bool = False  # dropped from the cache; close once unused
+
+
+class SQLQueryEngine:
+    """LRU cache of DuckDB databases, one per source file version."""
+
+    def __init__(
+        self,
+        max_entries: int = 8,
+        memory_budget_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self._max_entries = max_entries
+        self._budget = memory_budget_bytes
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def query(
+        self,
+        path: str,
+        loader: Callable[[Any], list[str]],
+        sql: str,
+        *,
+        variant: str = "",
+        setup: Callable[[Any, list[str]], None] | None = None,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        allowed_paths: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        """Run *sql* against the cached database for *path*.
+
+        Args:
+            path: Source file; its mtime and size are part of the cache key.
+            loader: Called with a fresh DuckDB connection on a cache miss to
+                create the tables; returns names describing what it loaded
+                (e.g. sheet names), handed back to *setup* and the caller.
+            sql: The (already validated) query to run.
+            variant: Extra cache-key component for loaders whose output
+                depends on options other than the file itself.
+            setup: Called with a per-query cursor and the loader's names
+                before *sql* runs, e.g. to create a TEMP view.  Cursor state
+                never leaks between queries.
+            max_rows: Maximum number of rows to return.
+            allowed_paths: Files the loaded views still read at query time
+                (e.g. Parquet snapshots); all other file access is refused.
+
+        Returns:
+            Dict with columns, rows (as dicts), row_count, truncated,
+            tables, cached, load_time_ms and query_time_ms.
+        """
+        import duckdb
+
+        stat = os.stat(path)
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size, variant)
+
+        load_ms = 0.0
+        entry = self._get(key)
+        cached = entry is not None
+        if entry is None:
+            start = time.perf_counter()
+            con = duckdb.connect(":memory:")
+            try:
+                tables = loader(con)
+                _lock_down(con, allowed_paths)
+            except BaseException:
+                con.close()
+                raise
+            load_ms = (time.perf_counter() - start) * 1000
+            entry = self._put(key, _Entry(con=con, cost=stat.st_size, tables=tables))
+
+        try:
+            start = time.perf_counter()
+            cur = entry.con.cursor()
+            try:
+                cur.begin()
+                if setup is not None:
+                    setup(cur, entry.tables)
+                result = cur.execute(sql)
+                columns = [desc[0] for desc in result.description]
+                rows: list[dict[str, Any]] = []
+                truncated = False
+                while len(rows) <= max_rows:
+                    batch = result.fetchmany(min(_FETCH_BATCH, max_rows + 1 - len(rows)))
+                    if not batch:
+                        break
+                    rows.extend(dict(zip(columns, row, strict=False)) for row in batch)
+                if len(rows) > max_rows:
+                    rows = rows[:max_rows]
+                    truncated = True
+            finally:
+                # Discard anything the query (or setup) created or changed
+                try:
+                    cur.rollback()
+                except duckdb.Error:
+                    pass  # transaction already aborted by a failed statement
+                cur.close()
+            query_ms = (time.perf_counter() - start) * 1000
+        finally:
+            self._release(entry)
+
+        return {
+            "columns": columns,
+            "rows": rows,
+            "row_count": len(rows),
+            "truncated": truncated,
+            "tables": list(entry.tables),
+            "cached": cached,
+            "load_time_ms": round(load_ms, 2),
+            "query_time_ms": round(query_ms, 2),
+        }
+
+    def invalidate(self, path: str) -> None:
+        """Drop every cached database loaded from *path*."""
+        real = os.path.realpath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == real]:
+                self._retire(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Drop all cached databases, closing each once no query uses it."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._retire(entry)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "cost_bytes": sum(e.cost for e in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # --- internals -----------------------------------------------------------
+
+    def _get(self, key: tuple) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            entry.users += 1
+            return entry
+
+    def _put(self, key: tuple, entry: _Entry) -> _Entry:
+        """Cache a freshly loaded database; returns the entry to query (acquired)."""
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another thread loaded the same file version first
+                entry.con.close()
+                self._entries.move_to_end(key)
+                existing.users += 1
+                return existing
+
+            # Older versions of the same file are never queried again
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self._retire(self._entries.pop(stale))
+
+            entry.users += 1
+            self._entries[key] = entry
+            total = sum(e.cost for e in self._entries.values())
+            while len(self._entries) > 1 and (
+                len(self._entries) > self._max_entries or total > self._budget
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                total -= evicted.cost
+                self._retire(evicted)
+            return entry
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.users -= 1
+            if entry.retired and entry.users == 0:
+                entry.con.close()
+
+    @staticmethod
+    def _retire(entry: _Entry) -> None:
+        # Caller holds self._lock.  Queries may still be running on the
+        # connection; the last one to finish closes it.
+        entry.retired = True
+        if entry.users == 0:
+            entry.con.close()
+
+
+def _lock_down(con: Any, allowed_paths: Iterable[str]) -> None:
+    """Make a loaded database read-only as far as settings and files go."""
+    import duckdb
+
+    paths = [str(p) for p in allowed_paths]
+    if paths:
+        quoted = ", ".join("'" + p.replace("'", "''") + "'" for p in paths)
+        try:
+            con.execute(f"SET allowed_paths = [{quoted}]")
+        except duckdb.Error:
+            # DuckDB < 1.2 cannot allow individual files; keep file access
+            # so the views keep working (writes are still rolled back)
+            con.execute("SET lock_configuration = true")
+            return
+    con.execute("SET enable_external_access = false")
+    con.execute("SET lock_configuration = true")
+
+
+_engine: SQLQueryEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_sql_engine() -> SQLQueryEngine:
+    """Return the process-wide query engine shared by the SQL tools."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = SQLQueryEngine()
+        return _engine
@@ -8,6 +8,14 @@
 from aden_tools.credentials import CredentialStoreAdapter
 
 
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path: Path, monkeypatch):
+    """Keep on-disk tool caches out of ~/.hive and separate between tests."""
+    monkeypatch.setenv("HIVE_TOOL_CACHE_DIR", str(tmp_path / "tool_result_cache"))
+    monkeypatch.setenv("HIVE_CSV_INDEX_DIR", str(tmp_path / "csv_index"))
+    monkeypatch.setenv("HIVE_EXCEL_COLUMNAR_DIR", str(tmp_path / "excel_columnar"))
+
+
 @pytest.fixture
 def mcp() -> FastMCP:
     """Create a fresh FastMCP instance for testing."""
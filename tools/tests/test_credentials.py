@@ -206,6 +206,59 @@ def test_validate_for_tools_skips_optional_credentials(self, monkeypatch):
         # Should not raise because credential is optional
         creds.validate_for_tools(["optional_tool"])
 
+    def test_validation_loads_credentials_in_one_batch(self, monkeypatch):
+        """Startup and tool validation batch-load credentials instead of one by one."""
+        custom_specs = {
+            name: CredentialSpec(
+                env_var=f"{name.upper()}_KEY",
+                tools=[f"{name}_tool"],
+                startup_required=True,
+            )
+            for name in ("one", "two", "three")
+        }
+        monkeypatch.setenv("ONE_KEY", "1")
+        monkeypatch.setenv("TWO_KEY", "2")
+        monkeypatch.delenv("THREE_KEY", raising=False)
+
+        creds = CredentialStoreAdapter.with_env_storage(specs=custom_specs)
+        storage = creds.store._storage
+        with (
+            patch.object(storage, "load_many", wraps=storage.load_many) as load_many,
+            patch.object(storage, "load", wraps=storage.load) as load,
+        ):
+            with pytest.raises(CredentialError) as exc_info:
+                creds.validate_startup()
+            missing = creds.get_missing_for_tools(["one_tool", "two_tool", "three_tool"])
+
+        assert "THREE_KEY" in str(exc_info.value)
+        assert "ONE_KEY" not in str(exc_info.value)
+        assert [name for name, _ in missing] == ["three"]
+        assert load_many.call_count == 2
+        # Found credentials are served from the store cache on the second pass
+        assert load_many.call_args.args[0] == ["three"]
+        assert load.call_count == 4
+
+    def test_check_health_runs_available_credentials(self, monkeypatch):
+        """check_health skips unset credentials and passes the CSE ID to Google."""
+        monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "brave-key")
+        monkeypatch.setenv("GOOGLE_API_KEY", "google-key")
+        monkeypatch.setenv("GOOGLE_CSE_ID", "cse-123")
+        monkeypatch.delenv("HUBSPOT_ACCESS_TOKEN", raising=False)
+        creds = CredentialStoreAdapter.with_env_storage()
+
+        with patch(
+            "aden_tools.credentials.health_check.check_credentials_health_sync",
+            return_value={},
+        ) as run:
+            creds.check_health(["brave_search", "google_search", "hubspot"], timeout=5)
+
+        checks = run.call_args.args[0]
+        assert checks == {
+            "brave_search": "brave-key",
+            "google_search": ("google-key", {"cse_id": "cse-123"}),
+        }
+        assert run.call_args.kwargs == {"timeout": 5}
+
 
 class TestCredentialStoreAdapterForTesting:
     """Tests for test factory method."""
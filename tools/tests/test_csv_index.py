@@ -0,0 +1,128 @@
+"""Tests for the CSV row-offset index."""
+
+import csv
+import os
+from pathlib import Path
+
+import pytest
+
+from aden_tools.utils import csv_index
+from aden_tools.utils.csv_index import CSVIndexCache, EmptyCSVError
+
+
+def write_rows(path: Path, rows: list[list[str]]) -> Path:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+@pytest.fixture
+def cache() -> CSVIndexCache:
+    return CSVIndexCache()
+
+
+class TestIndexBuild:
+    def test_offsets_match_dictreader(self, cache, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text(
+            'id,note\n1,"multi\nline"\n\n2,plain\n,\n3,"quoted, comma"\n', encoding="utf-8"
+        )
+
+        index = cache.get(str(path))
+        with open(path, encoding="utf-8", newline="") as f:
+            expected = list(csv.DictReader(f))
+
+        assert index.columns == ["id", "note"]
+        assert index.row_count == len(expected) == 4
+        assert index.nonempty_row_count == 3
+        assert cache.read_rows(str(path), index, 0, None) == expected
+        assert cache.read_rows(str(path), index, 3, 5) == expected[3:]
+
+    def test_crlf_and_unicode(self, cache, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes("name,city\r\nZoë,Zürich\r\nJosé,São Paulo\r\n".encode())
+
+        index = cache.get(str(path))
+
+        assert cache.read_rows(str(path), index, 1, 1) == [{"name": "José", "city": "São Paulo"}]
+
+    def test_projection(self, cache, tmp_path):
+        path = write_rows(tmp_path / "data.csv", [["a", "b", "c"], ["1", "2", "3"]])
+        index = cache.get(str(path))
+
+        assert cache.read_rows(str(path), index, 0, None, ["c", "a"]) == [{"c": "3", "a": "1"}]
+
+    def test_empty_file(self, cache, tmp_path):
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+
+        with pytest.raises(EmptyCSVError):
+            cache.get(str(path))
+
+    def test_cached_until_modified(self, cache, tmp_path):
+        path = write_rows(tmp_path / "data.csv", [["a"], ["1"]])
+        cache.get(str(path))
+        cache.get(str(path))
+        assert cache.builds == 1
+
+        write_rows(path, [["a"], ["1"], ["2"]])
+        assert cache.get(str(path)).row_count == 2
+        assert cache.builds == 2
+
+
+class TestExtend:
+    def test_extend_scans_only_new_rows(self, cache, tmp_path):
+        path = write_rows(tmp_path / "data.csv", [["a", "b"], ["1", "2"]])
+        index = cache.get(str(path))
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows([["3", "4"], ["5", "6"]])
+
+        extended = cache.extend(str(path), index)
+
+        assert cache.builds == 1
+        assert extended.row_count == 3
+        assert cache.read_rows(str(path), extended, 2, 1) == [{"a": "5", "b": "6"}]
+        assert cache.get(str(path)) is extended
+
+    def test_extend_rebuilds_without_trailing_newline(self, cache, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1")
+        index = cache.get(str(path))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("2\n3\n")
+
+        extended = cache.extend(str(path), index)
+
+        assert cache.builds == 2
+        assert cache.read_rows(str(path), extended, 0, None) == [{"a": "12"}, {"a": "3"}]
+
+
+class TestSidecar:
+    def test_sidecar_reused_by_new_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(csv_index, "SIDECAR_MIN_BYTES", 0)
+        path = write_rows(tmp_path / "data.csv", [["a"]] + [[str(i)] for i in range(100)])
+
+        CSVIndexCache().get(str(path))
+        fresh = CSVIndexCache()
+        index = fresh.get(str(path))
+
+        assert fresh.builds == 0
+        assert index.row_count == 100
+        assert fresh.read_rows(str(path), index, 99, 1) == [{"a": "99"}]
+        assert list(Path(os.environ["HIVE_CSV_INDEX_DIR"]).glob("*.idx"))
+
+    def test_stale_sidecar_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(csv_index, "SIDECAR_MIN_BYTES", 0)
+        path = write_rows(tmp_path / "data.csv", [["a"], ["1"]])
+        CSVIndexCache().get(str(path))
+        write_rows(path, [["a"], ["1"], ["2"]])
+
+        fresh = CSVIndexCache()
+
+        assert fresh.get(str(path)).row_count == 2
+        assert fresh.builds == 1
+
+    def test_small_files_have_no_sidecar(self, cache, tmp_path):
+        path = write_rows(tmp_path / "data.csv", [["a"], ["1"]])
+        cache.get(str(path))
+        assert not Path(os.environ["HIVE_CSV_INDEX_DIR"]).exists()
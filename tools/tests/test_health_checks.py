@@ -1,8 +1,11 @@
 """Tests for credential health checkers."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import httpx
+import pytest
 
 from aden_tools.credentials.health_check import (
     HEALTH_CHECKERS,
@@ -10,8 +13,13 @@
     GitHubHealthChecker,
     GoogleMapsHealthChecker,
     GoogleSearchHealthChecker,
+    HealthCheckCache,
+    HealthCheckResult,
     ResendHealthChecker,
     check_credential_health,
+    check_credentials_health,
+    check_credentials_health_sync,
+    health_check_cache,
 )
 
 
@@ -414,3 +422,142 @@ def test_google_search_without_cse_id(self):
 
         assert result.valid is True
         assert result.details.get("partial_check") is True
+
+
+class _SlowChecker:
+    """Checker that sleeps, tracking how many checks overlap."""
+
+    def __init__(self, delay: float, result: HealthCheckResult | None = None):
+        self.delay = delay
+        self.result = result or HealthCheckResult(valid=True, message="ok")
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def check(self, credential_value: str) -> HealthCheckResult:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self.result
+
+
+class TestConcurrentHealthChecks:
+    """Tests for check_credentials_health() and the result cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        health_check_cache.clear()
+        yield
+        health_check_cache.clear()
+
+    def _register(self, monkeypatch, checker, count):
+        names = [f"fake_{i}" for i in range(count)]
+        for name in names:
+            monkeypatch.setitem(HEALTH_CHECKERS, name, checker)
+        return names
+
+    def test_checks_run_concurrently(self, monkeypatch):
+        checker = _SlowChecker(0.2)
+        names = self._register(monkeypatch, checker, 6)
+
+        started = time.monotonic()
+        results = check_credentials_health_sync(dict.fromkeys(names, "key"))
+        elapsed = time.monotonic() - started
+
+        assert list(results) == names
+        assert all(r.valid for r in results.values())
+        assert checker.max_active == 6
+        assert elapsed < 0.2 * 6 / 2
+
+    def test_concurrency_is_bounded(self, monkeypatch):
+        checker = _SlowChecker(0.05)
+        names = self._register(monkeypatch, checker, 6)
+
+        check_credentials_health_sync(dict.fromkeys(names, "key"), max_concurrency=2)
+
+        assert checker.calls == 6
+        assert checker.max_active <= 2
+
+    def test_timeout_returns_invalid_result(self, monkeypatch):
+        monkeypatch.setitem(HEALTH_CHECKERS, "fake_slow", _SlowChecker(0.5))
+
+        results = check_credentials_health_sync({"fake_slow": "key"}, timeout=0.05)
+
+        assert results["fake_slow"].valid is False
+        assert results["fake_slow"].details == {"error": "timeout"}
+
+    def test_checker_exception_is_reported(self, monkeypatch):
+        checker = MagicMock()
+        checker.check.side_effect = RuntimeError("boom")
+        monkeypatch.setitem(HEALTH_CHECKERS, "fake_broken", checker)
+
+        results = check_credentials_health_sync({"fake_broken": "key"})
+
+        assert results["fake_broken"].valid is False
+        assert "boom" in results["fake_broken"].message
+
+    def test_results_cached_by_credential_value(self, monkeypatch):
+        checker = _SlowChecker(0)
+        monkeypatch.setitem(HEALTH_CHECKERS, "fake", checker)
+
+        check_credentials_health_sync({"fake": "key-1"})
+        check_credentials_health_sync({"fake": "key-1"})
+        assert checker.calls == 1
+
+        check_credentials_health_sync({"fake": "key-2"})
+        check_credentials_health_sync({"fake": "key-1"}, use_cache=False)
+        assert checker.calls == 3
+
+    def test_transient_failures_not_cached(self, monkeypatch):
+        failure = HealthCheckResult(valid=False, message="down", details={"error": "timeout"})
+        checker = _SlowChecker(0, failure)
+        monkeypatch.setitem(HEALTH_CHECKERS, "fake", checker)
+
+        check_credentials_health_sync({"fake": "key"})
+        check_credentials_health_sync({"fake": "key"})
+
+        assert checker.calls == 2
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_passes_checker_kwargs(self, mock_client_cls):
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = 200
+        mock_client.get.return_value = response
+
+        results = check_credentials_health_sync(
+            {"google_search": ("api-key", {"cse_id": "cse-123"})}
+        )
+
+        assert results["google_search"].valid is True
+        assert mock_client.get.call_args[1]["params"]["cx"] == "cse-123"
+
+    @pytest.mark.asyncio
+    async def test_async_entry_point(self, monkeypatch):
+        monkeypatch.setitem(HEALTH_CHECKERS, "fake", _SlowChecker(0))
+
+        results = await check_credentials_health({"fake": "key"})
+
+        assert results["fake"].valid is True
+
+    def test_cache_entries_expire(self):
+        cache = HealthCheckCache(ttl=0.05)
+        key = HealthCheckCache.key("fake", "key")
+        cache.put(key, HealthCheckResult(valid=True, message="ok"))
+
+        assert cache.get(key) is not None
+        time.sleep(0.06)
+        assert cache.get(key) is None
+
+    def test_cache_key_hides_credential_value(self):
+        key = HealthCheckCache.key("fake", "secret-value")
+
+        assert "secret-value" not in key
+        assert key != HealthCheckCache.key("fake", "secret-value", cse_id="x")
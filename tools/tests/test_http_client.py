@@ -0,0 +1,221 @@
+"""Tests for the shared pooled HTTP client."""
+
+import asyncio
+import io
+import time
+
+import httpx
+import pytest
+
+from aden_tools.utils import http_client
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Install a MockTransport; the test sets ``handler`` on the returned dict."""
+    state = {"calls": 0, "handler": None, "sleeps": []}
+
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        state["calls"] += 1
+        return state["handler"](request)
+
+    async def adispatch(request: httpx.Request) -> httpx.Response:
+        return dispatch(request)
+
+    http_client.configure(
+        transport=httpx.MockTransport(dispatch),
+        async_transport=httpx.MockTransport(adispatch),
+    )
+    monkeypatch.setattr(time, "sleep", lambda s: state["sleeps"].append(s))
+    yield state
+    http_client.reset()
+
+
+class TestPooling:
+    def test_client_reused_across_calls(self, mock_transport):
+        mock_transport["handler"] = lambda request: httpx.Response(200, json={"ok": True})
+
+        first = http_client.get_client()
+        assert http_client.get("https://api.example.com/a").json() == {"ok": True}
+        assert http_client.get_client() is first
+
+    def test_configure_replaces_client(self, mock_transport):
+        first = http_client.get_client()
+        http_client.configure(transport=httpx.MockTransport(lambda r: httpx.Response(204)))
+        assert http_client.get_client() is not first
+        assert http_client.get("https://api.example.com").status_code == 204
+
+    def test_kwargs_forwarded(self, mock_transport):
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["authorization"]
+            return httpx.Response(201)
+
+        mock_transport["handler"] = handler
+        response = http_client.post(
+            "https://api.example.com/items",
+            params={"q": "x"},
+            headers={"Authorization": "Bearer t"},
+            json={"a": 1},
+            timeout=5.0,
+        )
+
+        assert response.status_code == 201
+        assert seen == {"url": "https://api.example.com/items?q=x", "auth": "Bearer t"}
+
+
+class TestRetries:
+    def test_retries_503_for_get(self, mock_transport):
+        responses = iter([httpx.Response(503), httpx.Response(200)])
+        mock_transport["handler"] = lambda request: next(responses)
+
+        assert http_client.get("https://api.example.com").status_code == 200
+        assert mock_transport["calls"] == 2
+
+    def test_no_retry_503_for_post(self, mock_transport):
+        mock_transport["handler"] = lambda request: httpx.Response(503)
+
+        assert http_client.post("https://api.example.com").status_code == 503
+        assert mock_transport["calls"] == 1
+
+    def test_429_retried_for_post_honouring_retry_after(self, mock_transport):
+        responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)])
+        mock_transport["handler"] = lambda request: next(responses)
+
+        assert http_client.post("https://api.example.com").status_code == 200
+        assert mock_transport["sleeps"] == [2.0]
+
+    def test_long_retry_after_returned_to_caller(self, mock_transport):
+        mock_transport["handler"] = lambda request: httpx.Response(
+            429, headers={"Retry-After": "3600"}
+        )
+
+        assert http_client.get("https://api.example.com").status_code == 429
+        assert mock_transport["calls"] == 1
+
+    def test_retries_exhausted(self, mock_transport):
+        mock_transport["handler"] = lambda request: httpx.Response(429)
+
+        response = http_client.get("https://api.example.com", max_retries=2)
+
+        assert response.status_code == 429
+        assert mock_transport["calls"] == 3
+
+    def test_connect_error_retried_then_raised(self, mock_transport):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        mock_transport["handler"] = handler
+
+        with pytest.raises(httpx.ConnectError):
+            http_client.post("https://api.example.com", max_retries=1)
+        assert mock_transport["calls"] == 2
+
+    def test_file_body_rewound_before_retry(self, mock_transport):
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            return httpx.Response(429 if len(bodies) == 1 else 200)
+
+        mock_transport["handler"] = handler
+        upload = io.BytesIO(b"payload")
+
+        response = http_client.post("https://api.example.com", files={"file": ("a.txt", upload)})
+
+        assert response.status_code == 200
+        assert len(bodies) == 2
+        assert all(b"payload" in body for body in bodies)
+
+    def test_one_shot_stream_not_retried(self, mock_transport):
+        mock_transport["handler"] = lambda request: httpx.Response(429)
+
+        response = http_client.post("https://api.example.com", content=iter([b"a", b"b"]))
+
+        assert response.status_code == 429
+        assert mock_transport["calls"] == 1
+
+    def test_read_timeout_not_retried(self, mock_transport):
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        mock_transport["handler"] = handler
+
+        with pytest.raises(httpx.ReadTimeout):
+            http_client.get("https://api.example.com")
+        assert mock_transport["calls"] == 1
+
+
+class TestRateLimitWait:
+    def test_retry_after_seconds(self):
+        assert http_client.rate_limit_wait(httpx.Headers({"Retry-After": "5"})) == 5.0
+
+    def test_retry_after_http_date(self):
+        headers = httpx.Headers({"Retry-After": "Thu, 01 Jan 1970 00:01:40 GMT"})
+        assert http_client.rate_limit_wait(headers, now=90.0) == pytest.approx(10.0)
+
+    def test_x_ratelimit_reset(self):
+        headers = httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "130"})
+        assert http_client.rate_limit_wait(headers, now=100.0) == 30.0
+
+    def test_remaining_budget_means_no_wait(self):
+        headers = httpx.Headers({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "130"})
+        assert http_client.rate_limit_wait(headers, now=100.0) is None
+
+
+class TestMetrics:
+    def test_per_host_stats(self, mock_transport):
+        responses = iter([httpx.Response(502), httpx.Response(200), httpx.Response(404)])
+        mock_transport["handler"] = lambda request: next(responses)
+
+        http_client.get("https://a.example.com/x")
+        http_client.get("https://b.example.com/y")
+
+        stats = http_client.stats()
+        assert stats["a.example.com"]["requests"] == 2
+        assert stats["a.example.com"]["retries"] == 1
+        assert stats["a.example.com"]["status_counts"] == {502: 1, 200: 1}
+        assert stats["b.example.com"]["status_counts"] == {404: 1}
+
+
+class TestAsync:
+    @pytest.mark.asyncio
+    async def test_async_request_with_retry(self, mock_transport, monkeypatch):
+        async def no_sleep(delay):
+            return None
+
+        monkeypatch.setattr(http_client.asyncio, "sleep", no_sleep)
+        responses = iter([httpx.Response(429), httpx.Response(200, json={"n": 1})])
+        mock_transport["handler"] = lambda request: next(responses)
+
+        response = await http_client.aget("https://api.example.com")
+
+        assert response.json() == {"n": 1}
+        assert mock_transport["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_async_client(self, mock_transport):
+        client = http_client.get_async_client()
+
+        await http_client.aclose()
+
+        assert client.is_closed
+        assert http_client.get_async_client() is not client
+
+    def test_close_closes_async_clients_on_their_loop(self, mock_transport):
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(_async_client())
+
+            http_client.close()
+            loop.run_until_complete(asyncio.sleep(0.01))
+
+            assert client.is_closed
+        finally:
+            loop.close()
+
+
+async def _async_client():
+    return http_client.get_async_client()
@@ -0,0 +1,164 @@
+"""Tests for the search-result TTL cache."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from aden_tools.utils.result_cache import DiskCacheBackend, ResultCache
+
+
+class Provider:
+    """Counts calls and returns a numbered result."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"results": [self.calls]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(backend=DiskCacheBackend(tmp_path))
+
+
+class TestResultCache:
+    def test_fresh_hit_skips_provider(self, cache):
+        provider = Provider()
+        first = cache.get_or_fetch("search", {"query": "AI agents"}, provider, ttl=60)
+        second = cache.get_or_fetch("search", {"query": "AI agents"}, provider, ttl=60)
+
+        assert provider.calls == 1
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["results"] == [1]
+        assert cache.stats()["search"] == {"hits": 1, "stale_hits": 0, "misses": 1, "refreshes": 0}
+
+    def test_query_normalized(self, cache):
+        provider = Provider()
+        cache.get_or_fetch("search", {"query": "AI   Agents", "page": None}, provider, ttl=60)
+        cache.get_or_fetch("search", {"query": "ai agents"}, provider, ttl=60)
+        assert provider.calls == 1
+
+    def test_params_and_namespace_distinguish_entries(self, cache):
+        provider = Provider()
+        cache.get_or_fetch("search", {"query": "x", "country": "us"}, provider, ttl=60)
+        cache.get_or_fetch("search", {"query": "x", "country": "de"}, provider, ttl=60)
+        cache.get_or_fetch("news", {"query": "x", "country": "us"}, provider, ttl=60)
+        assert provider.calls == 3
+
+    def test_credential_distinguishes_entries(self, cache):
+        provider = Provider()
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=60, credential="key-a")
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=60, credential="key-b")
+        again = cache.get_or_fetch("search", {"query": "x"}, provider, ttl=60, credential="key-a")
+
+        assert provider.calls == 2
+        assert again["results"] == [1]
+
+    def test_credential_not_stored_in_clear(self, cache, tmp_path):
+        cache.get_or_fetch("search", {"query": "x"}, Provider(), ttl=60, credential="sk-secret")
+
+        (path,) = tmp_path.glob("*.json")
+        assert "sk-secret" not in path.read_text()
+        assert "sk-secret" not in path.name
+
+    def test_errors_not_cached(self, cache):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            return {"error": "rate limited"}
+
+        cache.get_or_fetch("search", {"query": "x"}, failing, ttl=60)
+        cache.get_or_fetch("search", {"query": "x"}, failing, ttl=60)
+        assert len(calls) == 2
+
+    def test_expired_entry_refetched(self, cache, monkeypatch):
+        provider = Provider()
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        result = cache.get_or_fetch("search", {"query": "x"}, provider, ttl=10)
+
+        assert provider.calls == 2
+        assert result == {"results": [2]}
+
+    def test_stale_served_while_revalidating(self, cache, monkeypatch):
+        provider = Provider()
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=10, stale_ttl=100)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        refreshed = threading.Event()
+
+        def slow_provider():
+            result = provider()
+            refreshed.set()
+            return result
+
+        stale = cache.get_or_fetch("search", {"query": "x"}, slow_provider, ttl=10, stale_ttl=100)
+
+        assert stale["results"] == [1]
+        assert stale["cached"] is True
+        assert refreshed.wait(5)
+        for _ in range(100):  # the refresh thread stores right after fetching
+            if cache.stats()["search"]["refreshes"]:
+                break
+            time.sleep(0.01)
+        fresh = cache.get_or_fetch("search", {"query": "x"}, provider, ttl=10, stale_ttl=100)
+        assert fresh["results"] == [2]
+
+    def test_persists_across_instances(self, tmp_path):
+        provider = Provider()
+        ResultCache(backend=DiskCacheBackend(tmp_path)).get_or_fetch(
+            "search", {"query": "x"}, provider, ttl=60
+        )
+        result = ResultCache(backend=DiskCacheBackend(tmp_path)).get_or_fetch(
+            "search", {"query": "x"}, provider, ttl=60
+        )
+        assert provider.calls == 1
+        assert result["cached"] is True
+
+    def test_cached_result_isolated_from_caller_mutation(self, cache):
+        first = cache.get_or_fetch("search", {"query": "x"}, Provider(), ttl=60)
+        first["results"].append("mutated")
+        second = cache.get_or_fetch("search", {"query": "x"}, Provider(), ttl=60)
+        assert second["results"] == [1]
+
+    def test_disabled_cache_always_fetches(self):
+        provider = Provider()
+        cache = ResultCache(enabled=False)
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=60)
+        cache.get_or_fetch("search", {"query": "x"}, provider, ttl=60)
+        assert provider.calls == 2
+
+    def test_default_honours_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HIVE_TOOL_CACHE_DISABLED", "1")
+        assert ResultCache.default().enabled is False
+        monkeypatch.delenv("HIVE_TOOL_CACHE_DISABLED")
+        monkeypatch.setenv("HIVE_TOOL_CACHE_DIR", str(tmp_path / "c"))
+        ResultCache.default().get_or_fetch("s", {"query": "x"}, Provider(), ttl=60)
+        assert list((tmp_path / "c").glob("*.json"))
+
+
+class TestDiskCacheBackend:
+    def test_lru_eviction_by_size(self, tmp_path):
+        backend = DiskCacheBackend(tmp_path, max_bytes=250)
+        backend.set("a", {"v": "a" * 100})
+        backend.set("b", {"v": "b" * 100})
+        old = time.time() - 100
+        os.utime(tmp_path / "a.json", (old, old))
+        backend.set("c", {"v": "c" * 100})
+
+        assert backend.get("a") is None
+        assert backend.get("b") is not None
+        assert backend.get("c") is not None
+
+    def test_corrupt_entry_ignored(self, tmp_path):
+        (tmp_path / "k.json").write_text("{not json")
+        assert DiskCacheBackend(tmp_path).get("k") is None
@@ -0,0 +1,70 @@
+"""Tests for the cached DuckDB query engine behind csv_sql / excel_sql."""
+
+import pytest
+
+from aden_tools.utils.sql_engine import SQLQueryEngine
+
+duckdb = pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id\n1\n2\n")
+    return path
+
+
+def _load(con):
+    con.execute("CREATE TABLE data AS SELECT * FROM range(2) t(id)")
+    return ["data"]
+
+
+class TestSQLQueryEngine:
+    def test_query_changes_do_not_reach_next_query(self, source):
+        engine = SQLQueryEngine()
+        engine.query(str(source), _load, "INSERT INTO data VALUES (99)")
+
+        result = engine.query(str(source), _load, "SELECT COUNT(*) AS n FROM data")
+
+        assert result["cached"] is True
+        assert result["rows"] == [{"n": 2}]
+
+    def test_loaded_database_cannot_touch_files_or_settings(self, source, tmp_path):
+        engine = SQLQueryEngine()
+        engine.query(str(source), _load, "SELECT 1")
+
+        with pytest.raises(duckdb.Error):
+            engine.query(str(source), _load, f"SELECT * FROM read_csv('{source}')")
+        with pytest.raises(duckdb.Error):
+            engine.query(str(source), _load, "SET threads = 1")
+        with pytest.raises(duckdb.Error):
+            engine.query(str(source), _load, f"COPY data TO '{tmp_path / 'out.csv'}'")
+
+    def test_allowed_paths_stay_readable(self, source, tmp_path):
+        parquet = tmp_path / "snap.parquet"
+        duckdb.sql(f"COPY (SELECT 7 AS id) TO '{parquet}'")
+
+        def load(con):
+            con.execute(f"CREATE VIEW data AS SELECT * FROM read_parquet('{parquet}')")
+            return ["data"]
+
+        engine = SQLQueryEngine()
+        result = engine.query(str(source), load, "SELECT id FROM data", allowed_paths=[parquet])
+
+        assert result["rows"] == [{"id": 7}]
+
+    def test_evicted_database_closed_after_running_query(self, source, tmp_path):
+        engine = SQLQueryEngine(max_entries=1)
+        other = tmp_path / "other.csv"
+        other.write_text("id\n")
+
+        def evict_mid_query(cur, tables):
+            # Another thread loads a different file while this query runs
+            engine.query(str(other), _load, "SELECT 1")
+
+        result = engine.query(
+            str(source), _load, "SELECT COUNT(*) AS n FROM data", setup=evict_mid_query
+        )
+
+        assert result["rows"] == [{"n": 2}]
+        assert engine.stats()["entries"] == 1
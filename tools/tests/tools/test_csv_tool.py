@@ -361,6 +361,85 @@ def test_offset_beyond_rows(self, csv_tool_fn, basic_csv, tmp_path):
         assert result["total_rows"] == 3
 
 
+class TestCsvRowIndex:
+    """csv_read/csv_info/csv_append use the cached row-offset index."""
+
+    def test_column_projection(self, csv_tool_fn, basic_csv, tmp_path):
+        """Only the requested columns are returned."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tool_fn(
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["city", "name"],
+                limit=1,
+            )
+
+        assert result["columns"] == ["city", "name"]
+        assert result["rows"] == [{"city": "NYC", "name": "Alice"}]
+        assert result["total_rows"] == 3
+
+    def test_unknown_column(self, csv_tool_fn, basic_csv, tmp_path):
+        """Unknown projected columns are rejected."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tool_fn(
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["country"],
+            )
+
+        assert "Unknown columns: country" in result["error"]
+        assert result["available_columns"] == ["name", "age", "city"]
+
+    def test_pages_share_one_index(self, csv_tools, large_csv, tmp_path):
+        """Paging and info calls reuse the index built by the first call."""
+        from aden_tools.utils.csv_index import get_csv_index
+
+        builds = get_csv_index().builds
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            ids = []
+            for offset in (0, 10, 20):
+                page = csv_tools["csv_read"](
+                    path="large.csv",
+                    workspace_id=TEST_WORKSPACE_ID,
+                    agent_id=TEST_AGENT_ID,
+                    session_id=TEST_SESSION_ID,
+                    offset=offset,
+                    limit=10,
+                )
+                ids.append(page["rows"][0]["id"])
+            info = csv_tools["csv_info"](
+                path="large.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+            )
+
+        assert get_csv_index().builds == builds + 1
+        assert ids == ["0", "10", "20"]
+        assert info["total_rows"] == page["total_rows"]
+
+    def test_append_then_read_sees_new_rows(self, csv_tools, basic_csv, tmp_path):
+        """Rows appended after indexing are readable by offset."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            ids = {
+                "workspace_id": TEST_WORKSPACE_ID,
+                "agent_id": TEST_AGENT_ID,
+                "session_id": TEST_SESSION_ID,
+            }
+            csv_tools["csv_read"](path="basic.csv", **ids)
+            csv_tools["csv_append"](
+                path="basic.csv", rows=[{"name": "Dana", "age": "41", "city": "Austin"}], **ids
+            )
+            result = csv_tools["csv_read"](path="basic.csv", offset=3, **ids)
+
+        assert result["rows"] == [{"name": "Dana", "age": "41", "city": "Austin"}]
+        assert result["total_rows"] == 4
+
+
 class TestCsvWrite:
     """Tests for csv_write function."""
 
@@ -890,3 +969,66 @@ def test_unicode_data(self, csv_tools, session_dir, tmp_path):
         assert result["success"] is True
         assert result["row_count"] == 1
         assert result["rows"][0]["名前"] == "商品B"
+
+    def test_second_query_uses_cache(self, csv_tools, products_csv, tmp_path):
+        """Follow-up queries on an unchanged file skip the CSV load."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            first = csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT COUNT(*) AS n FROM data",
+            )
+            second = csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT name FROM data WHERE category = 'Kitchen'",
+            )
+
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["load_time_ms"] == 0
+        assert second["query_time_ms"] >= 0
+        assert second["row_count"] == 2
+
+    def test_modified_file_reloaded(self, csv_tools, products_csv, tmp_path):
+        """Editing the CSV invalidates the cached table."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+            )
+            with open(products_csv, "a") as f:
+                f.write("6,Kettle,Kitchen,40,10\n")
+            result = csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+            )
+
+        assert result["cached"] is False
+        assert result["row_count"] == 6
+
+    def test_max_rows_truncates(self, csv_tools, products_csv, tmp_path):
+        """Results are capped at max_rows and flagged as truncated."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT id FROM data ORDER BY id",
+                max_rows=2,
+            )
+
+        assert result["row_count"] == 2
+        assert result["truncated"] is True
+        assert [row["id"] for row in result["rows"]] == [1, 2]
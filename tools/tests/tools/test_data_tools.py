@@ -0,0 +1,157 @@
+"""Tests for data_tools - load_data / query_data paging over indexed data files."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from fastmcp import FastMCP
+
+from aden_tools.tools.file_system_toolkits.data_tools import register_tools
+from aden_tools.tools.file_system_toolkits.data_tools.index import (
+    INDEX_DIRNAME,
+    line_index,
+    record_index,
+)
+
+
+@pytest.fixture
+def data_tools(mcp: FastMCP):
+    """Register data tools and return them as a dict."""
+    register_tools(mcp)
+    return {
+        "load_data": mcp._tool_manager._tools["load_data"].fn,
+        "query_data": mcp._tool_manager._tools["query_data"].fn,
+        "list_data_files": mcp._tool_manager._tools["list_data_files"].fn,
+    }
+
+
+@pytest.fixture
+def numbered_lines(tmp_path: Path) -> Path:
+    path = tmp_path / "lines.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+    return path
+
+
+class TestLineIndex:
+    def test_built_on_first_access_and_reused(self, numbered_lines):
+        index = line_index(numbered_lines)
+        assert len(index) == 1000
+        sidecar = numbered_lines.parent / INDEX_DIRNAME / "lines.txt.idx"
+        assert sidecar.exists()
+
+        mtime = sidecar.stat().st_mtime_ns
+        assert len(line_index(numbered_lines)) == 1000
+        assert sidecar.stat().st_mtime_ns == mtime
+
+    def test_stale_index_rebuilt(self, numbered_lines):
+        line_index(numbered_lines)
+        with open(numbered_lines, "a") as f:
+            f.write("extra\n")
+        assert len(line_index(numbered_lines)) == 1001
+
+    def test_gzip_offsets_refer_to_decompressed_content(self, tmp_path):
+        path = tmp_path / "lines.txt.gz"
+        path.write_bytes(gzip.compress(b"a\nbb\nccc"))
+        assert list(line_index(path).slice(0, 10)) == [0, 2, 5]
+
+    def test_record_index_skips_nested_and_string_commas(self, tmp_path):
+        path = tmp_path / "arr.json"
+        path.write_text('[{"a": [1, 2]}, "x,]", 3]')
+        index = record_index(path)
+        assert len(index) == 4  # three elements + closing bracket
+
+    def test_record_index_none_for_non_array(self, tmp_path):
+        path = tmp_path / "obj.json"
+        path.write_text('{"a": 1}')
+        assert record_index(path) is None
+
+
+class TestLoadDataLines:
+    def test_page_by_lines(self, data_tools, numbered_lines):
+        result = data_tools["load_data"](
+            "lines.txt", str(numbered_lines.parent), offset_lines=500, limit_lines=3
+        )
+        assert result["content"] == "line 500\nline 501\nline 502\n"
+        assert result["next_offset_lines"] == 503
+        assert result["total_lines"] == 1000
+        assert result["has_more"] is True
+
+    def test_last_page(self, data_tools, numbered_lines):
+        result = data_tools["load_data"](
+            "lines.txt", str(numbered_lines.parent), offset_lines=998, limit_lines=10
+        )
+        assert result["content"] == "line 998\nline 999\n"
+        assert result["lines_read"] == 2
+        assert result["has_more"] is False
+
+    def test_offset_past_end(self, data_tools, numbered_lines):
+        result = data_tools["load_data"]("lines.txt", str(numbered_lines.parent), offset_lines=5000)
+        assert result["content"] == ""
+        assert result["lines_read"] == 0
+
+    def test_byte_paging_unchanged(self, data_tools, numbered_lines):
+        result = data_tools["load_data"]("lines.txt", str(numbered_lines.parent), limit_bytes=7)
+        assert result["content"] == "line 0\n"
+        assert result["next_offset_bytes"] == 7
+
+    def test_index_dir_hidden_from_listing(self, data_tools, numbered_lines):
+        data_tools["load_data"]("lines.txt", str(numbered_lines.parent), offset_lines=0)
+        files = data_tools["list_data_files"](str(numbered_lines.parent))["files"]
+        assert [f["filename"] for f in files] == ["lines.txt"]
+
+
+class TestQueryData:
+    def test_jsonl_record_range(self, data_tools, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(100)))
+
+        result = data_tools["query_data"](
+            "events.jsonl", str(tmp_path), offset_records=50, limit_records=2
+        )
+        assert result["format"] == "jsonl"
+        assert result["records"] == [{"id": 50}, {"id": 51}]
+        assert result["total_records"] == 100
+        assert result["has_more"] is True
+
+    def test_pretty_printed_array(self, data_tools, tmp_path):
+        path = tmp_path / "tool_search_call_1.txt"
+        path.write_text(json.dumps([{"login": f"u{i}", "n": i} for i in range(20)], indent=2))
+
+        result = data_tools["query_data"](
+            "tool_search_call_1.txt", str(tmp_path), offset_records=18, limit_records=5
+        )
+        assert result["format"] == "json_array"
+        assert result["records"] == [{"login": "u18", "n": 18}, {"login": "u19", "n": 19}]
+        assert result["total_records"] == 20
+        assert result["has_more"] is False
+
+    def test_jsonpath_selection(self, data_tools, tmp_path):
+        path = tmp_path / "users.json"
+        path.write_text(json.dumps([{"login": "a"}, {"login": "b"}]))
+
+        result = data_tools["query_data"]("users.json", str(tmp_path), path="$.login")
+        assert result["records"] == [["a"], ["b"]]
+
+    def test_single_document(self, data_tools, tmp_path):
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps({"items": [{"id": 1}, {"id": 2}]}, indent=2))
+
+        result = data_tools["query_data"]("doc.json", str(tmp_path), path="$.items[*].id")
+        assert result["format"] == "json"
+        assert result["records"] == [[1, 2]]
+
+    def test_string_document_not_parsed_twice(self, data_tools, tmp_path):
+        (tmp_path / "doc.json").write_text("\n" + json.dumps("[1, 2]"))
+
+        result = data_tools["query_data"]("doc.json", str(tmp_path))
+        assert result["format"] == "json"
+        assert result["records"] == ["[1, 2]"]
+
+    def test_invalid_jsonpath(self, data_tools, tmp_path):
+        (tmp_path / "doc.json").write_text("[]")
+        result = data_tools["query_data"]("doc.json", str(tmp_path), path="$[")
+        assert "error" in result
+
+    def test_invalid_filename(self, data_tools, tmp_path):
+        assert "error" in data_tools["query_data"]("../x.json", str(tmp_path))
@@ -37,6 +37,7 @@ def excel_tools(mcp: FastMCP, tmp_path: Path):
             "excel_sheet_list": mcp._tool_manager._tools["excel_sheet_list"].fn,
             "excel_sql": mcp._tool_manager._tools["excel_sql"].fn,
             "excel_search": mcp._tool_manager._tools["excel_search"].fn,
+            "excel_convert_columnar": mcp._tool_manager._tools["excel_convert_columnar"].fn,
         }
 
 
@@ -972,6 +973,61 @@ def test_sql_file_not_found(self, excel_tools, session_dir, tmp_path):
         assert "error" in result
         assert "not found" in result["error"].lower()
 
+    def test_sql_cached_workbook_switches_sheet(self, excel_tools, multi_sheet_xlsx, tmp_path):
+        """'data' follows the requested sheet even when the workbook is cached."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            first = excel_tools["excel_sql"](
+                path="multi_sheet.xlsx",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+                sheet="Products",
+            )
+            second = excel_tools["excel_sql"](
+                path="multi_sheet.xlsx",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+            )
+
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["target_sheet"] == "Employees"
+        assert second["rows"] != first["rows"]
+
+    def test_sql_sheet_not_found(self, excel_tools, basic_xlsx, tmp_path):
+        """Return error for an unknown sheet."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = excel_tools["excel_sql"](
+                path="basic.xlsx",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+                sheet="Missing",
+            )
+
+        assert "error" in result
+        assert "not found" in result["error"].lower()
+
+    def test_sql_max_rows(self, excel_tools, basic_xlsx, tmp_path):
+        """Results are capped at max_rows."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = excel_tools["excel_sql"](
+                path="basic.xlsx",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+                max_rows=1,
+            )
+
+        assert result["row_count"] == 1
+        assert result["truncated"] is True
+        assert "query_time_ms" in result
+
 
 class TestExcelSearch:
     """Tests for excel_search function."""
@@ -1158,3 +1214,115 @@ def test_search_file_not_found(self, excel_tools, session_dir, tmp_path):
 
         assert "error" in result
         assert "not found" in result["error"].lower()
+
+
+IDS = {
+    "workspace_id": TEST_WORKSPACE_ID,
+    "agent_id": TEST_AGENT_ID,
+    "session_id": TEST_SESSION_ID,
+}
+
+
+class TestWorkbookCache:
+    """Read paths parse each sheet once per file version."""
+
+    def test_pages_and_info_parse_sheet_once(self, excel_tools, large_xlsx, tmp_path):
+        """Paging, info and search reuse the parsed sheet."""
+        from aden_tools.tools.excel_tool.workbook_cache import get_workbook_cache
+
+        parses = get_workbook_cache().sheet_parses
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            first = excel_tools["excel_read"](path="large.xlsx", limit=10, **IDS)
+            second = excel_tools["excel_read"](path="large.xlsx", offset=90, limit=20, **IDS)
+            info = excel_tools["excel_info"](path="large.xlsx", **IDS)
+            search = excel_tools["excel_search"](
+                path="large.xlsx", search_term="990", match_type="exact", **IDS
+            )
+
+        assert get_workbook_cache().sheet_parses == parses + 1
+        assert [r["id"] for r in first["rows"]] == list(range(10))
+        assert [r["id"] for r in second["rows"]] == list(range(90, 100))
+        assert second["total_rows"] == info["sheets"][0]["row_count"] == 100
+        assert search["matches"][0]["row"] == 101
+
+    def test_modified_file_reparsed(self, excel_tools, basic_xlsx, tmp_path):
+        """Writing the file invalidates the parsed copy."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            excel_tools["excel_read"](path="basic.xlsx", **IDS)
+            excel_tools["excel_append"](path="basic.xlsx", rows=[{"name": "Dana"}], **IDS)
+            result = excel_tools["excel_read"](path="basic.xlsx", **IDS)
+
+        assert result["total_rows"] == 4
+        assert result["rows"][-1]["name"] == "Dana"
+
+
+@pytest.mark.skipif(not duckdb_available, reason="duckdb not installed")
+class TestExcelColumnar:
+    """Parquet snapshots used by excel_sql and excel_search."""
+
+    def test_convert_all_sheets(self, excel_tools, multi_sheet_xlsx, tmp_path):
+        """Every sheet is converted and reported by excel_info."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = excel_tools["excel_convert_columnar"](path="multi_sheet.xlsx", **IDS)
+            info = excel_tools["excel_info"](path="multi_sheet.xlsx", **IDS)
+
+        assert result["success"] is True
+        assert result["columnar_sheets"] == ["Employees", "Products", "Summary"]
+        assert result["converted_sheets"][1] == {
+            "name": "Products",
+            "row_count": 2,
+            "column_count": 3,
+        }
+        assert result["snapshot_bytes"] > 0
+        assert all(sheet["columnar"] for sheet in info["sheets"])
+        assert list((tmp_path / "excel_columnar").rglob("*.parquet"))
+
+    def test_sql_reads_snapshot(self, excel_tools, multi_sheet_xlsx, tmp_path):
+        """excel_sql queries converted sheets without re-parsing the workbook."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            excel_tools["excel_convert_columnar"](path="multi_sheet.xlsx", **IDS)
+            with patch(
+                "aden_tools.tools.excel_tool.workbook_cache.WorkbookCache.sheet",
+                side_effect=AssertionError("workbook parsed"),
+            ):
+                result = excel_tools["excel_sql"](
+                    path="multi_sheet.xlsx",
+                    query="SELECT e.name, p.price FROM Employees e "
+                    "JOIN Products p ON e.id = p.id ORDER BY e.id",
+                    **IDS,
+                )
+
+        assert result["rows"] == [
+            {"name": "Alice", "price": 99.99},
+            {"name": "Bob", "price": 149.99},
+        ]
+
+    def test_search_matches_row_scan(self, excel_tools, multi_sheet_xlsx, tmp_path):
+        """Columnar search returns the same matches as the row scan."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            before = excel_tools["excel_search"](path="multi_sheet.xlsx", search_term="a", **IDS)
+            excel_tools["excel_convert_columnar"](path="multi_sheet.xlsx", **IDS)
+            after = excel_tools["excel_search"](path="multi_sheet.xlsx", search_term="a", **IDS)
+
+        assert after["matches"] == before["matches"]
+        assert after["match_count"] > 0
+
+    def test_snapshot_ignored_after_change(self, excel_tools, basic_xlsx, tmp_path):
+        """A snapshot only applies to the file version it was made from."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            excel_tools["excel_convert_columnar"](path="basic.xlsx", **IDS)
+            excel_tools["excel_append"](path="basic.xlsx", rows=[{"name": "Dana"}], **IDS)
+            info = excel_tools["excel_info"](path="basic.xlsx", **IDS)
+            result = excel_tools["excel_search"](
+                path="basic.xlsx", search_term="dana", match_type="exact", **IDS
+            )
+
+        assert info["sheets"][0]["columnar"] is False
+        assert result["match_count"] == 1
+
+    def test_convert_unknown_sheet(self, excel_tools, basic_xlsx, tmp_path):
+        """Unknown sheet names are rejected."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = excel_tools["excel_convert_columnar"](path="basic.xlsx", sheet="Nope", **IDS)
+
+        assert "not found" in result["error"]
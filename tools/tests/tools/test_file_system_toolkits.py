@@ -533,6 +533,116 @@ def test_grep_search_multiple_matches_per_line(
         assert result["success"] is True
         assert result["total_matches"] == 2  # Line 1 and Line 3
 
+    def test_grep_search_skips_binary_and_large_files(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path, monkeypatch
+    ):
+        """Binary and oversized files are skipped and reported."""
+        from aden_tools.tools.file_system_toolkits.grep_search import search_engine
+
+        monkeypatch.setattr(search_engine, "MAX_FILE_BYTES", 64)
+        (tmp_path / "text.txt").write_text("pattern\n")
+        (tmp_path / "blob.bin").write_bytes(b"pattern\x00\x01")
+        (tmp_path / "big.txt").write_text("pattern\n" * 20)
+
+        result = grep_search_fn(path=".", pattern="pattern", **mock_workspace)
+
+        assert [m["file"].rsplit("/", 1)[-1] for m in result["matches"]] == ["text.txt"]
+        assert result["files_searched"] == 1
+        assert result["files_skipped"] == {"binary": 1, "too_large": 1, "unreadable": 0}
+
+    def test_grep_search_max_results_truncates_in_file_order(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Matches stop at max_results and keep walk order."""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text("hit\nmiss\nhit\n")
+
+        result = grep_search_fn(path=".", pattern="hit", max_results=3, **mock_workspace)
+
+        assert result["total_matches"] == 3
+        assert result["truncated"] is True
+        files = [m["file"].rsplit("/", 1)[-1] for m in result["matches"]]
+        assert files == ["a.txt", "a.txt", "b.txt"]
+        assert [m["line_number"] for m in result["matches"]] == [1, 3, 1]
+
+        result = grep_search_fn(path=".", pattern="hit", max_results=6, **mock_workspace)
+        assert result["total_matches"] == 6
+        assert result["truncated"] is False
+
+    def test_grep_search_include_exclude_globs(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Glob filters restrict which files are searched."""
+        (tmp_path / "main.py").write_text("needle\n")
+        (tmp_path / "notes.md").write_text("needle\n")
+        (tmp_path / "test_main.py").write_text("needle\n")
+
+        result = grep_search_fn(
+            path=".", pattern="needle", include="*.py", exclude="test_*", **mock_workspace
+        )
+
+        assert [m["file"].rsplit("/", 1)[-1] for m in result["matches"]] == ["main.py"]
+
+    def test_grep_search_matches_line_semantics(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Byte-level scanning returns the same lines as a per-line search."""
+        import re
+
+        content = (
+            "def alpha():\r\n    return 1\r\ncaf\u00e9 def\nend$\nx = 'a' + \\\ndef omega(): pass"
+        )
+        (tmp_path / "mixed.py").write_bytes(content.encode("utf-8"))
+        path = tmp_path / "mixed.py"
+
+        for pattern in [r"^def ", r"\(\):$", r"caf. ", r"\w+ def", r"pass$", r"(?i)DEF"]:
+            result = grep_search_fn(path="mixed.py", pattern=pattern, **mock_workspace)
+            with open(path, encoding="utf-8") as f:
+                expected = [i for i, line in enumerate(f, 1) if re.search(pattern, line)]
+            assert [m["line_number"] for m in result["matches"]] == expected, pattern
+
+    def test_grep_search_trigram_index_prunes_files(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """The trigram index skips files that lack the pattern's literals."""
+        (tmp_path / "has.txt").write_text("the needle is here\n")
+        (tmp_path / "lacks.txt").write_text("nothing to see\n")
+
+        result = grep_search_fn(path=".", pattern=r"needle\s+is", use_index=True, **mock_workspace)
+
+        assert result["total_matches"] == 1
+        assert result["files_pruned_by_index"] == 1
+
+        # The index follows file changes
+        (tmp_path / "lacks.txt").write_text("a needle is here too, now longer\n")
+        result = grep_search_fn(path=".", pattern=r"needle\s+is", use_index=True, **mock_workspace)
+        assert result["total_matches"] == 2
+        assert result["files_pruned_by_index"] == 0
+
+
+class TestRequiredLiterals:
+    """Tests for the trigram prefilter's literal extraction."""
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            ("needle", ["needle"]),
+            (r"foo\d+barbaz", ["foo", "barbaz"]),
+            ("abcd?", ["abc"]),
+            ("abc{0,2}def", ["def"]),
+            ("(optional)?tail", ["tail"]),
+            ("one|two", []),
+            (r"\.env\.local", [".env.local"]),
+            ("[abc]xyz", ["xyz"]),
+        ],
+    )
+    def test_required_literals(self, pattern, expected):
+        from aden_tools.tools.file_system_toolkits.grep_search.search_engine import (
+            _required_literals,
+        )
+
+        assert _required_literals(pattern) == expected
+
 
 class TestExecuteCommandTool:
     """Tests for execute_command_tool."""
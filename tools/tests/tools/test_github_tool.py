@@ -4,6 +4,7 @@
 Covers:
 - _GitHubClient methods (repositories, issues, PRs, search, branches)
 - Error handling (API errors, timeout, network errors)
+- ETag/Last-Modified response cache
 - Credential retrieval (CredentialStoreAdapter vs env var)
 - All 15 MCP tool functions
 """
@@ -18,6 +19,7 @@
 
 from aden_tools.tools.github_tool.github_tool import (
     _GitHubClient,
+    _ResponseCache,
     register_tools,
 )
 
@@ -70,7 +72,7 @@ def test_handle_response_422(self):
         assert "error" in result
         assert "Validation" in result["error"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_repos(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -86,7 +88,7 @@ def test_list_repos(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_repos_authenticated_user(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -98,7 +100,7 @@ def test_list_repos_authenticated_user(self, mock_get):
         call_url = mock_get.call_args.args[0]
         assert "/user/repos" in call_url
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_repo(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -115,7 +117,7 @@ def test_get_repo(self, mock_get):
         assert result["success"] is True
         assert result["data"]["name"] == "test-repo"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_search_repos(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -130,7 +132,7 @@ def test_search_repos(self, mock_get):
         assert result["success"] is True
         assert "items" in result["data"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_issues(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -145,7 +147,7 @@ def test_list_issues(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_issue(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -161,7 +163,7 @@ def test_get_issue(self, mock_get):
         assert result["success"] is True
         assert result["data"]["title"] == "Test Issue"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.post")
     def test_create_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -181,7 +183,7 @@ def test_create_issue(self, mock_post):
         call_json = mock_post.call_args.kwargs["json"]
         assert call_json["labels"] == ["bug"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.patch")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.patch")
     def test_update_issue(self, mock_patch):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -197,7 +199,7 @@ def test_update_issue(self, mock_patch):
         assert result["success"] is True
         assert result["data"]["state"] == "closed"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_pull_requests(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -211,7 +213,7 @@ def test_list_pull_requests(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 1
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_pull_request(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -228,7 +230,7 @@ def test_get_pull_request(self, mock_get):
         assert result["success"] is True
         assert result["data"]["title"] == "Test PR"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.post")
     def test_create_pull_request(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -246,7 +248,7 @@ def test_create_pull_request(self, mock_post):
         assert result["success"] is True
         assert result["data"]["number"] == 10
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_search_code(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -261,7 +263,7 @@ def test_search_code(self, mock_get):
         assert result["success"] is True
         assert "items" in result["data"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_branches(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -276,7 +278,7 @@ def test_list_branches(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_branch(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -293,6 +295,106 @@ def test_get_branch(self, mock_get):
         assert result["data"]["name"] == "main"
 
 
+# --- Response cache tests ---
+
+
+SHA = "a" * 40
+
+
+def _json_response(status: int, body: bytes = b"", **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status, content=body, headers={"Content-Type": "application/json", **headers}
+    )
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.cache = _ResponseCache()
+        self.client = _GitHubClient("ghp_test_token", cache=self.cache)
+
+    def test_revalidates_with_etag_and_serves_304_from_cache(self):
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.side_effect = [
+                _json_response(200, b'{"id": 1}', ETag='"v1"'),
+                _json_response(304),
+            ]
+            first = self.client.get_repo("owner", "repo")
+            second = self.client.get_repo("owner", "repo")
+
+        assert first == second == {"success": True, "data": {"id": 1}}
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert self.cache.stats()["revalidated"] == 1
+
+    def test_changed_resource_replaces_entry(self):
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.side_effect = [
+                _json_response(200, b'{"v": 1}', ETag='"v1"'),
+                _json_response(200, b'{"v": 2}', ETag='"v2"'),
+                _json_response(304),
+            ]
+            self.client.get_repo("owner", "repo")
+            second = self.client.get_repo("owner", "repo")
+            third = self.client.get_repo("owner", "repo")
+
+        assert second["data"] == third["data"] == {"v": 2}
+        assert mock_get.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+
+    def test_last_modified_validator(self):
+        stamp = "Wed, 21 Oct 2015 07:28:00 GMT"
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.side_effect = [
+                _json_response(200, b"{}", **{"Last-Modified": stamp}),
+                _json_response(304),
+            ]
+            self.client.get_user_profile("octocat")
+            self.client.get_user_profile("octocat")
+
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-Modified-Since"] == stamp
+
+    def test_sha_pinned_resource_served_without_request(self):
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.return_value = _json_response(200, b'{"sha": 1}')
+            self.client._get(f"https://api.github.com/repos/o/r/commits/{SHA}")
+            result = self.client._get(f"https://api.github.com/repos/o/r/commits/{SHA}")
+
+        assert mock_get.call_count == 1
+        assert result.json() == {"sha": 1}
+        assert self.cache.stats()["hits"] == 1
+
+    def test_entries_keyed_per_token(self):
+        other = _GitHubClient("ghp_other_token", cache=self.cache)
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.return_value = _json_response(200, b"{}", ETag='"v1"')
+            self.client.get_repo("owner", "repo")
+            other.get_repo("owner", "repo")
+
+        assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+    def test_lru_eviction_by_size(self):
+        cache = _ResponseCache(max_bytes=250)
+        client = _GitHubClient("ghp_test_token", cache=cache)
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.side_effect = lambda url, **kw: _json_response(200, b"x" * 100, ETag='"e"')
+            client.get_repo("o", "a")
+            client.get_repo("o", "b")
+            client.get_repo("o", "a")  # a is now most recently used
+            client.get_repo("o", "c")
+
+        assert cache.stats()["entries"] == 2
+        assert (
+            cache.get(cache.key("ghp_test_token", "https://api.github.com/repos/o/b", None)) is None
+        )
+        assert cache.get(cache.key("ghp_test_token", "https://api.github.com/repos/o/a", None))
+
+    def test_errors_not_cached(self):
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
+            mock_get.return_value = _json_response(404, b"{}", ETag='"e"')
+            self.client.get_repo("owner", "missing")
+
+        assert self.cache.stats()["entries"] == 0
+
+
 # --- Credential retrieval tests ---
 
 
@@ -317,7 +419,7 @@ def test_no_credentials_returns_error(self, mcp):
     def test_env_var_token(self, mcp):
         """Token from GITHUB_TOKEN env var is used."""
         with patch("os.getenv", return_value="ghp_env_token"):
-            with patch("aden_tools.tools.github_tool.github_tool.httpx.get") as mock_get:
+            with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = []
@@ -336,7 +438,7 @@ def test_credential_store_token(self, mcp):
         mock_credentials = MagicMock()
         mock_credentials.get.return_value = "ghp_store_token"
 
-        with patch("aden_tools.tools.github_tool.github_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.github_tool.github_tool.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = []
@@ -360,7 +462,7 @@ class TestGitHubListRepos:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_repos_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -375,7 +477,7 @@ def test_list_repos_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_repos_timeout(self, mock_get, mcp):
         mock_get.side_effect = httpx.TimeoutException("Timeout")
 
@@ -388,7 +490,7 @@ def test_list_repos_timeout(self, mock_get, mcp):
             assert "error" in result
             assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_repos_network_error(self, mock_get, mcp):
         mock_get.side_effect = httpx.RequestError("Network error")
 
@@ -407,7 +509,7 @@ class TestGitHubGetRepo:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_repo_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -428,7 +530,7 @@ class TestGitHubSearchRepos:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_search_repos_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -449,7 +551,7 @@ class TestGitHubIssues:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_issues_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -464,7 +566,7 @@ def test_list_issues_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_issue_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -479,7 +581,7 @@ def test_get_issue_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.post")
     def test_create_issue_success(self, mock_post, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -494,7 +596,7 @@ def test_create_issue_success(self, mock_post, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.patch")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.patch")
     def test_update_issue_success(self, mock_patch, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -515,7 +617,7 @@ class TestGitHubPullRequests:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_pull_requests_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -530,7 +632,7 @@ def test_list_pull_requests_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_pull_request_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -545,7 +647,7 @@ def test_get_pull_request_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.post")
     def test_create_pull_request_success(self, mock_post, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -572,7 +674,7 @@ class TestGitHubSearch:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_search_code_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -593,7 +695,7 @@ class TestGitHubBranches:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_list_branches_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -608,7 +710,7 @@ def test_list_branches_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.http_client.get")
     def test_get_branch_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
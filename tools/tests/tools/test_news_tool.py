@@ -8,6 +8,7 @@
 from fastmcp import FastMCP
 
 from aden_tools.tools.news_tool import news_tool, register_tools
+from aden_tools.utils import http_client
 
 
 class DummyResponse:
@@ -56,7 +57,7 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(http_client, "get", mock_get)
 
         result = news_tools["news_search"].fn(query="funding")
 
@@ -91,8 +92,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "get", mock_get)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="markets")
 
@@ -121,7 +122,7 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
             captured["params"] = params or {}
             return DummyResponse(200, {"results": []})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(http_client, "get", mock_get)
 
         result = news_tools["news_by_company"].fn(company_name="Acme", days_back=7)
 
@@ -132,71 +133,76 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
 
 
 class TestRateLimiting:
-    """Tests for exponential backoff on 429 responses."""
+    """Tests for backoff on 429 responses (handled by the shared HTTP client)."""
 
-    def test_newsdata_retries_on_429_then_succeeds(self, news_tools, monkeypatch):
+    @pytest.fixture
+    def transport(self, monkeypatch):
+        """Route http_client through a MockTransport driven by per-host handlers."""
+        handlers = {}
+
+        def dispatch(request: httpx.Request) -> httpx.Response:
+            return handlers[request.url.host](request)
+
+        http_client.configure(transport=httpx.MockTransport(dispatch))
+        monkeypatch.setattr(time, "sleep", lambda s: None)
+        yield handlers
+        http_client.reset()
+
+    def test_newsdata_retries_on_429_then_succeeds(self, news_tools, monkeypatch, transport):
         """NewsData retries with backoff on 429 and succeeds on next attempt."""
         monkeypatch.setenv("NEWSDATA_API_KEY", "news-key")
         monkeypatch.delenv("FINLIGHT_API_KEY", raising=False)
 
         call_count = 0
 
-        def mock_get(url: str, params=None, timeout=30.0, headers=None):
+        def newsdata(request):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return DummyResponse(429, {})
-            return DummyResponse(200, {"results": [{"title": "OK", "source_id": "s"}]})
+                return httpx.Response(429, json={})
+            return httpx.Response(200, json={"results": [{"title": "OK", "source_id": "s"}]})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(time, "sleep", lambda s: None)
+        transport["newsdata.io"] = newsdata
 
         result = news_tools["news_search"].fn(query="test")
 
         assert call_count == 2
         assert result["provider"] == "newsdata"
 
-    def test_newsdata_429_exhausts_retries_then_falls_back(self, news_tools, monkeypatch):
+    def test_newsdata_429_exhausts_retries_then_falls_back(
+        self, news_tools, monkeypatch, transport
+    ):
         """NewsData exhausts retries on 429, seamlessly falls back to Finlight."""
         monkeypatch.setenv("NEWSDATA_API_KEY", "news-key")
         monkeypatch.setenv("FINLIGHT_API_KEY", "finlight-key")
 
-        def mock_get(url: str, params=None, timeout=30.0, headers=None):
-            return DummyResponse(429, {})
-
-        def mock_post(url: str, json=None, timeout=30.0, headers=None):
-            return DummyResponse(
-                200,
-                {"articles": [{"title": "Fallback", "source": "fin"}]},
-            )
-
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
-        monkeypatch.setattr(time, "sleep", lambda s: None)
+        transport["newsdata.io"] = lambda request: httpx.Response(429, json={})
+        transport["api.finlight.me"] = lambda request: httpx.Response(
+            200, json={"articles": [{"title": "Fallback", "source": "fin"}]}
+        )
 
         result = news_tools["news_search"].fn(query="test")
 
         assert result["provider"] == "finlight"
+        assert http_client.stats()["newsdata.io"]["retries"] == 3
 
-    def test_finlight_retries_on_429_then_succeeds(self, news_tools, monkeypatch):
+    def test_finlight_retries_on_429_then_succeeds(self, news_tools, monkeypatch, transport):
         """Finlight retries with backoff on 429 and succeeds on next attempt."""
         monkeypatch.setenv("FINLIGHT_API_KEY", "finlight-key")
         monkeypatch.delenv("NEWSDATA_API_KEY", raising=False)
 
         call_count = 0
 
-        def mock_post(url: str, json=None, timeout=30.0, headers=None):
+        def finlight(request):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return DummyResponse(429, {})
-            return DummyResponse(
-                200,
-                {"articles": [{"title": "OK", "source": "fin", "sentiment": 0.5}]},
+                return httpx.Response(429, json={})
+            return httpx.Response(
+                200, json={"articles": [{"title": "OK", "source": "fin", "sentiment": 0.5}]}
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
-        monkeypatch.setattr(time, "sleep", lambda s: None)
+        transport["api.finlight.me"] = finlight
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -222,7 +228,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -245,7 +251,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -263,7 +269,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "A", "source": "s", "sentiment": 5.0}]},
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -288,8 +294,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
             finlight_called = True
             return DummyResponse(200, {"articles": []})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "get", mock_get)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="test")
 
@@ -310,8 +316,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "Fallback", "source": "fin"}]},
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(http_client, "get", mock_get)
+        monkeypatch.setattr(http_client, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="test")
 
@@ -5,7 +5,48 @@
 import pytest
 from fastmcp import FastMCP
 
-from aden_tools.tools.pdf_read_tool import register_tools
+from aden_tools.tools.pdf_read_tool import pdf_read_tool, register_tools
+
+
+def write_text_pdf(path: Path, num_pages: int, prefix: str = "Page") -> Path:
+    """Write a PDF whose page N contains the text '<prefix> N text'."""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for i in range(num_pages):
+        page = writer.add_blank_page(612, 792)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 712 Td ({prefix} {i + 1} text) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    writer.write(path)
+    return path
+
+
+@pytest.fixture
+def reader_opens(monkeypatch):
+    """Count PdfReader constructions inside the tool process."""
+    opens = []
+    real_reader = pdf_read_tool.PdfReader
+
+    def counting_reader(path):
+        opens.append(path)
+        return real_reader(path)
+
+    monkeypatch.setattr(pdf_read_tool, "PdfReader", counting_reader)
+    return opens
 
 
 @pytest.fixture
@@ -111,3 +152,107 @@ def __init__(self, path: Path) -> None:  # noqa: ARG002
         # New behavior: explicit truncation metadata instead of silent truncation
         assert result.get("truncated") is True
         assert "truncation_warning" in result
+
+
+class TestExtractionCache:
+    """Extracted page text is cached per file version."""
+
+    def test_later_ranges_served_from_cache(self, pdf_read_fn, tmp_path: Path, reader_opens):
+        pdf = write_text_pdf(tmp_path / "report.pdf", 6)
+
+        first = pdf_read_fn(file_path=str(pdf), pages="1-6")
+        second = pdf_read_fn(file_path=str(pdf), pages="2-3")
+
+        assert len(reader_opens) == 1
+        assert "Page 1 text" in first["content"]
+        assert second["content"] == "--- Page 2 ---\nPage 2 text\n\n--- Page 3 ---\nPage 3 text"
+        assert second["total_pages"] == 6
+
+    def test_uncached_pages_extracted_on_demand(self, pdf_read_fn, tmp_path: Path, reader_opens):
+        pdf = write_text_pdf(tmp_path / "report.pdf", 4)
+
+        pdf_read_fn(file_path=str(pdf), pages="1")
+        result = pdf_read_fn(file_path=str(pdf), pages="4")
+
+        assert len(reader_opens) == 2
+        assert "Page 4 text" in result["content"]
+
+    def test_modified_file_reparsed(self, pdf_read_fn, tmp_path: Path):
+        pdf = write_text_pdf(tmp_path / "report.pdf", 2)
+        pdf_read_fn(file_path=str(pdf))
+
+        write_text_pdf(pdf, 3, prefix="Revised")
+        result = pdf_read_fn(file_path=str(pdf))
+
+        assert result["total_pages"] == 3
+        assert "Revised 1 text" in result["content"]
+
+
+class TestCharBudget:
+    """max_chars returns pages incrementally."""
+
+    def test_budget_returns_continuation(self, pdf_read_fn, tmp_path: Path):
+        pdf = write_text_pdf(tmp_path / "report.pdf", 5)
+        page_len = len("--- Page 1 ---\nPage 1 text")
+
+        first = pdf_read_fn(file_path=str(pdf), max_chars=2 * page_len + 2)
+
+        assert first["pages_extracted"] == 2
+        assert first["has_more"] is True
+        assert first["next_pages"] == "3-5"
+
+        rest = pdf_read_fn(file_path=str(pdf), pages=first["next_pages"], max_chars=10_000)
+        assert rest["pages_extracted"] == 3
+        assert "has_more" not in rest
+        assert "Page 5 text" in rest["content"]
+
+    def test_budget_always_returns_one_page(self, pdf_read_fn, tmp_path: Path):
+        pdf = write_text_pdf(tmp_path / "report.pdf", 3)
+
+        result = pdf_read_fn(file_path=str(pdf), pages="1,3", max_chars=1)
+
+        assert result["pages_extracted"] == 1
+        assert result["next_pages"] == "3"
+
+    def test_budget_stops_extracting_early(self, pdf_read_fn, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(pdf_read_tool, "PAGES_PER_TASK", 2)
+        monkeypatch.setattr(pdf_read_tool, "MAX_WORKERS", 1)
+        pdf = write_text_pdf(tmp_path / "report.pdf", 10)
+
+        result = pdf_read_fn(file_path=str(pdf), max_chars=10)
+        again = pdf_read_fn(file_path=str(pdf), pages="3")
+
+        assert result["pages_extracted"] == 1
+        assert "Page 3 text" in again["content"]
+
+
+class TestParallelExtraction:
+    """Large extractions fan out across the process pool."""
+
+    def test_pool_matches_sequential(self, pdf_read_fn, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(pdf_read_tool, "PARALLEL_MIN_PAGES", 4)
+        monkeypatch.setattr(pdf_read_tool, "PAGES_PER_TASK", 3)
+        monkeypatch.setattr(pdf_read_tool, "MAX_WORKERS", 2)
+        pdf = write_text_pdf(tmp_path / "report.pdf", 10)
+
+        try:
+            result = pdf_read_fn(file_path=str(pdf))
+        finally:
+            pdf_read_tool._discard_pool()
+
+        expected = "\n\n".join(f"--- Page {i} ---\nPage {i} text" for i in range(1, 11))
+        assert result["content"] == expected
+
+    def test_pool_failure_falls_back(self, pdf_read_fn, tmp_path: Path, monkeypatch):
+        class BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise RuntimeError("pool is broken")
+
+        monkeypatch.setattr(pdf_read_tool, "PARALLEL_MIN_PAGES", 2)
+        monkeypatch.setattr(pdf_read_tool, "_get_pool", lambda: BrokenPool())
+        pdf = write_text_pdf(tmp_path / "report.pdf", 4)
+
+        result = pdf_read_fn(file_path=str(pdf))
+
+        assert result["pages_extracted"] == 4
+        assert "Page 4 text" in result["content"]
@@ -62,7 +62,7 @@ def test_credentials_from_env(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -128,7 +128,7 @@ def test_detect_labels_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/dog.jpg", max_labels=5)
 
@@ -156,7 +156,7 @@ def test_detect_text_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/text.jpg")
 
@@ -189,7 +189,7 @@ def test_detect_faces_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/face.jpg")
 
@@ -224,7 +224,7 @@ def test_localize_objects_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/cat.jpg")
 
@@ -250,7 +250,7 @@ def test_detect_logos_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/logos.jpg")
 
@@ -279,7 +279,7 @@ def test_detect_landmarks_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/paris.jpg")
 
@@ -316,7 +316,7 @@ def test_image_properties_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/colorful.jpg")
 
@@ -346,7 +346,7 @@ def test_web_detection_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/sunset.jpg")
 
@@ -376,7 +376,7 @@ def test_safe_search_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/photo.jpg")
 
@@ -396,7 +396,7 @@ def test_local_file_success(mcp: FastMCP, sample_image: Path):
     mock_response = {"responses": [{"labelAnnotations": [{"description": "Image", "score": 0.9}]}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source=str(sample_image))
 
@@ -416,7 +416,7 @@ def test_api_error_401(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(401)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -430,7 +430,7 @@ def test_api_error_403(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(403)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -444,7 +444,7 @@ def test_api_error_429(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(429)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -458,7 +458,7 @@ def test_timeout_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.side_effect = httpx.TimeoutException("Timeout")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -472,7 +472,7 @@ def test_network_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.side_effect = httpx.RequestError("Network error")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -486,7 +486,7 @@ def test_empty_response(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json={"responses": []})
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -502,7 +502,7 @@ def test_api_error_in_response(mcp: FastMCP):
     mock_response = {"responses": [{"error": {"message": "Image too small"}}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -521,7 +521,7 @@ def test_max_labels_clamped(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             # Test with value > 100
             tool_fn(image_source="https://example.com/image.jpg", max_labels=200)
@@ -540,9 +540,152 @@ def test_detect_text_no_text_found(mcp: FastMCP):
     mock_response = {"responses": [{"textAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
     assert result["text"] == ""
     assert result["blocks"] == []
+
+
+# --- Batched Analysis Tests ---
+
+
+def test_analyze_batches_images_and_features(mcp: FastMCP, sample_image: Path):
+    """Test several features on several images go out in one call."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+
+    mock_response = {
+        "responses": [
+            {
+                "labelAnnotations": [{"description": "Dog", "score": 0.97}],
+                "safeSearchAnnotation": {"adult": "VERY_UNLIKELY"},
+            },
+            {"error": {"message": "Bad image data"}},
+        ]
+    }
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post") as mock_post:
+            mock_post.return_value = httpx.Response(200, json=mock_response)
+            result = tool_fn(
+                image_sources=["https://example.com/dog.jpg", str(sample_image)],
+                features=["labels", "safe_search"],
+                max_results=3,
+            )
+
+    assert mock_post.call_count == 1
+    request = mock_post.call_args.kwargs["json"]["requests"]
+    assert len(request) == 2
+    assert request[0]["features"] == [
+        {"type": "LABEL_DETECTION", "maxResults": 3},
+        {"type": "SAFE_SEARCH_DETECTION"},
+    ]
+    assert result["api_calls"] == 1
+    first, second = result["results"]
+    assert first["image_source"] == "https://example.com/dog.jpg"
+    assert first["labels"] == [{"description": "Dog", "score": 0.97}]
+    assert first["safe_search"]["adult"] == "VERY_UNLIKELY"
+    assert second == {"image_source": str(sample_image), "error": "Bad image data"}
+
+
+def test_analyze_dedupes_identical_images(mcp: FastMCP, sample_image: Path, tmp_path: Path):
+    """Test duplicate sources and identical file content are sent once."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(sample_image.read_bytes())
+
+    mock_response = {"responses": [{"labelAnnotations": []}]}
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post") as mock_post:
+            mock_post.return_value = httpx.Response(200, json=mock_response)
+            result = tool_fn(
+                image_sources=[str(sample_image), str(copy), str(sample_image)],
+                features=["labels"],
+            )
+
+    assert len(mock_post.call_args.kwargs["json"]["requests"]) == 1
+    assert [r["labels"] for r in result["results"]] == [[], [], []]
+
+
+def test_analyze_splits_large_batches(mcp: FastMCP):
+    """Test batches are capped at 16 images per call."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+
+    def respond(url, **kwargs):
+        count = len(kwargs["json"]["requests"])
+        return httpx.Response(200, json={"responses": [{"labelAnnotations": []}] * count})
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post", side_effect=respond) as mock_post:
+            result = tool_fn(
+                image_sources=[f"https://example.com/{i}.jpg" for i in range(20)],
+                features=["labels"],
+            )
+
+    assert result["api_calls"] == 2
+    sizes = [len(call.kwargs["json"]["requests"]) for call in mock_post.call_args_list]
+    assert sizes == [16, 4]
+    assert all(r["labels"] == [] for r in result["results"])
+
+
+def test_analyze_reports_per_image_load_errors(mcp: FastMCP):
+    """Test unreadable images fail individually without a request."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post") as mock_post:
+            result = tool_fn(image_sources=["/nonexistent/a.jpg"])
+
+    mock_post.assert_not_called()
+    assert result["api_calls"] == 0
+    assert "File not found" in result["results"][0]["error"]
+
+
+def test_analyze_api_error_applies_to_batch(mcp: FastMCP):
+    """Test an HTTP error is reported on every image in the batch."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post") as mock_post:
+            mock_post.return_value = httpx.Response(429)
+            result = tool_fn(image_sources=["https://example.com/a.jpg", "https://b.com/b.jpg"])
+
+    assert all("Rate limit" in r["error"] for r in result["results"])
+
+
+def test_analyze_unknown_feature(mcp: FastMCP):
+    """Test unknown feature names are rejected."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_analyze"].fn
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        result = tool_fn(image_sources=["https://example.com/a.jpg"], features=["colour"])
+
+    assert "Unknown features: colour" in result["error"]
+
+
+def test_image_cache_skips_reencoding(mcp: FastMCP, sample_image: Path):
+    """Test an unchanged local file is read and encoded only once."""
+    register_tools(mcp, credentials=None)
+    tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
+    mock_response = {"responses": [{"labelAnnotations": []}]}
+
+    with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
+        with patch("aden_tools.utils.http_client.post") as mock_post:
+            mock_post.return_value = httpx.Response(200, json=mock_response)
+            tool_fn(image_source=str(sample_image))
+            with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+                result = tool_fn(image_source=str(sample_image))
+
+    assert result == {"labels": []}
+    contents = [
+        c.kwargs["json"]["requests"][0]["image"]["content"] for c in mock_post.call_args_list
+    ]
+    assert contents[0] == contents[1]
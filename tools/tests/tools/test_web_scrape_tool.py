@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastmcp import FastMCP
 
@@ -31,8 +32,12 @@ def _make_playwright_mocks(html, status=200, final_url="https://example.com/page
     mock_context = AsyncMock()
     mock_context.new_page.return_value = mock_page
 
+    mock_context.on = MagicMock()
+
     mock_browser = AsyncMock()
     mock_browser.new_context.return_value = mock_context
+    mock_browser.on = MagicMock()
+    mock_browser.is_connected = MagicMock(return_value=True)
 
     mock_pw = MagicMock()
     mock_pw.chromium.launch = AsyncMock(return_value=mock_browser)
@@ -47,6 +52,24 @@ def _make_playwright_mocks(html, status=200, final_url="https://example.com/page
 
 _PW_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool.async_playwright"
 _STEALTH_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool.Stealth"
+_HTTP_GET_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool.http_client.aget"
+
+
+@pytest.fixture(autouse=True)
+def static_fetch():
+    """Fail the plain-HTTP tier by default so tests exercise the browser path."""
+    with patch(_HTTP_GET_PATH, new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = httpx.ConnectError("offline")
+        yield mock_get
+
+
+def _html_response(html, status=200, content_type="text/html; charset=utf-8", url=None):
+    return httpx.Response(
+        status,
+        text=html,
+        headers={"content-type": content_type},
+        request=httpx.Request("GET", url or "https://example.com/page"),
+    )
 
 
 class TestWebScrapeTool:
@@ -349,3 +372,311 @@ async def test_empty_href_skipped(self, mock_pw, mock_stealth, web_scrape_fn):
         # Empty and whitespace-only text should be filtered
         assert "" not in texts
         assert len([t for t in texts if not t.strip()]) == 0
+
+
+class TestBrowserPool:
+    """Tests for browser reuse, readiness waits and recycling."""
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_browser_reused_across_calls(self, mock_pw, mock_stealth, web_scrape_fn):
+        """Consecutive scrapes share one launched browser; each page is closed."""
+        mock_cm, _, mock_page = _make_playwright_mocks("<html><body>Hi</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        for _ in range(3):
+            result = await web_scrape_fn(url="https://example.com")
+            assert "error" not in result
+
+        pw = mock_cm.__aenter__.return_value
+        assert mock_pw.call_count == 1
+        assert pw.chromium.launch.await_count == 1
+        assert mock_page.close.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_waits_for_readiness_not_fixed_sleep(self, mock_pw, mock_stealth, web_scrape_fn):
+        """Network idle (or the requested selector) replaces the fixed 2s wait."""
+        html = '<html><body><div class="content">Body</div></body></html>'
+        mock_cm, _, mock_page = _make_playwright_mocks(html)
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        await web_scrape_fn(url="https://example.com")
+        mock_page.wait_for_load_state.assert_awaited_once_with("networkidle", timeout=5000)
+
+        await web_scrape_fn(url="https://example.com", selector=".content")
+        mock_page.wait_for_selector.assert_awaited_once_with(".content", timeout=5000)
+        mock_page.wait_for_timeout.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_idle_timeout_still_returns_content(self, mock_pw, mock_stealth, web_scrape_fn):
+        """Pages that never go network-idle are scraped as rendered so far."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+        mock_cm, _, mock_page = _make_playwright_mocks("<html><body>Partial</body></html>")
+        mock_page.wait_for_load_state.side_effect = PlaywrightTimeout("idle")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com")
+
+        assert result["content"] == "Partial"
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_browser_recycled_after_crash(self, mock_pw, mock_stealth, web_scrape_fn):
+        """A disconnected browser is retired; the next call relaunches."""
+        from playwright.async_api import Error as PlaywrightError
+
+        mock_cm, mock_response, mock_page = _make_playwright_mocks("<html><body>Hi</body></html>")
+        browser = mock_cm.__aenter__.return_value.chromium.launch.return_value
+
+        def goto(*args, **kwargs):
+            if mock_page.goto.await_count == 1:
+                browser.is_connected.return_value = False
+                raise PlaywrightError("Target crashed")
+            return mock_response
+
+        mock_page.goto.side_effect = goto
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        first = await web_scrape_fn(url="https://example.com")
+        second = await web_scrape_fn(url="https://example.com")
+
+        pw = mock_cm.__aenter__.return_value
+        assert "Browser error" in first["error"]
+        assert "error" not in second
+        assert pw.chromium.launch.await_count == 2
+        pw.chromium.launch.return_value.close.assert_awaited()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_navigation_error_keeps_browser(self, mock_pw, mock_stealth, web_scrape_fn):
+        """Page-level failures (DNS, timeouts) do not recycle a healthy browser."""
+        from playwright.async_api import Error as PlaywrightError
+
+        mock_cm, mock_response, mock_page = _make_playwright_mocks("<html><body>Hi</body></html>")
+        mock_page.goto.side_effect = [
+            PlaywrightError("net::ERR_NAME_NOT_RESOLVED"),
+            mock_response,
+        ]
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        first = await web_scrape_fn(url="https://nowhere.invalid")
+        second = await web_scrape_fn(url="https://example.com")
+
+        pw = mock_cm.__aenter__.return_value
+        assert "Browser error" in first["error"]
+        assert "error" not in second
+        assert pw.chromium.launch.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_browser_recycled_after_page_budget(self, mock_pw, mock_stealth):
+        """Browsers are relaunched after max_pages_per_browser pages."""
+        from aden_tools.tools.web_scrape_tool.web_scrape_tool import BrowserPool
+
+        mock_cm, _, _ = _make_playwright_mocks("<html></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+        pool = BrowserPool(size=1, max_pages_per_browser=2)
+
+        for _ in range(3):
+            async with pool.page():
+                pass
+
+        assert pool.launches == 2
+        await pool.close()
+        mock_cm.__aexit__.assert_awaited_once()
+
+
+class TestWebScrapeMany:
+    """Tests for web_scrape_many batch scraping."""
+
+    @pytest.fixture
+    def web_scrape_many_fn(self, mcp: FastMCP):
+        register_tools(mcp)
+        return mcp._tool_manager._tools["web_scrape_many"].fn
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_results_in_input_order(self, mock_pw, mock_stealth, web_scrape_many_fn):
+        """Each URL gets its own result, in the order requested."""
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Same</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_many_fn(urls=["https://a.example", "b.example"])
+
+        assert [r["url"] for r in result["results"]] == ["https://a.example", "https://b.example"]
+        assert result["succeeded"] == 2
+        assert result["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_urls_rejected(self, web_scrape_many_fn):
+        result = await web_scrape_many_fn(urls=[])
+        assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_too_many_urls_rejected(self, web_scrape_many_fn):
+        result = await web_scrape_many_fn(urls=[f"https://e{i}.example" for i in range(21)])
+        assert "error" in result
+
+
+ARTICLE = "<html><head><title>Post</title></head><body><article>{}</article></body></html>".format(
+    "Server-rendered paragraph. " * 20
+)
+
+
+class TestHttpFirst:
+    """Tests for the plain-HTTP tier and browser escalation."""
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_static_page_served_over_http(self, mock_pw, web_scrape_fn, static_fetch):
+        """Server-rendered pages never touch the browser."""
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response(ARTICLE)
+
+        result = await web_scrape_fn(url="https://example.com/page")
+
+        assert result["fetched_with"] == "http"
+        assert result["title"] == "Post"
+        assert result["content"].startswith("Server-rendered paragraph.")
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "html",
+        [
+            '<html><body><div id="root"></div><script src="/app.js"></script></body></html>',
+            "<html><body><noscript>You need to enable JavaScript to run this app.</noscript>"
+            + "<p>{}</p></body></html>".format("Filler text. " * 30),
+            "<html><head><title>Just a moment...</title></head><body>Checking</body></html>",
+        ],
+        ids=["empty-shell", "noscript-notice", "challenge"],
+    )
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_js_shell_escalates_to_browser(
+        self, mock_pw, mock_stealth, html, web_scrape_fn, static_fetch
+    ):
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response(html)
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Rendered by JS</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com/page")
+
+        assert result["fetched_with"] == "browser"
+        assert result["content"] == "Rendered by JS"
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_empty_static_page_escalates(
+        self, mock_pw, mock_stealth, web_scrape_fn, static_fetch
+    ):
+        """No extractable text over HTTP means the browser gets a go, scripts or not."""
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response("<html><body><div></div></body></html>")
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Rendered</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com/page")
+
+        assert result["fetched_with"] == "browser"
+        assert result["content"] == "Rendered"
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_gated_status_escalates(self, mock_pw, mock_stealth, web_scrape_fn, static_fetch):
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response("Forbidden", status=403)
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Let in</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com/page")
+
+        assert result["fetched_with"] == "browser"
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_not_found_returned_without_browser(self, mock_pw, web_scrape_fn, static_fetch):
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response("Nope", status=404)
+
+        result = await web_scrape_fn(url="https://example.com/missing")
+
+        assert result["error"] == "HTTP 404: Failed to fetch URL"
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_non_html_skipped_without_browser(self, mock_pw, web_scrape_fn, static_fetch):
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response("%PDF", content_type="application/pdf")
+
+        result = await web_scrape_fn(url="https://example.com/file.pdf")
+
+        assert result["skipped"] is True
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_missing_selector_escalates(
+        self, mock_pw, mock_stealth, web_scrape_fn, static_fetch
+    ):
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response(ARTICLE)
+        rendered = '<html><body><div class="widget">Loaded later</div></body></html>'
+        mock_cm, _, _ = _make_playwright_mocks(rendered)
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com/page", selector=".widget")
+
+        assert result["fetched_with"] == "browser"
+        assert result["content"] == "Loaded later"
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_force_browser_skips_http(
+        self, mock_pw, mock_stealth, web_scrape_fn, static_fetch
+    ):
+        mock_cm, _, _ = _make_playwright_mocks(ARTICLE)
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com/page", force_browser=True)
+
+        assert result["fetched_with"] == "browser"
+        static_fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_links_resolved_against_redirect_target(self, web_scrape_fn, static_fetch):
+        html = ARTICLE.replace("</article>", '<a href="next">Next</a></article>')
+        static_fetch.side_effect = None
+        static_fetch.return_value = _html_response(html, url="https://example.com/docs/intro")
+
+        result = await web_scrape_fn(url="https://example.com/old", include_links=True)
+
+        assert result["links"] == [{"text": "Next", "href": "https://example.com/docs/next"}]
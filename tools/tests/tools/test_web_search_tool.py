@@ -145,3 +145,46 @@ def test_num_results_parameter(self, web_search_fn, monkeypatch):
 
         result = web_search_fn(query="test", num_results=5)
         assert isinstance(result, dict)
+
+
+class TestResultCaching:
+    """Repeated queries are served from the result cache."""
+
+    @pytest.fixture
+    def brave_calls(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            "web": {"results": [{"title": "T", "url": "https://x.test", "description": "D"}]}
+        }
+        get = MagicMock(return_value=response)
+        monkeypatch.setattr("aden_tools.utils.http_client.get", get)
+        return get
+
+    def test_repeated_query_hits_provider_once(self, web_search_fn, brave_calls):
+        first = web_search_fn(query="AI agents")
+        second = web_search_fn(query="  ai   AGENTS ")
+
+        assert brave_calls.call_count == 1
+        assert second["cached"] is True
+        assert second["results"] == first["results"]
+
+    def test_errors_not_cached(self, web_search_fn, brave_calls):
+        brave_calls.return_value.status_code = 429
+
+        web_search_fn(query="AI agents")
+        web_search_fn(query="AI agents")
+
+        assert brave_calls.call_count == 2
+
+    def test_cache_can_be_disabled(self, mcp, brave_calls, monkeypatch):
+        monkeypatch.setenv("HIVE_TOOL_CACHE_DISABLED", "1")
+        register_tools(mcp)
+        fn = mcp._tool_manager._tools["web_search"].fn
+
+        fn(query="AI agents")
+        fn(query="AI agents")
+
+        assert brave_calls.call_count == 2